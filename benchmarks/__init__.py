@@ -0,0 +1,7 @@
+"""!
+@brief Offline performance benchmarks for Office Janitor.
+@details Runs on any platform: a synthetic in-memory registry stands in for
+``winreg``, generated directory trees stand in for Office installs, and a fake
+subprocess layer stands in for PowerShell, ``reg.exe`` and friends. Run
+``python -m benchmarks --help`` for usage.
+"""
@@ -0,0 +1,127 @@
+"""!
+@brief Command-line entry point: ``python -m benchmarks``.
+@details Populates the synthetic machine, runs the selected benchmarks,
+writes the JSON report and, with ``--compare``, exits with status 1 when any
+benchmark is slower than the baseline by more than ``--threshold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from . import harness
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Offline Office Janitor performance benchmarks.",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply the synthetic machine size (1.0 = 100k components, 2k products).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per benchmark.")
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="NAME",
+        help="Run only this benchmark (repeatable).",
+    )
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit.")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmark-results.json"),
+        help="Where to write the JSON report.",
+    )
+    parser.add_argument("--compare", type=Path, metavar="BASELINE", help="Baseline report.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed median slowdown as a fraction of the baseline (default 0.25).",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.005,
+        help="Ignore slowdowns smaller than this many seconds (default 0.005).",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    registry = harness.prepare_environment()
+
+    from . import scenarios
+    from .fake_subprocess import FakeProcessLayer
+
+    if args.list:
+        for benchmark in scenarios.BENCHMARKS:
+            print(f"{benchmark.name:32} {benchmark.description}")
+        return 0
+
+    try:
+        selected = scenarios.select(args.only)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    baseline = harness.load_report(args.compare) if args.compare else None
+    if baseline is not None and float(baseline.get("scale", 1.0)) != args.scale:
+        print(
+            f"Baseline was recorded at --scale {baseline.get('scale')}; "
+            f"rerun with the same scale to compare.",
+            file=sys.stderr,
+        )
+        return 2
+
+    with tempfile.TemporaryDirectory(prefix="oj-bench-") as scratch:
+        workload = harness.Workload(
+            registry=registry,
+            processes=FakeProcessLayer(),
+            scratch=Path(scratch),
+            scale=args.scale,
+        )
+        start = time.perf_counter()
+        summary = scenarios.populate_workload(workload)
+        print(
+            f"Synthetic machine: {registry.key_count()} keys, "
+            f"{len(summary['office_products'])} Office products, "
+            f"{summary['components']} components ({time.perf_counter() - start:.1f}s)"
+        )
+
+        def progress(result: harness.BenchmarkResult) -> None:
+            data = result.to_dict()
+            print(f"  {result.name:32} median {data['median']:9.4f}s  min {data['min']:9.4f}s")
+
+        report = harness.run_benchmarks(selected, workload, repeat=args.repeat, progress=progress)
+
+    harness.write_report(report, args.output)
+    print(f"Report written to {args.output}")
+
+    if baseline is None:
+        return 0
+    comparisons = harness.compare_reports(
+        report, baseline, threshold=args.threshold, min_delta=args.min_delta
+    )
+    for comparison in comparisons:
+        marker = "REGRESSION" if comparison.regressed else "ok"
+        print(
+            f"  {comparison.name:32} {comparison.baseline:9.4f}s -> "
+            f"{comparison.current:9.4f}s  x{comparison.ratio:5.2f}  {marker}"
+        )
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""!
+@brief Subprocess stand-in with configurable per-executable latency.
+@details :class:`FakeProcessLayer` replaces ``subprocess.Popen`` and
+``subprocess.run`` while installed. Every spawn is recorded and then "runs"
+for the latency configured for its executable (``powershell``, ``reg``,
+``schtasks`` ...) before returning a canned exit code and output, so a
+benchmark measures how many processes a code path starts and how well it
+overlaps them, without running anything.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import PureWindowsPath
+from typing import Any
+
+DEFAULT_LATENCIES: Mapping[str, float] = {
+    "powershell": 0.35,
+    "pwsh": 0.35,
+    "wmic": 0.8,
+    "reg": 0.03,
+    "schtasks": 0.05,
+    "sc": 0.02,
+    "taskkill": 0.04,
+    "tasklist": 0.06,
+    "msiexec": 0.5,
+    "cscript": 0.2,
+    "cmd": 0.02,
+}
+"""!
+@brief Typical spawn-to-exit times in seconds for the tools Office Janitor runs.
+"""
+
+
+@dataclass
+class CannedResult:
+    """!
+    @brief Exit code and output returned for an executable.
+    """
+
+    returncode: int = 0
+    stdout: str = ""
+    stderr: str = ""
+
+
+@dataclass
+class FakeProcessLayer:
+    """!
+    @brief Configuration and call log for the patched ``subprocess`` functions.
+    """
+
+    latencies: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_LATENCIES))
+    default_latency: float = 0.01
+    results: dict[str, CannedResult] = field(default_factory=dict)
+    calls: list[list[str]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def executable(command: Sequence[str] | str) -> str:
+        """!
+        @brief Return the lower-case executable stem of ``command``.
+        """
+        if isinstance(command, str):
+            first = command.strip().split(" ", 1)[0]
+        else:
+            first = str(command[0]) if command else ""
+        return PureWindowsPath(first).stem.lower()
+
+    def latency(self, command: Sequence[str] | str) -> float:
+        return self.latencies.get(self.executable(command), self.default_latency)
+
+    def result(self, command: Sequence[str] | str) -> CannedResult:
+        return self.results.get(self.executable(command), CannedResult())
+
+    def record(self, command: Sequence[str] | str) -> None:
+        entry = [command] if isinstance(command, str) else [str(part) for part in command]
+        with self._lock:
+            self.calls.append(entry)
+
+    def spawn_counts(self) -> dict[str, int]:
+        """!
+        @brief Return how many times each executable was started.
+        """
+        counts: dict[str, int] = {}
+        with self._lock:
+            for command in self.calls:
+                name = self.executable(command)
+                counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    @contextmanager
+    def installed(self) -> Iterator[FakeProcessLayer]:
+        """!
+        @brief Patch ``subprocess.Popen`` and ``subprocess.run`` for the duration.
+        """
+        layer = self
+        original_popen = subprocess.Popen
+        original_run = subprocess.run
+
+        class _FakePopen:
+            _next_pid = 10_000
+
+            def __init__(self, args: Sequence[str] | str, *_args: Any, **kwargs: Any) -> None:
+                layer.record(args)
+                self.args = args
+                self._deadline = time.monotonic() + layer.latency(args)
+                self._result = layer.result(args)
+                self._text = bool(
+                    kwargs.get("text") or kwargs.get("universal_newlines") or kwargs.get("encoding")
+                )
+                self.returncode: int | None = None
+                _FakePopen._next_pid += 1
+                self.pid = _FakePopen._next_pid
+                self.stdout = None
+                self.stderr = None
+
+            def _output(self) -> tuple[Any, Any]:
+                if self._text:
+                    return self._result.stdout, self._result.stderr
+                return self._result.stdout.encode(), self._result.stderr.encode()
+
+            def poll(self) -> int | None:
+                if self.returncode is None and time.monotonic() >= self._deadline:
+                    self.returncode = self._result.returncode
+                return self.returncode
+
+            def wait(self, timeout: float | None = None) -> int:
+                remaining = self._deadline - time.monotonic()
+                if timeout is not None and remaining > timeout:
+                    time.sleep(timeout)
+                    raise subprocess.TimeoutExpired(self.args, timeout)
+                if remaining > 0:
+                    time.sleep(remaining)
+                self.returncode = self._result.returncode
+                return self.returncode
+
+            def communicate(
+                self, input: Any = None, timeout: float | None = None
+            ) -> tuple[Any, Any]:
+                self.wait(timeout)
+                return self._output()
+
+            def kill(self) -> None:
+                self._deadline = time.monotonic()
+                self._result = CannedResult(returncode=-9)
+
+            terminate = kill
+
+            def __enter__(self) -> _FakePopen:
+                return self
+
+            def __exit__(self, *_exc: object) -> None:
+                self.wait()
+
+        def _fake_run(args: Sequence[str] | str, *_args: Any, **kwargs: Any) -> Any:
+            proc = _FakePopen(args, **kwargs)
+            stdout, stderr = proc.communicate(timeout=kwargs.get("timeout"))
+            completed = subprocess.CompletedProcess(args, proc.returncode or 0, stdout, stderr)
+            if kwargs.get("check"):
+                completed.check_returncode()
+            return completed
+
+        subprocess.Popen = _FakePopen  # type: ignore[misc, assignment]
+        subprocess.run = _fake_run  # type: ignore[assignment]
+        try:
+            yield self
+        finally:
+            subprocess.Popen = original_popen  # type: ignore[misc]
+            subprocess.run = original_run
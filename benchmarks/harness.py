@@ -0,0 +1,254 @@
+"""!
+@brief Timing loop, result files and regression comparison for the benchmarks.
+@details :func:`prepare_environment` must run before anything imports
+``office_janitor``: it puts ``src`` on ``sys.path`` and registers one shared
+:class:`~benchmarks.synthetic_registry.SyntheticRegistry` as the ``winreg``
+module, so every module binds to the synthetic registry on Linux and Windows
+alike. :func:`run_benchmarks` times each :class:`Benchmark` and
+:func:`compare_reports` checks a new report against a stored baseline.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .fake_subprocess import FakeProcessLayer
+from .synthetic_registry import SyntheticRegistry
+
+REPORT_FORMAT = 1
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+
+_REGISTRY: SyntheticRegistry | None = None
+
+
+def install_registry(registry: SyntheticRegistry) -> None:
+    """!
+    @brief Register ``registry`` as ``winreg`` and rebind already-imported modules.
+    """
+
+    sys.modules["winreg"] = registry  # type: ignore[assignment]
+    for name, module in list(sys.modules.items()):
+        if name.startswith("office_janitor") and hasattr(module, "winreg"):
+            module.winreg = registry  # type: ignore[attr-defined]
+
+
+def prepare_environment() -> SyntheticRegistry:
+    """!
+    @brief Make ``office_janitor`` importable against the synthetic registry.
+    @returns The shared registry; repeated calls return the same instance.
+    """
+
+    global _REGISTRY
+    if str(SRC_PATH) not in sys.path:
+        sys.path.insert(0, str(SRC_PATH))
+    if _REGISTRY is None:
+        _REGISTRY = SyntheticRegistry()
+        install_registry(_REGISTRY)
+
+    from office_janitor import powershell_host, spinner
+
+    spinner.enable_spinner(False)
+    # PowerShell calls must reach the fake process layer, not a pooled host.
+    powershell_host.configure(enabled=False)
+    return _REGISTRY
+
+
+@dataclass
+class Workload:
+    """!
+    @brief Shared state handed to every benchmark's setup.
+    """
+
+    registry: SyntheticRegistry
+    processes: FakeProcessLayer
+    scratch: Path
+    scale: float = 1.0
+    cache: dict[str, Any] = field(default_factory=dict)
+    """Values computed once per run (inventory, plan) and reused by later benchmarks."""
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """!
+    @brief A named measurement.
+    @details ``setup`` runs untimed before each repetition and returns the
+    callable that is timed, so per-repetition fixtures (a fresh directory
+    tree, a restored registry subtree) never count against the result.
+    """
+
+    name: str
+    description: str
+    setup: Callable[[Workload], Callable[[], object]]
+
+
+@dataclass
+class BenchmarkResult:
+    """!
+    @brief Samples and call counts gathered for one :class:`Benchmark`.
+    """
+
+    name: str
+    description: str
+    samples: list[float]
+    spawns: dict[str, int] = field(default_factory=dict)
+    registry_calls: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "description": self.description,
+            "samples": [round(sample, 6) for sample in self.samples],
+            "min": round(min(self.samples), 6),
+            "median": round(statistics.median(self.samples), 6),
+            "mean": round(statistics.fmean(self.samples), 6),
+            "spawns": dict(sorted(self.spawns.items())),
+            "registry_calls": dict(sorted(self.registry_calls.items())),
+        }
+
+
+@contextlib.contextmanager
+def _quiet() -> Any:
+    """!
+    @brief Discard console output produced by the code under test.
+    """
+
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+            yield
+
+
+def run_benchmark(benchmark: Benchmark, workload: Workload, *, repeat: int) -> BenchmarkResult:
+    """!
+    @brief Time ``benchmark`` ``repeat`` times under the fake process layer.
+    @details Spawn and registry call counts are taken from the last repetition.
+    """
+
+    samples: list[float] = []
+    spawns: dict[str, int] = {}
+    registry_calls: dict[str, int] = {}
+    for _ in range(max(1, repeat)):
+        with _quiet():
+            target = benchmark.setup(workload)
+        workload.processes.calls.clear()
+        workload.registry.calls.clear()
+        with workload.processes.installed(), _quiet():
+            start = time.perf_counter()
+            target()
+            samples.append(time.perf_counter() - start)
+        spawns = workload.processes.spawn_counts()
+        registry_calls = dict(workload.registry.calls)
+    return BenchmarkResult(
+        name=benchmark.name,
+        description=benchmark.description,
+        samples=samples,
+        spawns=spawns,
+        registry_calls=registry_calls,
+    )
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    workload: Workload,
+    *,
+    repeat: int = 5,
+    progress: Callable[[BenchmarkResult], None] | None = None,
+) -> dict[str, Any]:
+    """!
+    @brief Run ``benchmarks`` in order and return a JSON-ready report.
+    """
+
+    results: dict[str, Any] = {}
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, workload, repeat=repeat)
+        results[benchmark.name] = result.to_dict()
+        if progress is not None:
+            progress(result)
+    return {
+        "format": REPORT_FORMAT,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": workload.scale,
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+def write_report(report: Mapping[str, Any], path: Path) -> None:
+    """!
+    @brief Write ``report`` to ``path`` as indented JSON.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    """!
+    @brief Read a report written by :func:`write_report`.
+    @throws ValueError When the file is not a benchmark report of a known format.
+    """
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("format") != REPORT_FORMAT:
+        raise ValueError(f"{path} is not a benchmark report (format {REPORT_FORMAT})")
+    return payload
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """!
+    @brief Baseline and current medians for one benchmark.
+    """
+
+    name: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+
+def compare_reports(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    *,
+    threshold: float = 0.25,
+    min_delta: float = 0.005,
+) -> list[Comparison]:
+    """!
+    @brief Compare the medians of benchmarks present in both reports.
+    @details A benchmark regresses when its median grows by more than
+    ``threshold`` (a fraction of the baseline) and by more than ``min_delta``
+    seconds; the absolute floor keeps millisecond-scale benchmarks from
+    failing on scheduler noise. Benchmarks missing from either side are
+    ignored.
+    """
+
+    comparisons: list[Comparison] = []
+    base_results = baseline.get("benchmarks", {})
+    for name, result in current.get("benchmarks", {}).items():
+        if name not in base_results:
+            continue
+        before = float(base_results[name]["median"])
+        after = float(result["median"])
+        delta = after - before
+        regressed = delta > before * threshold and delta > min_delta
+        comparisons.append(
+            Comparison(name=name, baseline=before, current=after, regressed=regressed)
+        )
+    return comparisons
@@ -0,0 +1,153 @@
+"""!
+@brief The benchmark definitions: detection, planning and scrub hot paths.
+@details Every benchmark runs against the machine populated into the shared
+synthetic registry by :func:`populate_workload`. ``office_janitor`` modules are
+imported inside the setup functions so :func:`harness.prepare_environment`
+has already registered the synthetic ``winreg`` by the time they load.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable
+from typing import Any
+
+from .harness import Benchmark, Workload
+from .synthetic_fs import TreeProfile, build_office_tree
+from .synthetic_registry import HKEY_CLASSES_ROOT, MachineProfile, populate_office_machine
+
+PLAN_OPTIONS: dict[str, object] = {"auto_all": True, "dry_run": True}
+"""!
+@brief Options for the planned run: remove everything detected, dry-run.
+"""
+
+_PUBLISHED_COMPONENTS = r"Installer\Components"
+_tree_counter = itertools.count()
+
+
+def populate_workload(workload: Workload) -> dict[str, Any]:
+    """!
+    @brief Build the synthetic machine for ``workload.scale``.
+    """
+
+    workload.registry.clear()
+    workload.cache.clear()
+    return populate_office_machine(workload.registry, MachineProfile().scaled(workload.scale))
+
+
+def _inventory(workload: Workload) -> dict[str, object]:
+    """!
+    @brief Return the inventory of the synthetic machine, detecting it once.
+    """
+
+    if "inventory" not in workload.cache:
+        from office_janitor import detect
+
+        with workload.processes.installed():
+            workload.cache["inventory"] = detect.gather_office_inventory()
+    return workload.cache["inventory"]
+
+
+def _plan(workload: Workload) -> list[dict[str, object]]:
+    """!
+    @brief Return the plan for :data:`PLAN_OPTIONS`, building it once.
+    """
+
+    if "plan" not in workload.cache:
+        from office_janitor import plan
+
+        workload.cache["plan"] = plan.build_plan(_inventory(workload), PLAN_OPTIONS)
+    return workload.cache["plan"]
+
+
+def _setup_gather(workload: Workload) -> Callable[[], object]:
+    from office_janitor import detect
+
+    def run() -> object:
+        workload.cache["inventory"] = detect.gather_office_inventory()
+        return workload.cache["inventory"]
+
+    return run
+
+
+def _setup_build_plan(workload: Workload) -> Callable[[], object]:
+    from office_janitor import plan
+
+    inventory = _inventory(workload)
+    return lambda: plan.build_plan(inventory, PLAN_OPTIONS)
+
+
+def _setup_published_components(workload: Workload) -> Callable[[], object]:
+    from office_janitor import registry_tools
+
+    registry = workload.registry
+    snapshot = workload.cache.get("published_components")
+    if snapshot is None:
+        snapshot = registry.snapshot(HKEY_CLASSES_ROOT, _PUBLISHED_COMPONENTS)
+        workload.cache["published_components"] = snapshot
+    else:
+        registry.restore(HKEY_CLASSES_ROOT, _PUBLISHED_COMPONENTS, snapshot)
+    return lambda: registry_tools.cleanup_published_components(dry_run=False)
+
+
+def _setup_remove_paths(workload: Workload) -> Callable[[], object]:
+    from office_janitor import fs_tools
+
+    base = workload.scratch / f"tree-{next(_tree_counter)}"
+    roots = build_office_tree(base, TreeProfile().scaled(workload.scale))
+    return lambda: fs_tools.remove_paths(roots)
+
+
+def _setup_execute_plan(workload: Workload) -> Callable[[], object]:
+    from office_janitor import scrub
+
+    plan_steps = _plan(workload)
+    inventory = _inventory(workload)
+    return lambda: scrub.execute_plan(plan_steps, dry_run=True, inventory=inventory)
+
+
+BENCHMARKS: tuple[Benchmark, ...] = (
+    Benchmark(
+        "gather_office_inventory",
+        "Full parallel detection against the synthetic registry",
+        _setup_gather,
+    ),
+    Benchmark(
+        "build_plan",
+        "Plan generation for auto-all removal of the detected inventory",
+        _setup_build_plan,
+    ),
+    Benchmark(
+        "cleanup_published_components",
+        "Scan and rewrite Installer\\Components (restored before each run)",
+        _setup_published_components,
+    ),
+    Benchmark(
+        "remove_paths",
+        "Delete freshly generated Office install trees",
+        _setup_remove_paths,
+    ),
+    Benchmark(
+        "execute_plan_dry_run",
+        "Dry-run execution of the auto-all plan",
+        _setup_execute_plan,
+    ),
+)
+"""!
+@brief All benchmarks in run order.
+"""
+
+
+def select(names: list[str] | None) -> list[Benchmark]:
+    """!
+    @brief Return the benchmarks named in ``names`` (all when empty).
+    @throws ValueError When a name does not match any benchmark.
+    """
+
+    if not names:
+        return list(BENCHMARKS)
+    by_name = {benchmark.name: benchmark for benchmark in BENCHMARKS}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    return [by_name[name] for name in names]
@@ -0,0 +1,97 @@
+"""!
+@brief Generated Office-like directory trees for filesystem benchmarks.
+@details :func:`build_office_tree` lays out ``Program Files``-style roots with
+nested application folders, many small files and a few larger ones, which is
+the shape :func:`office_janitor.fs_tools.remove_paths` spends its time on.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+_APP_FOLDERS = (
+    "root\\Office16",
+    "root\\Office16\\1033",
+    "root\\Office16\\ADDINS",
+    "root\\vfs\\ProgramFilesCommonX64\\Microsoft Shared\\OFFICE16",
+    "root\\vfs\\ProgramFilesX86\\Microsoft Office\\Office16",
+    "root\\Licenses16",
+    "root\\Templates\\1033",
+    "Updates\\Download\\PackageFiles",
+)
+
+
+@dataclass(frozen=True)
+class TreeProfile:
+    """!
+    @brief Shape of the tree produced by :func:`build_office_tree`.
+    """
+
+    roots: int = 2
+    """Top-level install roots (e.g. ``Microsoft Office`` and ``ClickToRun``)."""
+
+    files_per_folder: int = 60
+    """Small files written into each application folder."""
+
+    nesting: int = 3
+    """Extra levels of ``Resources\\<n>`` folders under every application folder."""
+
+    file_size: int = 512
+    """Bytes written to each small file."""
+
+    large_files: int = 4
+    """Files of ``large_file_size`` bytes per root (e.g. ``.cab`` payloads)."""
+
+    large_file_size: int = 1 << 20
+
+    def scaled(self, factor: float) -> TreeProfile:
+        """!
+        @brief Return a copy with the per-folder file count multiplied by ``factor``.
+        """
+        return TreeProfile(
+            roots=self.roots,
+            files_per_folder=max(1, int(self.files_per_folder * factor)),
+            nesting=self.nesting,
+            file_size=self.file_size,
+            large_files=self.large_files,
+            large_file_size=self.large_file_size,
+        )
+
+
+def build_office_tree(base: Path, profile: TreeProfile | None = None) -> list[Path]:
+    """!
+    @brief Create the synthetic install roots under ``base``.
+    @returns The top-level root directories, ready to pass to ``remove_paths``.
+    """
+
+    profile = profile or TreeProfile()
+    small = b"\0" * profile.file_size
+    large = b"\0" * profile.large_file_size
+    roots: list[Path] = []
+    for root_index in range(profile.roots):
+        root = base / f"Microsoft Office {root_index}"
+        roots.append(root)
+        for folder in _APP_FOLDERS:
+            current = root.joinpath(*folder.split("\\"))
+            for level in range(profile.nesting + 1):
+                current.mkdir(parents=True, exist_ok=True)
+                for file_index in range(profile.files_per_folder):
+                    (current / f"MSO{level}_{file_index:04d}.DLL").write_bytes(small)
+                current = current / "Resources" / str(level)
+        payload = root / "Updates" / "Download" / "PackageFiles"
+        for file_index in range(profile.large_files):
+            (payload / f"stream.x64.{file_index}.dat").write_bytes(large)
+    return roots
+
+
+def count_files(paths: list[Path]) -> int:
+    """!
+    @brief Count the regular files beneath ``paths``.
+    """
+    total = 0
+    for path in paths:
+        for _dirpath, _dirnames, filenames in os.walk(path):
+            total += len(filenames)
+    return total
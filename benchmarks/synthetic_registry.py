@@ -0,0 +1,522 @@
+"""!
+@brief In-memory registry implementing the ``winreg`` surface Office Janitor uses.
+@details :class:`SyntheticRegistry` stands in for the ``winreg`` module so the
+detection, planning and scrub code paths can be timed on any platform. Keys
+are case-insensitive, enumeration order is stable, ``QueryInfoKey`` reports a
+monotonically increasing last-write time, and enumeration results are cached
+per key so walking 100k ``Installer\\Components`` keys costs what a real
+registry walk costs rather than a sort per ``EnumKey`` call. WOW64 view flags
+are accepted and ignored; every view sees the same tree.
+
+:func:`populate_office_machine` fills a registry with a configurable number of
+Office and non-Office MSI products, ARP ``Uninstall`` entries, Windows
+Installer components and Published Components values.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+HKEY_CLASSES_ROOT = 0x80000000
+HKEY_CURRENT_USER = 0x80000001
+HKEY_LOCAL_MACHINE = 0x80000002
+HKEY_USERS = 0x80000003
+
+_HIVES = (HKEY_CLASSES_ROOT, HKEY_CURRENT_USER, HKEY_LOCAL_MACHINE, HKEY_USERS)
+
+_ERROR_ACCESS_DENIED = 5
+_ERROR_FILE_NOT_FOUND = 2
+_ERROR_NO_MORE_ITEMS = 259
+
+_FILETIME_BASE = 133_000_000_000_000_000
+"""!
+@brief Starting ``FILETIME`` for synthetic last-write times (a date in 2022).
+"""
+
+
+class _Key:
+    """!
+    @brief One registry key: named children, named values and a last-write time.
+    """
+
+    __slots__ = ("name", "children", "values", "modified", "_names", "_items")
+
+    def __init__(self, name: str, modified: int) -> None:
+        self.name = name
+        self.children: dict[str, _Key] = {}
+        self.values: dict[str, tuple[str, Any, int]] = {}
+        self.modified = modified
+        self._names: list[str] | None = None
+        self._items: list[tuple[str, Any, int]] | None = None
+
+    def subkey_names(self) -> list[str]:
+        names = self._names
+        if names is None:
+            names = self._names = sorted(
+                (child.name for child in self.children.values()), key=str.lower
+            )
+        return names
+
+    def value_items(self) -> list[tuple[str, Any, int]]:
+        items = self._items
+        if items is None:
+            items = self._items = sorted(self.values.values(), key=lambda item: item[0].lower())
+        return items
+
+
+@dataclass(frozen=True)
+class _Handle:
+    """!
+    @brief Open key handle returned by :meth:`SyntheticRegistry.OpenKey`.
+    """
+
+    hive: int
+    path: str
+    key: _Key
+
+
+def _split(path: str) -> list[str]:
+    return [segment for segment in str(path or "").split("\\") if segment]
+
+
+def _copy_tree(source: _Key) -> _Key:
+    """!
+    @brief Copy ``source`` and its descendants; list values are copied too.
+    """
+    root = _Key(source.name, source.modified)
+    stack = [(source, root)]
+    while stack:
+        original, copy = stack.pop()
+        copy.values = {
+            lowered: (name, list(data) if isinstance(data, list) else data, kind)
+            for lowered, (name, data, kind) in original.values.items()
+        }
+        for lowered, child in original.children.items():
+            child_copy = copy.children[lowered] = _Key(child.name, child.modified)
+            stack.append((child, child_copy))
+    return root
+
+
+class SyntheticRegistry:
+    """!
+    @brief ``winreg`` stand-in backed by an in-memory key tree.
+    @details Install it with :func:`benchmarks.harness.install_registry`; the
+    module-level ``HKEY_*``, ``KEY_*`` and ``REG_*`` constants mirror the real
+    values so code that ORs access masks behaves as it does on Windows.
+    """
+
+    HKEY_CLASSES_ROOT = HKEY_CLASSES_ROOT
+    HKEY_CURRENT_USER = HKEY_CURRENT_USER
+    HKEY_LOCAL_MACHINE = HKEY_LOCAL_MACHINE
+    HKEY_USERS = HKEY_USERS
+
+    KEY_QUERY_VALUE = 0x0001
+    KEY_SET_VALUE = 0x0002
+    KEY_ENUMERATE_SUB_KEYS = 0x0008
+    KEY_NOTIFY = 0x0010
+    KEY_READ = 0x20019
+    KEY_WRITE = 0x20006
+    KEY_ALL_ACCESS = 0xF003F
+    KEY_WOW64_64KEY = 0x0100
+    KEY_WOW64_32KEY = 0x0200
+
+    REG_NONE = 0
+    REG_SZ = 1
+    REG_EXPAND_SZ = 2
+    REG_BINARY = 3
+    REG_DWORD = 4
+    REG_MULTI_SZ = 7
+    REG_QWORD = 11
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._clock = itertools.count(_FILETIME_BASE, 10_000)
+        self._hives: dict[int, _Key] = {}
+        self.clear()
+
+    # ------------------------------------------------------------------
+    # Construction helpers
+    # ------------------------------------------------------------------
+    def clear(self) -> None:
+        """!
+        @brief Drop every key and reset the per-operation counters.
+        """
+        with self._lock:
+            self._hives = {hive: _Key("", next(self._clock)) for hive in _HIVES}
+            self.calls: dict[str, int] = {}
+
+    def add_key(self, hive: int, path: str, values: dict[str, Any] | None = None) -> None:
+        """!
+        @brief Create ``hive\\path`` (and parents) and merge ``values`` into it.
+        @details ``values`` maps names to data; the type is inferred as
+        ``REG_DWORD`` for ints, ``REG_MULTI_SZ`` for lists and ``REG_SZ``
+        otherwise. Pass ``(data, type)`` tuples to choose explicitly.
+        """
+        with self._lock:
+            key = self._create(self._hives[hive], _split(path))
+            for name, data in (values or {}).items():
+                if isinstance(data, tuple):
+                    data, kind = data
+                elif isinstance(data, bool) or not isinstance(data, (int, list)):
+                    kind = self.REG_SZ
+                else:
+                    kind = self.REG_DWORD if isinstance(data, int) else self.REG_MULTI_SZ
+                key.values[name.lower()] = (name, data, kind)
+            key._items = None
+
+    def snapshot(self, hive: int, path: str) -> _Key:
+        """!
+        @brief Return a detached copy of the ``hive\\path`` subtree.
+        @details Pair with :meth:`restore` to rerun a benchmark that writes to
+        the registry without repopulating the whole machine.
+        """
+        with self._lock:
+            return _copy_tree(self._find(hive, path).key)
+
+    def restore(self, hive: int, path: str, snapshot: _Key) -> None:
+        """!
+        @brief Replace the ``hive\\path`` subtree with a copy of ``snapshot``.
+        """
+        parts = _split(path)
+        with self._lock:
+            parent = self._create(self._hives[hive], parts[:-1])
+            parent.children[parts[-1].lower()] = _copy_tree(snapshot)
+            parent.modified = next(self._clock)
+            parent._names = None
+
+    def key_count(self) -> int:
+        """!
+        @brief Return the total number of keys across all hives.
+        """
+        stack = list(self._hives.values())
+        total = 0
+        while stack:
+            key = stack.pop()
+            total += len(key.children)
+            stack.extend(key.children.values())
+        return total
+
+    # ------------------------------------------------------------------
+    # Internal tree access
+    # ------------------------------------------------------------------
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def _base(self, root: Any) -> _Key:
+        if isinstance(root, _Handle):
+            return root.key
+        try:
+            return self._hives[int(root)]
+        except (KeyError, TypeError, ValueError):
+            raise OSError(6, "The handle is invalid") from None
+
+    def _root_identity(self, root: Any) -> tuple[int, str]:
+        if isinstance(root, _Handle):
+            return root.hive, root.path
+        return int(root), ""
+
+    def _find(self, root: Any, sub_key: str) -> _Handle:
+        key = self._base(root)
+        hive, base = self._root_identity(root)
+        parts = _split(sub_key)
+        for part in parts:
+            child = key.children.get(part.lower())
+            if child is None:
+                raise FileNotFoundError(
+                    _ERROR_FILE_NOT_FOUND, "The system cannot find the file specified"
+                )
+            key = child
+        path = "\\".join(part for part in (base, "\\".join(parts)) if part)
+        return _Handle(hive, path, key)
+
+    def _create(self, key: _Key, parts: Iterable[str]) -> _Key:
+        for part in parts:
+            child = key.children.get(part.lower())
+            if child is None:
+                child = key.children[part.lower()] = _Key(part, next(self._clock))
+                key.modified = next(self._clock)
+                key._names = None
+            key = child
+        return key
+
+    # ------------------------------------------------------------------
+    # winreg surface
+    # ------------------------------------------------------------------
+    def ConnectRegistry(self, _computer: str | None, key: int) -> _Handle:
+        self._count("ConnectRegistry")
+        return self._find(key, "")
+
+    def OpenKey(self, key: Any, sub_key: str, reserved: int = 0, access: int = KEY_READ) -> _Handle:
+        self._count("OpenKey")
+        return self._find(key, sub_key)
+
+    OpenKeyEx = OpenKey
+
+    def CreateKey(self, key: Any, sub_key: str) -> _Handle:
+        self._count("CreateKey")
+        with self._lock:
+            hive, base = self._root_identity(key)
+            parts = _split(sub_key)
+            node = self._create(self._base(key), parts)
+        path = "\\".join(part for part in (base, "\\".join(parts)) if part)
+        return _Handle(hive, path, node)
+
+    def CreateKeyEx(
+        self, key: Any, sub_key: str, reserved: int = 0, access: int = KEY_WRITE
+    ) -> _Handle:
+        return self.CreateKey(key, sub_key)
+
+    def CloseKey(self, _handle: Any) -> None:
+        return None
+
+    def EnumKey(self, key: Any, index: int) -> str:
+        self._count("EnumKey")
+        names = self._base(key).subkey_names()
+        if index >= len(names):
+            raise OSError(_ERROR_NO_MORE_ITEMS, "No more data is available")
+        return names[index]
+
+    def EnumValue(self, key: Any, index: int) -> tuple[str, Any, int]:
+        self._count("EnumValue")
+        items = self._base(key).value_items()
+        if index >= len(items):
+            raise OSError(_ERROR_NO_MORE_ITEMS, "No more data is available")
+        return items[index]
+
+    def QueryValueEx(self, key: Any, value_name: str | None) -> tuple[Any, int]:
+        self._count("QueryValueEx")
+        entry = self._base(key).values.get((value_name or "").lower())
+        if entry is None:
+            raise FileNotFoundError(
+                _ERROR_FILE_NOT_FOUND, "The system cannot find the file specified"
+            )
+        return entry[1], entry[2]
+
+    def QueryInfoKey(self, key: Any) -> tuple[int, int, int]:
+        self._count("QueryInfoKey")
+        node = self._base(key)
+        return len(node.children), len(node.values), node.modified
+
+    def SetValueEx(self, key: Any, value_name: str | None, reserved: int, kind: int, value: Any):
+        self._count("SetValueEx")
+        name = value_name or ""
+        with self._lock:
+            node = self._base(key)
+            node.values[name.lower()] = (name, value, kind)
+            node.modified = next(self._clock)
+            node._items = None
+
+    def DeleteValue(self, key: Any, value: str | None) -> None:
+        self._count("DeleteValue")
+        with self._lock:
+            node = self._base(key)
+            if node.values.pop((value or "").lower(), None) is None:
+                raise FileNotFoundError(
+                    _ERROR_FILE_NOT_FOUND, "The system cannot find the file specified"
+                )
+            node.modified = next(self._clock)
+            node._items = None
+
+    def DeleteKey(self, key: Any, sub_key: str) -> None:
+        self._count("DeleteKey")
+        parts = _split(sub_key)
+        if not parts:
+            raise PermissionError(_ERROR_ACCESS_DENIED, "Access is denied")
+        with self._lock:
+            parent = self._find(key, "\\".join(parts[:-1])).key
+            child = parent.children.get(parts[-1].lower())
+            if child is None:
+                raise FileNotFoundError(
+                    _ERROR_FILE_NOT_FOUND, "The system cannot find the file specified"
+                )
+            if child.children:
+                raise PermissionError(_ERROR_ACCESS_DENIED, "Access is denied")
+            del parent.children[parts[-1].lower()]
+            parent.modified = next(self._clock)
+            parent._names = None
+
+    def DeleteKeyEx(self, key: Any, sub_key: str, access: int = 0, reserved: int = 0) -> None:
+        self.DeleteKey(key, sub_key)
+
+
+# ----------------------------------------------------------------------
+# Population
+# ----------------------------------------------------------------------
+
+_UNINSTALL_ROOT = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+_UNINSTALL_ROOT_WOW = r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
+_USERDATA_ROOT = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Installer\UserData\S-1-5-18"
+_CLASSES_PRODUCTS_ROOT = r"SOFTWARE\Classes\Installer\Products"
+_PUBLISHED_COMPONENTS_ROOT = r"Installer\Components"
+_C2R_CONFIGURATION = r"SOFTWARE\Microsoft\Office\ClickToRun\Configuration"
+_C2R_CDN_URL = "http://officecdn.microsoft.com/pr/492350f6-3a01-4f97-b9c0-c7c6ddf67d60"
+
+_OFFICE_SKUS = ("0011", "0016", "0019", "001A", "001B", "0051", "007E", "008C", "008F", "00DD")
+_OFFICE_NAMES = (
+    "Microsoft Office Professional Plus 2016",
+    "Microsoft Office Standard 2016",
+    "Microsoft Access 2016",
+    "Microsoft Excel 2016",
+    "Microsoft PowerPoint 2016",
+    "Microsoft Publisher 2016",
+    "Microsoft Outlook 2016",
+    "Microsoft Word 2016",
+    "Microsoft Visio Professional 2016",
+    "Microsoft Project Professional 2016",
+)
+
+
+@dataclass(frozen=True)
+class MachineProfile:
+    """!
+    @brief Size of the synthetic machine built by :func:`populate_office_machine`.
+    """
+
+    office_products: int = 10
+    """Office MSI products (Office 2016 style ``...0000000FF1CE`` codes)."""
+
+    other_products: int = 2_000
+    """Non-Office MSI products; each gets an ``Uninstall`` entry."""
+
+    components: int = 100_000
+    """``Installer\\Components`` keys, spread across all products."""
+
+    office_component_ratio: float = 0.3
+    """Share of Published Components values that reference an Office product."""
+
+    click_to_run: bool = True
+    """Whether to register a Click-to-Run configuration key."""
+
+    seed: int = 1729
+    """Random seed; the same profile always yields the same registry."""
+
+    def scaled(self, factor: float) -> MachineProfile:
+        """!
+        @brief Return a copy with product and component counts multiplied by ``factor``.
+        """
+        return MachineProfile(
+            office_products=max(1, int(self.office_products * factor)),
+            other_products=max(1, int(self.other_products * factor)),
+            components=max(1, int(self.components * factor)),
+            office_component_ratio=self.office_component_ratio,
+            click_to_run=self.click_to_run,
+            seed=self.seed,
+        )
+
+
+def _guid(rng: random.Random) -> str:
+    raw = f"{rng.getrandbits(128):032X}"
+    return f"{{{raw[:8]}-{raw[8:12]}-{raw[12:16]}-{raw[16:20]}-{raw[20:]}}}"
+
+
+def _office_guid(index: int) -> str:
+    sku = _OFFICE_SKUS[index % len(_OFFICE_SKUS)]
+    return f"{{90160000-{sku}-{index // len(_OFFICE_SKUS):04X}-1000-0000000FF1CE}}"
+
+
+def _iter_product_codes(profile: MachineProfile, rng: random.Random) -> Iterator[tuple[str, bool]]:
+    for index in range(profile.office_products):
+        yield _office_guid(index), True
+    for _ in range(profile.other_products):
+        yield _guid(rng), False
+
+
+def populate_office_machine(
+    registry: SyntheticRegistry, profile: MachineProfile | None = None
+) -> dict[str, Any]:
+    """!
+    @brief Fill ``registry`` with an Office-like machine described by ``profile``.
+    @returns Summary of what was created (product codes, component count).
+    """
+
+    # Imported lazily so the registry can be installed before the package loads.
+    from office_janitor import guid_utils
+
+    profile = profile or MachineProfile()
+    rng = random.Random(profile.seed)
+    hklm = HKEY_LOCAL_MACHINE
+    hkcr = HKEY_CLASSES_ROOT
+
+    products = list(_iter_product_codes(profile, rng))
+    office_codes = [code for code, office in products if office]
+    other_codes = [code for code, office in products if not office]
+
+    for position, (code, office) in enumerate(products):
+        packed = guid_utils.compress_guid(code)
+        if office:
+            name = _OFFICE_NAMES[position % len(_OFFICE_NAMES)]
+            publisher = "Microsoft Corporation"
+            location = r"C:\Program Files\Microsoft Office"
+        else:
+            name = f"Contoso Line-of-Business App {position:05d}"
+            publisher = "Contoso Ltd."
+            location = rf"C:\Program Files\Contoso\App{position:05d}"
+        arp = {
+            "DisplayName": name,
+            "DisplayVersion": "16.0.4266.1001",
+            "Publisher": publisher,
+            "InstallLocation": location,
+            "UninstallString": f"MsiExec.exe /X{code}",
+            "WindowsInstaller": 1,
+        }
+        root = _UNINSTALL_ROOT if position % 3 else _UNINSTALL_ROOT_WOW
+        registry.add_key(hklm, f"{root}\\{code}", arp)
+        registry.add_key(
+            hklm,
+            f"{_USERDATA_ROOT}\\Products\\{packed}\\InstallProperties",
+            {
+                "DisplayName": name,
+                "DisplayVersion": "16.0.4266.1001",
+                "InstallLocation": location,
+                "LocalPackage": rf"C:\Windows\Installer\{position:08x}.msi",
+            },
+        )
+        registry.add_key(
+            hklm,
+            f"{_CLASSES_PRODUCTS_ROOT}\\{packed}",
+            {"ProductName": name, "Version": 0x10000000 | 4266},
+        )
+
+    for index in range(profile.components):
+        component = _guid(rng)
+        packed_component = guid_utils.compress_guid(component)
+        office = rng.random() < profile.office_component_ratio and office_codes
+        owner = rng.choice(office_codes) if office else rng.choice(other_codes)
+        packed_owner = guid_utils.compress_guid(owner)
+        registry.add_key(
+            hklm,
+            f"{_USERDATA_ROOT}\\Components\\{packed_component}",
+            {packed_owner: rf"C:\Program Files\Shared\{index:06d}.dll"},
+        )
+        entries = [guid_utils.squish_guid(owner) + "ENU_Feature>"]
+        if office and other_codes:
+            entries.append(guid_utils.squish_guid(rng.choice(other_codes)) + "Shared>")
+        registry.add_key(
+            hkcr,
+            f"{_PUBLISHED_COMPONENTS_ROOT}\\{packed_component}",
+            {"": (entries, SyntheticRegistry.REG_MULTI_SZ)},
+        )
+
+    if profile.click_to_run:
+        registry.add_key(
+            hklm,
+            _C2R_CONFIGURATION,
+            {
+                "ProductReleaseIds": "O365ProPlusRetail",
+                "Platform": "x64",
+                "VersionToReport": "16.0.17928.20156",
+                "CDNBaseUrl": _C2R_CDN_URL,
+                "InstallationPath": r"C:\Program Files\Microsoft Office",
+            },
+        )
+
+    return {
+        "office_products": office_codes,
+        "other_products": len(other_codes),
+        "components": profile.components,
+    }
@@ -11,8 +11,7 @@ import logging
 import subprocess
 from typing import TYPE_CHECKING
 
-from . import constants
-from .encoding_helpers import SUBPROCESS_ENCODING, SUBPROCESS_ERRORS
+from . import constants, exec_utils
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -27,27 +26,26 @@ __all__ = [
 _logger = logging.getLogger(__name__)
 
 
-def _run_powershell(
-    command: str,
-    *,
-    capture_output: bool = True,
-    timeout: int = 120,
-) -> subprocess.CompletedProcess[str]:
+def _run_powershell(command: str, *, timeout: int = 120) -> exec_utils.CommandResult:
     """!
-    @brief Execute a PowerShell command.
+    @brief Execute a PowerShell command through :func:`exec_utils.run_command`.
+    @details The call is logged like every other command and runs on a pooled
+    PowerShell host when one is available.
     @param command The PowerShell command to execute.
-    @param capture_output Whether to capture stdout/stderr.
     @param timeout Timeout in seconds.
-    @returns CompletedProcess result.
+    @returns CommandResult with the decoded output.
+    @throws subprocess.TimeoutExpired When the command exceeded ``timeout``.
+    @throws OSError When PowerShell could not be started.
     """
-    return subprocess.run(
-        ["powershell", "-NoProfile", "-NonInteractive", "-Command", command],
-        capture_output=capture_output,
-        encoding=SUBPROCESS_ENCODING,
-        errors=SUBPROCESS_ERRORS,
-        timeout=timeout,
-        check=False,
-    )
+    command_list = ["powershell", "-NoProfile", "-NonInteractive", "-Command", command]
+    result = exec_utils.run_command(command_list, event="appx_powershell", timeout=timeout)
+    if result.timed_out:
+        raise subprocess.TimeoutExpired(
+            command_list, timeout, output=result.stdout, stderr=result.stderr
+        )
+    if result.error:
+        raise OSError(result.error)
+    return result
 
 
 def detect_office_appx_packages() -> list[dict[str, str]]:
@@ -13,7 +13,14 @@ from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
-from . import command_runner, constants, logging_ext, registry_tools, tasks_services
+from . import (
+    command_runner,
+    constants,
+    logging_ext,
+    registry_tools,
+    removal_watch,
+    tasks_services,
+)
 
 # Re-export ODT and integrator functionality for backwards compatibility
 from .c2r_integrator import (  # noqa: F401
@@ -107,12 +114,12 @@ C2R_RETRY_DELAY = 10.0
 
 C2R_VERIFICATION_ATTEMPTS = 3
 """!
-@brief Number of verification probes issued after uninstall commands complete.
+@brief Verification window, in probe slots of :data:`C2R_VERIFICATION_DELAY`.
 """
 
 C2R_VERIFICATION_DELAY = 5.0
 """!
-@brief Delay between verification probes for Click-to-Run removal.
+@brief Longest wait between verification probes for Click-to-Run removal.
 """
 
 _C2R_RELEASE_LOOKUP = {key.lower(): key for key in constants.C2R_PRODUCT_RELEASES.keys()}
@@ -364,30 +371,46 @@ def _install_paths_present(target: _C2RTarget) -> bool:
 
 def _await_removal(target: _C2RTarget) -> bool:
     """!
-    @brief Poll registry and filesystem to confirm Click-to-Run removal.
+    @brief Confirm Click-to-Run removal from the registry and filesystem.
+    @details Waits on the parent keys of the uninstall handles through
+    :mod:`removal_watch`, polling the install paths adaptively in between.
     """
     human_logger = logging_ext.get_human_logger()
     machine_logger = logging_ext.get_machine_logger()
+    state = {"registry": True, "filesystem": True}
+
+    def _probe() -> bool:
+        state["registry"] = _handles_present(target)
+        state["filesystem"] = _install_paths_present(target)
+        return state["registry"] or state["filesystem"]
 
-    for attempt in range(1, C2R_VERIFICATION_ATTEMPTS + 1):
-        registry_present = _handles_present(target)
-        filesystem_present = _install_paths_present(target)
+    def _record(_: removal_watch.RemovalTarget, attempt: int, present: bool) -> None:
         machine_logger.info(
             "c2r_uninstall_verify",
             extra={
                 "event": "c2r_uninstall_verify",
                 "release_ids": list(target.release_ids) or None,
                 "attempt": attempt,
-                "registry_present": registry_present,
-                "filesystem_present": filesystem_present,
+                "registry_present": state["registry"],
+                "filesystem_present": state["filesystem"],
             },
         )
-        if not registry_present and not filesystem_present:
+        if not present:
             human_logger.info("Confirmed Click-to-Run removal for %s", target.display_name)
-            return True
-        if attempt < C2R_VERIFICATION_ATTEMPTS:
-            time.sleep(C2R_VERIFICATION_DELAY)
-    return False
+
+    watch_keys: list[tuple[int, str]] = []
+    for handle in target.uninstall_handles:
+        parsed = _parse_registry_handle(handle)
+        if parsed:
+            watch_keys.append((parsed[0], removal_watch.parent_key(parsed[1])))
+
+    confirmed = removal_watch.await_removals(
+        [removal_watch.RemovalTarget(target.display_name, _probe, watch_keys)],
+        budget=C2R_VERIFICATION_DELAY * max(0, C2R_VERIFICATION_ATTEMPTS - 1),
+        max_interval=C2R_VERIFICATION_DELAY,
+        on_probe=_record,
+    )
+    return confirmed.get(target.display_name, False)
 
 
 def _find_existing_path(candidates: Sequence[Path]) -> Path | None:
@@ -551,6 +574,7 @@ def uninstall_products(
                 timeout=C2R_TIMEOUT,
                 dry_run=dry_run,
                 human_message=message,
+                stream_output=True,
                 extra={
                     "release_ids": list(target.release_ids) or None,
                     "attempt": attempt,
@@ -610,6 +634,7 @@ def uninstall_products(
                 timeout=C2R_TIMEOUT,
                 dry_run=dry_run,
                 human_message=message,
+                stream_output=True,
                 extra={
                     "release_id": release_id,
                     "executable": str(setup_path),
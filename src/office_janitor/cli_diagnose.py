@@ -17,6 +17,7 @@ OUTPUT FORMATS:
   --plan FILE           Save detailed action plan as JSON
   --json                Output structured events to stdout
   --verbose             Increase detail level (-v, -vv, -vvv)
+  --refresh             Re-probe instead of reusing the cached inventory
 
 LEGACY MODE FLAGS:
   --diagnose            Emit inventory and plan without making changes
@@ -75,3 +76,8 @@ def add_diagnose_subcommand_options(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Check for available updates.",
     )
+    diag_opts.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the cached inventory in the log directory and probe everything.",
+    )
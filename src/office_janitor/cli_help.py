@@ -9,6 +9,7 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 # Import subcommand-specific options
@@ -416,6 +417,7 @@ def add_legacy_options(parser: argparse.ArgumentParser) -> argparse.ArgumentPars
     # Output & Logging Options (subset not already in global)
     parser.add_argument("--plan", metavar="OUT", help=argparse.SUPPRESS)
     parser.add_argument("--logdir", metavar="DIR", help=argparse.SUPPRESS)
+    parser.add_argument("--trace", metavar="FILE", help=argparse.SUPPRESS)
     parser.add_argument("--backup", metavar="DIR", help=argparse.SUPPRESS)
     parser.add_argument("--timeout", metavar="SEC", type=int, help=argparse.SUPPRESS)
 
@@ -423,6 +425,7 @@ def add_legacy_options(parser: argparse.ArgumentParser) -> argparse.ArgumentPars
     parser.add_argument("--tui-compact", action="store_true", help=argparse.SUPPRESS)
     parser.add_argument("--tui-refresh", metavar="MS", type=int, help=argparse.SUPPRESS)
     parser.add_argument("--limited-user", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--refresh", action="store_true", help=argparse.SUPPRESS)
 
     # Retry & Resilience Options
     parser.add_argument("--retries", type=int, default=None, metavar="N", help=argparse.SUPPRESS)
@@ -756,6 +759,16 @@ def add_scrub_options(parser: argparse.ArgumentParser) -> argparse.ArgumentParse
         metavar="N",
         help="Maximum uninstall/re-detect passes (alias for --passes).",
     )
+    scrub.add_argument(
+        "--step-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Run independent plan steps concurrently on N workers, following step "
+            "dependencies (default: 1, sequential)."
+        ),
+    )
     scrub.add_argument(
         "--skip-uninstall",
         action="store_true",
@@ -997,6 +1010,11 @@ def add_output_options(
         action="store_true",
         help="Mirror structured events to stdout.",
     )
+    output.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Record timing spans and write a Chrome trace (open in Perfetto).",
+    )
     output.add_argument(
         "--verbose",
         "-v",
@@ -1369,6 +1387,22 @@ def add_advanced_options(parser: argparse.ArgumentParser) -> argparse.ArgumentPa
         action="store_true",
         help="Skip verification probes after uninstall.",
     )
+    advanced.add_argument(
+        "--deep-probe",
+        action="store_true",
+        help=(
+            "Also query Win32_Product via WMI/PowerShell during MSI detection. "
+            "Slow (typically 1-3 minutes); the registry probe is used by default."
+        ),
+    )
+    advanced.add_argument(
+        "--refresh",
+        action="store_true",
+        help=(
+            "Ignore the cached inventory in the log directory and probe every section. "
+            "Unchanged sections are otherwise reused between runs."
+        ),
+    )
     advanced.add_argument(
         "--schedule-reboot",
         action="store_true",
@@ -1414,64 +1448,67 @@ def add_advanced_options(parser: argparse.ArgumentParser) -> argparse.ArgumentPa
     return parser
 
 
-def build_arg_parser(version_info: dict[str, str] | None = None) -> argparse.ArgumentParser:
-    """!
-    @brief Create the top-level argument parser with subcommands and all CLI options.
-    @param version_info Optional version metadata dict with 'version' and 'build' keys.
-    @returns Configured ArgumentParser instance.
-    @details Supports three operation modes via subcommands:
-    - install: Deploy Office via ODT presets or custom configurations
-    - repair: Fix broken Office installations
-    - remove: Uninstall Office and clean up residual artifacts
+# ---------------------------------------------------------------------------
+# Subcommand Parsers
+# ---------------------------------------------------------------------------
 
-    Legacy flags (--auto-all, --auto-repair, etc.) are preserved for backward compatibility.
+
+class LazySubParsersAction(argparse._SubParsersAction):  # type: ignore[type-arg]
+    """!
+    @brief Subparsers action that fills in a subcommand's options on first use.
+    @details Subcommands registered with :meth:`add_lazy_parser` start as empty
+    parsers; their builder runs only when the subcommand is selected on the
+    command line (or when :meth:`build` is called), so parsing ``--version`` or
+    one subcommand does not pay for constructing all of the others.
     """
-    parser = argparse.ArgumentParser(
-        prog=PROGRAM_NAME,
-        add_help=False,  # We'll add custom help action
-        description=PROGRAM_DESCRIPTION,
-        epilog=EPILOG_TEXT,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        allow_abbrev=False,  # Disable prefix matching to avoid ambiguous flags
-    )
 
-    # Add custom help action that pauses before exit
-    parser.add_argument(
-        "-h",
-        "--help",
-        action=HelpActionWithPause,
-        help="show this help message and exit",
-    )
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._builders: dict[str, Callable[[argparse.ArgumentParser], None]] = {}
 
-    if version_info:
-        parser.add_argument(
-            "-V",
-            "--version",
-            action=VersionActionWithPause,
-            version=f"{version_info.get('version', '0.0.0')} ({version_info.get('build', 'dev')})",
-        )
+    def add_lazy_parser(
+        self,
+        name: str,
+        builder: Callable[[argparse.ArgumentParser], None],
+        **kwargs: Any,
+    ) -> argparse.ArgumentParser:
+        """!
+        @brief Register ``name`` with ``builder`` deferred until it is needed.
+        """
+        subparser = self.add_parser(name, **kwargs)
+        self._builders[name] = builder
+        return subparser
+
+    def build(self, name: str) -> argparse.ArgumentParser:
+        """!
+        @brief Return the fully built parser for subcommand ``name``.
+        """
+        subparser = self._name_parser_map[name]
+        builder = self._builders.pop(name, None)
+        if builder is not None:
+            builder(subparser)
+        return subparser
 
-    # ---------------------------------------------------------------------------
-    # Subcommands: install, repair, remove
-    # ---------------------------------------------------------------------------
-    subparsers = parser.add_subparsers(
-        dest="command",
-        title="operation modes",
-        description="Choose an operation mode (or use legacy flags for backward compatibility)",
-        metavar="<command>",
-    )
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        if values and values[0] in self._name_parser_map:
+            self.build(values[0])
+        super().__call__(parser, namespace, values, option_string)
 
-    # ----- INSTALL subcommand -----
-    install_parser = subparsers.add_parser(
-        "install",
-        help="Deploy Office via ODT presets or custom configurations",
-        description="Install Microsoft Office using the Office Deployment Tool (ODT).",
-        epilog=INSTALL_EPILOG,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    install_parser.add_argument("-h", "--help", action=HelpActionWithPause)
-    install_parser.set_defaults(show_help=install_parser)
+
+def _add_subcommand_help(parser: argparse.ArgumentParser, epilog: str) -> None:
+    parser.epilog = epilog
+    parser.add_argument("-h", "--help", action=HelpActionWithPause)
+    parser.set_defaults(show_help=parser)
+
+
+def _build_install_parser(install_parser: argparse.ArgumentParser) -> None:
+    _add_subcommand_help(install_parser, INSTALL_EPILOG)
     add_install_subcommand_options(install_parser)
     add_core_options(install_parser)
     add_output_options(install_parser)
@@ -1479,17 +1516,9 @@ def build_arg_parser(version_info: dict[str, str] | None = None) -> argparse.Arg
     add_retry_options(install_parser)
     add_advanced_options(install_parser)
 
-    # ----- REPAIR subcommand -----
-    repair_parser = subparsers.add_parser(
-        "repair",
-        help="Fix broken Office installations (quick or full repair)",
-        description="Repair Microsoft Office installations using various methods.",
-        epilog=REPAIR_EPILOG,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    repair_parser.add_argument("-h", "--help", action=HelpActionWithPause)
-    repair_parser.set_defaults(show_help=repair_parser)
+
+def _build_repair_parser(repair_parser: argparse.ArgumentParser) -> None:
+    _add_subcommand_help(repair_parser, REPAIR_EPILOG)
     add_repair_subcommand_options(repair_parser)
     add_core_options(repair_parser)
     add_output_options(repair_parser, include_timeout=False)  # Timeout already in repair opts
@@ -1497,17 +1526,9 @@ def build_arg_parser(version_info: dict[str, str] | None = None) -> argparse.Arg
     add_retry_options(repair_parser)
     add_advanced_options(repair_parser)
 
-    # ----- REMOVE subcommand -----
-    remove_parser = subparsers.add_parser(
-        "remove",
-        help="Uninstall Office and clean up residual artifacts",
-        description="Remove Microsoft Office installations and scrub leftover artifacts.",
-        epilog=REMOVE_EPILOG,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    remove_parser.add_argument("-h", "--help", action=HelpActionWithPause)
-    remove_parser.set_defaults(show_help=remove_parser)
+
+def _build_remove_parser(remove_parser: argparse.ArgumentParser) -> None:
+    _add_subcommand_help(remove_parser, REMOVE_EPILOG)
     add_remove_subcommand_options(remove_parser)
     add_core_options(remove_parser, include_passes=False)  # Passes already in remove opts
     add_scrub_options(remove_parser)
@@ -1520,97 +1541,170 @@ def build_arg_parser(version_info: dict[str, str] | None = None) -> argparse.Arg
     add_offscrub_options(remove_parser)
     add_advanced_options(remove_parser)
 
-    # ----- DIAGNOSE subcommand -----
-    diagnose_parser = subparsers.add_parser(
-        "diagnose",
-        help="Detect and report Office installations without making changes",
-        description="Scan the system for Office installations and generate a diagnostic report.",
-        epilog=DIAGNOSE_EPILOG,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    diagnose_parser.add_argument("-h", "--help", action=HelpActionWithPause)
-    diagnose_parser.set_defaults(show_help=diagnose_parser)
+
+def _build_diagnose_parser(diagnose_parser: argparse.ArgumentParser) -> None:
+    _add_subcommand_help(diagnose_parser, DIAGNOSE_EPILOG)
     add_diagnose_subcommand_options(diagnose_parser)
     add_output_options(diagnose_parser)
     add_tui_options(diagnose_parser)
 
-    # ----- ODT subcommand -----
-    odt_parser = subparsers.add_parser(
-        "odt",
-        help="Build and manage Office Deployment Tool XML configurations",
-        description="Generate ODT configuration files for Office installation/removal.",
-        epilog=ODT_EPILOG,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    odt_parser.add_argument("-h", "--help", action=HelpActionWithPause)
-    odt_parser.set_defaults(show_help=odt_parser)
+
+def _build_odt_parser(odt_parser: argparse.ArgumentParser) -> None:
+    _add_subcommand_help(odt_parser, ODT_EPILOG)
     add_odt_subcommand_options(odt_parser)
     # ODT has own --output, --stdout options; no common output options
     add_tui_options(odt_parser)
 
-    # ----- OFFSCRUB subcommand -----
-    offscrub_parser = subparsers.add_parser(
-        "offscrub",
-        help="OffScrub-style deep removal of Office installations",
-        description="Perform thorough Office removal using OffScrub techniques.",
-        epilog=OFFSCRUB_EPILOG,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    offscrub_parser.add_argument("-h", "--help", action=HelpActionWithPause)
-    offscrub_parser.set_defaults(show_help=offscrub_parser)
+
+def _build_offscrub_parser(offscrub_parser: argparse.ArgumentParser) -> None:
+    _add_subcommand_help(offscrub_parser, OFFSCRUB_EPILOG)
     add_offscrub_subcommand_options(offscrub_parser)
     # OffScrub has own --quiet; no common output options
     add_tui_options(offscrub_parser)
     add_advanced_options(offscrub_parser)
 
-    # ----- C2R subcommand -----
-    c2r_parser = subparsers.add_parser(
-        "c2r",
-        help="Direct Click-to-Run operations passthrough",
-        description="Execute Click-to-Run operations directly via OfficeClickToRun.exe.",
-        epilog=C2R_EPILOG,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    c2r_parser.add_argument("-h", "--help", action=HelpActionWithPause)
-    c2r_parser.set_defaults(show_help=c2r_parser)
+
+def _build_c2r_parser(c2r_parser: argparse.ArgumentParser) -> None:
+    _add_subcommand_help(c2r_parser, C2R_EPILOG)
     add_c2r_subcommand_options(c2r_parser)
     # C2R has own --timeout, passthrough args; no common output options
     add_tui_options(c2r_parser)
 
-    # ----- LICENSE subcommand -----
-    license_parser = subparsers.add_parser(
-        "license",
-        help="Manage Office licensing and activation",
-        description="View, clean, and manage Office licensing information.",
-        epilog=LICENSE_EPILOG,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    license_parser.add_argument("-h", "--help", action=HelpActionWithPause)
-    license_parser.set_defaults(show_help=license_parser)
+
+def _build_license_parser(license_parser: argparse.ArgumentParser) -> None:
+    _add_subcommand_help(license_parser, LICENSE_EPILOG)
     add_license_subcommand_options(license_parser)
     # License has own --backup, --export; no common output options
     add_tui_options(license_parser)
 
-    # ----- CONFIG subcommand -----
-    config_parser = subparsers.add_parser(
-        "config",
-        help="Generate and manage configuration files",
-        description="Generate Office Janitor configuration files interactively or from templates.",
-        epilog=CONFIG_EPILOG,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    config_parser.add_argument("-h", "--help", action=HelpActionWithPause)
-    config_parser.set_defaults(show_help=config_parser)
+
+def _build_config_parser(config_parser: argparse.ArgumentParser) -> None:
+    _add_subcommand_help(config_parser, CONFIG_EPILOG)
     add_config_subcommand_options(config_parser)
     # Config has own --output, --json; no common output options
     add_tui_options(config_parser)
 
+
+_SUBCOMMANDS: tuple[tuple[str, str, str, Callable[[argparse.ArgumentParser], None]], ...] = (
+    (
+        "install",
+        "Deploy Office via ODT presets or custom configurations",
+        "Install Microsoft Office using the Office Deployment Tool (ODT).",
+        _build_install_parser,
+    ),
+    (
+        "repair",
+        "Fix broken Office installations (quick or full repair)",
+        "Repair Microsoft Office installations using various methods.",
+        _build_repair_parser,
+    ),
+    (
+        "remove",
+        "Uninstall Office and clean up residual artifacts",
+        "Remove Microsoft Office installations and scrub leftover artifacts.",
+        _build_remove_parser,
+    ),
+    (
+        "diagnose",
+        "Detect and report Office installations without making changes",
+        "Scan the system for Office installations and generate a diagnostic report.",
+        _build_diagnose_parser,
+    ),
+    (
+        "odt",
+        "Build and manage Office Deployment Tool XML configurations",
+        "Generate ODT configuration files for Office installation/removal.",
+        _build_odt_parser,
+    ),
+    (
+        "offscrub",
+        "OffScrub-style deep removal of Office installations",
+        "Perform thorough Office removal using OffScrub techniques.",
+        _build_offscrub_parser,
+    ),
+    (
+        "c2r",
+        "Direct Click-to-Run operations passthrough",
+        "Execute Click-to-Run operations directly via OfficeClickToRun.exe.",
+        _build_c2r_parser,
+    ),
+    (
+        "license",
+        "Manage Office licensing and activation",
+        "View, clean, and manage Office licensing information.",
+        _build_license_parser,
+    ),
+    (
+        "config",
+        "Generate and manage configuration files",
+        "Generate Office Janitor configuration files interactively or from templates.",
+        _build_config_parser,
+    ),
+)
+"""!
+@brief Subcommand name, summary, description and option builder, in help order.
+"""
+
+
+def build_arg_parser(version_info: dict[str, str] | None = None) -> argparse.ArgumentParser:
+    """!
+    @brief Create the top-level argument parser with subcommands and all CLI options.
+    @param version_info Optional version metadata dict with 'version' and 'build' keys.
+    @returns Configured ArgumentParser instance.
+    @details Supports three operation modes via subcommands:
+    - install: Deploy Office via ODT presets or custom configurations
+    - repair: Fix broken Office installations
+    - remove: Uninstall Office and clean up residual artifacts
+
+    Legacy flags (--auto-all, --auto-repair, etc.) are preserved for backward compatibility.
+    """
+    parser = argparse.ArgumentParser(
+        prog=PROGRAM_NAME,
+        add_help=False,  # We'll add custom help action
+        description=PROGRAM_DESCRIPTION,
+        epilog=EPILOG_TEXT,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        allow_abbrev=False,  # Disable prefix matching to avoid ambiguous flags
+    )
+
+    # Add custom help action that pauses before exit
+    parser.add_argument(
+        "-h",
+        "--help",
+        action=HelpActionWithPause,
+        help="show this help message and exit",
+    )
+
+    if version_info:
+        parser.add_argument(
+            "-V",
+            "--version",
+            action=VersionActionWithPause,
+            version=f"{version_info.get('version', '0.0.0')} ({version_info.get('build', 'dev')})",
+        )
+
+    # ---------------------------------------------------------------------------
+    # Subcommands: install, repair, remove
+    # ---------------------------------------------------------------------------
+    # Subcommand options are added only when that subcommand is selected (see
+    # LazySubParsersAction); the top-level help only needs names and summaries.
+    parser.register("action", "parsers", LazySubParsersAction)
+    subparsers = parser.add_subparsers(
+        dest="command",
+        title="operation modes",
+        description="Choose an operation mode (or use legacy flags for backward compatibility)",
+        metavar="<command>",
+    )
+    for name, summary, description, builder in _SUBCOMMANDS:
+        subparsers.add_lazy_parser(
+            name,
+            builder,
+            help=summary,
+            description=description,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            add_help=False,
+        )
+
     # ---------------------------------------------------------------------------
     # Global options (shown in main help)
     # ---------------------------------------------------------------------------
@@ -1735,6 +1829,7 @@ __all__ = [
     "REMOVE_EPILOG",
     "DIAGNOSE_EPILOG",
     "build_arg_parser",
+    "LazySubParsersAction",
     "format_repair_help",
     "format_quick_reference",
     "add_mode_arguments",
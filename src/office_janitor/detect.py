@@ -16,12 +16,26 @@ import shlex
 import sys
 import threading
 import time
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TypeVar
 
-from . import constants, elevation, exec_utils, logging_ext, registry_tools, spinner
+from . import (
+    constants,
+    elevation,
+    exec_utils,
+    guid_utils,
+    inventory_cache,
+    logging_ext,
+    process_snapshot,
+    registry_tools,
+    spinner,
+    task_scheduler,
+    tracing,
+    uninstall_snapshot,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -113,6 +127,11 @@ _TASK_PREFIXES = (r"\\Microsoft\\Office\\", r"\\Microsoft\\OfficeSoftwareProtect
 @brief Scheduled task prefixes that indicate Office automation jobs.
 """
 
+_TASK_FOLDERS = tuple(task_scheduler.normalize_task_path(prefix) for prefix in _TASK_PREFIXES)
+"""!
+@brief Task Scheduler folders walked when reading the task XML tree.
+"""
+
 _KNOWN_TASK_NAMES = {
     task if task.startswith("\\") else f"\\{task}" for task in constants.KNOWN_SCHEDULED_TASKS
 }
@@ -324,11 +343,144 @@ def _powershell_read_values(root: int, path: str) -> dict[str, Any]:
     return filtered
 
 
+_BULK_FALLBACK_CHUNK = 200
+"""!
+@brief Maximum registry keys resolved by a single bulk PowerShell invocation.
+@details Keeps the generated ``-Command`` argument well below the Windows
+command-line length limit.
+"""
+
+_fallback_cache: dict[tuple[int, str], dict[str, Any]] = {}
+_fallback_cache_lock = threading.Lock()
+
+
+def _fallback_cache_key(root: int, path: str) -> tuple[int, str]:
+    """!
+    @brief Normalise a registry location for use as a fallback cache key.
+    """
+
+    return root, path.replace("/", "\\").strip("\\").lower()
+
+
+def _powershell_bulk_read_values(
+    keys: Iterable[tuple[int, str]],
+) -> dict[tuple[int, str], dict[str, Any]] | None:
+    """!
+    @brief Read values for many registry keys with one ``powershell`` process.
+    @details Emits a JSON object keyed by provider path for every key that
+    exists. Keys absent from the output are returned as empty mappings.
+    @returns Mapping of ``(root, path)`` to values, or ``None`` when PowerShell
+    could not be run or produced unparsable output.
+    """
+
+    ordered = list(dict.fromkeys(keys))
+    if not ordered:
+        return {}
+    provider_paths = [_powershell_registry_path(root, path) for root, path in ordered]
+    path_list = ",".join(f"'{_powershell_escape(item)}'" for item in provider_paths)
+    script = (
+        "$ErrorActionPreference='SilentlyContinue';"
+        "$r=@{};"
+        f"foreach($p in @({path_list})){{"
+        "  if(Test-Path -LiteralPath $p){"
+        "    $r[$p]=Get-ItemProperty -LiteralPath $p | Select-Object * -ExcludeProperty PS*"
+        "  }"
+        "};"
+        "$r | ConvertTo-Json -Compress -Depth 3"
+    )
+    code, output = _run_command(["powershell", "-NoProfile", "-Command", script])
+    if code != 0:
+        return None
+
+    text = output.strip()
+    try:
+        data = json.loads(text) if text else {}
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    lowered = {str(name).lower(): payload for name, payload in data.items()}
+    results: dict[tuple[int, str], dict[str, Any]] = {}
+    for (root, path), provider_path in zip(ordered, provider_paths):
+        payload = lowered.get(provider_path.lower())
+        values: dict[str, Any] = {}
+        if isinstance(payload, dict):
+            for key, value in payload.items():
+                if str(key).startswith("PS"):
+                    continue
+                values[str(key)] = value
+        results[(root, path)] = values
+    return results
+
+
+def _prime_registry_fallback(keys: Iterable[tuple[int, str]]) -> list[tuple[int, str]]:
+    """!
+    @brief Populate the fallback cache for ``keys`` using one bulk probe.
+    @details Every key is read natively first. Only the keys that come back
+    empty are collected and resolved by a single PowerShell invocation per
+    :data:`_BULK_FALLBACK_CHUNK` keys. Keys PowerShell cannot resolve are cached
+    as empty so later lookups do not spawn per-key processes.
+    @returns Cache keys added by this call so the caller can release them.
+    """
+
+    entries: dict[tuple[int, str], dict[str, Any]] = {}
+    misses: list[tuple[int, str]] = []
+    for root, path in dict.fromkeys(keys):
+        values = _safe_read_values(root, path)
+        entries[_fallback_cache_key(root, path)] = values
+        if not values:
+            misses.append((root, path))
+
+    for start in range(0, len(misses), _BULK_FALLBACK_CHUNK):
+        chunk = misses[start : start + _BULK_FALLBACK_CHUNK]
+        resolved = _powershell_bulk_read_values(chunk) or {}
+        for root, path in chunk:
+            entries[_fallback_cache_key(root, path)] = resolved.get((root, path), {})
+
+    if misses:
+        _LOGGER.debug(
+            "Bulk registry fallback resolved %d of %d keys natively; %d via PowerShell",
+            len(entries) - len(misses),
+            len(entries),
+            len(misses),
+        )
+
+    with _fallback_cache_lock:
+        added = [key for key in entries if key not in _fallback_cache]
+        _fallback_cache.update(entries)
+    return added
+
+
+@contextmanager
+def bulk_registry_fallback(keys: Iterable[tuple[int, str]]) -> Iterator[None]:
+    """!
+    @brief Serve :func:`_read_values_with_fallback` for ``keys`` from one snapshot.
+    @details Intended for detection loops that probe many known locations; the
+    cached entries are dropped when the context exits.
+    """
+
+    added = _prime_registry_fallback(keys)
+    try:
+        yield
+    finally:
+        with _fallback_cache_lock:
+            for key in added:
+                _fallback_cache.pop(key, None)
+
+
 def _read_values_with_fallback(root: int, path: str) -> dict[str, Any]:
     """!
     @brief Read registry values with a PowerShell fallback when necessary.
+    @details Lookups primed by :func:`bulk_registry_fallback` are served from
+    the cached snapshot without touching the registry or PowerShell again.
     """
 
+    with _fallback_cache_lock:
+        cached = _fallback_cache.get(_fallback_cache_key(root, path))
+    if cached is not None:
+        return dict(cached)
+
     values = _safe_read_values(root, path)
     if values:
         return values
@@ -600,6 +752,103 @@ def _probe_msi_powershell() -> dict[str, dict[str, Any]]:
     return results
 
 
+_MSI_USERDATA_ROOT = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Installer\UserData"
+_MSI_CLASSES_PRODUCTS_ROOT = r"SOFTWARE\Classes\Installer\Products"
+_MSI_PROBE_KEYWORDS = ("office", "visio", "project")
+_MSI_PROBE_EXCLUSIONS = ("aspire", "template", "sdk", "visual studio")
+
+
+def _is_office_msi_name(name: str) -> bool:
+    """!
+    @brief Apply the Win32_Product probes' Office name filter to ``name``.
+    """
+
+    name_lower = name.lower()
+    if not any(token in name_lower for token in _MSI_PROBE_KEYWORDS):
+        return False
+    # Exclude non-Office products that match keywords (e.g., Aspire.ProjectTemplates)
+    return not any(excl in name_lower for excl in _MSI_PROBE_EXCLUSIONS)
+
+
+def _safe_iter_subkeys(root: int, path: str) -> list[str]:
+    """!
+    @brief List subkeys of ``root``/``path``, returning an empty list when unreadable.
+    """
+
+    try:
+        return list(registry_tools.iter_subkeys(root, path))
+    except OSError:
+        return []
+
+
+def _decode_msi_version(raw: object) -> str:
+    """!
+    @brief Render the packed ``Version`` DWORD Windows Installer stores per product.
+    @details The DWORD encodes ``major << 24 | minor << 16 | build``; string values
+    are returned unchanged.
+    """
+
+    if isinstance(raw, int):
+        value = raw & 0xFFFFFFFF
+        return f"{value >> 24}.{(value >> 16) & 0xFF}.{value & 0xFFFF}"
+    return str(raw or "").strip()
+
+
+def _probe_msi_registry() -> dict[str, dict[str, Any]]:
+    """!
+    @brief Collect MSI product metadata straight from the Windows Installer registry.
+    @details Enumerates ``Installer\\UserData\\<SID>\\Products\\<packed>\\InstallProperties``
+    and ``Classes\\Installer\\Products`` and recovers product codes with
+    :func:`guid_utils.expand_guid`. Produces the same shape as :func:`_probe_msi_wmi`
+    without touching the ``Win32_Product`` provider, so it completes in well under a
+    second and never triggers MSI self-repair.
+    """
+
+    hive = constants.HKLM
+    results: dict[str, dict[str, Any]] = {}
+
+    for sid in _safe_iter_subkeys(hive, _MSI_USERDATA_ROOT):
+        products_path = f"{_MSI_USERDATA_ROOT}\\{sid}\\Products"
+        for packed in _safe_iter_subkeys(hive, products_path):
+            try:
+                product_code = guid_utils.expand_guid(packed).upper()
+            except guid_utils.GuidError:
+                continue
+            if product_code in results:
+                continue
+            values = _safe_read_values(hive, f"{products_path}\\{packed}\\InstallProperties")
+            name = str(values.get("DisplayName") or "").strip()
+            if not _is_office_msi_name(name):
+                continue
+            results[product_code] = {
+                "product": name,
+                "version": str(values.get("DisplayVersion") or "").strip(),
+                "install_location": str(values.get("InstallLocation") or "").strip(),
+                "probe": "registry",
+            }
+
+    # Products registered without per-SID install properties (e.g. advertised).
+    for packed in _safe_iter_subkeys(hive, _MSI_CLASSES_PRODUCTS_ROOT):
+        try:
+            product_code = guid_utils.expand_guid(packed).upper()
+        except guid_utils.GuidError:
+            continue
+        if product_code in results:
+            continue
+        values = _safe_read_values(hive, f"{_MSI_CLASSES_PRODUCTS_ROOT}\\{packed}")
+        name = str(values.get("ProductName") or "").strip()
+        if not _is_office_msi_name(name):
+            continue
+        results[product_code] = {
+            "product": name,
+            "version": _decode_msi_version(values.get("Version")),
+            "install_location": "",
+            "probe": "registry",
+        }
+
+    return results
+
+
 def detect_appx_packages() -> list[dict[str, object]]:
     """!
     @brief Detect installed Office AppX/MSIX packages (modern Windows apps).
@@ -685,6 +934,25 @@ def detect_appx_packages() -> list[dict[str, object]]:
     return results
 
 
+def _iter_office_uninstall_entries(
+    snapshot: uninstall_snapshot.UninstallSnapshot,
+) -> Iterator[tuple[int, str, dict[str, Any]]]:
+    """!
+    @brief Yield Office-like ARP entries, served from ``snapshot`` where possible.
+    @details Roots the snapshot could not enumerate fall back to
+    :func:`registry_tools.iter_office_uninstall_entries`.
+    """
+
+    for hive, base in constants.MSI_UNINSTALL_ROOTS:
+        if snapshot.subkeys(hive, base) is None:
+            yield from registry_tools.iter_office_uninstall_entries([(hive, base)])
+            continue
+        for name in snapshot.entries(hive, base):
+            values = snapshot.values(hive, base, name)
+            if values and registry_tools.looks_like_office_entry(values):
+                yield hive, f"{base}\\{name}", values
+
+
 def detect_uninstall_entries() -> list[dict[str, object]]:
     """!
     @brief Detect Office entries from Windows Control Panel uninstall registry.
@@ -696,10 +964,7 @@ def detect_uninstall_entries() -> list[dict[str, object]]:
     results: list[dict[str, object]] = []
     seen_handles: set[str] = set()
 
-    # Use the registry_tools function to find Office-like uninstall entries
-    for hive, key_path, values in registry_tools.iter_office_uninstall_entries(
-        constants.MSI_UNINSTALL_ROOTS
-    ):
+    for hive, key_path, values in _iter_office_uninstall_entries(uninstall_snapshot.current()):
         handle = f"HKLM\\{key_path}" if hive == constants.HKLM else f"HKCU\\{key_path}"
         if handle in seen_handles:
             continue
@@ -742,11 +1007,14 @@ def detect_msi_installations(
     *,
     skip_slow_probes: bool = False,
     precomputed_fallbacks: dict[str, dict[str, Any]] | None = None,
+    deep_probe: bool = False,
 ) -> list[DetectedInstallation]:
     """!
     @brief Inspect the registry and return metadata for MSI-based Office installs.
     @param skip_slow_probes If True, skip WMI/PowerShell probes that can take 60-120+ seconds.
     @param precomputed_fallbacks Pre-collected WMI/PS probe results (avoids re-running probes).
+    @param deep_probe If True, also run the WMI/PowerShell ``Win32_Product`` probes on top
+           of the Windows Installer registry probe.
     """
 
     installations: list[DetectedInstallation] = []
@@ -754,11 +1022,13 @@ def detect_msi_installations(
     seen_codes: set[str] = set()
 
     fallback_sources: dict[str, dict[str, Any]] = {}
+    # The Installer registry probe is cheap, so it always seeds the fallbacks.
+    _merge_fallback_metadata(fallback_sources, _probe_msi_registry())
 
     if precomputed_fallbacks is not None:
         # Use pre-computed fallback data (probes ran externally in parallel)
-        fallback_sources.update(precomputed_fallbacks)
-    elif skip_slow_probes:
+        _merge_fallback_metadata(fallback_sources, precomputed_fallbacks)
+    elif skip_slow_probes or not deep_probe:
         # Skip the extremely slow WMI queries
         _LOGGER.debug("Skipping slow MSI probes (WMI/PowerShell)")
     else:
@@ -772,84 +1042,107 @@ def detect_msi_installations(
             _merge_fallback_metadata(fallback_sources, wmi_future.result())
             _merge_fallback_metadata(fallback_sources, ps_future.result())
 
-    for product_code, metadata in constants.MSI_PRODUCT_MAP.items():
-        registry_roots: Iterable[tuple[int, str]] = metadata.get(
-            "registry_roots", constants.MSI_UNINSTALL_ROOTS
-        )
-        for hive, base_key in registry_roots:
-            key_path = f"{base_key}\\{product_code}"
-            values = _read_values_with_fallback(hive, key_path)
-            if not values:
-                continue
-
-            handle = _compose_handle(hive, key_path)
-            if handle in seen_handles:
-                continue
-
-            fallback_meta = fallback_sources.pop(product_code.upper(), None)
-            display_name = str(values.get("DisplayName") or metadata.get("product") or product_code)
-            display_version = str(
-                values.get("DisplayVersion")
-                or metadata.get("version")
-                or (fallback_meta or {}).get("version")
-                or "unknown"
-            )
-            uninstall_string = str(values.get("UninstallString") or "")
-            install_location = str(
-                values.get("InstallLocation") or (fallback_meta or {}).get("install_location") or ""
-            )
-            display_icon_value = str(values.get("DisplayIcon") or "").strip()
-            maintenance_paths = _collect_maintenance_paths(values)
-            raw_architecture = str(metadata.get("architecture", "")).strip()
-            architecture = raw_architecture or _infer_architecture(
-                display_name, install_location or None
+    # Enumerated roots answer "is this product registered?" with a dict lookup;
+    # only roots the snapshot could not list are probed key by key.
+    snapshot = uninstall_snapshot.current()
+    probe_keys = [
+        (hive, f"{base_key}\\{product_code}")
+        for product_code, metadata in constants.MSI_PRODUCT_MAP.items()
+        for hive, base_key in metadata.get("registry_roots", constants.MSI_UNINSTALL_ROOTS)
+        if snapshot.subkeys(hive, base_key) is None
+    ]
+    # Resolve every candidate key up front so misses share one PowerShell probe.
+    with bulk_registry_fallback(probe_keys):
+        for product_code, metadata in constants.MSI_PRODUCT_MAP.items():
+            registry_roots: Iterable[tuple[int, str]] = metadata.get(
+                "registry_roots", constants.MSI_UNINSTALL_ROOTS
             )
-            if not architecture:
-                architecture = "unknown"
-            family = constants.resolve_msi_family(product_code) or str(metadata.get("family", ""))
-            languages = _parse_languages(
-                values.get("InstallLanguage"),
-                values.get("Language"),
-                values.get("ProductLanguage"),
-            )
-
-            properties: dict[str, object] = {
-                "display_name": display_name,
-                "display_version": display_version,
-                "supported_versions": list(metadata.get("supported_versions", ())),
-                "edition": metadata.get("edition", ""),
-            }
-            if uninstall_string:
-                properties["uninstall_string"] = uninstall_string
-            if install_location:
-                properties["install_location"] = install_location
-            if display_icon_value:
-                properties["display_icon"] = display_icon_value
-            if maintenance_paths:
-                properties["maintenance_paths"] = list(maintenance_paths)
-            if family:
-                properties["family"] = family
-            if languages:
-                properties["languages"] = list(languages)
-            if fallback_meta and fallback_meta.get("probe"):
-                properties["supplemental_probes"] = [str(fallback_meta["probe"])]
+            for hive, base_key in registry_roots:
+                key_path = f"{base_key}\\{product_code}"
+                listed = snapshot.contains(hive, base_key, product_code)
+                if listed is False:
+                    continue
+                values = snapshot.values(hive, base_key, product_code) if listed else {}
+                if not values:
+                    # Unlisted roots, or a listed key the native read could not open
+                    values = _read_values_with_fallback(hive, key_path)
+                if not values:
+                    continue
+
+                handle = _compose_handle(hive, key_path)
+                if handle in seen_handles:
+                    continue
+
+                fallback_meta = fallback_sources.pop(product_code.upper(), None)
+                display_name = str(
+                    values.get("DisplayName") or metadata.get("product") or product_code
+                )
+                display_version = str(
+                    values.get("DisplayVersion")
+                    or metadata.get("version")
+                    or (fallback_meta or {}).get("version")
+                    or "unknown"
+                )
+                uninstall_string = str(values.get("UninstallString") or "")
+                install_location = str(
+                    values.get("InstallLocation")
+                    or (fallback_meta or {}).get("install_location")
+                    or ""
+                )
+                display_icon_value = str(values.get("DisplayIcon") or "").strip()
+                maintenance_paths = _collect_maintenance_paths(values)
+                raw_architecture = str(metadata.get("architecture", "")).strip()
+                architecture = raw_architecture or _infer_architecture(
+                    display_name, install_location or None
+                )
+                if not architecture:
+                    architecture = "unknown"
+                family = constants.resolve_msi_family(product_code) or str(
+                    metadata.get("family", "")
+                )
+                languages = _parse_languages(
+                    values.get("InstallLanguage"),
+                    values.get("Language"),
+                    values.get("ProductLanguage"),
+                )
 
-            installations.append(
-                DetectedInstallation(
-                    source="MSI",
-                    product=str(metadata.get("product", display_name)),
-                    version=display_version or "unknown",
-                    architecture=architecture or "unknown",
-                    uninstall_handles=(handle,),
-                    channel="MSI",
-                    product_code=product_code,
-                    properties=properties,
-                    display_icon=display_icon_value or None,
-                    maintenance_paths=maintenance_paths,
+                properties: dict[str, object] = {
+                    "display_name": display_name,
+                    "display_version": display_version,
+                    "supported_versions": list(metadata.get("supported_versions", ())),
+                    "edition": metadata.get("edition", ""),
+                }
+                if uninstall_string:
+                    properties["uninstall_string"] = uninstall_string
+                if install_location:
+                    properties["install_location"] = install_location
+                if display_icon_value:
+                    properties["display_icon"] = display_icon_value
+                if maintenance_paths:
+                    properties["maintenance_paths"] = list(maintenance_paths)
+                if family:
+                    properties["family"] = family
+                if languages:
+                    properties["languages"] = list(languages)
+                if fallback_meta and fallback_meta.get("probe"):
+                    properties["supplemental_probes"] = [str(fallback_meta["probe"])]
+
+                installations.append(
+                    DetectedInstallation(
+                        source="MSI",
+                        product=str(metadata.get("product", display_name)),
+                        version=display_version or "unknown",
+                        architecture=architecture or "unknown",
+                        uninstall_handles=(handle,),
+                        channel="MSI",
+                        product_code=product_code,
+                        properties=properties,
+                        display_icon=display_icon_value or None,
+                        maintenance_paths=maintenance_paths,
+                    )
                 )
-            )
-            seen_handles.add(handle)
-            seen_codes.add(product_code.upper())
+                seen_handles.add(handle)
+                seen_codes.add(product_code.upper())
 
     for product_code, metadata in fallback_sources.items():
         if product_code in seen_codes:
@@ -1036,6 +1329,8 @@ def gather_office_inventory(
     progress_callback: Callable[[str, str], None] | None = None,
     parallel: bool = True,
     fast_mode: bool = False,
+    deep_probe: bool = False,
+    cache: inventory_cache.InventoryCache | None = None,
 ) -> dict[str, object]:
     """!
     @brief Aggregate MSI, C2R, and ancillary signals into an inventory payload.
@@ -1043,8 +1338,41 @@ def gather_office_inventory(
     @param progress_callback Optional callback(phase, status) for progress reporting.
            phase is a description, status is "start", "ok", "skip", or "fail".
     @param parallel If True, run independent detection tasks in parallel threads.
-    @param fast_mode If True, skip slow WMI/PowerShell probes (reduces MSI detection from
-           60-120+ seconds to under 1 second, but may miss some edge-case installations).
+    @param fast_mode If True, skip slow WMI/PowerShell probes even when ``deep_probe``
+           is requested.
+    @param deep_probe If True, also run the WMI/PowerShell ``Win32_Product`` probes
+           (60-120+ seconds). By default MSI metadata comes from the Windows Installer
+           registry probe, which completes in under a second.
+    @param cache Optional :class:`inventory_cache.InventoryCache`; sections whose
+           fingerprint is unchanged since the cached run are reused instead of
+           probed, and the cache is rewritten with the result.
+    @details Every detection routine in the run shares one
+    :class:`uninstall_snapshot.UninstallSnapshot`, so the ARP ``Uninstall``
+    roots are enumerated once no matter how many threads consult them.
+    """
+
+    with uninstall_snapshot.scope(), tracing.span("detect.gather_office_inventory"):
+        return _gather_office_inventory(
+            limited_user=limited_user,
+            progress_callback=progress_callback,
+            parallel=parallel,
+            fast_mode=fast_mode,
+            deep_probe=deep_probe,
+            cache=cache,
+        )
+
+
+def _gather_office_inventory(
+    *,
+    limited_user: bool | None,
+    progress_callback: Callable[[str, str], None] | None,
+    parallel: bool,
+    fast_mode: bool,
+    deep_probe: bool,
+    cache: inventory_cache.InventoryCache | None = None,
+) -> dict[str, object]:
+    """!
+    @brief Body of :func:`gather_office_inventory` run inside a snapshot scope.
     """
 
     # Start the spinner thread (for use during slow operations only)
@@ -1114,12 +1442,47 @@ def gather_office_inventory(
     }
     _report("Checking execution context", "ok")
 
+    run_deep_probes = deep_probe and not fast_mode
+
+    # Reuse cached sections whose registry/filesystem fingerprint is unchanged
+    fingerprints: dict[str, str | None] = {}
+    reused: dict[str, Any] = {}
+    if cache is not None:
+        fingerprints = inventory_cache.section_fingerprints(options={"deep_probe": run_deep_probes})
+        reused = cache.reusable(fingerprints)
+        if reused:
+            phase = f"Reusing cached inventory ({', '.join(sorted(reused))})"
+            _report(phase)
+            _report(phase, "ok")
+        logging_ext.get_machine_logger().info(
+            "inventory_cache",
+            extra={
+                "event": "inventory_cache",
+                "path": str(cache.path),
+                "refresh": cache.refresh,
+                "reused": sorted(reused),
+                "uncacheable": sorted(name for name, fp in fingerprints.items() if fp is None),
+            },
+        )
+
+    trace_parent = tracing.current_span_id()
+
+    def _section(section: str, detector: Callable[[], _T]) -> Callable[[], _T]:
+        """Wrap ``detector`` in a trace span, serving cached sections directly."""
+
+        def _run() -> _T:
+            cached = section in reused
+            with tracing.span(f"detect.{section}", parent=trace_parent, cached=cached):
+                return reused[section] if cached else detector()
+
+        return _run
+
     # Start slow WMI/PS probes immediately (they run in background while other tasks execute)
     wmi_future: concurrent.futures.Future[dict[str, dict[str, Any]]] | None = None
     ps_future: concurrent.futures.Future[dict[str, dict[str, Any]]] | None = None
     probe_executor: concurrent.futures.ThreadPoolExecutor | None = None
 
-    if not fast_mode and parallel:
+    if run_deep_probes and parallel and "msi" not in reused:
         # Don't track as parallel task - this is just informational that probes started
         # The actual waiting happens later with _wait_with_progress
         if progress_callback:
@@ -1137,10 +1500,10 @@ def gather_office_inventory(
         *,
         probes_attempted: bool = False,
     ) -> list[dict[str, object]]:
-        if fast_mode:
-            _report("Scanning MSI-based installations (fast mode)")
+        if not run_deep_probes:
+            _report("Scanning MSI-based installations")
             result = [entry.to_dict() for entry in detect_msi_installations(skip_slow_probes=True)]
-            _report("Scanning MSI-based installations (fast mode)", "ok")
+            _report("Scanning MSI-based installations", "ok")
         else:
             _report("Scanning MSI-based installations")
             fallback_payload = precomputed_fallbacks if precomputed_fallbacks else None
@@ -1160,6 +1523,7 @@ def gather_office_inventory(
                 for entry in detect_msi_installations(
                     skip_slow_probes=skip_slow_probes,
                     precomputed_fallbacks=fallback_payload if skip_slow_probes else None,
+                    deep_probe=True,
                 )
             ]
             _report("Scanning MSI-based installations", "ok")
@@ -1280,15 +1644,17 @@ def gather_office_inventory(
                 max_workers=14, thread_name_prefix="detect"
             ) as executor:
                 # Start all fast tasks immediately (WMI/PS probes already running in background)
-                c2r_future = executor.submit(_detect_c2r)
-                processes_future = executor.submit(_detect_processes)
-                services_future = executor.submit(_detect_services)
-                tasks_future = executor.submit(_detect_tasks)
-                appx_future = executor.submit(_detect_appx)
-                uninstall_future = executor.submit(_detect_uninstall_entries)
-                activation_future = executor.submit(_detect_activation)
-                registry_future = executor.submit(_detect_registry)
-                filesystem_future = executor.submit(_detect_filesystem)
+                c2r_future = executor.submit(_section("c2r", _detect_c2r))
+                processes_future = executor.submit(_section("processes", _detect_processes))
+                services_future = executor.submit(_section("services", _detect_services))
+                tasks_future = executor.submit(_section("tasks", _detect_tasks))
+                appx_future = executor.submit(_section("appx", _detect_appx))
+                uninstall_future = executor.submit(
+                    _section("uninstall_entries", _detect_uninstall_entries)
+                )
+                activation_future = executor.submit(_section("activation", _detect_activation))
+                registry_future = executor.submit(_section("registry", _detect_registry))
+                filesystem_future = executor.submit(_section("filesystem", _detect_filesystem))
 
                 # Use interruptible waiting for all futures
                 futures = {
@@ -1354,10 +1720,13 @@ def gather_office_inventory(
                         raise
 
                 # Now run MSI detection with probe results
-                msi_list = _detect_msi(
-                    probe_fallbacks if probe_fallbacks else None,
-                    probes_attempted=wmi_future is not None and ps_future is not None,
-                )
+                msi_list = _section(
+                    "msi",
+                    lambda: _detect_msi(
+                        probe_fallbacks if probe_fallbacks else None,
+                        probes_attempted=wmi_future is not None and ps_future is not None,
+                    ),
+                )()
 
         except KeyboardInterrupt:
             _LOGGER.info("Detection interrupted by user")
@@ -1370,24 +1739,27 @@ def gather_office_inventory(
         if probe_executor is not None:
             probe_executor.shutdown(wait=False)
     else:
-        # Sequential fallback (with probes if not fast_mode)
+        # Sequential fallback (with probes if deep probing was requested)
         probe_fallbacks_seq: dict[str, dict[str, Any]] = {}
-        if not fast_mode:
+        if run_deep_probes and "msi" not in reused:
             _merge_fallback_metadata(probe_fallbacks_seq, _probe_msi_wmi())
             _merge_fallback_metadata(probe_fallbacks_seq, _probe_msi_powershell())
-        msi_list = _detect_msi(
-            probe_fallbacks_seq if probe_fallbacks_seq else None,
-            probes_attempted=not fast_mode,
-        )
-        c2r_list = _detect_c2r()
-        processes_list = _detect_processes()
-        services_list = _detect_services()
-        tasks_list = _detect_tasks()
-        appx_list = _detect_appx()
-        uninstall_list = _detect_uninstall_entries()
-        activation_info = _detect_activation()
-        registry_residue = _detect_registry()
-        filesystem_list = _detect_filesystem()
+        msi_list = _section(
+            "msi",
+            lambda: _detect_msi(
+                probe_fallbacks_seq if probe_fallbacks_seq else None,
+                probes_attempted=run_deep_probes,
+            ),
+        )()
+        c2r_list = _section("c2r", _detect_c2r)()
+        processes_list = _section("processes", _detect_processes)()
+        services_list = _section("services", _detect_services)()
+        tasks_list = _section("tasks", _detect_tasks)()
+        appx_list = _section("appx", _detect_appx)()
+        uninstall_list = _section("uninstall_entries", _detect_uninstall_entries)()
+        activation_info = _section("activation", _detect_activation)()
+        registry_residue = _section("registry", _detect_registry)()
+        filesystem_list = _section("filesystem", _detect_filesystem)()
 
     inventory: dict[str, object] = {
         "context": context_info,
@@ -1403,6 +1775,9 @@ def gather_office_inventory(
         "registry": registry_residue,
     }
 
+    if cache is not None:
+        cache.save(inventory, fingerprints)
+
     # Clear any remaining parallel tasks from spinner
     spinner.clear_parallel_tasks()
 
@@ -1412,9 +1787,9 @@ def gather_office_inventory(
 def reprobe(options: Mapping[str, object] | None = None) -> dict[str, object]:
     """!
     @brief Re-run Office detection after a scrub pass to check for leftovers.
-    @details The optional ``options`` mapping is accepted for parity with future
-    targeted detection strategies, but currently serves only as a hook for
-    logging and diagnostics. The returned inventory mirrors
+    @details The optional ``options`` mapping is accepted for parity with
+    :func:`reprobe_incremental`, which the scrubber prefers when it still holds
+    the previous inventory. The returned inventory mirrors
     :func:`gather_office_inventory`.
     """
 
@@ -1425,6 +1800,178 @@ def reprobe(options: Mapping[str, object] | None = None) -> dict[str, object]:
     return gather_office_inventory(limited_user=limited_user)
 
 
+@dataclass
+class InventoryDiff:
+    """!
+    @brief Outcome of an incremental re-probe between scrub passes.
+    @details ``removed`` holds the records confirmed gone and ``remaining``
+    the attempted records that are still installed, both keyed by inventory
+    section (``msi``, ``c2r``, ``uninstall_entries``).
+    """
+
+    removed: dict[str, list[dict[str, Any]]]
+    remaining: dict[str, list[dict[str, Any]]]
+
+    def apply(self, inventory: Mapping[str, object]) -> dict[str, object]:
+        """!
+        @brief Return a copy of ``inventory`` without the removed records.
+        """
+
+        updated: dict[str, object] = dict(inventory)
+        for section, records in self.removed.items():
+            current = inventory.get(section)
+            if not records or not isinstance(current, list):
+                continue
+            gone = {_record_identity(record) for record in records}
+            updated[section] = [
+                record
+                for record in current
+                if not (isinstance(record, Mapping) and _record_identity(record) in gone)
+            ]
+        return updated
+
+    def to_dict(self) -> dict[str, object]:
+        """!
+        @brief Summarise the diff for structured logging.
+        """
+
+        return {
+            "removed": {section: len(records) for section, records in self.removed.items()},
+            "remaining": {section: len(records) for section, records in self.remaining.items()},
+        }
+
+
+def _record_identity(record: Mapping[str, Any]) -> tuple[object, ...]:
+    """!
+    @brief Identify an inventory record by its product code and registry handles.
+    @details Used instead of object identity so copies of a record (for example
+    sections restored from the inventory cache) still match.
+    """
+
+    return (
+        str(record.get("product_code") or "").strip().upper(),
+        str(record.get("registry_handle") or "").lower(),
+        tuple(sorted(str(handle).lower() for handle in record.get("uninstall_handles") or [])),
+        tuple(sorted(str(release).lower() for release in record.get("release_ids") or [])),
+    )
+
+
+def _handle_exists(handle: object) -> bool:
+    """!
+    @brief Check a ``HKLM\\...`` style handle without raising.
+    """
+
+    try:
+        return bool(registry_tools.key_exists(str(handle)))
+    except (OSError, ValueError):
+        return False
+
+
+def _path_exists(raw: object) -> bool:
+    """!
+    @brief Check a filesystem path recorded in an inventory record.
+    """
+
+    text = str(raw or "").strip()
+    if not text:
+        return False
+    try:
+        return Path(text).exists()
+    except OSError:
+        return False
+
+
+def _msi_record_present(record: Mapping[str, Any]) -> bool:
+    """!
+    @brief Recheck the uninstall keys of one MSI inventory record.
+    """
+
+    handles = list(record.get("uninstall_handles") or [])
+    code = str(record.get("product_code") or "").strip()
+    if code:
+        handles.extend(
+            _compose_handle(hive, f"{base}\\{code}") for hive, base in constants.MSI_UNINSTALL_ROOTS
+        )
+    return any(_handle_exists(handle) for handle in handles)
+
+
+def _c2r_record_present(record: Mapping[str, Any]) -> bool:
+    """!
+    @brief Recheck the uninstall keys and install path of one Click-to-Run record.
+    """
+
+    if any(_handle_exists(handle) for handle in record.get("uninstall_handles") or []):
+        return True
+    properties = record.get("properties")
+    if isinstance(properties, Mapping) and _path_exists(properties.get("install_path")):
+        return True
+    return False
+
+
+def reprobe_incremental(
+    previous: Mapping[str, object],
+    attempted: Mapping[str, Iterable[str]],
+) -> InventoryDiff:
+    """!
+    @brief Recheck only the products the last scrub pass tried to remove.
+    @details ``attempted`` maps ``msi`` to product codes and ``c2r`` to release
+    identifiers. Only the uninstall handles and install paths of matching
+    records in ``previous`` are probed; every other section is left alone, so
+    processes, services, tasks, AppX, activation and filesystem scans are not
+    repeated. When the pass removed anything, the remaining MSI, Click-to-Run
+    and uninstall-entry records get the same cheap existence check so products
+    that went away as a side effect (suite members, shared Click-to-Run
+    installs) are dropped too.
+    @returns An :class:`InventoryDiff` whose :meth:`InventoryDiff.apply` yields
+    the inventory for the next plan.
+    """
+
+    codes = {str(code).strip().upper() for code in attempted.get("msi", ()) if code}
+    releases = {str(release).strip().lower() for release in attempted.get("c2r", ()) if release}
+    removed: dict[str, list[dict[str, Any]]] = {"msi": [], "c2r": [], "uninstall_entries": []}
+    remaining: dict[str, list[dict[str, Any]]] = {"msi": [], "c2r": []}
+    others: dict[str, list[dict[str, Any]]] = {"msi": [], "c2r": []}
+
+    for record in previous.get("msi") or []:
+        if not isinstance(record, Mapping):
+            continue
+        if str(record.get("product_code") or "").strip().upper() not in codes:
+            others["msi"].append(record)
+            continue
+        bucket = remaining if _msi_record_present(record) else removed
+        bucket["msi"].append(record)
+
+    for record in previous.get("c2r") or []:
+        if not isinstance(record, Mapping):
+            continue
+        record_releases = {str(item).lower() for item in record.get("release_ids") or []}
+        if not record_releases & releases:
+            others["c2r"].append(record)
+            continue
+        bucket = remaining if _c2r_record_present(record) else removed
+        bucket["c2r"].append(record)
+
+    sweep = bool(removed["msi"] or removed["c2r"])
+    if sweep:
+        removed["msi"].extend(record for record in others["msi"] if not _msi_record_present(record))
+        removed["c2r"].extend(record for record in others["c2r"] if not _c2r_record_present(record))
+
+    removed_codes = {str(record.get("product_code") or "").upper() for record in removed["msi"]}
+    for entry in previous.get("uninstall_entries") or []:
+        if not isinstance(entry, Mapping):
+            continue
+        code = str(entry.get("product_code") or "").strip().upper()
+        handle = str(entry.get("registry_handle") or "")
+        leaf = handle.rpartition("\\")[2].lower()
+        linked = (code and code in removed_codes) or any(
+            leaf.startswith(release) for release in releases
+        )
+        if (linked or sweep) and not _handle_exists(handle):
+            removed["uninstall_entries"].append(entry)
+
+    return InventoryDiff(removed=removed, remaining=remaining)
+
+
 def _run_command(
     arguments: Iterable[str], *, timeout: int | float | None = None
 ) -> tuple[int, str]:
@@ -1469,12 +2016,29 @@ if __name__ == "__main__":  # pragma: no cover - manual execution
 
 def gather_running_office_processes() -> list[dict[str, str]]:
     """!
-    @brief Inspect running processes for Office executables via ``tasklist``.
-    @details Output is filtered to the executables referenced in the
-    specification so downstream planners can prompt for graceful shutdowns
-    before uninstall operations commence.
+    @brief Inspect running processes for Office executables.
+    @details Reads one native process snapshot, falling back to ``tasklist``
+    when none is available. Output is filtered to the executables referenced
+    in the specification so downstream planners can prompt for graceful
+    shutdowns before uninstall operations commence.
     """
 
+    snapshot = process_snapshot.take_snapshot()
+    if snapshot is not None:
+        found: list[dict[str, str]] = []
+        for process in snapshot.entries:
+            if process.name.lower() not in _OFFICE_PROCESS_TARGETS:
+                continue
+            record = {
+                "name": process.name,
+                "pid": str(process.pid),
+                "parent_pid": str(process.parent_pid),
+            }
+            if process.session_id is not None:
+                record["session_id"] = str(process.session_id)
+            found.append(record)
+        return found
+
     code, output = _run_command(["tasklist", "/FO", "CSV"])
     if code != 0 and not output:
         return []
@@ -1548,13 +2112,28 @@ def gather_office_services() -> list[dict[str, str]]:
     return services
 
 
-def gather_office_tasks() -> list[dict[str, str]]:
+def gather_office_tasks() -> list[dict[str, Any]]:
     """!
     @brief Query scheduled tasks associated with Office maintenance.
-    @details Uses ``schtasks`` to surface telemetry, licensing, and background
-    handlers that may interfere with uninstall flows.
+    @details Reads the Office task folders from the task XML tree in one walk,
+    falling back to ``schtasks`` when the tree is not readable, to surface
+    telemetry, licensing, and background handlers that may interfere with
+    uninstall flows.
     """
 
+    registered = task_scheduler.list_registered_tasks(folders=_TASK_FOLDERS)
+    if registered is not None:
+        known = {task_scheduler.normalize_task_path(name).lower() for name in _KNOWN_TASK_NAMES}
+        found: list[dict[str, Any]] = []
+        for key in sorted(registered):
+            task = registered[key]
+            record: dict[str, Any] = {"task": task.path}
+            if task.enabled is not None:
+                record["status"] = "Ready" if task.enabled else "Disabled"
+            record["known"] = key in known
+            found.append(record)
+        return found
+
     code, output = _run_command(["schtasks", "/Query", "/FO", "CSV"])
     if code != 0 and not output:
         return []
@@ -1784,31 +2363,22 @@ def find_orphaned_wi_products() -> list[dict[str, str]]:
         have no corresponding Add/Remove Programs entry.
     @returns List of orphaned products with product_code, name, and version.
     """
-    from . import guid_utils
-
     human_logger = logging_ext.get_human_logger()
     orphans: list[dict[str, str]] = []
 
     try:
         import winreg
 
-        # Get all ARP entries for comparison
-        arp_codes: set[str] = set()
-        arp_base = r"SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall"
-        try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, arp_base, 0, winreg.KEY_READ) as arp_key:
-                index = 0
-                while True:
-                    try:
-                        subkey = winreg.EnumKey(arp_key, index)
-                        index += 1
-                        # Check if subkey looks like a product code
-                        if subkey.startswith("{") and subkey.endswith("}"):
-                            arp_codes.add(subkey.upper())
-                    except OSError:
-                        break
-        except OSError:
-            pass
+        # Get all ARP entries for comparison from the shared Uninstall snapshot
+        snapshot = uninstall_snapshot.current()
+        arp_codes: set[str] = {
+            subkey.upper()
+            for hive, base in constants.MSI_UNINSTALL_ROOTS
+            if hive == constants.HKLM
+            for subkey in snapshot.entries(hive, base)
+            # Check if subkey looks like a product code
+            if subkey.startswith("{") and subkey.endswith("}")
+        }
 
         # Scan WI Products
         wi_products_path = r"SOFTWARE\\Classes\\Installer\\Products"
@@ -9,14 +9,18 @@ virtual environment variables.
 
 from __future__ import annotations
 
+import codecs
+import collections
+import concurrent.futures
 import os
 import subprocess
+import threading
 import time
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import IO, Any
 
-from . import logging_ext
+from . import logging_ext, spinner, tracing
 from .encoding_helpers import SUBPROCESS_ENCODING, SUBPROCESS_ERRORS
 
 _SANITIZE_BLOCKLIST = {
@@ -49,8 +53,70 @@ class CommandResult:
     skipped: bool = False
     timed_out: bool = False
     error: str | None = None
+    stdout_bytes: int | None = None
+    stderr_bytes: int | None = None
+    output_truncated: bool = False
+    """Byte counts and truncation flag; only set for ``stream_output`` runs."""
 
 
+OutputCallback = Callable[[str, str], None]
+"""!
+@brief Receives ``(stream, line)`` for each line of streamed output.
+@details ``stream`` is ``"stdout"`` or ``"stderr"`` and ``line`` has its line
+ending removed. Called on reader threads, so it must be thread-safe.
+"""
+
+DEFAULT_OUTPUT_LIMIT = 1024 * 1024
+"""!
+@brief Bytes of each stream a streamed :class:`CommandResult` retains.
+"""
+
+_LOG_OUTPUT_LIMIT = 16 * 1024
+"""!
+@brief Bytes of each streamed stream copied into the ``*_result`` log event.
+"""
+
+_READ_CHUNK = 64 * 1024
+
+_DRAIN_GRACE = 2.0
+"""!
+@brief Seconds streamed readers may keep draining after the child exits.
+@details Used when no timeout is set, and as a floor when the deadline has
+nearly passed. A grandchild that inherited the pipes can keep them open long
+after the child exits; its output is then abandoned rather than waited for.
+"""
+
+_BATCH = threading.local()
+"""!
+@brief Per-thread list collecting the children a :func:`run_commands` worker spawns.
+"""
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """!
+    @brief One command for :func:`run_commands`.
+    @details Fields mirror the keyword arguments of :func:`run_command`;
+    ``dry_run`` is supplied per batch rather than per spec.
+    """
+
+    command: Sequence[str] | str
+    event: str
+    timeout: int | float | None = None
+    human_message: str | None = None
+    extra: Mapping[str, object] | None = None
+    env: Mapping[str, str] | None = None
+    inherit_env: bool = True
+    env_overrides: Mapping[str, str] | None = None
+    env_remove: Iterable[str] | None = None
+    cwd: str | None = None
+
+
+DEFAULT_MAX_CONCURRENCY = 4
+"""!
+@brief Default number of commands :func:`run_commands` keeps in flight.
+"""
+
 _GLOBAL_TIMEOUT: float | None = None
 
 
@@ -114,8 +180,10 @@ def _build_result_payload(
     stderr: str,
     error: str | None = None,
     timed_out: bool = False,
+    stdout_bytes: int | None = None,
+    stderr_bytes: int | None = None,
 ) -> dict[str, object]:
-    return {
+    payload: dict[str, object] = {
         "rc": return_code,
         "duration_ms": round(duration * 1000, 3),
         "stdout": stdout,
@@ -123,6 +191,28 @@ def _build_result_payload(
         "error": error,
         "timed_out": timed_out,
     }
+    if stdout_bytes is not None or stderr_bytes is not None:
+        payload["stdout"] = _excerpt(stdout, stdout_bytes, _LOG_OUTPUT_LIMIT)
+        payload["stderr"] = _excerpt(stderr, stderr_bytes, _LOG_OUTPUT_LIMIT)
+        payload["stdout_bytes"] = stdout_bytes
+        payload["stderr_bytes"] = stderr_bytes
+    return payload
+
+
+def _excerpt(text: str, total_bytes: int | None, limit: int) -> str:
+    """!
+    @brief Shorten ``text`` to about ``limit`` characters, keeping head and tail.
+    @details The marker records how much of the original ``total_bytes`` was
+    left out of the excerpt.
+    """
+
+    if len(text) <= limit:
+        return text
+    keep = limit // 2
+    head, tail = text[:keep], text[-keep:]
+    total = total_bytes if total_bytes is not None else len(text.encode("utf-8"))
+    omitted = total - len(head.encode("utf-8")) - len(tail.encode("utf-8"))
+    return f"{head}\n... [{max(0, omitted)} of {total} bytes omitted] ...\n{tail}"
 
 
 def sanitize_environment(
@@ -170,6 +260,284 @@ def sanitize_environment(
     return environment
 
 
+@dataclass
+class _CompletedProcess:
+    """!
+    @brief Exit code and captured output of one finished command.
+    """
+
+    returncode: int
+    stdout: str
+    stderr: str
+    stdout_bytes: int | None = None
+    stderr_bytes: int | None = None
+    truncated: bool = False
+
+
+class _BoundedOutput:
+    """!
+    @brief Line buffer keeping the first and last ``limit / 2`` bytes of a stream.
+    @details Lines past the head budget go to a tail deque that drops its oldest
+    lines once over budget. :attr:`total_bytes` counts everything received.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.half = max(1, limit // 2)
+        self.head: list[str] = []
+        self.head_bytes = 0
+        self.tail: collections.deque[tuple[str, int]] = collections.deque()
+        self.tail_bytes = 0
+        self.total_bytes = 0
+        self.dropped = False
+
+    def append(self, line: str, size: int) -> None:
+        self.total_bytes += size
+        if not self.tail and self.head_bytes + size <= self.half:
+            self.head.append(line)
+            self.head_bytes += size
+            return
+        self.tail.append((line, size))
+        self.tail_bytes += size
+        while self.tail_bytes > self.half and len(self.tail) > 1:
+            _, dropped = self.tail.popleft()
+            self.tail_bytes -= dropped
+            self.dropped = True
+
+    def text(self) -> str:
+        tail = "".join(line for line, _ in self.tail)
+        if not self.dropped:
+            return "".join(self.head) + tail
+        omitted = self.total_bytes - self.head_bytes - self.tail_bytes
+        return f"{''.join(self.head)}... [{omitted} bytes omitted] ...\n{tail}"
+
+
+def _pump(
+    pipe: IO[bytes],
+    name: str,
+    buffer: _BoundedOutput,
+    callback: OutputCallback | None,
+    detached: threading.Event,
+) -> None:
+    """!
+    @brief Reader thread: decode ``pipe`` line by line into ``buffer``.
+    @details A failing callback is dropped rather than allowed to stop the
+    reader, since an undrained pipe would block the child. Once ``detached``
+    is set the caller has returned, so the reader stops at its next line and
+    closes the pipe instead of reporting output nobody collects.
+    """
+
+    decoder = codecs.getincrementaldecoder(SUBPROCESS_ENCODING)(SUBPROCESS_ERRORS)
+    with pipe:
+        # Bounded reads so a child that never prints a newline cannot grow one line forever
+        for raw in iter(lambda: pipe.readline(_READ_CHUNK), b""):
+            if detached.is_set():
+                return
+            line = decoder.decode(raw).replace("\r\n", "\n")
+            buffer.append(line, len(raw))
+            if callback is None:
+                continue
+            try:
+                callback(name, line.rstrip("\r\n"))
+            except Exception:  # noqa: BLE001 - never let a consumer stall the pipe
+                logging_ext.get_human_logger().debug(
+                    "Output callback failed; further %s lines are not forwarded", name
+                )
+                callback = None
+        remainder = decoder.decode(b"", final=True)
+        if remainder:
+            buffer.append(remainder, 0)
+
+
+def _register_process(proc: subprocess.Popen[Any]) -> None:
+    """!
+    @brief Track ``proc`` with :mod:`spinner` and the calling worker's batch.
+    """
+
+    spinner.register_process(proc)
+    batch = getattr(_BATCH, "processes", None)
+    if batch is not None:
+        batch.append(proc)
+
+
+def _join_readers(
+    readers: Sequence[threading.Thread], detached: threading.Event, deadline: float
+) -> None:
+    """!
+    @brief Wait for the reader threads until ``deadline``, then detach the rest.
+    @details A reader still blocked after the child exited is reading a pipe a
+    grandchild inherited. Closing that pipe here would block on the reader's
+    buffer lock, so the reader is detached instead: it closes the pipe itself
+    once the grandchild writes or exits, and the caller keeps what was buffered.
+    """
+
+    for reader in readers:
+        reader.join(timeout=max(0.0, deadline - time.monotonic()))
+    detached.set()
+
+
+def _spawn_streaming(
+    command_list: Sequence[str],
+    timeout: float | int | None,
+    env: Mapping[str, str],
+    cwd: str | None,
+    *,
+    limit: int,
+    callback: OutputCallback | None,
+) -> _CompletedProcess:
+    """!
+    @brief Spawn ``command_list`` and read its pipes incrementally.
+    @details Like :func:`_spawn`, but each stream is drained by its own reader
+    thread into a :class:`_BoundedOutput`, so memory stays bounded however
+    much the child prints, and ``callback`` sees lines as they arrive. After
+    the child exits the readers get until the remaining deadline (at least
+    :data:`_DRAIN_GRACE`) to finish; output still arriving later is dropped.
+    @throws subprocess.TimeoutExpired When ``timeout`` elapses (the child is killed).
+    """
+
+    start = time.monotonic()
+    proc = subprocess.Popen(  # noqa: S603 - intentional command execution
+        command_list,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        cwd=cwd,
+    )
+    _register_process(proc)
+    buffers = {"stdout": _BoundedOutput(limit), "stderr": _BoundedOutput(limit)}
+    detached = threading.Event()
+    readers = [
+        threading.Thread(
+            target=_pump,
+            args=(pipe, name, buffers[name], callback, detached),
+            name=f"exec-{name}",
+            daemon=True,
+        )
+        for name, pipe in (("stdout", proc.stdout), ("stderr", proc.stderr))
+        if pipe is not None
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        while True:
+            try:
+                proc.wait(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                if timeout is not None and time.monotonic() - start >= timeout:
+                    proc.kill()
+                    proc.wait()
+                    _join_readers(readers, detached, time.monotonic() + 1.0)
+                    expired = subprocess.TimeoutExpired(
+                        command_list,
+                        timeout,
+                        output=buffers["stdout"].text(),
+                        stderr=buffers["stderr"].text(),
+                    )
+                    # Carried to the timeout event so it can report the full size
+                    for name, buffer in buffers.items():
+                        setattr(expired, f"{name}_bytes", buffer.total_bytes)
+                    raise expired from None
+        drain_until = time.monotonic() + _DRAIN_GRACE
+        if timeout is not None:
+            drain_until = max(drain_until, start + timeout)
+        _join_readers(readers, detached, drain_until)
+    finally:
+        spinner.unregister_process(proc)
+
+    stdout, stderr = buffers["stdout"], buffers["stderr"]
+    return _CompletedProcess(
+        proc.returncode,
+        stdout.text(),
+        stderr.text(),
+        stdout_bytes=stdout.total_bytes,
+        stderr_bytes=stderr.total_bytes,
+        truncated=stdout.dropped or stderr.dropped,
+    )
+
+
+def _spawn(
+    command_list: Sequence[str],
+    timeout: float | int | None,
+    env: Mapping[str, str],
+    cwd: str | None,
+) -> _CompletedProcess:
+    """!
+    @brief Spawn ``command_list`` and wait for it, polling so SIGINT is seen.
+    @throws subprocess.TimeoutExpired When ``timeout`` elapses (the child is killed).
+    """
+
+    start = time.monotonic()
+    # Use Popen with polling instead of run() for interruptibility
+    proc = subprocess.Popen(  # noqa: S603 - intentional command execution
+        command_list,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding=SUBPROCESS_ENCODING,
+        errors=SUBPROCESS_ERRORS,
+        env=env,
+        cwd=cwd,
+    )
+
+    # Tracked so Ctrl+C kills the child even when it runs on a worker thread
+    _register_process(proc)
+    try:
+        # Poll loop - allows SIGINT to be processed between iterations
+        stdout_data = ""
+        stderr_data = ""
+        while True:
+            try:
+                # Short timeout allows signal handling between polls
+                stdout_data, stderr_data = proc.communicate(timeout=0.1)
+                break  # Process finished
+            except subprocess.TimeoutExpired:
+                # Check if we've exceeded our timeout
+                if timeout is not None:
+                    elapsed = time.monotonic() - start
+                    if elapsed >= timeout:
+                        proc.kill()
+                        proc.wait()
+                        raise subprocess.TimeoutExpired(
+                            command_list, timeout, output=stdout_data, stderr=stderr_data
+                        ) from None
+                # Otherwise continue polling
+                continue
+    finally:
+        spinner.unregister_process(proc)
+
+    return _CompletedProcess(proc.returncode, stdout_data, stderr_data)
+
+
+def _run_in_powershell_host(
+    command_list: Sequence[str], timeout: float | int | None
+) -> _CompletedProcess | None:
+    """!
+    @brief Run a plain ``powershell -Command``/``-File`` call on a pooled host.
+    @details See :mod:`powershell_host`. Returns ``None`` when the command is
+    not a hostable PowerShell call or no host is available, in which case the
+    caller spawns it as usual.
+    @throws subprocess.TimeoutExpired When the script exceeded ``timeout``.
+    @throws OSError When the host died while running the script.
+    """
+
+    from . import powershell_host
+
+    if not powershell_host.is_enabled():
+        return None
+    script = powershell_host.script_from_command(command_list)
+    if script is None:
+        return None
+    try:
+        hosted = powershell_host.run_script(script, timeout=timeout)
+    except powershell_host.PowerShellHostTimeout:
+        raise subprocess.TimeoutExpired(list(command_list), timeout or 0) from None
+    except powershell_host.PowerShellHostError as exc:
+        raise OSError(str(exc)) from exc
+    if hosted is None:
+        return None
+    return _CompletedProcess(hosted.returncode, hosted.stdout, hosted.stderr)
+
+
+@tracing.traced("exec.run_command", capture=("event", "dry_run"))
 def run_command(
     command: Sequence[str] | str,
     *,
@@ -184,6 +552,9 @@ def run_command(
     env_remove: Iterable[str] | None = None,
     cwd: str | None = None,
     check: bool = False,
+    stream_output: bool = False,
+    output_callback: OutputCallback | None = None,
+    output_limit: int = DEFAULT_OUTPUT_LIMIT,
 ) -> CommandResult:
     """!
     @brief Execute ``command`` with consistent logging and environment hygiene.
@@ -207,6 +578,13 @@ def run_command(
     @param cwd Working directory supplied to :func:`subprocess.run`.
     @param check When ``True`` non-zero exit codes raise
     :class:`subprocess.CalledProcessError` after logging the result.
+    @param stream_output Read output incrementally and keep only the first and
+    last ``output_limit / 2`` bytes of each stream; the ``*_result`` event then
+    carries a shorter excerpt plus the byte counts. Use for chatty,
+    long-running tools such as installers.
+    @param output_callback Receives each output line as it arrives; implies
+    ``stream_output``.
+    @param output_limit Bytes retained per stream when streaming.
     @returns :class:`CommandResult` describing the observed outcome.
     """
 
@@ -274,48 +652,23 @@ def run_command(
         remove=env_remove,
     )
 
+    streaming = stream_output or output_callback is not None
     start = time.monotonic()
     try:
-        # Use Popen with polling instead of run() for interruptibility
-        proc = subprocess.Popen(  # noqa: S603 - intentional command execution
-            command_list,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            encoding=SUBPROCESS_ENCODING,
-            errors=SUBPROCESS_ERRORS,
-            env=sanitized_env,
-            cwd=cwd,
-        )
-
-        # Poll loop - allows SIGINT to be processed between iterations
-        stdout_data = ""
-        stderr_data = ""
-        while True:
-            try:
-                # Short timeout allows signal handling between polls
-                stdout_data, stderr_data = proc.communicate(timeout=0.1)
-                break  # Process finished
-            except subprocess.TimeoutExpired:
-                # Check if we've exceeded our timeout
-                if effective_timeout is not None:
-                    elapsed = time.monotonic() - start
-                    if elapsed >= effective_timeout:
-                        proc.kill()
-                        proc.wait()
-                        raise subprocess.TimeoutExpired(
-                            command_list, effective_timeout, output=stdout_data, stderr=stderr_data
-                        ) from None
-                # Otherwise continue polling
-                continue
-
-        # Build a result object similar to subprocess.run
-        class _CompletedProcess:
-            def __init__(self) -> None:
-                self.returncode = proc.returncode
-                self.stdout = stdout_data
-                self.stderr = stderr_data
-
-        completed = _CompletedProcess()
+        completed: _CompletedProcess | None = None
+        if streaming:
+            completed = _spawn_streaming(
+                command_list,
+                effective_timeout,
+                sanitized_env,
+                cwd,
+                limit=output_limit,
+                callback=output_callback,
+            )
+        elif env is None and env_overrides is None and env_remove is None and cwd is None:
+            completed = _run_in_powershell_host(command_list, effective_timeout)
+        if completed is None:
+            completed = _spawn(command_list, effective_timeout, sanitized_env, cwd)
     except FileNotFoundError as exc:
         duration = time.monotonic() - start
         human_logger.error("Command not found: %s", command_list[0])
@@ -363,6 +716,8 @@ def run_command(
                 stderr=str(exc.stderr or ""),
                 error="timeout",
                 timed_out=True,
+                stdout_bytes=getattr(exc, "stdout_bytes", None),
+                stderr_bytes=getattr(exc, "stderr_bytes", None),
             ),
         }
         machine_logger.error(f"{event}_timeout", extra=dict(failure_meta))
@@ -421,6 +776,8 @@ def run_command(
             stderr=str(completed.stderr),
             error=None,
             timed_out=False,
+            stdout_bytes=completed.stdout_bytes,
+            stderr_bytes=completed.stderr_bytes,
         ),
     }
     machine_logger.info(f"{event}_result", extra=dict(result_meta))
@@ -434,6 +791,9 @@ def run_command(
         stdout=completed.stdout,
         stderr=completed.stderr,
         duration=duration,
+        stdout_bytes=completed.stdout_bytes,
+        stderr_bytes=completed.stderr_bytes,
+        output_truncated=completed.truncated,
     )
 
     if check and completed.returncode != 0:
@@ -445,3 +805,82 @@ def run_command(
         )
 
     return result
+
+
+def run_commands(
+    specs: Iterable[CommandSpec],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    dry_run: bool = False,
+) -> list[CommandResult]:
+    """!
+    @brief Run independent commands concurrently through :func:`run_command`.
+    @details Each spec is executed by :func:`run_command` on a pool of at most
+    ``max_concurrency`` threads, so logging, dry-run handling, environment
+    sanitisation and timeouts are identical to serial calls. Every spawned
+    child is registered with :mod:`spinner`, so Ctrl+C kills the whole batch.
+    If the wait raises in the calling thread, queued commands are cancelled;
+    on ``KeyboardInterrupt`` the children this batch spawned are also killed,
+    while processes started elsewhere are left alone.
+    @param specs Commands to run; they must not depend on each other.
+    @param max_concurrency Upper bound on commands in flight.
+    @param dry_run Applied to every spec as in :func:`run_command`.
+    @returns One :class:`CommandResult` per spec, in input order.
+    """
+
+    spec_list = list(specs)
+    if not spec_list:
+        return []
+    spawned: list[subprocess.Popen[Any]] = []
+
+    def _run(spec: CommandSpec) -> CommandResult:
+        _BATCH.processes = spawned
+        try:
+            return _run_spec(spec)
+        finally:
+            _BATCH.processes = None
+
+    def _run_spec(spec: CommandSpec) -> CommandResult:
+        if spinner.is_cancelled():
+            return CommandResult(
+                command=[spec.command] if isinstance(spec.command, str) else list(spec.command),
+                returncode=1,
+                stdout="",
+                stderr="",
+                duration=0.0,
+                skipped=True,
+                error="cancelled",
+            )
+        return run_command(
+            spec.command,
+            event=spec.event,
+            timeout=spec.timeout,
+            dry_run=dry_run,
+            human_message=spec.human_message,
+            extra=spec.extra,
+            env=spec.env,
+            inherit_env=spec.inherit_env,
+            env_overrides=spec.env_overrides,
+            env_remove=spec.env_remove,
+            cwd=spec.cwd,
+        )
+
+    workers = max(1, min(int(max_concurrency), len(spec_list)))
+    if workers == 1:
+        return [_run(spec) for spec in spec_list]
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="exec")
+    futures: list[concurrent.futures.Future[CommandResult]] = []
+    try:
+        for spec in spec_list:
+            futures.append(pool.submit(_run, spec))
+        results = [future.result() for future in futures]
+    except BaseException as exc:
+        for future in futures:
+            future.cancel()
+        if isinstance(exc, KeyboardInterrupt):
+            spinner.kill_processes(list(spawned))
+        pool.shutdown(wait=False)
+        raise
+    pool.shutdown(wait=True)
+    return results
@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import ctypes
 import hashlib
 import logging
@@ -18,9 +19,10 @@ import shutil
 import stat
 from collections.abc import Iterable, Mapping, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Callable
 
-from . import constants, exec_utils, logging_ext, spinner
+from . import constants, exec_utils, logging_ext, spinner, tracing
+from .prefix_trie import PrefixTrie
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     import winreg as _winreg
@@ -95,6 +97,11 @@ _ENVIRONMENT_DEFAULTS: Mapping[str, str] = {
 
 _ENV_PATTERN = re.compile(r"%([A-Za-z0-9_]+)%")
 
+DEFAULT_DELETE_WORKERS = 8
+"""!
+@brief Threads deleting files in parallel while :func:`remove_paths` walks a tree.
+"""
+
 _MOVEFILE_DELAY_UNTIL_REBOOT = 0x00000004
 _PENDING_FILE_RENAME_KEY = r"SYSTEM\\CurrentControlSet\\Control\\Session Manager"
 _PENDING_FILE_RENAME_VALUE = "PendingFileRenameOperations"
@@ -161,6 +168,93 @@ def _expand_environment(path: str, env: Mapping[str, str]) -> str:
     return _ENV_PATTERN.sub(replacer, path)
 
 
+_PROFILE_VARIABLES: Mapping[str, str] = {
+    "%APPDATA%": "\\APPDATA\\ROAMING",
+    "%LOCALAPPDATA%": "\\APPDATA\\LOCAL",
+}
+"""!
+@brief Profile variables matched under any ``\\USERS\\`` profile instead of expanded.
+"""
+
+
+class PathPolicy:
+    """!
+    @brief Whitelist/blacklist rules compiled once for repeated path checks.
+    @details Plain entries are environment-expanded, normalised and stored in a
+    :class:`~office_janitor.prefix_trie.PrefixTrie`; the longest matching entry
+    decides, with whitelist entries winning ties. ``%APPDATA%`` and
+    ``%LOCALAPPDATA%`` entries match any user profile, as before. Nothing else
+    is allowed.
+    """
+
+    def __init__(
+        self,
+        whitelist: Iterable[str] | None = None,
+        blacklist: Iterable[str] | None = None,
+        *,
+        env: Mapping[str, object] | None = None,
+    ) -> None:
+        environment = _prepare_environment(env)
+        self._prefixes: PrefixTrie[bool] = PrefixTrie()
+        self._profile_suffixes: list[str] = []
+        for entry in tuple(blacklist or FILESYSTEM_BLACKLIST):
+            expanded = _expand_environment(str(entry), environment)
+            self._prefixes.add(normalize_windows_path(expanded), False)
+        for entry in tuple(whitelist or FILESYSTEM_WHITELIST):
+            entry_text = str(entry)
+            entry_upper = entry_text.upper()
+            for variable, profile_path in _PROFILE_VARIABLES.items():
+                if entry_upper.startswith(variable + "\\"):
+                    suffix = normalize_windows_path(profile_path + entry_upper[len(variable) :])
+                    self._profile_suffixes.append(suffix)
+                    break
+            else:
+                expanded = _expand_environment(entry_text, environment)
+                self._prefixes.add(normalize_windows_path(expanded), True)
+
+    def allows(self, path: str | os.PathLike[str]) -> bool:
+        """!
+        @brief Return ``True`` when ``path`` falls under an allowed root.
+        """
+
+        normalized = normalize_windows_path(path)
+        for suffix in self._profile_suffixes:
+            index = normalized.find(suffix)
+            if index >= 0 and "\\USERS\\" in normalized[:index]:
+                return True
+        match = self._prefixes.longest_match(normalized)
+        return match is not None and match[1]
+
+
+_DEFAULT_PATH_POLICY: tuple[tuple[object, object], PathPolicy] | None = None
+
+
+def default_path_policy() -> PathPolicy:
+    """!
+    @brief Return the :class:`PathPolicy` for the default lists, compiling it once.
+    @details The cache is keyed on the list objects, so rebinding
+    :data:`FILESYSTEM_WHITELIST` or :data:`FILESYSTEM_BLACKLIST` recompiles it.
+    """
+
+    global _DEFAULT_PATH_POLICY
+    sources = (FILESYSTEM_WHITELIST, FILESYSTEM_BLACKLIST)
+    cached = _DEFAULT_PATH_POLICY
+    if cached is None or cached[0][0] is not sources[0] or cached[0][1] is not sources[1]:
+        cached = (sources, PathPolicy(FILESYSTEM_WHITELIST, FILESYSTEM_BLACKLIST))
+        _DEFAULT_PATH_POLICY = cached
+    return cached[1]
+
+
+def _path_policy(
+    whitelist: Iterable[str] | None,
+    blacklist: Iterable[str] | None,
+    env: Mapping[str, object] | None,
+) -> PathPolicy:
+    if whitelist is None and blacklist is None and env is None:
+        return default_path_policy()
+    return PathPolicy(whitelist, blacklist, env=env)
+
+
 def is_path_whitelisted(
     path: str | os.PathLike[str],
     *,
@@ -170,45 +264,11 @@ def is_path_whitelisted(
 ) -> bool:
     """!
     @brief Check whether ``path`` is within the allowed Office cleanup roots.
+    @details Uses the cached :func:`default_path_policy` when no overrides are
+    given; callers checking many paths should build one :class:`PathPolicy`.
     """
 
-    environment = _prepare_environment(env)
-    allowed = tuple(whitelist or FILESYSTEM_WHITELIST)
-    blocked = tuple(blacklist or FILESYSTEM_BLACKLIST)
-    normalized = normalize_windows_path(path)
-
-    for entry in allowed:
-        entry_text = str(entry)
-        entry_upper = entry_text.upper()
-        if entry_upper.startswith("%APPDATA%\\"):
-            suffix = entry_upper[len("%APPDATA%") :]
-            if match_environment_suffix(
-                normalized, "\\APPDATA\\ROAMING" + suffix, require_users=True
-            ):
-                return True
-            continue
-        if entry_upper.startswith("%LOCALAPPDATA%\\"):
-            suffix = entry_upper[len("%LOCALAPPDATA%") :]
-            if match_environment_suffix(
-                normalized, "\\APPDATA\\LOCAL" + suffix, require_users=True
-            ):
-                return True
-            continue
-
-        expanded = _expand_environment(entry_text, environment)
-        candidate = normalize_windows_path(expanded)
-        if candidate and normalized.startswith(candidate):
-            return True
-        if normalized == candidate:
-            return True
-
-    for entry in blocked:
-        expanded = _expand_environment(str(entry), environment)
-        candidate = normalize_windows_path(expanded)
-        if candidate and normalized.startswith(candidate):
-            return False
-
-    return False
+    return _path_policy(whitelist, blacklist, env).allows(path)
 
 
 def filter_whitelisted_paths(
@@ -222,7 +282,7 @@ def filter_whitelisted_paths(
     @brief Return the subset of ``paths`` permitted by the whitelist/blacklist rules.
     """
 
-    environment = _prepare_environment(env)
+    policy = _path_policy(whitelist, blacklist, env)
     allowed_paths: list[Path] = []
     seen: set[str] = set()
     for raw in paths:
@@ -230,12 +290,7 @@ def filter_whitelisted_paths(
         normalized = normalize_windows_path(candidate_path)
         if normalized in seen:
             continue
-        if is_path_whitelisted(
-            candidate_path,
-            whitelist=whitelist,
-            blacklist=blacklist,
-            env=environment,
-        ):
+        if policy.allows(candidate_path):
             allowed_paths.append(candidate_path)
             seen.add(normalized)
     return allowed_paths
@@ -264,8 +319,7 @@ def discover_paths(
     else:
         search_roots.extend(candidates)
 
-    allowed = tuple(whitelist or FILESYSTEM_WHITELIST)
-    blocked = tuple(blacklist or FILESYSTEM_BLACKLIST)
+    policy = PathPolicy(whitelist, blacklist, env=environment)
 
     discovered: list[Path] = []
     seen: set[str] = set()
@@ -275,12 +329,7 @@ def discover_paths(
         normalized = normalize_windows_path(expanded)
         if normalized in seen:
             continue
-        if not is_path_whitelisted(
-            candidate_path,
-            whitelist=allowed,
-            blacklist=blocked,
-            env=environment,
-        ):
+        if not policy.allows(candidate_path):
             continue
         exists = True
         if must_exist:
@@ -296,20 +345,186 @@ def discover_paths(
     return discovered
 
 
-def _handle_readonly(
-    function: Callable[[str], None],
-    path: str,
-    exc_info: tuple[type[BaseException], BaseException, Any],
-) -> None:  # pragma: no cover - defensive callback
+def _clear_readonly(path: str) -> None:
     """!
-    @brief Clear read-only attributes before retrying removal.
+    @brief Clear the read-only attribute on ``path`` in-process.
     """
 
-    if isinstance(exc_info[1], PermissionError):
-        os.chmod(path, stat.S_IWRITE)
-        function(path)
-    else:
-        raise exc_info[1]
+    try:
+        os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+    except OSError:
+        pass
+
+
+def _unlink_entry(path: str) -> None:
+    """!
+    @brief Remove one file or link, clearing read-only attributes on demand.
+    @details Directory symlinks and junctions are removed as links; their
+    targets are never traversed.
+    """
+
+    try:
+        os.unlink(path)
+    except IsADirectoryError:
+        os.rmdir(path)
+    except PermissionError:
+        _clear_readonly(path)
+        try:
+            os.unlink(path)
+        except (IsADirectoryError, PermissionError):
+            if not os.path.isdir(path):
+                raise
+            os.rmdir(path)
+
+
+def _rmdir_entry(path: str) -> None:
+    """!
+    @brief Remove one empty directory, clearing read-only attributes on demand.
+    """
+
+    try:
+        os.rmdir(path)
+    except PermissionError:
+        _clear_readonly(path)
+        os.rmdir(path)
+
+
+def _is_reparse_point(info: os.stat_result) -> bool:
+    """!
+    @brief Report whether ``info`` (an ``lstat`` result) describes a reparse point.
+    @details Covers NTFS junctions and mount points, which ``is_symlink`` does not
+    report before Python 3.12. Always ``False`` off Windows.
+    """
+
+    attributes = getattr(info, "st_file_attributes", 0)
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _is_link(entry: os.DirEntry[str]) -> bool:
+    """!
+    @brief Report whether ``entry`` is a symlink, NTFS junction or other reparse point.
+    """
+
+    return entry.is_symlink() or _is_reparse_point(entry.stat(follow_symlinks=False))
+
+
+def _is_real_directory(path: Path) -> bool:
+    """!
+    @brief Report whether ``path`` is a directory that is safe to walk into.
+    @details Symlinks, junctions and other reparse points are not, so their
+    targets are never deleted through them.
+    """
+
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(info.st_mode) and not _is_reparse_point(info)
+
+
+class _TreeRemoval:
+    """!
+    @brief Delete one directory tree with a single ``os.scandir`` walk.
+    @details Files are unlinked on a shared bounded thread pool while the walk
+    continues; directories are removed deepest first once their files are gone.
+    ACLs are reset (``icacls /reset /t``) only for directories that refuse
+    enumeration and for the parents of files that still deny access after the
+    read-only attribute was cleared.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        pool: concurrent.futures.Executor,
+        human_logger: logging.Logger,
+    ) -> None:
+        self.root = root
+        self._pool = pool
+        self._human_logger = human_logger
+        self.files = 0
+        self.directories: list[str] = []
+        self.acl_resets: list[str] = []
+        self.failed: list[str] = []
+
+    def _reset_acl_once(self, directory: str) -> None:
+        if directory in self.acl_resets:
+            return
+        self.acl_resets.append(directory)
+        try:
+            reset_acl(Path(directory))
+        except Exception as exc:  # pragma: no cover - logged for diagnostics
+            self._human_logger.warning("Unable to reset ACLs for %s: %s", directory, exc)
+
+    def _scan(self, directory: str) -> list[os.DirEntry[str]] | None:
+        for attempt in range(2):
+            try:
+                with os.scandir(directory) as iterator:
+                    return list(iterator)
+            except FileNotFoundError:
+                return []
+            except PermissionError:
+                if attempt:
+                    break
+                self._reset_acl_once(directory)
+                _clear_readonly(directory)
+            except OSError:
+                break
+        self.failed.append(directory)
+        return None
+
+    def run(self) -> list[str]:
+        """!
+        @brief Remove the tree and return the paths that could not be deleted.
+        """
+
+        pending: dict[concurrent.futures.Future[None], str] = {}
+        stack = [str(self.root)]
+        while stack:
+            directory = stack.pop()
+            self.directories.append(directory)
+            entries = self._scan(directory)
+            for entry in entries or ():
+                try:
+                    descend = entry.is_dir(follow_symlinks=False) and not _is_link(entry)
+                except OSError:
+                    descend = False
+                if descend:
+                    stack.append(entry.path)
+                else:
+                    self.files += 1
+                    pending[self._pool.submit(_unlink_entry, entry.path)] = entry.path
+
+        denied: list[str] = []
+        for future in concurrent.futures.as_completed(pending):
+            try:
+                future.result()
+            except FileNotFoundError:
+                continue
+            except PermissionError:
+                denied.append(pending[future])
+            except OSError:
+                self.failed.append(pending[future])
+
+        for path in sorted(denied):
+            self._reset_acl_once(os.path.dirname(path))
+            try:
+                _unlink_entry(path)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                self.failed.append(path)
+
+        # Pre-order walk reversed: every directory comes after its children.
+        for directory in reversed(self.directories):
+            if directory in self.failed:
+                continue
+            try:
+                _rmdir_entry(directory)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                self.failed.append(directory)
+        return self.failed
 
 
 def _get_movefileex() -> Callable[[str, str | None, int], int] | None:
@@ -462,9 +677,19 @@ def _schedule_delete_on_reboot(
     return False
 
 
-def remove_paths(paths: Iterable[Path | str], *, dry_run: bool = False) -> None:
+@tracing.traced("filesystem.remove_paths", capture=("dry_run",))
+def remove_paths(
+    paths: Iterable[Path | str],
+    *,
+    dry_run: bool = False,
+    max_workers: int = DEFAULT_DELETE_WORKERS,
+) -> None:
     """!
     @brief Delete the supplied paths recursively while respecting dry-run behaviour.
+    @details Missing paths are skipped before any work is done. Directory trees
+    are walked once in-process (see :class:`_TreeRemoval`) and their files are
+    deleted on a pool of ``max_workers`` threads. Paths that still cannot be
+    deleted are queued for removal on reboot.
     """
 
     human_logger = logging_ext.get_human_logger()
@@ -472,95 +697,107 @@ def remove_paths(paths: Iterable[Path | str], *, dry_run: bool = False) -> None:
 
     path_list = list(paths)
     total_paths = len(path_list)
-
-    for idx, raw in enumerate(path_list, 1):
-        target = Path(raw)
-
-        # Update spinner with current path being cleaned
-        short_path = target.name if len(str(target)) > 50 else str(target)
-        spinner.set_task(f"Cleaning {short_path} ({idx}/{total_paths})")
-
-        machine_logger.info(
-            "filesystem_remove_plan",
-            extra={
-                "event": "filesystem_remove_plan",
-                "path": str(target),
-                "dry_run": bool(dry_run),
-            },
+    pool: concurrent.futures.ThreadPoolExecutor | None = None
+
+    def schedule(path: Path) -> None:
+        _schedule_delete_on_reboot(
+            path,
+            dry_run=dry_run,
+            human_logger=human_logger,
+            machine_logger=machine_logger,
         )
 
-        if dry_run:
-            human_logger.info("Dry-run: would remove %s", target)
-            continue
+    try:
+        for idx, raw in enumerate(path_list, 1):
+            target = Path(raw)
+
+            # Update spinner with current path being cleaned
+            short_path = target.name if len(str(target)) > 50 else str(target)
+            spinner.set_task(f"Cleaning {short_path} ({idx}/{total_paths})")
+
+            machine_logger.info(
+                "filesystem_remove_plan",
+                extra={
+                    "event": "filesystem_remove_plan",
+                    "path": str(target),
+                    "dry_run": bool(dry_run),
+                },
+            )
 
-        try:
-            make_paths_writable([target])
-            reset_acl(target)
-        except Exception as exc:  # pragma: no cover - logged for diagnostics
-            human_logger.warning("Unable to reset ACLs for %s: %s", target, exc)
+            if dry_run:
+                human_logger.info("Dry-run: would remove %s", target)
+                continue
 
-        try:
-            exists = target.exists()
-        except OSError:
-            exists = False
+            try:
+                exists = os.path.lexists(target)
+            except OSError:
+                exists = False
 
-        if not exists:
-            human_logger.debug("Skipping %s because it does not exist", target)
-            continue
+            if not exists:
+                human_logger.debug("Skipping %s because it does not exist", target)
+                continue
 
-        human_logger.info("Removing %s", target)
-        if target.is_dir():
-            try:
-                shutil.rmtree(target, onerror=_handle_readonly)
-            except PermissionError as exc:
-                human_logger.warning("Unable to remove %s due to permissions: %s", target, exc)
-                _schedule_delete_on_reboot(
-                    target,
-                    dry_run=dry_run,
-                    human_logger=human_logger,
-                    machine_logger=machine_logger,
-                )
-            except OSError as exc:  # pragma: no cover - unexpected failure
-                human_logger.warning("Unable to remove %s: %s", target, exc)
-                _schedule_delete_on_reboot(
-                    target,
-                    dry_run=dry_run,
-                    human_logger=human_logger,
-                    machine_logger=machine_logger,
+            human_logger.info("Removing %s", target)
+            if _is_real_directory(target):
+                if pool is None:
+                    pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=max(1, int(max_workers)),
+                        thread_name_prefix="fs_remove",
+                    )
+                removal = _TreeRemoval(target, pool, human_logger)
+                failed = removal.run()
+                machine_logger.info(
+                    "filesystem_remove_tree",
+                    extra={
+                        "event": "filesystem_remove_tree",
+                        "path": str(target),
+                        "files": removal.files,
+                        "directories": len(removal.directories),
+                        "acl_resets": len(removal.acl_resets),
+                        "failed": len(failed),
+                    },
                 )
-        else:
+                if failed:
+                    human_logger.warning(
+                        "Unable to remove %d entries under %s; queueing for reboot",
+                        len(failed),
+                        target,
+                    )
+                    # Files were appended before their parent directories.
+                    for path in failed:
+                        schedule(Path(path))
+                continue
+
             try:
                 target.unlink()
             except PermissionError:
-                os.chmod(target, stat.S_IWRITE)
+                _clear_readonly(str(target))
                 try:
                     target.unlink()
-                except PermissionError as exc:
-                    human_logger.warning("Unable to remove %s due to permissions: %s", target, exc)
-                    _schedule_delete_on_reboot(
-                        target,
-                        dry_run=dry_run,
-                        human_logger=human_logger,
-                        machine_logger=machine_logger,
-                    )
+                except PermissionError:
+                    reset_acl(target)
+                    try:
+                        target.unlink()
+                    except PermissionError as exc:
+                        human_logger.warning(
+                            "Unable to remove %s due to permissions: %s", target, exc
+                        )
+                        schedule(target)
+                    except OSError as exc:  # pragma: no cover - unexpected failure
+                        human_logger.warning("Unable to remove %s: %s", target, exc)
+                        schedule(target)
                 except OSError as exc:  # pragma: no cover - unexpected failure
                     human_logger.warning("Unable to remove %s: %s", target, exc)
-                    _schedule_delete_on_reboot(
-                        target,
-                        dry_run=dry_run,
-                        human_logger=human_logger,
-                        machine_logger=machine_logger,
-                    )
+                    schedule(target)
             except OSError as exc:
                 human_logger.warning("Unable to remove %s: %s", target, exc)
-                _schedule_delete_on_reboot(
-                    target,
-                    dry_run=dry_run,
-                    human_logger=human_logger,
-                    machine_logger=machine_logger,
-                )
+                schedule(target)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
 
 
+@tracing.traced("filesystem.reset_acl")
 def reset_acl(path: Path) -> None:
     """!
     @brief Reset permissions on ``path`` so cleanup operations can proceed.
@@ -597,6 +834,7 @@ def reset_acl(path: Path) -> None:
         )
 
 
+@tracing.traced("filesystem.make_paths_writable", capture=("dry_run",))
 def make_paths_writable(paths: Sequence[Path | str], *, dry_run: bool = False) -> None:
     """!
     @brief Clear read-only attributes in preparation for recursive deletion.
@@ -1336,17 +1574,20 @@ def remove_office_appx_packages(*, dry_run: bool = False) -> dict[str, object]:
 
 
 __all__ = [
+    "DEFAULT_DELETE_WORKERS",
     "FILESYSTEM_BLACKLIST",
     "FILESYSTEM_WHITELIST",
     "MSOCACHE_PATHS",
     "MSOCACHE_PRODUCT_PATTERNS",
     "OFFICE_APPX_PATTERNS",
     "OFFICE_SHORTCUT_NAMES",
+    "PathPolicy",
     "WI_CACHE_PATH",
     "backup_path",
     "cleanup_msocache",
     "cleanup_office_shortcuts",
     "cleanup_wi_cache_orphans",
+    "default_path_policy",
     "discover_msocache_paths",
     "discover_paths",
     "enumerate_msocache_products",
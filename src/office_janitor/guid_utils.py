@@ -87,12 +87,12 @@ def compress_guid(guid: str) -> str:
 
     @details The compression algorithm:
     1. Remove braces and hyphens
-    2. Split into segments: 8-4-4-2-2-2-2-2-2-2-2 characters
-    3. Reverse each pair of characters within each segment
+    2. Reverse the first three segments (8-4-4 characters) entirely
+    3. Reverse each pair of characters within the last two segments
 
     Example:
-    - Input:  ``{00000000-0000-0000-0000-000000000001}``
-    - Output: ``00000000000000000000000000000010``
+    - Input:  ``{90160000-0011-0000-0000-0000000FF1CE}``
+    - Output: ``00006109110000000000000000F01FEC``
 
     This matches the VBS ``GetCompressedGuid`` function from OffScrub_O16msi.vbs.
     """
@@ -103,15 +103,9 @@ def compress_guid(guid: str) -> str:
     # Extract groups: (8 chars)-(4)-(4)-(4)-(12)
     g1, g2, g3, g4, g5 = match.groups()
 
-    # Apply pair reversal to each segment
-    # The 4th group (4 chars) and 5th group (12 chars) are treated as pairs
-    compressed = (
-        _reverse_pairs(g1)
-        + _reverse_pairs(g2)
-        + _reverse_pairs(g3)
-        + _reverse_pairs(g4)
-        + _reverse_pairs(g5)
-    )
+    # The first three groups are stored fully reversed; the 4th group (4 chars)
+    # and 5th group (12 chars) are stored as byte pairs with swapped nibbles.
+    compressed = g1[::-1] + g2[::-1] + g3[::-1] + _reverse_pairs(g4) + _reverse_pairs(g5)
 
     return compressed.upper()
 
@@ -126,8 +120,8 @@ def expand_guid(compressed: str) -> str:
     @details Reverses the compression algorithm to restore the original GUID.
 
     Example:
-    - Input:  ``00000000000000000000000000000010``
-    - Output: ``{00000000-0000-0000-0000-000000000001}``
+    - Input:  ``00006109110000000000000000F01FEC``
+    - Output: ``{90160000-0011-0000-0000-0000000FF1CE}``
 
     This matches the VBS ``GetExpandedGuid`` function from OffScrub_O16msi.vbs.
     """
@@ -136,9 +130,9 @@ def expand_guid(compressed: str) -> str:
 
     # Split into segments matching the compression pattern
     c = compressed.upper()
-    g1 = _reverse_pairs(c[0:8])
-    g2 = _reverse_pairs(c[8:12])
-    g3 = _reverse_pairs(c[12:16])
+    g1 = c[0:8][::-1]
+    g2 = c[8:12][::-1]
+    g3 = c[12:16][::-1]
     g4 = _reverse_pairs(c[16:20])
     g5 = _reverse_pairs(c[20:32])
 
@@ -0,0 +1,324 @@
+"""!
+@brief Persistent, fingerprint-validated cache of inventory sections.
+@details Detection results are stored per inventory section in a JSON file in
+the log directory. Each section is keyed by a cheap fingerprint of the state
+it was derived from: ``RegQueryInfoKey`` subkey counts and last-write times of
+the registry roots it reads, and directory modification times for the install
+and residue roots it checks. A later run that computes the same fingerprint
+reuses the stored section instead of probing again, so ``diagnose`` followed by
+``remove`` on an unchanged machine pays for detection once. Sections whose
+sources cannot be fingerprinted on this host are never cached, and
+``--refresh`` bypasses the stored data entirely.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from . import constants, logging_ext, registry_tools, task_scheduler
+
+CACHE_FILENAME = "inventory-cache.json"
+CACHE_FORMAT = 1
+
+CACHED_SECTIONS: tuple[str, ...] = (
+    "msi",
+    "c2r",
+    "appx",
+    "uninstall_entries",
+    "tasks",
+    "registry",
+    "filesystem",
+)
+"""!
+@brief Inventory sections eligible for reuse.
+@details Context, running processes, service state and activation state change
+without leaving a cheap trace and are always probed afresh.
+"""
+
+_MSI_USERDATA_ROOT = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Installer\UserData"
+_MSI_CLASSES_PRODUCTS_ROOT = r"SOFTWARE\Classes\Installer\Products"
+_APPX_STORE_ROOT = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Appx\AppxAllUserStore"
+_TASK_FOLDERS = ("Microsoft\\Office", "Microsoft\\OfficeSoftwareProtectionPlatform")
+_C2R_INSTALL_ROOTS = (
+    r"C:\Program Files\Microsoft Office\root",
+    r"C:\Program Files (x86)\Microsoft Office\root",
+    r"C:\Program Files\Common Files\microsoft shared\ClickToRun",
+)
+
+
+class FingerprintUnavailable(Exception):
+    """!
+    @brief Raised when a fingerprint source cannot be read on this host.
+    """
+
+
+def _key_stamp(hive: int, path: str) -> list[list[int]]:
+    """!
+    @brief Return ``[subkeys, values, last_write]`` for every view of ``hive\\path``.
+    @details A missing key yields an empty list so its later creation changes
+    the fingerprint.
+    @throws FingerprintUnavailable When the key exists but cannot be queried.
+    """
+
+    winreg = registry_tools.winreg
+    if not hasattr(winreg, "QueryInfoKey"):
+        raise FingerprintUnavailable(path)
+    stamps: list[list[int]] = []
+    for mask in registry_tools._iter_access_masks(registry_tools._WINREG_KEY_READ, None):
+        try:
+            handle = winreg.OpenKey(hive, path, 0, mask)
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            raise FingerprintUnavailable(path) from exc
+        try:
+            subkeys, values, modified = winreg.QueryInfoKey(handle)[:3]
+        except OSError as exc:
+            raise FingerprintUnavailable(path) from exc
+        finally:
+            winreg.CloseKey(handle)
+        stamps.append([int(subkeys), int(values), int(modified)])
+    return stamps
+
+
+def _keys_stamp(keys: Iterable[tuple[int, str]]) -> list[object]:
+    """!
+    @brief Stamp each distinct registry key in ``keys``.
+    """
+
+    return [[hive, path, _key_stamp(hive, path)] for hive, path in dict.fromkeys(keys)]
+
+
+def _dir_stamp(path: str | Path) -> int | None:
+    """!
+    @brief Return the modification time of ``path`` in nanoseconds, ``None`` if absent.
+    @throws FingerprintUnavailable When the path exists but cannot be stat'ed.
+    """
+
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        raise FingerprintUnavailable(str(path)) from exc
+
+
+def _dirs_stamp(paths: Iterable[str | Path]) -> list[object]:
+    """!
+    @brief Stamp each distinct directory in ``paths``.
+    """
+
+    return [[str(path), _dir_stamp(path)] for path in dict.fromkeys(str(p) for p in paths)]
+
+
+def _parent_keys(keys: Iterable[tuple[int, str]]) -> list[tuple[int, str]]:
+    """!
+    @brief Return the parent of each registry key; creating or deleting a
+    child updates the parent's last-write time.
+    """
+
+    return [(hive, path.rstrip("\\").rpartition("\\")[0] or path) for hive, path in keys]
+
+
+def _msi_source() -> list[object]:
+    keys: list[tuple[int, str]] = list(constants.MSI_UNINSTALL_ROOTS)
+    keys.append((constants.HKLM, _MSI_CLASSES_PRODUCTS_ROOT))
+    keys.append((constants.HKLM, _MSI_USERDATA_ROOT))
+    try:
+        sids = list(registry_tools.iter_subkeys(constants.HKLM, _MSI_USERDATA_ROOT))
+    except OSError:
+        sids = []
+    keys.extend((constants.HKLM, f"{_MSI_USERDATA_ROOT}\\{sid}\\Products") for sid in sids)
+    return _keys_stamp(keys)
+
+
+def _c2r_source() -> list[object]:
+    keys = (
+        list(constants.C2R_CONFIGURATION_KEYS)
+        + list(constants.C2R_PRODUCT_RELEASE_ROOTS)
+        + list(constants.C2R_SUBSCRIPTION_ROOTS)
+    )
+    return [_keys_stamp(keys), _dirs_stamp(_C2R_INSTALL_ROOTS)]
+
+
+def _appx_source() -> list[object]:
+    return _keys_stamp(
+        [
+            (constants.HKLM, _APPX_STORE_ROOT),
+            (constants.HKLM, f"{_APPX_STORE_ROOT}\\Applications"),
+        ]
+    )
+
+
+def _uninstall_source() -> list[object]:
+    return _keys_stamp(constants.MSI_UNINSTALL_ROOTS)
+
+
+def _tasks_source() -> list[object]:
+    root = task_scheduler.default_tasks_root()
+    if not root.is_dir():
+        raise FingerprintUnavailable(str(root))
+    stamps: list[object] = []
+    for folder in _TASK_FOLDERS:
+        start = root.joinpath(*folder.split("\\"))
+        count = 0
+        latest = _dir_stamp(start)
+        try:
+            for directory, _dirs, files in os.walk(start):
+                for filename in files:
+                    count += 1
+                    modified = _dir_stamp(Path(directory) / filename) or 0
+                    latest = max(latest or 0, modified)
+        except OSError as exc:
+            raise FingerprintUnavailable(str(start)) from exc
+        stamps.append([folder, count, latest])
+    return stamps
+
+
+def _registry_source() -> list[object]:
+    return _keys_stamp(_parent_keys(constants.REGISTRY_RESIDUE_PATHS))
+
+
+def _filesystem_source() -> list[object]:
+    paths: list[str] = []
+    for template in (*constants.INSTALL_ROOT_TEMPLATES, *constants.RESIDUE_PATH_TEMPLATES):
+        raw = str(template.get("path", "")).strip()
+        if raw:
+            candidate = Path(os.path.expandvars(raw))
+            paths.extend((str(candidate.parent), str(candidate)))
+    return _dirs_stamp(paths)
+
+
+_SECTION_SOURCES: Mapping[str, Callable[[], list[object]]] = {
+    "msi": _msi_source,
+    "c2r": _c2r_source,
+    "appx": _appx_source,
+    "uninstall_entries": _uninstall_source,
+    "tasks": _tasks_source,
+    "registry": _registry_source,
+    "filesystem": _filesystem_source,
+}
+
+
+def section_fingerprints(
+    sections: Iterable[str] = CACHED_SECTIONS,
+    *,
+    options: Mapping[str, object] | None = None,
+) -> dict[str, str | None]:
+    """!
+    @brief Compute a digest per section from its registry and filesystem stamps.
+    @param options Detection options that change a section's content (for
+    example ``deep_probe``); they are folded into every digest.
+    @returns Mapping of section to digest, ``None`` when it cannot be fingerprinted.
+    """
+
+    salt = json.dumps(dict(options or {}), sort_keys=True, default=str)
+    fingerprints: dict[str, str | None] = {}
+    for section in sections:
+        source = _SECTION_SOURCES.get(section)
+        if source is None:
+            fingerprints[section] = None
+            continue
+        try:
+            parts = source()
+        except FingerprintUnavailable:
+            fingerprints[section] = None
+            continue
+        payload = json.dumps([section, salt, parts], sort_keys=True, default=str)
+        fingerprints[section] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return fingerprints
+
+
+class InventoryCache:
+    """!
+    @brief JSON file holding inventory sections alongside their fingerprints.
+    @details :meth:`reusable` returns the stored sections whose fingerprint
+    still matches and :meth:`save` rewrites the file after a detection run.
+    With ``refresh`` set nothing is reused but the file is still rewritten, so
+    the next run benefits from the fresh probe.
+    """
+
+    def __init__(self, path: str | Path, *, refresh: bool = False) -> None:
+        self.path = Path(path)
+        self.refresh = refresh
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("format") != CACHE_FORMAT:
+            return {}
+        sections = payload.get("sections")
+        return sections if isinstance(sections, dict) else {}
+
+    def reusable(self, fingerprints: Mapping[str, str | None]) -> dict[str, Any]:
+        """!
+        @brief Return stored sections whose fingerprint equals ``fingerprints``.
+        """
+
+        if self.refresh:
+            return {}
+        stored = self._load()
+        hits: dict[str, Any] = {}
+        for section, fingerprint in fingerprints.items():
+            entry = stored.get(section)
+            if fingerprint is None or not isinstance(entry, dict):
+                continue
+            if entry.get("fingerprint") == fingerprint and "data" in entry:
+                hits[section] = copy.deepcopy(entry["data"])
+        return hits
+
+    def save(self, inventory: Mapping[str, object], fingerprints: Mapping[str, str | None]) -> None:
+        """!
+        @brief Persist every fingerprinted section of ``inventory``.
+        @details The file is written to a temporary sibling and moved into
+        place so a concurrent reader never sees a partial document.
+        """
+
+        sections = {
+            section: {"fingerprint": fingerprint, "data": inventory[section]}
+            for section, fingerprint in fingerprints.items()
+            if fingerprint is not None and section in inventory
+        }
+        payload = {"format": CACHE_FORMAT, "sections": sections}
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(json.dumps(payload, default=str), encoding="utf-8")
+            os.replace(temporary, self.path)
+        except OSError as exc:
+            logging_ext.get_human_logger().debug(
+                "Unable to write inventory cache %s: %s", self.path, exc
+            )
+
+
+def default_cache(
+    log_directory: str | Path | None = None, *, refresh: bool = False
+) -> InventoryCache | None:
+    """!
+    @brief Return the cache stored in ``log_directory`` (or the active log directory).
+    @returns ``None`` when no log directory is known.
+    """
+
+    directory = log_directory if log_directory is not None else logging_ext.get_log_directory()
+    if directory is None:
+        return None
+    return InventoryCache(Path(directory) / CACHE_FILENAME, refresh=refresh)
+
+
+__all__ = [
+    "CACHED_SECTIONS",
+    "CACHE_FILENAME",
+    "CACHE_FORMAT",
+    "FingerprintUnavailable",
+    "InventoryCache",
+    "default_cache",
+    "section_fingerprints",
+]
@@ -862,6 +862,7 @@ def _run_ospp_command(
         dry_run=dry_run,
         human_message=f"Running OSPP.VBS {command}",
         extra={"ospp_path": str(ospp_path), "command": command},
+        stream_output=True,
     )
 
 
@@ -13,10 +13,13 @@ import getpass
 import json
 import logging
 import os
+import queue
 import sys
+import threading
+import time
 import uuid
 from collections import deque
-from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence
+from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence, Sequence
 from logging import handlers
 from pathlib import Path
 from typing import Any, Callable
@@ -222,7 +225,8 @@ class _SizedTimedRotatingFileHandler(handlers.TimedRotatingFileHandler):
     ``maxBytes`` and ``when`` rotation triggers simultaneously. This helper
     subclasses :class:`logging.handlers.TimedRotatingFileHandler` and extends
     :func:`shouldRollover` with the size check from
-    :class:`logging.handlers.RotatingFileHandler`.
+    :class:`logging.handlers.RotatingFileHandler`. The file size is tracked in
+    memory, so records are formatted once and the stream is never seeked.
     """
 
     def __init__(
@@ -247,19 +251,206 @@ class _SizedTimedRotatingFileHandler(handlers.TimedRotatingFileHandler):
             **kwargs,
         )
         self.maxBytes = max_bytes
+        self._size: int | None = None
 
-    def shouldRollover(self, record: logging.LogRecord) -> int:  # noqa: D401 - stdlib compatibility
-        if super().shouldRollover(record):
-            return 1
-        if self.maxBytes > 0:
+    def _current_size(self) -> int:
+        if self._size is None:
             if self.stream is None:
                 self.stream = self._open()
-            msg = f"{self.format(record)}\n"
             self.stream.seek(0, os.SEEK_END)
-            if self.stream.tell() + len(msg) >= self.maxBytes:
-                return 1
+            self._size = self.stream.tell()
+        return self._size
+
+    def _exceeds_size(self, size: int) -> bool:
+        current = self._current_size()
+        return self.maxBytes > 0 and current > 0 and current + size >= self.maxBytes
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:  # noqa: D401 - stdlib compatibility
+        if super().shouldRollover(record):
+            return 1
+        if self.maxBytes > 0 and self._exceeds_size(_encoded_size(f"{self.format(record)}\n")):
+            return 1
         return 0
 
+    def doRollover(self) -> None:  # noqa: D401 - stdlib compatibility
+        super().doRollover()
+        self._size = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._write_lines([(record, f"{self.format(record)}{self.terminator}")])
+        except Exception:
+            self.handleError(record)
+
+    def _write_lines(self, lines: Sequence[tuple[logging.LogRecord, str]]) -> None:
+        """!
+        @brief Write formatted ``lines``, rolling over between them as needed.
+        @details Consecutive lines are joined into a single write and the
+        stream is flushed once at the end.
+        """
+
+        if self.stream is None:
+            self.stream = self._open()
+            self._size = None
+        chunk: list[str] = []
+        for record, text in lines:
+            size = _encoded_size(text)
+            if handlers.TimedRotatingFileHandler.shouldRollover(self, record) or (
+                self._exceeds_size(size)
+            ):
+                if chunk:
+                    self.stream.write("".join(chunk))
+                    chunk = []
+                self.doRollover()
+                self._current_size()
+            chunk.append(text)
+            self._size = self._current_size() + size
+        if chunk:
+            self.stream.write("".join(chunk))
+        self.stream.flush()
+
+
+def _encoded_size(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+_STOP_WRITER = object()
+
+
+class _QueuedJsonlFileHandler(_SizedTimedRotatingFileHandler):
+    """!
+    @brief Rotating JSONL handler that writes on a background thread.
+    @details :meth:`handle` only resolves the message and enqueues the record,
+    which is all the logging thread pays for. A single writer thread formats
+    queued records and writes them in batches once ``batch_bytes`` have
+    accumulated or ``flush_interval`` seconds have passed since the first
+    pending record. :meth:`flush` blocks until everything queued before it is
+    on disk, and :meth:`close` drains the queue, so ``logging.shutdown`` at exit
+    loses nothing. Both waits give up after ``drain_timeout`` seconds, so a
+    writer stuck on a slow disk cannot hang shutdown or the Ctrl+C exit path.
+    Extras are serialised on the writer thread, so callers must not mutate
+    objects after passing them to the logger.
+    """
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        *,
+        batch_bytes: int = 64 * 1024,
+        flush_interval: float = 0.25,
+        drain_timeout: float = 5.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(filename, **kwargs)
+        self.batch_bytes = batch_bytes
+        self.flush_interval = flush_interval
+        self.drain_timeout = drain_timeout
+        self._queue: queue.SimpleQueue[object] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        self._queue_closed = False
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if self._queue_closed:
+            return bool(super().handle(record))
+        accepted = self.filter(record)
+        if isinstance(accepted, logging.LogRecord):
+            record = accepted
+        if accepted:
+            # Freeze the message now; args may be mutated once the call returns.
+            record.msg = record.getMessage()
+            record.args = None
+            self._start_writer()
+            self._queue.put(record)
+        return bool(accepted)
+
+    def _start_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="jsonl-writer", daemon=True)
+                self._writer.start()
+
+    def _run(self) -> None:
+        pending: list[tuple[logging.LogRecord, str]] = []
+        pending_bytes = 0
+        deadline = 0.0
+        while True:
+            try:
+                if pending:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                else:
+                    item = self._queue.get()
+            except queue.Empty:
+                item = None
+            if isinstance(item, logging.LogRecord):
+                try:
+                    text = f"{self.format(item)}{self.terminator}"
+                except Exception:
+                    self.handleError(item)
+                    continue
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append((item, text))
+                pending_bytes += len(text)
+                if pending_bytes < self.batch_bytes:
+                    continue
+            self._write_pending(pending)
+            pending = []
+            pending_bytes = 0
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP_WRITER:
+                return
+
+    def _write_pending(self, pending: Sequence[tuple[logging.LogRecord, str]]) -> None:
+        # The writer owns the stream while it runs and must not take ``self.lock``:
+        # ``logging.shutdown`` holds it while calling flush() and close().
+        if not pending:
+            return
+        try:
+            self._write_lines(pending)
+        except Exception:
+            self.handleError(pending[-1][0])
+
+    def _wait_for_writer(self, marker: object) -> bool:
+        """!
+        @brief Queue ``marker`` and wait until the writer has handled it.
+        @details Waits at most ``drain_timeout`` seconds; records the writer
+        has not reached by then are left to it.
+        @returns ``False`` when no writer thread is running.
+        """
+
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return False
+        if writer is threading.current_thread():
+            return True
+        self._queue.put(marker)
+        deadline = time.monotonic() + self.drain_timeout
+        while writer.is_alive():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if isinstance(marker, threading.Event):
+                if marker.wait(min(0.1, remaining)):
+                    break
+            else:
+                writer.join(min(0.1, remaining))
+        return True
+
+    def flush(self) -> None:
+        # The writer flushes after every batch; only flush directly without one.
+        if not self._wait_for_writer(threading.Event()):
+            super().flush()
+
+    def close(self) -> None:
+        if not self._queue_closed:
+            self._queue_closed = True
+            self._wait_for_writer(_STOP_WRITER)
+        super().close()
+
 
 def _configure_logger(
     logger: logging.Logger, formatter: logging.Formatter, handlers_to_add: Iterable[logging.Handler]
@@ -316,7 +507,7 @@ def setup_logging(
         max_bytes=10_485_760,
         backup_count=10,
     )
-    machine_file = _SizedTimedRotatingFileHandler(
+    machine_file = _QueuedJsonlFileHandler(
         root_dir / "events.jsonl",
         max_bytes=10_485_760,
         backup_count=10,
@@ -369,6 +560,19 @@ def get_loggers(json_stdout: bool, level: int) -> tuple[logging.Logger, logging.
     return human, machine
 
 
+def flush_logs() -> None:
+    """!
+    @brief Block until every queued human and machine record has been written.
+    @details Machine events are written by a background thread; call this
+    before reading ``events.jsonl`` or handing the log directory to another
+    process.
+    """
+
+    for name in (HUMAN_LOGGER_NAME, MACHINE_LOGGER_NAME):
+        for handler in logging.getLogger(name).handlers:
+            handler.flush()
+
+
 def get_human_logger() -> logging.Logger:
     """!
     @brief Retrieve the configured human-readable logger.
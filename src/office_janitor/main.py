@@ -9,6 +9,7 @@ like elevation, logging, and console configuration.
 from __future__ import annotations
 
 import argparse
+import importlib
 import logging
 import os
 import pathlib
@@ -16,26 +17,19 @@ import signal
 import sys
 import time
 from collections.abc import Iterable
+from typing import Any
 
 from . import (
     cli_help,
     confirm,
-    detect,  # noqa: F401 - re-exported for test patching
     elevation,
     exec_utils,
     logging_ext,
-    safety,
-    scrub,
     spinner,
-    tui,
-    ui,
+    tracing,
     version,
 )
-from . import plan as plan_module
 from .app_state import AppState  # noqa: F401
-
-# Import from refactored modules
-from .main_odt import handle_odt_build_commands, handle_odt_list_commands
 from .main_progress import (
     enable_vt_mode_if_possible,
     get_elapsed_secs,
@@ -45,24 +39,6 @@ from .main_progress import (
     progress_skip,
     set_main_start_time,
 )
-from .main_repair import (
-    handle_auto_repair_mode,
-    handle_oem_config_mode,
-    handle_repair_c2r_mode,
-    handle_repair_mode,
-    handle_repair_odt_mode,
-)
-from .main_state import (
-    build_app_state,
-    collect_plan_options,
-    determine_mode,
-    enforce_runtime_guards,
-    handle_plan_artifacts,
-    load_config_file,
-    resolve_log_directory,
-    run_detection,
-    should_use_tui,
-)
 
 # Re-export with underscore prefix for backwards compatibility (tests patch these)
 _progress = progress
@@ -70,22 +46,84 @@ _progress_ok = progress_ok
 _progress_fail = progress_fail
 _progress_skip = progress_skip
 _get_elapsed_secs = get_elapsed_secs
-_determine_mode = determine_mode
-_should_use_tui = should_use_tui
-_build_app_state = build_app_state
-_collect_plan_options = collect_plan_options
-_run_detection = run_detection
-_handle_plan_artifacts = handle_plan_artifacts
-_enforce_runtime_guards = enforce_runtime_guards
-_resolve_log_directory = resolve_log_directory
-_load_config_file = load_config_file
-_handle_odt_list_commands = handle_odt_list_commands
-_handle_odt_build_commands = handle_odt_build_commands
-_handle_auto_repair_mode = handle_auto_repair_mode
-_handle_repair_odt_mode = handle_repair_odt_mode
-_handle_repair_c2r_mode = handle_repair_c2r_mode
-_handle_repair_mode = handle_repair_mode
-_handle_oem_config_mode = handle_oem_config_mode
+
+# Detection, planning, scrub, the UIs and the mode handlers pull in most of the
+# package; they are imported on first use so ``--help``, ``--version`` and the
+# ODT listing commands start quickly. Names stay reachable as module attributes.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "detect": ("detect", None),
+    "plan_module": ("plan", None),
+    "safety": ("safety", None),
+    "scrub": ("scrub", None),
+    "tui": ("tui", None),
+    "ui": ("ui", None),
+    "build_app_state": ("main_state", "build_app_state"),
+    "collect_plan_options": ("main_state", "collect_plan_options"),
+    "determine_mode": ("main_state", "determine_mode"),
+    "enforce_runtime_guards": ("main_state", "enforce_runtime_guards"),
+    "handle_plan_artifacts": ("main_state", "handle_plan_artifacts"),
+    "load_config_file": ("main_state", "load_config_file"),
+    "resolve_log_directory": ("main_state", "resolve_log_directory"),
+    "run_detection": ("main_state", "run_detection"),
+    "should_use_tui": ("main_state", "should_use_tui"),
+    "_determine_mode": ("main_state", "determine_mode"),
+    "_should_use_tui": ("main_state", "should_use_tui"),
+    "_build_app_state": ("main_state", "build_app_state"),
+    "_collect_plan_options": ("main_state", "collect_plan_options"),
+    "_run_detection": ("main_state", "run_detection"),
+    "_handle_plan_artifacts": ("main_state", "handle_plan_artifacts"),
+    "_load_config_file": ("main_state", "load_config_file"),
+    "handle_odt_build_commands": ("main_odt", "handle_odt_build_commands"),
+    "handle_odt_list_commands": ("main_odt", "handle_odt_list_commands"),
+    "_handle_odt_list_commands": ("main_odt", "handle_odt_list_commands"),
+    "_handle_odt_build_commands": ("main_odt", "handle_odt_build_commands"),
+    "handle_auto_repair_mode": ("main_repair", "handle_auto_repair_mode"),
+    "handle_oem_config_mode": ("main_repair", "handle_oem_config_mode"),
+    "handle_repair_c2r_mode": ("main_repair", "handle_repair_c2r_mode"),
+    "handle_repair_mode": ("main_repair", "handle_repair_mode"),
+    "handle_repair_odt_mode": ("main_repair", "handle_repair_odt_mode"),
+    "_handle_auto_repair_mode": ("main_repair", "handle_auto_repair_mode"),
+    "_handle_repair_odt_mode": ("main_repair", "handle_repair_odt_mode"),
+    "_handle_repair_c2r_mode": ("main_repair", "handle_repair_c2r_mode"),
+    "_handle_repair_mode": ("main_repair", "handle_repair_mode"),
+    "_handle_oem_config_mode": ("main_repair", "handle_oem_config_mode"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """!
+    @brief Resolve the lazily imported names in :data:`_LAZY_ATTRIBUTES`.
+    @details The value is cached in the module namespace, so each module is
+    imported once and later lookups (and ``monkeypatch``) see a plain attribute.
+    """
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value: Any = importlib.import_module(f"{__package__}.{module_name}")
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def _resolve_log_directory(candidate: str | None) -> pathlib.Path:
+    """!
+    @brief Lazy wrapper around :func:`main_state.resolve_log_directory`.
+    """
+    from . import main_state
+
+    return main_state.resolve_log_directory(candidate)
+
+
+def _enforce_runtime_guards(options: dict[str, object], *, dry_run: bool) -> None:
+    """!
+    @brief Lazy wrapper around :func:`main_state.enforce_runtime_guards`.
+    """
+    from . import main_state
+
+    main_state.enforce_runtime_guards(options, dry_run=dry_run)
+
 
 # Module-level reference to start time for signal handlers
 _MAIN_START_TIME: float = time.perf_counter()
@@ -257,14 +295,37 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
     parser = build_arg_parser()
     args = parser.parse_args(list(argv) if argv is not None else None)
 
+    trace_path = getattr(args, "trace", None)
+    if not trace_path:
+        return _run_parsed(args)
+
+    tracing.enable()
+    try:
+        with tracing.span("main", command=str(getattr(args, "command", None))):
+            return _run_parsed(args)
+    finally:
+        tracing.disable()
+        try:
+            written = tracing.export_chrome(trace_path)
+            progress(f"Trace written to {written}")
+        except OSError as exc:
+            progress(f"Unable to write trace {trace_path}: {exc}")
+
+
+def _run_parsed(args: argparse.Namespace) -> int:
+    """!
+    @brief Run the selected mode for already parsed command-line ``args``.
+    """
     # Show subcommand help if invoked without action-specific arguments
     show_help_parser = getattr(args, "show_help", None)
     if show_help_parser is not None and _should_show_subcommand_help(args):
         show_help_parser.print_help()
         return 0
 
+    from . import main_odt
+
     # Handle ODT listing commands early (before elevation check)
-    if handle_odt_list_commands(args):
+    if main_odt.handle_odt_list_commands(args):
         return 0
 
     # Phase 1: Elevation check
@@ -282,9 +343,12 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
     progress_ok("VT mode enabled")
 
     # Handle ODT build commands (after elevation since they write files)
-    if handle_odt_build_commands(args):
+    if main_odt.handle_odt_build_commands(args):
         return 0
 
+    from . import main_repair, main_state, safety, scrub
+    from . import plan as plan_module
+
     # Phase 3: Timeout configuration
     progress("Phase 3: Configuring execution timeout...", newline=False)
     timeout_val = getattr(args, "timeout", None)
@@ -300,7 +364,7 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
 
     # Phase 6: Mode determination
     progress("Phase 6: Determining operation mode...", newline=False)
-    mode = determine_mode(args)
+    mode = main_state.determine_mode(args)
     progress_ok(mode)
 
     # Log startup event
@@ -315,7 +379,9 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
 
     # Phase 7: App state construction
     progress("Phase 7: Building application state...", newline=False)
-    app_state = build_app_state(args, human_log, machine_log, start_time=_MAIN_START_TIME)
+    app_state = main_state.build_app_state(
+        args, human_log, machine_log, start_time=_MAIN_START_TIME
+    )
     progress_ok()
 
     # ---------------------------------------------------------------------------
@@ -325,7 +391,7 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
         progress("Entering install mode...")
         # Route install subcommand modes to ODT handlers
         # The determine_mode already mapped subcommand options back to ODT args
-        if handle_odt_build_commands(args):
+        if main_odt.handle_odt_build_commands(args):
             return 0
         progress("Install mode requires --preset or --product specification.")
         return 1
@@ -336,22 +402,22 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
     # Auto-repair mode handling - intelligent repair of all Office installations
     if mode == "auto-repair":
         progress("Entering auto-repair mode...")
-        return handle_auto_repair_mode(args, human_log, machine_log)
+        return main_repair.handle_auto_repair_mode(args, human_log, machine_log)
 
     # Repair-ODT mode handling - repair via ODT configuration
     if mode == "repair-odt":
         progress("Entering ODT repair mode...")
-        return handle_repair_odt_mode(args, human_log, machine_log)
+        return main_repair.handle_repair_odt_mode(args, human_log, machine_log)
 
     # Repair-C2R mode handling - repair via OfficeClickToRun.exe
     if mode == "repair-c2r":
         progress("Entering C2R repair mode...")
-        return handle_repair_c2r_mode(args, human_log, machine_log)
+        return main_repair.handle_repair_c2r_mode(args, human_log, machine_log)
 
     # Repair mode handling - separate from standard detection/scrub flow
     if mode.startswith("repair:"):
         progress("Entering repair mode...")
-        return handle_repair_mode(args, mode, human_log, machine_log)
+        return main_repair.handle_repair_mode(args, mode, human_log, machine_log)
 
     # ---------------------------------------------------------------------------
     # Remove mode handling (maps to auto-all, target, etc.)
@@ -364,16 +430,18 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
     # OEM config mode handling - execute bundled XML configurations
     if mode.startswith("oem-config:"):
         progress("Entering OEM configuration mode...")
-        return handle_oem_config_mode(args, mode, human_log, machine_log)
+        return main_repair.handle_oem_config_mode(args, mode, human_log, machine_log)
 
     # Interactive mode handling
     if mode == "interactive":
         progress("Entering interactive mode...")
+        from . import tui, ui
+
         if getattr(args, "tui", False):
             progress("Launching TUI (forced via --tui)...")
             tui.run_tui(app_state)
         else:
-            tui_candidate = should_use_tui(args)
+            tui_candidate = main_state.should_use_tui(args)
             if tui_candidate:
                 progress("Launching TUI (auto-detected)...")
                 tui.run_tui(app_state)
@@ -397,10 +465,12 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
     limited_flag = bool(getattr(args, "limited_user", False))
     if limited_flag:
         progress("Using limited user token for detection", indent=1)
-    inventory = run_detection(
+    inventory = main_state.run_detection(
         machine_log,
         logdir_path,
         limited_user=limited_flag or None,
+        deep_probe=bool(getattr(args, "deep_probe", False)),
+        refresh=bool(getattr(args, "refresh", False)),
     )
     item_count = sum(len(v) if hasattr(v, "__len__") else 0 for v in inventory.values())
     progress(f"Detection complete: {item_count} items found", indent=1)
@@ -408,7 +478,7 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
     # Phase 9: Plan generation
     spinner.set_task("Building execution plan")
     progress("Phase 9: Building execution plan...")
-    options = collect_plan_options(args, mode)
+    options = main_state.collect_plan_options(args, mode)
     progress(
         f"Plan options: dry_run={options.get('dry_run')}, force={options.get('force')}",
         indent=1,
@@ -435,7 +505,7 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
     # Phase 11: Artifacts
     spinner.set_task("Writing plan artifacts")
     progress("Phase 11: Writing plan artifacts...")
-    handle_plan_artifacts(args, generated_plan, inventory, human_log, mode)
+    main_state.handle_plan_artifacts(args, generated_plan, inventory, human_log, mode)
 
     if mode == "diagnose":
         spinner.clear_task()
@@ -493,7 +563,12 @@ def _main_impl(argv: Iterable[str] | None = None) -> int:
     progress("=" * 60)
     fatal_error: str | None = None
     try:
-        scrub.execute_plan(generated_plan, dry_run=scrub_dry_run, start_time=_MAIN_START_TIME)
+        scrub.execute_plan(
+            generated_plan,
+            dry_run=scrub_dry_run,
+            start_time=_MAIN_START_TIME,
+            inventory=inventory,
+        )
     except KeyboardInterrupt:
         progress("Execution interrupted by user", indent=1, newline=False)
         progress_skip("cancelled")
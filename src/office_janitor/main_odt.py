@@ -10,7 +10,6 @@ from __future__ import annotations
 import pathlib
 from typing import TYPE_CHECKING
 
-from . import odt_build
 from .main_progress import progress, progress_fail, progress_ok
 
 if TYPE_CHECKING:
@@ -22,6 +21,9 @@ __all__ = [
 ]
 
 
+_LIST_FLAGS = ("odt_list_products", "odt_list_presets", "odt_list_channels", "odt_list_languages")
+
+
 def handle_odt_list_commands(args: argparse.Namespace) -> bool:
     """!
     @brief Handle ODT listing commands that don't require elevation.
@@ -31,6 +33,11 @@ def handle_odt_list_commands(args: argparse.Namespace) -> bool:
     @param args Parsed command-line arguments.
     @returns True if a list command was handled (caller should exit), False otherwise.
     """
+    if not any(getattr(args, flag, False) for flag in _LIST_FLAGS):
+        return False
+
+    from . import odt_build
+
     if getattr(args, "odt_list_products", False):
         print("\nAvailable Office Products for ODT Configuration:")
         print("=" * 80)
@@ -145,6 +152,8 @@ def _run_odt_install(args: argparse.Namespace) -> bool:
     @param args Parsed command-line arguments.
     @returns True (command was handled).
     """
+    from . import odt_build
+
     dry_run = getattr(args, "dry_run", False)
 
     try:
@@ -250,6 +259,8 @@ def _run_author_install(
     @param name Display name for the alias.
     @returns True (command was handled).
     """
+    from . import odt_build
+
     dry_run = getattr(args, "dry_run", False)
 
     try:
@@ -297,6 +308,8 @@ def _build_odt_config(args: argparse.Namespace) -> bool:
     @param args Parsed command-line arguments.
     @returns True (command was handled).
     """
+    from . import odt_build
+
     try:
         preset = getattr(args, "odt_preset", None)
         products = getattr(args, "odt_products", None)
@@ -377,6 +390,8 @@ def _build_odt_removal(args: argparse.Namespace) -> bool:
     @param args Parsed command-line arguments.
     @returns True (command was handled).
     """
+    from . import odt_build
+
     product_ids = getattr(args, "odt_products", None)
     force_shutdown = not getattr(args, "no_force_app_shutdown", False)
     remove_msi = getattr(args, "odt_remove_msi", False)
@@ -404,6 +419,8 @@ def _build_odt_download(args: argparse.Namespace) -> bool:
     @param args Parsed command-line arguments.
     @returns True (command was handled).
     """
+    from . import odt_build
+
     download_path = getattr(args, "odt_download", None)
     if not download_path:
         return False
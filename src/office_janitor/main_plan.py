@@ -128,6 +128,7 @@ def collect_plan_options(args: argparse.Namespace, mode: str) -> dict[str, objec
         # Scrubbing
         "scrub_level": _get("scrub_level", "standard"),
         "max_passes": int(resolved_passes),
+        "step_workers": int(_get("step_workers", 1) or 1),
         "skip_processes": _get("skip_processes", False, is_bool=True) or registry_only,
         "skip_services": _get("skip_services", False, is_bool=True) or registry_only,
         "skip_tasks": _get("skip_tasks", False, is_bool=True),
@@ -14,7 +14,7 @@ import os
 import pathlib
 import platform
 from collections.abc import Iterable, Mapping
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from . import (
     confirm,
@@ -22,6 +22,7 @@ from . import (
     detect,
     exec_utils,
     fs_tools,
+    inventory_cache,
     logging_ext,
     processes,
     safety,
@@ -251,6 +252,8 @@ def build_app_state(
             machine_log,
             logdir_path,
             limited_user=bool(getattr(args, "limited_user", False)),
+            deep_probe=bool(getattr(args, "deep_probe", False)),
+            refresh=bool(getattr(args, "refresh", False)),
         )
 
     def planner(
@@ -314,7 +317,12 @@ def build_app_state(
 
         enforce_runtime_guards(guard_options, dry_run=dry_run)
         main_start = start_time if start_time is not None else get_main_start_time()
-        scrub.execute_plan(plan_data, dry_run=dry_run, start_time=main_start)
+        scrub.execute_plan(
+            plan_data,
+            dry_run=dry_run,
+            start_time=main_start,
+            inventory=inventory_override if isinstance(inventory_override, Mapping) else None,
+        )
         return True
 
     app_state: AppState = {
@@ -336,12 +344,16 @@ def run_detection(
     log_directory: pathlib.Path | str | None = None,
     *,
     limited_user: bool | None = None,
+    deep_probe: bool = False,
+    refresh: bool = False,
 ) -> dict[str, object]:
     """!
     @brief Execute inventory gathering, persist artifacts, and emit telemetry.
     @param machine_log Machine-readable logger for telemetry.
-    @param log_directory Directory to write inventory files.
+    @param log_directory Directory to write inventory files and the inventory cache.
     @param limited_user Whether to run under limited user token.
+    @param deep_probe Whether to add the slow WMI/PowerShell MSI probes.
+    @param refresh Whether to ignore the inventory cache and probe every section.
     @returns Dictionary containing the inventory.
     """
     progress("Starting inventory scan...", indent=1)
@@ -385,14 +397,22 @@ def run_detection(
         finally:
             spinner.resume_after_output()
 
+    if log_directory is None:
+        logdir_path = resolve_log_directory(None)
+    else:
+        logdir_path = pathlib.Path(log_directory).expanduser()
+
     progress("Gathering Office inventory...", indent=2)
+    gather_kwargs: dict[str, Any] = {"progress_callback": progress_callback}
+    if limited_user:
+        gather_kwargs["limited_user"] = True
+    if deep_probe:
+        gather_kwargs["deep_probe"] = True
+    gather_kwargs["cache"] = inventory_cache.default_cache(logdir_path, refresh=refresh)
+    if refresh:
+        progress("Ignoring cached inventory (--refresh)", indent=2)
     try:
-        if limited_user:
-            inventory = detect.gather_office_inventory(
-                limited_user=True, progress_callback=progress_callback
-            )
-        else:
-            inventory = detect.gather_office_inventory(progress_callback=progress_callback)
+        inventory = detect.gather_office_inventory(**gather_kwargs)
         progress("Inventory collection complete", indent=2, newline=False)
         progress_ok()
     except KeyboardInterrupt:
@@ -401,11 +421,6 @@ def run_detection(
         progress_skip("user cancelled")
         raise
 
-    if log_directory is None:
-        logdir_path = resolve_log_directory(None)
-    else:
-        logdir_path = pathlib.Path(log_directory).expanduser()
-
     progress(f"Log directory: {logdir_path}", indent=2)
 
     inventory_path: pathlib.Path | None = None
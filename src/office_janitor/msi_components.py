@@ -14,15 +14,17 @@ platforms, stub classes are provided to allow module import without errors.
 
 from __future__ import annotations
 
+import json
 import logging
 import re
-from collections.abc import Iterator, Sequence
+import threading
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from enum import IntEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final
 
-from . import guid_utils
+from . import guid_utils, registry_tools
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     pass
@@ -151,6 +153,297 @@ class ScanResult:
     """All registry key paths discovered."""
 
 
+USERDATA_PATH: Final[str] = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Installer\UserData"
+"""!
+@brief Per-SID Windows Installer registration data under ``HKLM``.
+"""
+
+_INDEX_FORMAT: Final[int] = 2
+
+
+@dataclass
+class ComponentIndex:
+    """!
+    @brief Product/component relationships read straight from the registry.
+    @details Built from ``UserData\\<SID>\\Components\\<compressed>`` where every
+    value name is a compressed product code and its data is that product's
+    key path for the component. ``stamp`` records a signature of every per-SID
+    ``Components`` key the index was read from, so a persisted copy can be
+    reused until an install, uninstall or repair touches them.
+    """
+
+    clients_by_component: dict[str, list[str]] = field(default_factory=dict)
+    """Component GUID to the product codes that reference it."""
+
+    components_by_product: dict[str, list[str]] = field(default_factory=dict)
+    """Product code to the component GUIDs it references."""
+
+    key_paths: dict[str, dict[str, str]] = field(default_factory=dict)
+    """Component GUID to ``{product code: key path}``."""
+
+    stamp: dict[str, list[int]] = field(default_factory=dict)
+    """``Components`` key path to its :func:`_components_signature`."""
+
+    def add(self, component_id: str, product_code: str, key_path: str) -> None:
+        """!
+        @brief Record that ``product_code`` uses ``component_id`` via ``key_path``.
+        """
+        clients = self.clients_by_component.setdefault(component_id, [])
+        if product_code not in clients:
+            clients.append(product_code)
+            self.components_by_product.setdefault(product_code, []).append(component_id)
+        self.key_paths.setdefault(component_id, {}).setdefault(product_code, key_path)
+
+    def clients(self, component_id: str) -> list[str]:
+        """!
+        @brief Return the product codes referencing ``component_id``.
+        """
+        return list(self.clients_by_component.get(component_id, ()))
+
+    def components(self, product_code: str) -> list[str]:
+        """!
+        @brief Return the component GUIDs referenced by ``product_code``.
+        """
+        return list(self.components_by_product.get(product_code, ()))
+
+    def key_path(self, product_code: str, component_id: str) -> str:
+        """!
+        @brief Return the key path ``product_code`` registered for ``component_id``.
+        """
+        return self.key_paths.get(component_id, {}).get(product_code, "")
+
+    def to_dict(self) -> dict[str, Any]:
+        """!
+        @brief Serialise the index for :func:`load_component_index` persistence.
+        """
+        return {"format": _INDEX_FORMAT, "stamp": self.stamp, "key_paths": self.key_paths}
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> ComponentIndex:
+        """!
+        @brief Rebuild an index persisted with :meth:`to_dict`.
+        @throws ValueError When the payload has an unknown layout.
+        """
+        if payload.get("format") != _INDEX_FORMAT:
+            raise ValueError("Unsupported component index format")
+        stamp = dict(payload.get("stamp") or {})
+        index = cls(stamp={str(k): [int(part) for part in v] for k, v in stamp.items()})
+        for component_id, products in dict(payload.get("key_paths") or {}).items():
+            for product_code, key_path in dict(products).items():
+                index.add(str(component_id), str(product_code), str(key_path))
+        return index
+
+
+def _userdata_access() -> int:
+    """!
+    @brief Access mask reading the 64-bit ``UserData`` tree from any process.
+    """
+    winreg = registry_tools.winreg
+    return int(getattr(winreg, "KEY_READ", 0x20019)) | int(getattr(winreg, "KEY_WOW64_64KEY", 0))
+
+
+def _enum_subkeys(winreg: Any, handle: Any) -> Iterator[str]:
+    index = 0
+    while True:
+        try:
+            name = winreg.EnumKey(handle, index)
+        except OSError:
+            return
+        index += 1
+        yield name
+
+
+def _components_keys(winreg: Any, userdata: Any, access: int) -> Iterator[tuple[str, Any]]:
+    """!
+    @brief Yield ``(path, handle)`` for every ``<SID>\\Components`` key.
+    @details Callers own the yielded handles and must close them.
+    """
+    for sid in _enum_subkeys(winreg, userdata):
+        try:
+            handle = winreg.OpenKey(userdata, f"{sid}\\Components", 0, access)
+        except OSError:
+            continue
+        yield f"{sid}\\Components", handle
+
+
+def _query_info(winreg: Any, handle: Any) -> tuple[int, int, int]:
+    """!
+    @brief Return ``(subkeys, values, last-write)`` for ``handle``, zeros on error.
+    """
+    try:
+        subkeys, values, modified = winreg.QueryInfoKey(handle)[:3]
+    except OSError:
+        return 0, 0, 0
+    return int(subkeys), int(values), int(modified)
+
+
+def _components_signature(
+    winreg: Any,
+    components: Any,
+    access: int,
+    visit: Callable[[str, Any], None] | None = None,
+) -> list[int]:
+    """!
+    @brief Fingerprint one ``<SID>\\Components`` key and its component subkeys.
+    @details Adding or removing a client value under an existing component key
+    does not touch the parent's last-write time, so the signature also folds in
+    the total value count and the newest last-write time of the component keys.
+    Each key is only queried with ``QueryInfoKey``; ``visit`` lets
+    :func:`build_component_index` read the values during the same pass.
+    @returns ``[last-write, subkeys, total values, newest component last-write]``.
+    """
+    subkeys, _values, modified = _query_info(winreg, components)
+    total_values = 0
+    newest = 0
+    for compressed in _enum_subkeys(winreg, components):
+        try:
+            handle = winreg.OpenKey(components, compressed, 0, access)
+        except OSError:
+            continue
+        try:
+            _subkeys, values, child_modified = _query_info(winreg, handle)
+            total_values += values
+            newest = max(newest, child_modified)
+            if visit is not None:
+                visit(compressed, handle)
+        finally:
+            winreg.CloseKey(handle)
+    return [modified, subkeys, total_values, newest]
+
+
+def _read_stamp() -> dict[str, list[int]] | None:
+    """!
+    @brief Return the signature of every per-SID ``Components`` key.
+    @returns ``None`` when the ``UserData`` tree cannot be opened.
+    """
+    winreg = registry_tools.winreg
+    access = _userdata_access()
+    try:
+        userdata = winreg.OpenKey(registry_tools._WINREG_HKLM, USERDATA_PATH, 0, access)
+    except (AttributeError, OSError):
+        return None
+    stamp: dict[str, list[int]] = {}
+    try:
+        for path, handle in _components_keys(winreg, userdata, access):
+            try:
+                stamp[path] = _components_signature(winreg, handle, access)
+            finally:
+                winreg.CloseKey(handle)
+    finally:
+        winreg.CloseKey(userdata)
+    return stamp
+
+
+def build_component_index() -> ComponentIndex | None:
+    """!
+    @brief Build a :class:`ComponentIndex` in one pass over ``UserData``.
+    @details Each component key is opened once relative to its ``Components``
+    parent and its values are enumerated a single time; no COM calls are made.
+    @returns ``None`` when the ``UserData`` tree is not readable on this host.
+    """
+    winreg = registry_tools.winreg
+    access = _userdata_access()
+    try:
+        userdata = winreg.OpenKey(registry_tools._WINREG_HKLM, USERDATA_PATH, 0, access)
+    except (AttributeError, OSError):
+        return None
+
+    index = ComponentIndex()
+
+    def read_clients(compressed: str, handle: Any) -> None:
+        try:
+            component_id = guid_utils.expand_guid(compressed)
+        except guid_utils.GuidError:
+            return
+        value_index = 0
+        while True:
+            try:
+                name, data, _kind = winreg.EnumValue(handle, value_index)
+            except OSError:
+                return
+            value_index += 1
+            try:
+                product_code = guid_utils.expand_guid(str(name))
+            except guid_utils.GuidError:
+                continue
+            index.add(component_id, product_code, str(data or ""))
+
+    try:
+        for path, components in _components_keys(winreg, userdata, access):
+            try:
+                index.stamp[path] = _components_signature(winreg, components, access, read_clients)
+            finally:
+                winreg.CloseKey(components)
+    finally:
+        winreg.CloseKey(userdata)
+    return index
+
+
+_INDEX_LOCK = threading.Lock()
+_CACHED_INDEX: ComponentIndex | None = None
+
+
+def load_component_index(
+    cache_path: Path | str | None = None,
+    *,
+    refresh: bool = False,
+) -> ComponentIndex | None:
+    """!
+    @brief Return the component index, rebuilding it only when the registry changed.
+    @details The index is kept in memory for the rest of the run and, when
+    ``cache_path`` is given, persisted there as JSON. Both copies are reused
+    while the ``Components`` key signatures still match.
+    @param cache_path Optional JSON file used to persist the index across runs.
+    @param refresh Ignore any cached copy and rebuild from the registry.
+    @returns ``None`` when the ``UserData`` tree is not readable on this host.
+    """
+    global _CACHED_INDEX
+
+    with _INDEX_LOCK:
+        stamp = _read_stamp()
+        if stamp is None:
+            return None
+        if not refresh and _CACHED_INDEX is not None and _CACHED_INDEX.stamp == stamp:
+            return _CACHED_INDEX
+
+        cache_file = Path(cache_path) if cache_path is not None else None
+        if not refresh and cache_file is not None:
+            try:
+                cached = ComponentIndex.from_dict(json.loads(cache_file.read_text("utf-8")))
+            except (OSError, ValueError, TypeError, AttributeError):
+                cached = None
+            if cached is not None and cached.stamp == stamp:
+                _CACHED_INDEX = cached
+                return cached
+
+        index = build_component_index()
+        if index is None:
+            return None
+        _CACHED_INDEX = index
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(index.to_dict()), encoding="utf-8")
+            except OSError as exc:
+                _LOGGER.debug("Unable to persist component index to %s: %s", cache_file, exc)
+        return index
+
+
+def _state_from_key_path(key_path: str) -> MsiInstallState:
+    """!
+    @brief Infer a component state from its registered key path.
+    @details Mirrors :func:`get_component_state` without a COM round trip.
+    """
+    if not key_path:
+        return MsiInstallState.ABSENT
+    if key_path[:3] in {"01:", "02:"}:
+        return MsiInstallState.LOCAL
+    try:
+        return MsiInstallState.LOCAL if Path(key_path).exists() else MsiInstallState.SOURCE_ABSENT
+    except OSError:
+        return MsiInstallState.UNKNOWN
+
+
 class WindowsInstallerError(RuntimeError):
     """!
     @brief Raised when Windows Installer operations fail.
@@ -386,13 +679,22 @@ class MSIComponentScanner:
     ```
     """
 
-    def __init__(self, logger: logging.Logger | None = None) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        *,
+        index_cache: Path | str | None = None,
+    ) -> None:
         """!
         @brief Initialize the scanner.
         @param logger Optional logger for diagnostic output.
+        @param index_cache Optional JSON file persisting the component index.
         """
         self._logger = logger or _LOGGER
         self._installer: Any = None
+        self._index: ComponentIndex | None = None
+        self._index_loaded = False
+        self._index_cache = index_cache
 
     def _get_installer(self) -> Any:
         """Get or create the WI COM object."""
@@ -400,6 +702,34 @@ class MSIComponentScanner:
             self._installer = _create_installer()
         return self._installer
 
+    def _get_index(self) -> ComponentIndex | None:
+        """!
+        @brief Return the registry component index, or ``None`` to use COM.
+        """
+        if not self._index_loaded:
+            self._index_loaded = True
+            if self._index is None:
+                self._index = load_component_index(self._index_cache)
+        return self._index
+
+    def _iter_component_clients(self, installer: Any) -> Iterator[tuple[str, list[str]]]:
+        """!
+        @brief Yield ``(component, clients)`` from the index or the COM API.
+        """
+        index = self._get_index()
+        if index is not None:
+            for comp_id, clients in index.clients_by_component.items():
+                yield comp_id, list(clients)
+            return
+        for comp_id in enumerate_components(installer):
+            yield comp_id, get_component_clients(comp_id, installer)
+
+    def _key_path(self, product_code: str, component_id: str, installer: Any) -> str:
+        index = self._get_index()
+        if index is not None:
+            return index.key_path(product_code, component_id)
+        return get_component_path(product_code, component_id, installer)
+
     def scan(
         self,
         *,
@@ -409,6 +739,9 @@ class MSIComponentScanner:
     ) -> ScanResult:
         """!
         @brief Perform a comprehensive scan of WI products and components.
+        @details Products come from the COM API; component clients and key
+        paths come from the registry :class:`ComponentIndex` when available,
+        falling back to per-component COM queries otherwise.
         @param office_only If True, focus only on Office products.
         @param include_components If True, enumerate components for products.
         @param product_filter Optional list of product codes to limit scanning.
@@ -446,9 +779,7 @@ class MSIComponentScanner:
         # Enumerate components for Office products
         office_product_codes = {p.product_code for p in result.office_products}
 
-        for comp_id in enumerate_components(installer):
-            clients = get_component_clients(comp_id, installer)
-
+        for comp_id, clients in self._iter_component_clients(installer):
             # Check if this component is owned by any Office product
             office_clients = [c for c in clients if c in office_product_codes]
 
@@ -464,7 +795,7 @@ class MSIComponentScanner:
 
             key_path = ""
             if client_for_path:
-                key_path = get_component_path(client_for_path, comp_id, installer)
+                key_path = self._key_path(client_for_path, comp_id, installer)
 
             comp_info = ComponentInfo(
                 component_id=comp_id,
@@ -511,12 +842,26 @@ class MSIComponentScanner:
     def get_product_components(self, product_code: str) -> list[ComponentInfo]:
         """!
         @brief Get all components belonging to a specific product.
+        @details Served from the component index in O(1) when it is available;
+        otherwise every component is queried through COM.
         @param product_code Product GUID.
         @return List of ComponentInfo for the product's components.
         """
-        installer = self._get_installer()
         product_code = guid_utils.normalize_guid(product_code)
 
+        index = self._get_index()
+        if index is not None:
+            return [
+                ComponentInfo(
+                    component_id=comp_id,
+                    key_path=index.key_path(product_code, comp_id),
+                    clients=index.clients(comp_id),
+                    state=_state_from_key_path(index.key_path(product_code, comp_id)),
+                )
+                for comp_id in index.components(product_code)
+            ]
+
+        installer = self._get_installer()
         components: list[ComponentInfo] = []
 
         for comp_id in enumerate_components(installer):
@@ -633,13 +978,16 @@ def list_office_products(*, logger: logging.Logger | None = None) -> list[Produc
 
 
 __all__ = [
+    "ComponentIndex",
     "ComponentInfo",
     "MSIComponentScanner",
     "MsiInstallState",
     "MsiReinstallMode",
     "ProductInfo",
     "ScanResult",
+    "USERDATA_PATH",
     "WindowsInstallerError",
+    "build_component_index",
     "enumerate_components",
     "enumerate_products",
     "get_component_clients",
@@ -647,5 +995,6 @@ __all__ = [
     "get_component_state",
     "is_office_component",
     "list_office_products",
+    "load_component_index",
     "scan_office_products",
 ]
@@ -18,7 +18,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
-from . import command_runner, constants, logging_ext, registry_tools
+from . import command_runner, constants, logging_ext, registry_tools, removal_watch
 
 MSIEXEC_TIMEOUT = 3600
 """!
@@ -57,12 +57,14 @@ MSI_BUSY_BACKOFF_CAP = 60.0
 
 MSI_VERIFICATION_ATTEMPTS = 3
 """!
-@brief Number of registry probes performed when confirming removal.
+@brief Verification window, in probe slots of :data:`MSI_VERIFICATION_DELAY`.
+@details Products are verified together for up to
+``(MSI_VERIFICATION_ATTEMPTS - 1) * MSI_VERIFICATION_DELAY`` seconds.
 """
 
 MSI_VERIFICATION_DELAY = 5.0
 """!
-@brief Seconds to wait between registry verification probes.
+@brief Longest wait between registry verification probes.
 """
 
 
@@ -583,6 +585,7 @@ def attempt_setup_exe_removal(
         command,
         event="msi_setup_exe_uninstall",
         timeout=timeout,
+        stream_output=True,
     )
 
     machine_logger.info(
@@ -645,6 +648,7 @@ def _run_uninstall_command(
             timeout=MSIEXEC_TIMEOUT,
             dry_run=dry_run,
             human_message=message,
+            stream_output=True,
             extra={
                 "product_code": entry.product_code,
                 "display_name": entry.display_name,
@@ -691,33 +695,66 @@ def _run_uninstall_command(
     return result
 
 
-def _await_removal(entry: _MsiProduct) -> bool:
+def _removal_target(entry: _MsiProduct) -> removal_watch.RemovalTarget:
     """!
-    @brief Poll registry keys to confirm the product has been removed.
+    @brief Describe ``entry`` for :func:`removal_watch.await_removals`.
+    """
+
+    watch_keys: list[tuple[int, str]] = []
+    for handle in entry.uninstall_handles:
+        parsed = _parse_registry_handle(handle)
+        if parsed:
+            watch_keys.append((parsed[0], removal_watch.parent_key(parsed[1])))
+    watch_keys.extend(constants.MSI_UNINSTALL_ROOTS)
+    return removal_watch.RemovalTarget(
+        name=entry.product_code,
+        probe=lambda: _is_product_present(entry),
+        watch_keys=watch_keys,
+    )
+
+
+def _await_removals(entries: Sequence[_MsiProduct]) -> dict[str, bool]:
+    """!
+    @brief Confirm that every product in ``entries`` has been removed.
+    @details All products share one verification window; each is reported as
+    soon as its uninstall keys disappear.
+    @returns Mapping of product code to ``True`` when removal was confirmed.
     """
 
     human_logger = logging_ext.get_human_logger()
     machine_logger = logging_ext.get_machine_logger()
+    by_code = {entry.product_code: entry for entry in entries}
 
-    for attempt in range(1, MSI_VERIFICATION_ATTEMPTS + 1):
-        present = _is_product_present(entry)
+    def _record(target: removal_watch.RemovalTarget, attempt: int, present: bool) -> None:
         machine_logger.info(
             "msi_uninstall_verify",
             extra={
                 "event": "msi_uninstall_verify",
-                "product_code": entry.product_code,
+                "product_code": target.name,
                 "attempt": attempt,
                 "present": present,
             },
         )
         if not present:
+            entry = by_code[target.name]
             human_logger.info(
                 "Confirmed removal of %s (%s)", entry.display_name, entry.product_code
             )
-            return True
-        if attempt < MSI_VERIFICATION_ATTEMPTS:
-            time.sleep(MSI_VERIFICATION_DELAY)
-    return False
+
+    return removal_watch.await_removals(
+        [_removal_target(entry) for entry in by_code.values()],
+        budget=MSI_VERIFICATION_DELAY * max(0, MSI_VERIFICATION_ATTEMPTS - 1),
+        max_interval=MSI_VERIFICATION_DELAY,
+        on_probe=_record,
+    )
+
+
+def _await_removal(entry: _MsiProduct) -> bool:
+    """!
+    @brief Confirm the product has been removed.
+    """
+
+    return _await_removals([entry]).get(entry.product_code, False)
 
 
 def uninstall_products(
@@ -729,8 +766,9 @@ def uninstall_products(
 ) -> None:
     """!
     @brief Uninstall the supplied MSI products via ``msiexec`` or setup fallbacks.
-    @details Each product is normalised, executed with retry semantics, and
-    verified for removal using registry probes. Non-zero exit codes or failed
+    @details Each product is normalised and executed with retry semantics.
+    Once every command has run, the products are verified for removal together
+    through :mod:`removal_watch`. Non-zero exit codes or failed
     verifications raise :class:`RuntimeError` summarising the offending product
     codes.
     @param products Iterable of product codes or inventory mappings.
@@ -754,6 +792,7 @@ def uninstall_products(
         return
 
     failures: list[str] = []
+    verify: list[tuple[_MsiProduct, Sequence[str]]] = []
     total_attempts = max(1, int(retries) + 1)
 
     for entry in entries:
@@ -845,23 +884,28 @@ def uninstall_products(
             failures.append(entry.product_code)
             continue
 
-        if not _await_removal(entry):
-            human_logger.error(
-                "Registry still reports %s (%s) after uninstall command",
-                entry.display_name,
-                entry.product_code,
-            )
-            machine_logger.error(
-                "msi_uninstall_residue",
-                extra={
-                    "event": "msi_uninstall_residue",
-                    "product_code": entry.product_code,
-                    "display_name": entry.display_name,
-                    "version": entry.version,
-                    "executor": command[0] if command else None,
-                },
-            )
-            failures.append(entry.product_code)
+        verify.append((entry, command))
+
+    confirmed = _await_removals([entry for entry, _ in verify]) if verify else {}
+    for entry, command in verify:
+        if confirmed.get(entry.product_code):
+            continue
+        human_logger.error(
+            "Registry still reports %s (%s) after uninstall command",
+            entry.display_name,
+            entry.product_code,
+        )
+        machine_logger.error(
+            "msi_uninstall_residue",
+            extra={
+                "event": "msi_uninstall_residue",
+                "product_code": entry.product_code,
+                "display_name": entry.display_name,
+                "version": entry.version,
+                "executor": command[0] if command else None,
+            },
+        )
+        failures.append(entry.product_code)
 
     if failures:
         raise RuntimeError(
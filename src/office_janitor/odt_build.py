@@ -24,6 +24,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from types import ModuleType
+from typing import IO
 
 from . import logging_ext
 from .encoding_helpers import SUBPROCESS_ENCODING, SUBPROCESS_ERRORS
@@ -978,14 +979,19 @@ def _get_odt_log_path() -> Path:
     return Path(os.environ.get("TEMP", tempfile.gettempdir()))
 
 
-def _find_latest_odt_log() -> Path | None:
+_ODT_LOG_GLOB = "Microsoft Office Click-to-Run*.log"
+
+
+def _find_latest_odt_log(log_dir: Path | None = None) -> Path | None:
     """!
     @brief Find the most recent ODT Click-to-Run log file.
+    @param log_dir Directory to search; defaults to :func:`_get_odt_log_path`.
     @returns Path to the latest log file, or None if not found.
     """
-    log_dir = _get_odt_log_path()
+    if log_dir is None:
+        log_dir = _get_odt_log_path()
     # ODT creates logs like "Microsoft Office Click-to-Run*.log"
-    pattern = str(log_dir / "Microsoft Office Click-to-Run*.log")
+    pattern = str(log_dir / _ODT_LOG_GLOB)
     logs = glob.glob(pattern)
     if not logs:
         return None
@@ -993,64 +999,149 @@ def _find_latest_odt_log() -> Path | None:
     return Path(max(logs, key=os.path.getmtime))
 
 
+@dataclass
+class _DirectoryState:
+    """!
+    @brief Cached totals for the files directly inside one directory.
+    """
+
+    mtime_ns: int
+    size: int = 0
+    files: int = 0
+    subdirs: tuple[str, ...] = ()
+    hot: dict[str, int] = field(default_factory=dict)
+    """Recently written files (name -> last seen size), re-stat'd on every refresh."""
+
+
+class _InstallTreeTracker:
+    """!
+    @brief Incrementally tracks total size and file count under a set of folders.
+    @details Keeps a per-directory cache keyed by the directory's mtime. A
+    refresh only stats directories; a directory is listed again only when its
+    mtime changed (a file was created, deleted or renamed inside it). Writes to
+    an existing file do not touch the directory's mtime, so files modified
+    within ``hot_window`` seconds of a scan are re-stat'd individually until
+    they go quiet. Totals are the sum of the cached per-directory values.
+    """
+
+    def __init__(self, roots: Sequence[Path], *, hot_window: float = 60.0) -> None:
+        self.roots = [str(root) for root in roots]
+        self.hot_window_ns = int(hot_window * 1_000_000_000)
+        self.total_size = 0
+        self.file_count = 0
+        self.directories_scanned = 0
+        """Directories listed during the most recent :meth:`refresh`."""
+        self._directories: dict[str, _DirectoryState] = {}
+
+    def refresh(self) -> tuple[int, int]:
+        """!
+        @brief Bring the totals up to date.
+        @returns Tuple of (total size in bytes, file count).
+        """
+        now = time.time_ns()
+        seen: set[str] = set()
+        total_size = 0
+        file_count = 0
+        self.directories_scanned = 0
+        pending = list(self.roots)
+        while pending:
+            path = pending.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            seen.add(path)
+            state = self._directories.get(path)
+            if state is None or state.mtime_ns != mtime_ns:
+                state = self._scan(path, mtime_ns, now)
+                self._directories[path] = state
+            elif state.hot:
+                self._restat_hot_files(path, state, now)
+            total_size += state.size
+            file_count += state.files
+            pending.extend(os.path.join(path, name) for name in state.subdirs)
+            if len(seen) % 100 == 0:
+                time.sleep(0)  # Yield GIL
+        for path in self._directories.keys() - seen:
+            del self._directories[path]
+        self.total_size = total_size
+        self.file_count = file_count
+        return total_size, file_count
+
+    def _scan(self, path: str, mtime_ns: int, now: int) -> _DirectoryState:
+        """!
+        @brief List ``path`` and total the files directly inside it.
+        """
+        self.directories_scanned += 1
+        state = _DirectoryState(mtime_ns)
+        subdirs: list[str] = []
+        try:
+            with os.scandir(path) as entries:
+                for index, entry in enumerate(entries, 1):
+                    if index % 100 == 0:
+                        time.sleep(0)  # Yield GIL
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        info = entry.stat()
+                    except OSError:
+                        continue
+                    state.files += 1
+                    state.size += info.st_size
+                    if now - info.st_mtime_ns < self.hot_window_ns:
+                        state.hot[entry.name] = info.st_size
+        except OSError:
+            pass
+        state.subdirs = tuple(subdirs)
+        return state
+
+    def _restat_hot_files(self, path: str, state: _DirectoryState, now: int) -> None:
+        """!
+        @brief Pick up size changes of recently written files in an unchanged directory.
+        """
+        for name, previous_size in list(state.hot.items()):
+            try:
+                info = os.stat(os.path.join(path, name))
+            except OSError:
+                del state.hot[name]
+                state.size -= previous_size
+                state.files -= 1
+                continue
+            state.size += info.st_size - previous_size
+            if now - info.st_mtime_ns < self.hot_window_ns:
+                state.hot[name] = info.st_size
+            else:
+                del state.hot[name]
+
+
 def _get_folder_size(path: Path) -> int:
     """!
     @brief Get total size of a folder in bytes.
-    @details Yields GIL every 100 files to keep spinner responsive.
     @param path Path to the folder.
     @returns Total size in bytes, or 0 if folder doesn't exist.
     """
-    if not path.exists():
-        return 0
-    try:
-        total = 0
-        count = 0
-        for entry in path.rglob("*"):
-            if entry.is_file():
-                try:
-                    total += entry.stat().st_size
-                except (OSError, PermissionError):
-                    pass
-            # Yield GIL every 100 files to keep spinner responsive
-            count += 1
-            if count % 100 == 0:
-                time.sleep(0)
-        return total
-    except (OSError, PermissionError):
-        return 0
+    return _InstallTreeTracker([path]).refresh()[0]
 
 
 def _get_office_install_size() -> int:
     """!
     @brief Get combined size of all Office installation folders.
+    @details One-shot scan; monitors keep an :class:`_InstallTreeTracker` instead.
     @returns Total size in bytes.
     """
-    total = 0
-    for path in _OFFICE_INSTALL_PATHS:
-        total += _get_folder_size(path)
-    return total
+    return _InstallTreeTracker(_OFFICE_INSTALL_PATHS).refresh()[0]
 
 
 def _count_office_files() -> int:
     """!
     @brief Count files in Office installation folders.
-    @details Yields GIL every 100 files to keep spinner responsive.
+    @details One-shot scan; monitors keep an :class:`_InstallTreeTracker` instead.
     @returns Total file count.
     """
-    total = 0
-    yield_counter = 0
-    for path in _OFFICE_INSTALL_PATHS:
-        if path.exists():
-            try:
-                for entry in path.rglob("*"):
-                    if entry.is_file():
-                        total += 1
-                    yield_counter += 1
-                    if yield_counter % 100 == 0:
-                        time.sleep(0)  # Yield GIL
-            except (OSError, PermissionError):
-                pass
-    return total
+    return _InstallTreeTracker(_OFFICE_INSTALL_PATHS).refresh()[1]
 
 
 def _check_registry_key_exists(key_path: str) -> bool:
@@ -1398,9 +1489,55 @@ def _get_process_tree_stats(pid: int) -> tuple[float, float]:
         return 0.0, 0.0
 
 
+_ODT_PERCENT_PATTERN = re.compile(r"(\d{1,3})%")
+
+_ODT_LOG_STATUSES: tuple[tuple[tuple[str, ...], str, bool], ...] = (
+    (("downloading",), "Downloading Office files", True),
+    (("installing",), "Installing Office", True),
+    (("configuring",), "Configuring Office", False),
+    (("applying",), "Applying settings", False),
+    (("finalizing", "completing"), "Finalizing installation", False),
+    (("registering",), "Registering components", False),
+    (("updating",), "Updating Office", False),
+    (("removing",), "Removing old version", False),
+    (("verifying",), "Verifying installation", False),
+)
+"""!
+@brief Log keywords in priority order, the status they map to, and whether a
+percentage on the same line is reported with it.
+"""
+
+_ODT_STATUS_PATTERN = re.compile(
+    "|".join(keyword for keywords, _, _ in _ODT_LOG_STATUSES for keyword in keywords) + r"|\d%",
+    re.IGNORECASE,
+)
+
+
+def _parse_odt_log_line(line: str) -> tuple[str, int | None] | None:
+    """!
+    @brief Map one ODT log line to a progress status.
+    @returns Tuple of (status_message, percentage or None), or None if the line
+    carries no progress information.
+    """
+    if not _ODT_STATUS_PATTERN.search(line):
+        return None
+    pct_match = _ODT_PERCENT_PATTERN.search(line)
+    pct = int(pct_match.group(1)) if pct_match else None
+    line_lower = line.lower()
+    for keywords, status, with_percent in _ODT_LOG_STATUSES:
+        if any(keyword in line_lower for keyword in keywords):
+            return status, pct if with_percent else None
+    if pct is not None:
+        # Found a percentage without specific context
+        return "Installing Office", pct
+    return None
+
+
 def _parse_odt_progress(log_path: Path) -> tuple[str, int | None]:
     """!
     @brief Parse ODT log file for installation progress.
+    @details One-shot read of the log tail; monitors keep an
+    :class:`_OdtLogFollower` instead.
     @param log_path Path to the ODT log file.
     @returns Tuple of (status_message, percentage or None).
     """
@@ -1420,35 +1557,9 @@ def _parse_odt_progress(log_path: Path) -> tuple[str, int | None]:
 
         # Look for progress indicators from bottom up
         for line in reversed(lines[-50:]):  # Check last 50 lines
-            line_lower = line.lower()
-
-            # Check for percentage patterns
-            pct_match = re.search(r"(\d{1,3})%", line)
-
-            # Check for specific status messages
-            if "downloading" in line_lower:
-                pct = int(pct_match.group(1)) if pct_match else None
-                return "Downloading Office files", pct
-            elif "installing" in line_lower:
-                pct = int(pct_match.group(1)) if pct_match else None
-                return "Installing Office", pct
-            elif "configuring" in line_lower:
-                return "Configuring Office", None
-            elif "applying" in line_lower:
-                return "Applying settings", None
-            elif "finalizing" in line_lower or "completing" in line_lower:
-                return "Finalizing installation", None
-            elif "registering" in line_lower:
-                return "Registering components", None
-            elif "updating" in line_lower:
-                return "Updating Office", None
-            elif "removing" in line_lower:
-                return "Removing old version", None
-            elif "verifying" in line_lower:
-                return "Verifying installation", None
-            elif pct_match:
-                # Found a percentage without specific context
-                return "Installing Office", int(pct_match.group(1))
+            parsed = _parse_odt_log_line(line)
+            if parsed is not None:
+                return parsed
 
         return "Installing Office...", None
 
@@ -1456,6 +1567,121 @@ def _parse_odt_progress(log_path: Path) -> tuple[str, int | None]:
         return "Installing Office...", None
 
 
+class _OdtLogFollower:
+    """!
+    @brief Follows the latest ODT log, parsing only newly appended lines.
+    @details Keeps the log open with its byte offset and the last status seen.
+    The log directory is re-globbed only when its mtime changes, i.e. when a
+    log is created, renamed or deleted, so a newer log is picked up without
+    globbing on every poll. A log that shrinks or is replaced under the same
+    name is reopened. On first open only the last ``tail_bytes`` are parsed.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path | None = None,
+        *,
+        tail_bytes: int = 8192,
+    ) -> None:
+        self.log_dir = log_dir if log_dir is not None else _get_odt_log_path()
+        self.tail_bytes = tail_bytes
+        self.path: Path | None = None
+        self.status: str | None = None
+        self.percent: int | None = None
+        self._dir_mtime_ns: int | None = None
+        self._handle: IO[bytes] | None = None
+        self._identity: tuple[int, int] | None = None
+        self._offset = 0
+        self._partial = b""
+        self._skip_first_line = False
+
+    def poll(self, default: str = "Starting...") -> tuple[str, int | None]:
+        """!
+        @brief Read whatever the log gained since the last poll.
+        @param default Status reported while no log exists yet.
+        @returns Tuple of (status_message, percentage or None).
+        """
+        self._check_directory()
+        if self.path is None:
+            return default, None
+        try:
+            self._read_new_lines()
+        except OSError:
+            self._close_handle()
+        if self.status is None:
+            return "Installing Office...", None
+        return self.status, self.percent
+
+    def close(self) -> None:
+        """!
+        @brief Release the log file handle.
+        """
+        self._close_handle()
+
+    def _check_directory(self) -> None:
+        try:
+            mtime_ns = os.stat(self.log_dir).st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns == self._dir_mtime_ns:
+            return
+        self._dir_mtime_ns = mtime_ns
+        latest = _find_latest_odt_log(self.log_dir)
+        if latest != self.path:
+            self._close_handle()
+            self.path = latest
+            self.status = None
+            self.percent = None
+
+    def _open(self) -> None:
+        assert self.path is not None
+        handle = open(self.path, "rb")
+        info = os.fstat(handle.fileno())
+        self._handle = handle
+        self._identity = (info.st_dev, info.st_ino)
+        self._offset = max(0, info.st_size - self.tail_bytes)
+        self._skip_first_line = self._offset > 0
+        self._partial = b""
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+        self._handle = None
+        self._identity = None
+
+    def _read_new_lines(self) -> None:
+        assert self.path is not None
+        if self._handle is None:
+            self._open()
+        else:
+            info = os.stat(self.path)
+            if (info.st_dev, info.st_ino) != self._identity or info.st_size < self._offset:
+                # Truncated or replaced under the same name: start over.
+                self._close_handle()
+                self.status = None
+                self.percent = None
+                self._open()
+        assert self._handle is not None
+        self._handle.seek(self._offset)
+        data = self._handle.read()
+        if not data:
+            return
+        self._offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        if self._skip_first_line and lines:
+            # The tail started mid-line; the first fragment is not a full line.
+            lines.pop(0)
+            self._skip_first_line = False
+        for raw in lines:
+            parsed = _parse_odt_log_line(raw.decode("utf-8", errors="ignore"))
+            if parsed is not None:
+                self.status, self.percent = parsed
+
+
 @dataclass
 class InstallMetrics:
     """!
@@ -1586,6 +1812,8 @@ def _install_poller_thread(
     HEAVY_POLL_INTERVAL = 5  # Only poll disk/files every 5 intervals (~2.5s)
 
     # Cache for heavy operations
+    install_tree = _InstallTreeTracker(_OFFICE_INSTALL_PATHS)
+    log_follower = _OdtLogFollower()
     cached_size = 0
     cached_files = 0
     cached_reg_keys = 0
@@ -1619,14 +1847,7 @@ def _install_poller_thread(
 
                 # Heavy disk/file operations
                 try:
-                    cached_size = _get_office_install_size()
-                except Exception:
-                    pass
-
-                time.sleep(0)  # Yield GIL
-
-                try:
-                    cached_files = _count_office_files()
+                    cached_size, cached_files = install_tree.refresh()
                 except Exception:
                     pass
 
@@ -1642,9 +1863,7 @@ def _install_poller_thread(
             # Log status is lightweight - check every poll
             log_status, log_pct = "Starting...", None
             try:
-                log_path = _find_latest_odt_log()
-                if log_path:
-                    log_status, log_pct = _parse_odt_progress(log_path)
+                log_status, log_pct = log_follower.poll(default=log_status)
             except Exception:
                 pass
 
@@ -1665,6 +1884,8 @@ def _install_poller_thread(
         # Wait for next poll - short interval for responsiveness
         stop_event.wait(interval)
 
+    log_follower.close()
+
 
 def _download_poller_thread(
     pid: int,
@@ -1686,6 +1907,8 @@ def _download_poller_thread(
     HEAVY_POLL_INTERVAL = 5  # Only poll disk every 5 intervals (~2.5s)
 
     # Cache for heavy operations
+    download_tree = _InstallTreeTracker([download_path])
+    log_follower = _OdtLogFollower()
     cached_dl_size = 0
     cached_dl_files = 0
     cached_cpu = 0.0
@@ -1716,23 +1939,14 @@ def _download_poller_thread(
                 time.sleep(0)  # Yield GIL
 
                 try:
-                    cached_dl_size = _get_folder_size(download_path)
-                except Exception:
-                    pass
-
-                time.sleep(0)  # Yield GIL
-
-                try:
-                    cached_dl_files = sum(1 for _ in download_path.rglob("*") if _.is_file())
+                    cached_dl_size, cached_dl_files = download_tree.refresh()
                 except Exception:
                     pass
 
             # Log status is lightweight - check every poll
             log_status, log_pct = "Starting...", None
             try:
-                log_path = _find_latest_odt_log()
-                if log_path:
-                    log_status, log_pct = _parse_odt_progress(log_path)
+                log_status, log_pct = log_follower.poll(default=log_status)
             except Exception:
                 pass
 
@@ -1747,6 +1961,8 @@ def _download_poller_thread(
         # Wait for next poll - short interval for responsiveness
         stop_event.wait(interval)
 
+    log_follower.close()
+
 
 def _capture_install_metrics(
     pid: int | None = None,
@@ -1759,8 +1975,7 @@ def _capture_install_metrics(
     @returns InstallMetrics with current state.
     """
     metrics = InstallMetrics()
-    metrics.install_size = _get_office_install_size()
-    metrics.file_count = _count_office_files()
+    metrics.install_size, metrics.file_count = _InstallTreeTracker(_OFFICE_INSTALL_PATHS).refresh()
     metrics.registry_keys = sum(_count_registry_subkeys(key) for key in _OFFICE_REGISTRY_KEYS)
     metrics.c2r_version = _get_c2r_version()
 
@@ -1987,6 +2202,8 @@ def _clicktorun_poller_thread(
     HEAVY_POLL_INTERVAL = 5
 
     # Cache for heavy operations
+    install_tree = _InstallTreeTracker(_OFFICE_INSTALL_PATHS)
+    log_follower = _OdtLogFollower()
     cached_size = 0
     cached_files = 0
     cached_reg_keys = 0
@@ -2021,14 +2238,7 @@ def _clicktorun_poller_thread(
                 time.sleep(0)
 
                 try:
-                    cached_size = _get_office_install_size()
-                except Exception:
-                    pass
-
-                time.sleep(0)
-
-                try:
-                    cached_files = _count_office_files()
+                    cached_size, cached_files = install_tree.refresh()
                 except Exception:
                     pass
 
@@ -2044,9 +2254,7 @@ def _clicktorun_poller_thread(
             # Log status - check every poll
             log_status, log_pct = "Installing...", None
             try:
-                log_path = _find_latest_odt_log()
-                if log_path:
-                    log_status, log_pct = _parse_odt_progress(log_path)
+                log_status, log_pct = log_follower.poll(default=log_status)
             except Exception:
                 pass
 
@@ -2065,6 +2273,8 @@ def _clicktorun_poller_thread(
 
         stop_event.wait(interval)
 
+    log_follower.close()
+
 
 def run_odt_install(
     config: ODTConfig,
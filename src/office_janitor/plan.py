@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence, Sequence
 
+from . import tracing
 from .plan_helpers import (
     NON_ACTIONABLE_CATEGORIES,
     augment_auto_all_c2r_inventory,
@@ -58,6 +59,7 @@ _coerce_to_list = coerce_to_list
 _coerce_to_mapping = coerce_to_mapping
 
 
+@tracing.traced("plan.build_plan", capture=("pass_index",))
 def build_plan(
     inventory: Mapping[str, Sequence[Mapping[str, object]]],
     options: Mapping[str, object],
@@ -336,6 +338,11 @@ def build_plan(
         )
         cleanup_dependencies = [licensing_step_id]
 
+    # Task and service cleanup do not depend on each other, so both hang off the
+    # same prerequisites and may run concurrently under a parallel executor.
+    service_prerequisites = cleanup_dependencies
+    control_step_ids: list[str] = []
+
     # Task cleanup (unless skipped)
     task_names = (
         []
@@ -359,7 +366,7 @@ def build_plan(
                 },
             }
         )
-        cleanup_dependencies = [task_step_id]
+        control_step_ids.append(task_step_id)
 
     # Service cleanup (unless skipped)
     service_names = (
@@ -374,7 +381,7 @@ def build_plan(
                 "id": service_step_id,
                 "category": "service-cleanup",
                 "description": "Delete Office background services.",
-                "depends_on": cleanup_dependencies,
+                "depends_on": service_prerequisites,
                 "metadata": {
                     "services": service_names,
                     "dry_run": dry_run,
@@ -384,7 +391,12 @@ def build_plan(
                 },
             }
         )
-        cleanup_dependencies = [service_step_id]
+        control_step_ids.append(service_step_id)
+    if control_step_ids:
+        cleanup_dependencies = control_step_ids
+
+    # Filesystem and registry cleanup likewise share prerequisites.
+    residue_step_ids: list[str] = []
 
     # Filesystem cleanup (unless skipped)
     filesystem_entries = (
@@ -414,7 +426,7 @@ def build_plan(
                 },
             }
         )
-        cleanup_dependencies = [f"filesystem-{pass_index}-0"]
+        residue_step_ids.append(f"filesystem-{pass_index}-0")
 
     # Registry cleanup (unless skipped)
     registry_entries = (
@@ -466,7 +478,9 @@ def build_plan(
                 },
             }
         )
-        cleanup_dependencies = [f"registry-{pass_index}-0"]
+        residue_step_ids.append(f"registry-{pass_index}-0")
+    if residue_step_ids:
+        cleanup_dependencies = residue_step_ids
 
     # vNext identity cleanup (aggressive/nuclear or explicit)
     if not diagnose_mode and (is_aggressive or clean_vnext):
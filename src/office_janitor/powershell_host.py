@@ -0,0 +1,545 @@
+"""!
+@brief Persistent PowerShell hosts shared by every PowerShell caller.
+@details Starting ``powershell.exe`` costs 0.3-1 s of process creation and
+.NET JIT per call. This module keeps a small pool of long-lived
+``powershell -NoLogo -NoExit -Command -`` processes and runs scripts inside
+them instead. :func:`exec_utils.run_command` routes plain ``-Command``/``-File``
+invocations here, so callers keep building the same command lines and keep the
+same logging, dry-run and timeout behaviour.
+
+The wire protocol is line framed. After the bootstrap loop (sent as the first
+stdin line) is running, each request is one JSON line
+``{"id": n, "script": <base64 UTF-8>}`` and each response is one stdout line
+starting with :data:`FRAME_PREFIX` followed by
+``{"id": n, "code": rc, "stdout": <base64>, "stderr": <base64>}``. Lines
+without the prefix are ignored, so stray console output cannot break framing.
+Every script is written to a randomly named ``.ps1`` and invoked with ``&``
+so ``exit`` ends the script rather than the host. Each host keeps those files
+in its own randomly named directory, restricted to the host's account, and
+creates them with ``FileMode.CreateNew`` so a file planted by another user is
+never executed even when the host runs as SYSTEM.
+
+A request that outlives its timeout kills the host; a host that exits is
+replaced on the next request. When a host cannot be started at all the pool
+is marked unavailable and callers fall back to spawning PowerShell directly.
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import itertools
+import json
+import ntpath
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import IO, Any
+
+from . import logging_ext
+
+FRAME_PREFIX = "<<OJ-PS>>"
+"""!
+@brief Marker that starts every response line written by a host.
+"""
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_START_TIMEOUT = 30.0
+
+_POWERSHELL_NAMES = {"powershell", "powershell.exe"}
+_PASSTHROUGH_SWITCHES = {"-noprofile", "-noninteractive", "-nologo"}
+_ERROR_RECORD = "[System.Management.Automation.ErrorRecord]"
+
+_HOST_BOOTSTRAP = ";".join(
+    (
+        "$ErrorActionPreference='Continue'",
+        "$ProgressPreference='SilentlyContinue'",
+        "$ojUtf8=New-Object System.Text.UTF8Encoding $false",
+        "$ojBom=New-Object System.Text.UTF8Encoding $true",
+        "$ojIn=New-Object System.IO.StreamReader([Console]::OpenStandardInput(),$ojUtf8)",
+        "$ojOut=New-Object System.IO.StreamWriter([Console]::OpenStandardOutput(),$ojUtf8)",
+        "$ojOut.AutoFlush=$true",
+        "$ojNl=[Environment]::NewLine",
+        "$ojDir=Join-Path ([IO.Path]::GetTempPath()) "
+        "('office-janitor-ps-'+[Guid]::NewGuid().ToString('N'))",
+        "$null=New-Item -ItemType Directory -Path $ojDir -ErrorAction Stop",
+        "try{$ojAcl=New-Object System.Security.AccessControl.DirectorySecurity;"
+        "$ojAcl.SetAccessRuleProtection($true,$false);"
+        "$ojAcl.AddAccessRule((New-Object System.Security.AccessControl.FileSystemAccessRule("
+        "[Security.Principal.WindowsIdentity]::GetCurrent().User,'FullControl',"
+        "'ContainerInherit,ObjectInherit','None','Allow')));"
+        "Set-Acl -LiteralPath $ojDir -AclObject $ojAcl}catch{}",
+        f"$ojOut.WriteLine('{FRAME_PREFIX}'+(@{{ready=$PID}}|ConvertTo-Json -Compress))",
+        "while($null -ne ($ojLine=$ojIn.ReadLine())){"
+        "$ojReq=$ojLine|ConvertFrom-Json;"
+        "$ojText=$ojUtf8.GetString([Convert]::FromBase64String($ojReq.script));"
+        "$ojFile=Join-Path $ojDir ([Guid]::NewGuid().ToString('N')+'.ps1');"
+        "$ojBytes=[byte[]]($ojBom.GetPreamble()+$ojUtf8.GetBytes($ojText));"
+        "$global:LASTEXITCODE=0;$ojOk=$true;"
+        "try{$ojFs=New-Object IO.FileStream -ArgumentList $ojFile,'CreateNew','Write','None';"
+        "try{$ojFs.Write($ojBytes,0,$ojBytes.Length)}finally{$ojFs.Dispose()};"
+        "$ojItems=@(& $ojFile *>&1);$ojOk=$?}catch{$ojItems=@($_);$ojOk=$false};"
+        f"$ojErr=@($ojItems|Where-Object{{$_ -is {_ERROR_RECORD}}});"
+        f"$ojStd=@($ojItems|Where-Object{{$_ -isnot {_ERROR_RECORD}}});"
+        "$ojCode=if($LASTEXITCODE){$LASTEXITCODE}elseif($ojOk){0}else{1};"
+        "Remove-Item -LiteralPath $ojFile -Force -ErrorAction SilentlyContinue;"
+        "$ojLines=@($ojStd|ForEach-Object{"
+        "if($_ -is [string]){$_}else{($_|Out-String -Width 4096).TrimEnd()}});"
+        "$ojStdOut=if($ojLines.Count){($ojLines -join $ojNl)+$ojNl}else{''};"
+        "$ojStdText=[Convert]::ToBase64String($ojUtf8.GetBytes([string]$ojStdOut));"
+        "$ojErrOut=[string]($ojErr|Out-String -Width 4096);"
+        "$ojErrText=[Convert]::ToBase64String($ojUtf8.GetBytes($ojErrOut));"
+        f"$ojOut.WriteLine('{FRAME_PREFIX}'+(@{{id=$ojReq.id;code=[int]$ojCode;"
+        "stdout=$ojStdText;stderr=$ojErrText}|ConvertTo-Json -Compress))"
+        "}",
+        "Remove-Item -LiteralPath $ojDir -Recurse -Force -ErrorAction SilentlyContinue",
+    )
+)
+"""!
+@brief Request loop run by each host; sent as a single ``-Command -`` line.
+"""
+
+
+class PowerShellHostError(RuntimeError):
+    """!
+    @brief A host failed while a request was in flight; the script may have run.
+    """
+
+
+class PowerShellHostUnavailable(PowerShellHostError):
+    """!
+    @brief No host could be started; nothing was executed.
+    """
+
+
+class PowerShellHostTimeout(PowerShellHostError):
+    """!
+    @brief A request exceeded its timeout and its host was killed.
+    """
+
+
+@dataclass
+class HostResult:
+    """!
+    @brief Exit code and decoded output streams of one hosted script.
+    """
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def host_command(executable: str = "powershell.exe") -> list[str]:
+    """!
+    @brief Command line used to start a host process.
+    """
+
+    return [
+        executable,
+        "-NoLogo",
+        "-NoProfile",
+        "-NonInteractive",
+        "-NoExit",
+        "-ExecutionPolicy",
+        "Bypass",
+        "-Command",
+        "-",
+    ]
+
+
+def _powershell_literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+def script_from_command(command: Sequence[str]) -> str | None:
+    """!
+    @brief Extract the script a ``powershell`` command line would run.
+    @details Recognises ``powershell[.exe] [switches] -Command <script>`` and
+    ``... -File <path>`` where the switches are limited to ``-NoProfile``,
+    ``-NonInteractive``, ``-NoLogo`` and ``-ExecutionPolicy <policy>`` (hosts
+    already run with ``Bypass``). Anything else returns ``None`` and should be
+    spawned as before.
+    """
+
+    if len(command) < 3:
+        return None
+    if ntpath.basename(str(command[0])).lower() not in _POWERSHELL_NAMES:
+        return None
+    arguments = [str(part) for part in command[1:]]
+    index = 0
+    while index < len(arguments):
+        switch = arguments[index].lower()
+        if switch in _PASSTHROUGH_SWITCHES:
+            index += 1
+        elif switch == "-executionpolicy":
+            index += 2
+        elif switch == "-command" and index == len(arguments) - 2:
+            script = arguments[index + 1]
+            return script if script != "-" else None
+        elif switch == "-file" and index == len(arguments) - 2:
+            return "& " + _powershell_literal(arguments[index + 1])
+        else:
+            return None
+    return None
+
+
+class PowerShellHost:
+    """!
+    @brief One persistent PowerShell process speaking the framed protocol.
+    @details Requests are serialised per host. The process is started on first
+    use and restarted by :meth:`execute` after it exits or is killed.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str] | None = None,
+        *,
+        start_timeout: float = DEFAULT_START_TIMEOUT,
+        env: dict[str, str] | None = None,
+    ) -> None:
+        self.command = list(command) if command is not None else host_command()
+        self.start_timeout = start_timeout
+        self.env = env
+        self.starts = 0
+        self._process: subprocess.Popen[bytes] | None = None
+        self._responses: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process is not None else None
+
+    def start(self) -> None:
+        """!
+        @brief Start the process and wait for its ready frame.
+        @throws PowerShellHostUnavailable When it cannot be started or never
+        becomes ready within ``start_timeout``.
+        """
+
+        self._kill()
+        if self.env is None:
+            from . import exec_utils
+
+            self.env = dict(exec_utils.sanitize_environment())
+        try:
+            process = subprocess.Popen(  # noqa: S603 - intentional command execution
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=self.env,
+            )
+        except OSError as exc:
+            raise PowerShellHostUnavailable(f"cannot start {self.command[0]}: {exc}") from exc
+        self._process = process
+        self._responses = queue.Queue()
+        assert process.stdout is not None
+        reader = threading.Thread(
+            target=_read_frames,
+            args=(process.stdout, self._responses),
+            name=f"powershell-host-{process.pid}",
+            daemon=True,
+        )
+        reader.start()
+        try:
+            self._send(_HOST_BOOTSTRAP)
+            frame = self._next_frame(self.start_timeout)
+        except PowerShellHostError as exc:
+            self._kill()
+            raise PowerShellHostUnavailable(f"host did not become ready: {exc}") from exc
+        if frame is None or "ready" not in frame:
+            self._kill()
+            raise PowerShellHostUnavailable("host exited during startup")
+        self.starts += 1
+
+    def execute(self, script: str, *, timeout: float | None = None) -> HostResult:
+        """!
+        @brief Run ``script`` and return its exit code and output.
+        @throws PowerShellHostTimeout When ``timeout`` elapses (the host is killed).
+        @throws PowerShellHostError When the host exits mid-request.
+        @throws PowerShellHostUnavailable When a replacement host cannot start.
+        """
+
+        with self._lock:
+            if not self.alive:
+                self.start()
+            request_id = next(self._ids)
+            payload = base64.b64encode(script.encode("utf-8")).decode("ascii")
+            try:
+                self._send(json.dumps({"id": request_id, "script": payload}))
+            except PowerShellHostError:
+                self._kill()
+                raise
+            while True:
+                try:
+                    frame = self._next_frame(timeout)
+                except PowerShellHostTimeout:
+                    self._kill()
+                    raise
+                if frame is None:
+                    self._kill()
+                    raise PowerShellHostError("PowerShell host exited during request")
+                if frame.get("id") == request_id:
+                    return HostResult(
+                        returncode=int(frame.get("code", 1)),
+                        stdout=_decode(frame.get("stdout")),
+                        stderr=_decode(frame.get("stderr")),
+                    )
+
+    def close(self) -> None:
+        """!
+        @brief Ask the host to exit (stdin EOF) and kill it if it lingers.
+        """
+
+        with self._lock:
+            process = self._process
+            if process is None:
+                return
+            try:
+                if process.stdin is not None:
+                    process.stdin.close()
+                process.wait(timeout=2.0)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            self._kill()
+
+    def _send(self, line: str) -> None:
+        process = self._process
+        if process is None or process.stdin is None:
+            raise PowerShellHostError("PowerShell host is not running")
+        try:
+            process.stdin.write(line.encode("utf-8") + b"\n")
+            process.stdin.flush()
+        except OSError as exc:
+            raise PowerShellHostError(f"cannot write to PowerShell host: {exc}") from exc
+
+    def _next_frame(self, timeout: float | None) -> dict[str, Any] | None:
+        """!
+        @brief Wait for the next frame; ``None`` means the host's stdout closed.
+        @details Waits in short slices so the main thread still sees Ctrl+C.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = 0.1
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PowerShellHostTimeout(f"no response within {timeout}s")
+                wait = min(wait, remaining)
+            try:
+                return self._responses.get(timeout=wait)
+            except queue.Empty:
+                continue
+
+    def _kill(self) -> None:
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+        try:
+            if process.poll() is None:
+                process.kill()
+            process.wait(timeout=5.0)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        for stream in (process.stdin, process.stdout):
+            try:
+                if stream is not None:
+                    stream.close()
+            except OSError:
+                pass
+
+
+def _decode(value: object) -> str:
+    if not value:
+        return ""
+    return base64.b64decode(str(value)).decode("utf-8", errors="replace")
+
+
+def _read_frames(stream: IO[bytes], responses: queue.Queue[dict[str, Any] | None]) -> None:
+    """!
+    @brief Reader thread: forward response frames from ``stream`` to ``responses``.
+    """
+
+    try:
+        for raw in iter(stream.readline, b""):
+            text = raw.decode("utf-8", errors="replace")
+            start = text.find(FRAME_PREFIX)
+            if start < 0:
+                continue
+            try:
+                frame = json.loads(text[start + len(FRAME_PREFIX) :])
+            except json.JSONDecodeError:
+                continue
+            if isinstance(frame, dict):
+                responses.put(frame)
+    except (OSError, ValueError):
+        pass
+    responses.put(None)
+
+
+class PowerShellPool:
+    """!
+    @brief Up to ``size`` hosts handed out to concurrent callers.
+    @details Hosts are created on demand. Once a host fails to start the pool
+    becomes unavailable and :meth:`run` raises :class:`PowerShellHostUnavailable`
+    straight away, so callers pay the failed start only once.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        *,
+        factory: Callable[[], PowerShellHost] = PowerShellHost,
+    ) -> None:
+        self.size = max(1, size)
+        self.factory = factory
+        self.available = True
+        self._idle: list[PowerShellHost] = []
+        self._hosts: list[PowerShellHost] = []
+        self._condition = threading.Condition()
+
+    def run(self, script: str, *, timeout: float | None = None) -> HostResult:
+        """!
+        @brief Run ``script`` on an idle host, waiting for one if all are busy.
+        """
+
+        host = self._acquire()
+        try:
+            return host.execute(script, timeout=timeout)
+        except PowerShellHostUnavailable:
+            self._mark_unavailable()
+            raise
+        finally:
+            self._release(host)
+
+    def shutdown(self) -> None:
+        """!
+        @brief Close every host.
+        """
+
+        with self._condition:
+            hosts, self._hosts, self._idle = self._hosts, [], []
+        for host in hosts:
+            host.close()
+
+    def _acquire(self) -> PowerShellHost:
+        with self._condition:
+            while True:
+                if not self.available:
+                    raise PowerShellHostUnavailable("PowerShell host pool is unavailable")
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._hosts) < self.size:
+                    host = self.factory()
+                    self._hosts.append(host)
+                    return host
+                self._condition.wait(0.1)
+
+    def _release(self, host: PowerShellHost) -> None:
+        with self._condition:
+            if host in self._hosts:
+                self._idle.append(host)
+            self._condition.notify()
+
+    def _mark_unavailable(self) -> None:
+        with self._condition:
+            self.available = False
+            self._condition.notify_all()
+        logging_ext.get_machine_logger().warning(
+            "powershell_host_unavailable",
+            extra={"event": "powershell_host_unavailable", "data": {"size": self.size}},
+        )
+
+
+_POOL_LOCK = threading.Lock()
+_POOL: PowerShellPool | None = None
+_ENABLED = sys.platform == "win32"
+_POOL_SIZE = DEFAULT_POOL_SIZE
+_HOST_COMMAND: list[str] | None = None
+
+
+def configure(
+    *,
+    enabled: bool | None = None,
+    size: int | None = None,
+    command: Sequence[str] | None = None,
+) -> None:
+    """!
+    @brief Change pool settings; running hosts are shut down.
+    @param enabled Route PowerShell through hosts (default: only on Windows).
+    @param size Maximum number of concurrent hosts.
+    @param command Host command line, e.g. ``host_command("pwsh")`` or a stub.
+    """
+
+    global _ENABLED, _POOL_SIZE, _HOST_COMMAND
+    shutdown()
+    with _POOL_LOCK:
+        if enabled is not None:
+            _ENABLED = enabled
+        if size is not None:
+            _POOL_SIZE = max(1, size)
+        if command is not None:
+            _HOST_COMMAND = list(command)
+
+
+def is_enabled() -> bool:
+    return _ENABLED
+
+
+def get_pool() -> PowerShellPool | None:
+    """!
+    @brief Return the shared pool, creating it on first use; ``None`` when disabled.
+    """
+
+    global _POOL
+    if not _ENABLED:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            command = _HOST_COMMAND
+            _POOL = PowerShellPool(_POOL_SIZE, factory=lambda: PowerShellHost(command))
+        return _POOL
+
+
+def run_script(script: str, *, timeout: float | None = None) -> HostResult | None:
+    """!
+    @brief Run ``script`` on the shared pool.
+    @returns The result, or ``None`` when hosting is disabled or unavailable and
+    the caller should spawn PowerShell itself.
+    @throws PowerShellHostTimeout When the script exceeded ``timeout``.
+    @throws PowerShellHostError When the host died while running the script.
+    """
+
+    pool = get_pool()
+    if pool is None or not pool.available:
+        return None
+    try:
+        return pool.run(script, timeout=timeout)
+    except PowerShellHostUnavailable:
+        return None
+
+
+def shutdown() -> None:
+    """!
+    @brief Close the shared pool's hosts (also registered with :mod:`atexit`).
+    """
+
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown)
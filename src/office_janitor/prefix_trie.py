@@ -0,0 +1,101 @@
+"""!
+@brief Component trie for longest-prefix matching of registry keys and paths.
+@details Whitelist and blacklist checks used to scan every prefix for every
+key. :class:`PrefixTrie` stores the prefixes once, split on the separator, so a
+lookup walks the key's components a single time regardless of how many
+prefixes are registered.
+
+Matching keeps the ``str.startswith`` semantics the guards have always had:
+a prefix's last component may match the start of a longer key component, so
+``C:\\PROGRAM FILES\\MICROSOFT OFFICE`` still covers
+``C:\\PROGRAM FILES\\MICROSOFT OFFICE 15``. Callers normalise case and
+separators before adding prefixes and before looking keys up.
+"""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Node(Generic[T]):
+    __slots__ = ("children", "has_value", "partials", "value")
+
+    value: T
+    """Only set once ``has_value`` is ``True``."""
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node[T]] = {}
+        self.partials: list[tuple[str, _Node[T]]] = []
+        """Children that carry a value, tried as prefixes of the next component."""
+        self.has_value = False
+
+
+class PrefixTrie(Generic[T]):
+    """!
+    @brief Map separator-delimited prefixes to values with longest-match lookup.
+    """
+
+    def __init__(self, separator: str = "\\") -> None:
+        self.separator = separator
+        self._root: _Node[T] = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, prefix: str, value: T) -> None:
+        """!
+        @brief Register ``prefix``; re-adding a prefix replaces its value.
+        @details Empty prefixes are ignored.
+        """
+
+        if not prefix:
+            return
+        parent = self._root
+        node = parent
+        components = prefix.split(self.separator)
+        for component in components:
+            parent = node
+            node = parent.children.setdefault(component, _Node())
+        node.value = value
+        if not node.has_value:
+            node.has_value = True
+            self._size += 1
+            parent.partials.append((components[-1], node))
+
+    def longest_match(self, key: str) -> tuple[int, T] | None:
+        """!
+        @brief Return ``(length, value)`` for the longest prefix of ``key``.
+        @details ``length`` is the number of characters of ``key`` covered by
+        the matching prefix. Returns ``None`` when no prefix matches.
+        """
+
+        best: tuple[int, T] | None = None
+        node = self._root
+        offset = 0
+        for component in key.split(self.separator):
+            for name, child in node.partials:
+                if len(name) < len(component) and component.startswith(name):
+                    if best is None or offset + len(name) > best[0]:
+                        best = (offset + len(name), child.value)
+            child = node.children.get(component)
+            if child is None:
+                break
+            node = child
+            offset += len(component)
+            if node.has_value:
+                best = (offset, node.value)
+            offset += len(self.separator)
+        return best
+
+    def matches(self, key: str) -> bool:
+        """!
+        @brief Return ``True`` when any registered prefix matches ``key``.
+        """
+
+        return self.longest_match(key) is not None
+
+
+__all__ = ["PrefixTrie"]
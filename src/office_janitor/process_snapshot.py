@@ -0,0 +1,318 @@
+"""!
+@brief Single-pass process snapshot and PID-based termination.
+@details Captures the running process table once through
+``CreateToolhelp32Snapshot`` and exposes image name, PID, parent PID and
+session for every entry. Name and wildcard matching happen in memory against
+that table, and process trees are walked through the recorded parent links so
+the kill path can terminate exactly the live PIDs it saw instead of spawning
+``tasklist``/``taskkill`` per name. A parent link only counts when the child
+was created after its parent, so a recycled parent PID cannot pull unrelated
+processes into a kill tree. Non-Windows hosts get no snapshot and
+callers fall back to the command-line tools.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import dataclasses
+import fnmatch
+import os
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+TH32CS_SNAPPROCESS = 0x00000002
+PROCESS_TERMINATE = 0x0001
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+ERROR_ACCESS_DENIED = 5
+ERROR_INVALID_PARAMETER = 87
+
+_MAX_PATH = 260
+_TERMINATE_EXIT_CODE = 1
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    """!
+    @brief Mirror of the Win32 ``PROCESSENTRY32W`` structure.
+    """
+
+    _fields_ = [
+        ("dwSize", ctypes.c_uint32),
+        ("cntUsage", ctypes.c_uint32),
+        ("th32ProcessID", ctypes.c_uint32),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", ctypes.c_uint32),
+        ("cntThreads", ctypes.c_uint32),
+        ("th32ParentProcessID", ctypes.c_uint32),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", ctypes.c_uint32),
+        ("szExeFile", ctypes.c_wchar * _MAX_PATH),
+    ]
+
+
+@dataclasses.dataclass(frozen=True)
+class ProcessEntry:
+    """!
+    @brief One row of a process snapshot.
+    @details ``session_id`` and ``create_time`` (a ``FILETIME`` tick count) are
+    ``None`` when they could not be queried.
+    """
+
+    pid: int
+    parent_pid: int
+    name: str
+    session_id: int | None = None
+    create_time: int | None = None
+
+
+class ProcessSnapshot:
+    """!
+    @brief Immutable view of the process table taken at one instant.
+    """
+
+    def __init__(self, entries: Iterable[ProcessEntry]) -> None:
+        self.entries: tuple[ProcessEntry, ...] = tuple(entries)
+        self._by_pid = {entry.pid: entry for entry in self.entries}
+        self._children: dict[int, list[int]] = {}
+        for entry in self.entries:
+            parent = self._by_pid.get(entry.parent_pid)
+            if parent is not None and entry.pid != parent.pid and _created_after(entry, parent):
+                self._children.setdefault(parent.pid, []).append(entry.pid)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, pid: int) -> ProcessEntry | None:
+        """!
+        @brief Return the entry for ``pid`` or ``None`` when it was not running.
+        """
+        return self._by_pid.get(int(pid))
+
+    def match(self, patterns: Iterable[str]) -> list[ProcessEntry]:
+        """!
+        @brief Return entries whose lowercase image name matches any pattern.
+        @details Patterns are case-insensitive ``fnmatch`` expressions; entries
+        keep snapshot order.
+        """
+        expanded = [str(item).strip().lower() for item in patterns if str(item).strip()]
+        if not expanded:
+            return []
+        return [
+            entry
+            for entry in self.entries
+            if any(fnmatch.fnmatch(entry.name.lower(), pattern) for pattern in expanded)
+        ]
+
+    def names(self, patterns: Iterable[str]) -> list[str]:
+        """!
+        @brief Return unique lowercase image names matching ``patterns``.
+        @details Results are grouped by pattern order, mirroring the historical
+        ``tasklist`` based enumeration.
+        """
+        expanded = [str(item).strip().lower() for item in patterns if str(item).strip()]
+        running: list[str] = []
+        for entry in self.entries:
+            name = entry.name.lower()
+            if name not in running:
+                running.append(name)
+        matched: list[str] = []
+        for pattern in expanded:
+            for name in running:
+                if fnmatch.fnmatch(name, pattern) and name not in matched:
+                    matched.append(name)
+        return matched
+
+    def tree(self, roots: Iterable[int]) -> list[int]:
+        """!
+        @brief Return ``roots`` and their descendants, children before parents.
+        @details Only PIDs present in the snapshot are returned. An entry is a
+        child only when it was created after its recorded parent; entries whose
+        creation time is unknown are never adopted. The walk also keeps a visited
+        set so a bad parent link cannot produce a cycle.
+        """
+        ordered: list[int] = []
+        visited: set[int] = set()
+        for root in roots:
+            root = int(root)
+            if root in visited or root not in self._by_pid:
+                continue
+            stack: list[tuple[int, bool]] = [(root, False)]
+            while stack:
+                pid, expanded = stack.pop()
+                if expanded:
+                    ordered.append(pid)
+                    continue
+                if pid in visited:
+                    continue
+                visited.add(pid)
+                stack.append((pid, True))
+                for child in self._children.get(pid, ()):
+                    if child not in visited:
+                        stack.append((child, False))
+        return ordered
+
+
+def _created_after(child: ProcessEntry, parent: ProcessEntry) -> bool:
+    """!
+    @brief Return ``True`` when ``child`` provably started after ``parent``.
+    """
+    if child.create_time is None or parent.create_time is None:
+        return False
+    return child.create_time >= parent.create_time
+
+
+class _Kernel32Processes:
+    """!
+    @brief Thin wrapper over the ``kernel32`` calls used by this module.
+    """
+
+    def __init__(self, kernel32: Any, get_last_error: Callable[[], int] | None = None) -> None:
+        self._api = kernel32
+        self._get_last_error = get_last_error or getattr(ctypes, "get_last_error", lambda: 0)
+
+    def snapshot(self) -> ProcessSnapshot:
+        handle = self._api.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if not handle or handle == INVALID_HANDLE_VALUE:
+            raise OSError(self._get_last_error(), "CreateToolhelp32Snapshot failed")
+        entries: list[ProcessEntry] = []
+        try:
+            record = PROCESSENTRY32W()
+            record.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            more = self._api.Process32FirstW(handle, ctypes.byref(record))
+            while more:
+                pid = int(record.th32ProcessID)
+                entries.append(
+                    ProcessEntry(
+                        pid=pid,
+                        parent_pid=int(record.th32ParentProcessID),
+                        name=str(record.szExeFile),
+                        session_id=self._session_id(pid),
+                        create_time=self._create_time(pid),
+                    )
+                )
+                more = self._api.Process32NextW(handle, ctypes.byref(record))
+        finally:
+            self._api.CloseHandle(handle)
+        return ProcessSnapshot(entries)
+
+    def _session_id(self, pid: int) -> int | None:
+        session = ctypes.c_uint32()
+        if not self._api.ProcessIdToSessionId(pid, ctypes.byref(session)):
+            return None
+        return int(session.value)
+
+    def _create_time(self, pid: int) -> int | None:
+        handle = self._api.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            created = ctypes.c_uint64()
+            unused = (ctypes.c_uint64(), ctypes.c_uint64(), ctypes.c_uint64())
+            if not self._api.GetProcessTimes(
+                handle, ctypes.byref(created), *(ctypes.byref(item) for item in unused)
+            ):
+                return None
+            return int(created.value)
+        finally:
+            self._api.CloseHandle(handle)
+
+    def terminate(self, pid: int) -> bool:
+        handle = self._api.OpenProcess(PROCESS_TERMINATE, False, pid)
+        if not handle:
+            # The process exited between the snapshot and the kill.
+            return self._get_last_error() == ERROR_INVALID_PARAMETER
+        try:
+            return bool(self._api.TerminateProcess(handle, _TERMINATE_EXIT_CODE))
+        finally:
+            self._api.CloseHandle(handle)
+
+
+def _load_kernel32() -> _Kernel32Processes | None:
+    """!
+    @brief Load ``kernel32`` with the prototypes the snapshot relies on.
+    """
+
+    if os.name != "nt":
+        return None
+    try:
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    except (AttributeError, OSError):
+        return None
+    handle = ctypes.c_void_p
+    dword = ctypes.c_uint32
+    try:  # pragma: no cover - exercised on Windows only
+        kernel32.CreateToolhelp32Snapshot.argtypes = (dword, dword)
+        kernel32.CreateToolhelp32Snapshot.restype = handle
+        kernel32.Process32FirstW.argtypes = (handle, ctypes.POINTER(PROCESSENTRY32W))
+        kernel32.Process32FirstW.restype = ctypes.c_int
+        kernel32.Process32NextW.argtypes = (handle, ctypes.POINTER(PROCESSENTRY32W))
+        kernel32.Process32NextW.restype = ctypes.c_int
+        kernel32.ProcessIdToSessionId.argtypes = (dword, ctypes.POINTER(dword))
+        kernel32.ProcessIdToSessionId.restype = ctypes.c_int
+        kernel32.OpenProcess.argtypes = (dword, ctypes.c_int, dword)
+        kernel32.OpenProcess.restype = handle
+        kernel32.GetProcessTimes.argtypes = (handle,) + (ctypes.POINTER(ctypes.c_uint64),) * 4
+        kernel32.GetProcessTimes.restype = ctypes.c_int
+        kernel32.TerminateProcess.argtypes = (handle, ctypes.c_uint)
+        kernel32.TerminateProcess.restype = ctypes.c_int
+        kernel32.CloseHandle.argtypes = (handle,)
+        kernel32.CloseHandle.restype = ctypes.c_int
+    except AttributeError:
+        return None
+    return _Kernel32Processes(kernel32)
+
+
+def take_snapshot() -> ProcessSnapshot | None:
+    """!
+    @brief Capture the process table, or ``None`` when no native API is available.
+    """
+
+    api = _load_kernel32()
+    if api is None:
+        return None
+    try:
+        return api.snapshot()
+    except OSError:
+        return None
+
+
+def terminate_pids(pids: Sequence[int]) -> dict[int, bool] | None:
+    """!
+    @brief Terminate each PID in order.
+    @details PIDs that have already exited count as terminated.
+    @returns Mapping of PID to success, or ``None`` when no native API is available.
+    """
+
+    api = _load_kernel32()
+    if api is None:
+        return None
+    return {int(pid): api.terminate(int(pid)) for pid in pids}
+
+
+def terminate_trees(
+    snapshot: ProcessSnapshot,
+    roots: Iterable[int],
+    *,
+    terminate: Callable[[Sequence[int]], dict[int, bool] | None] | None = None,
+) -> dict[int, bool] | None:
+    """!
+    @brief Terminate ``roots`` and every descendant recorded in ``snapshot``.
+    @details Children are killed before their parents so a dying parent cannot
+    respawn them. Roots missing from the snapshot are ignored.
+    @returns Mapping of PID to success, or ``None`` when no native API is available.
+    """
+
+    pids = snapshot.tree(roots)
+    if not pids:
+        return {}
+    killer = terminate if terminate is not None else terminate_pids
+    return killer(pids)
+
+
+__all__ = [
+    "ProcessEntry",
+    "ProcessSnapshot",
+    "take_snapshot",
+    "terminate_pids",
+    "terminate_trees",
+]
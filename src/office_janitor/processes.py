@@ -3,7 +3,10 @@
 @details Provides helpers to discover and terminate running Office
 processes. The module mirrors the behaviour from the legacy OffScrub
 scripts with structured logging, user prompting, and timeout-aware
-subprocess execution so automated runs stay safe.
+subprocess execution so automated runs stay safe. When a native
+:mod:`process_snapshot` is available, names are matched in memory and only
+the live PIDs (and their descendants) are terminated; ``tasklist`` and
+``taskkill`` remain the fallback.
 """
 
 from __future__ import annotations
@@ -12,15 +15,16 @@ import fnmatch
 from collections.abc import Iterable, Sequence
 from typing import Callable
 
-from . import exec_utils, logging_ext
+from . import exec_utils, logging_ext, process_snapshot
 
 
 def enumerate_processes(patterns: Iterable[str], *, timeout: int = 30) -> list[str]:
     """!
     @brief Enumerate running processes matching ``patterns``.
-    @details Invokes ``tasklist`` once and filters results against wildcard
-    expressions, returning unique process names. Errors are logged and result
-    in an empty list so callers can decide on the fallback behaviour.
+    @details Matches wildcard expressions against one process snapshot, or
+    invokes ``tasklist`` once when no snapshot is available, returning unique
+    process names. Errors are logged and result in an empty list so callers can
+    decide on the fallback behaviour.
     @param patterns Wildcard expressions or explicit process names.
     @param timeout Maximum seconds to wait for ``tasklist`` to finish.
     @returns A list of matching process names in lowercase.
@@ -35,6 +39,20 @@ def enumerate_processes(patterns: Iterable[str], *, timeout: int = 30) -> list[s
     if not expanded_patterns:
         return []
 
+    snapshot = process_snapshot.take_snapshot()
+    if snapshot is not None:
+        snapshot_matches = snapshot.names(expanded_patterns)
+        machine_logger.info(
+            "process_enumeration_result",
+            extra={
+                "event": "process_enumeration_result",
+                "patterns": expanded_patterns,
+                "matches": snapshot_matches,
+                "source": "snapshot",
+            },
+        )
+        return snapshot_matches
+
     listing = exec_utils.run_command(
         ["tasklist.exe"],
         event="process_enumerate",
@@ -156,33 +174,87 @@ def prompt_user_to_close(
     return False
 
 
-def terminate_office_processes(names: Iterable[str], *, timeout: int = 30) -> None:
+def _terminate_from_snapshot(
+    snapshot: process_snapshot.ProcessSnapshot, patterns: Sequence[str]
+) -> tuple[list[str], list[int]] | None:
     """!
-    @brief Forcefully terminate the specified processes.
-    @details Issues ``taskkill /F /T`` for each process name. Structured logs
-    capture command plans, success, or failure without raising on
-    non-critical errors so subsequent cleanup steps can continue.
-    @param names Collection of process image names.
-    @param timeout Maximum seconds to wait for each ``taskkill`` invocation.
+    @brief Terminate the process trees of snapshot entries matching ``patterns``.
+    @details Only PIDs captured in ``snapshot`` are killed, children first.
+    @returns ``(names, pids)``: lowercase image names of matched targets that
+    could not be terminated, and PIDs of failed descendants that did not match
+    themselves. Descendants must be retried by PID, since falling back by
+    image name would kill unrelated processes such as ``conhost.exe``.
+    ``None`` when the native termination API is unavailable.
     """
 
     human_logger = logging_ext.get_human_logger()
     machine_logger = logging_ext.get_machine_logger()
 
-    processes: list[str] = [str(name).strip() for name in names if str(name).strip()]
-    if not processes:
-        human_logger.debug("No Office processes supplied for termination.")
-        return
+    targets = snapshot.match(patterns)
+    if not targets:
+        human_logger.debug("No running processes matched %s", ", ".join(patterns))
+        return [], []
+
+    results = process_snapshot.terminate_trees(snapshot, [entry.pid for entry in targets])
+    if results is None:
+        return None
+
+    target_pids = {entry.pid for entry in targets}
+    failed_names: list[str] = []
+    failed_pids: list[int] = []
+    for pid, ok in results.items():
+        if ok:
+            continue
+        entry = snapshot.get(pid)
+        if pid in target_pids and entry is not None:
+            name = entry.name.lower()
+            if name not in failed_names:
+                failed_names.append(name)
+        else:
+            failed_pids.append(pid)
+    for entry in targets:
+        if results.get(entry.pid):
+            human_logger.info("Terminated %s (PID %d)", entry.name, entry.pid)
+
+    machine_logger.info(
+        "process_terminate_batch",
+        extra={
+            "event": "process_terminate_batch",
+            "patterns": list(patterns),
+            "targets": [{"name": entry.name, "pid": entry.pid} for entry in targets],
+            "terminated": sorted(pid for pid, ok in results.items() if ok),
+            "failed": sorted(pid for pid, ok in results.items() if not ok),
+        },
+    )
+    return failed_names, failed_pids
+
 
-    for process in processes:
-        result = exec_utils.run_command(
-            ["taskkill.exe", "/IM", process, "/F", "/T"],
+def _taskkill_processes(
+    processes: Sequence[str], *, timeout: int, pids: Sequence[int] = ()
+) -> None:
+    """!
+    @brief Issue ``taskkill /F /T`` for each image name in ``processes``.
+    @details ``pids`` are targeted with ``/PID`` instead of ``/IM`` so only
+    those processes are affected. The calls are independent and run
+    concurrently.
+    """
+
+    human_logger = logging_ext.get_human_logger()
+    machine_logger = logging_ext.get_machine_logger()
+
+    selectors = [("/IM", process, process) for process in processes]
+    selectors.extend(("/PID", str(pid), f"PID {pid}") for pid in pids)
+    results = exec_utils.run_commands(
+        exec_utils.CommandSpec(
+            ["taskkill.exe", switch, value, "/F", "/T"],
             event="terminate_process",
             timeout=timeout,
             human_message=f"Terminating {process}",
             extra={"process_name": process},
         )
-
+        for switch, value, process in selectors
+    )
+    for (_switch, _value, process), result in zip(selectors, results):
         if result.returncode == 127:
             human_logger.debug("taskkill.exe is unavailable; skipping termination for %s", process)
             continue
@@ -211,15 +283,55 @@ def terminate_office_processes(names: Iterable[str], *, timeout: int = 30) -> No
             )
 
 
+def terminate_office_processes(names: Iterable[str], *, timeout: int = 30) -> None:
+    """!
+    @brief Forcefully terminate the specified processes.
+    @details Takes one process snapshot and terminates the matching PIDs and
+    their descendants directly. Requested names that could not be killed
+    natively, or every name when no snapshot is available, go through
+    ``taskkill /IM /F /T``; failed descendants are retried with ``/PID``.
+    Structured logs capture command plans, success, or failure without raising
+    on non-critical errors so subsequent cleanup steps can continue.
+    @param names Collection of process image names.
+    @param timeout Maximum seconds to wait for each ``taskkill`` invocation.
+    """
+
+    human_logger = logging_ext.get_human_logger()
+
+    processes: list[str] = [str(name).strip() for name in names if str(name).strip()]
+    if not processes:
+        human_logger.debug("No Office processes supplied for termination.")
+        return
+
+    snapshot = process_snapshot.take_snapshot()
+    failed_pids: list[int] = []
+    if snapshot is not None:
+        remaining = _terminate_from_snapshot(snapshot, processes)
+        if remaining is not None:
+            processes, failed_pids = remaining
+    _taskkill_processes(processes, timeout=timeout, pids=failed_pids)
+
+
 def terminate_process_patterns(patterns: Sequence[str], *, timeout: int = 30) -> None:
     """!
     @brief Terminate processes that match the provided wildcard patterns.
-    @details Uses :func:`enumerate_processes` to expand patterns and forwards
-    the resulting process list to :func:`terminate_office_processes`.
+    @details Patterns are matched against a single process snapshot and the
+    live PIDs are terminated in place. Without a snapshot, uses
+    :func:`enumerate_processes` to expand patterns and forwards the resulting
+    process list to :func:`terminate_office_processes`.
     @param patterns Wildcard expressions identifying Office executables.
     @param timeout Maximum seconds for enumeration and termination commands.
     """
 
+    snapshot = process_snapshot.take_snapshot()
+    if snapshot is not None:
+        expanded = [str(pattern).strip() for pattern in patterns if str(pattern).strip()]
+        remaining = _terminate_from_snapshot(snapshot, expanded)
+        if remaining is not None:
+            failed_names, failed_pids = remaining
+            _taskkill_processes(failed_names, timeout=timeout, pids=failed_pids)
+            return
+
     matches = enumerate_processes(patterns, timeout=timeout)
     if matches:
         terminate_office_processes(matches, timeout=timeout)
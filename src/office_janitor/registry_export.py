@@ -0,0 +1,348 @@
+"""!
+@brief Native ``.reg`` exporter that streams registry trees to disk.
+@details Walks registry subtrees in-process with ``winreg`` and writes a
+``Windows Registry Editor Version 5.00`` file encoded as UTF-16LE, matching the
+format produced by ``reg export``. Output is accumulated in a bounded buffer
+and the tree walk keeps only one open handle per depth level, so memory stays
+flat even for very wide subtrees such as ``Installer\\Components``. Several
+keys can be written into one consolidated file or exported one file per key.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from . import registry_tools
+
+_LOGGER = logging.getLogger(__name__)
+
+REGEDIT5_HEADER = "Windows Registry Editor Version 5.00"
+"""!
+@brief First line of every file written by the exporter.
+"""
+
+DEFAULT_BUFFER_CHARS = 64 * 1024
+"""!
+@brief Characters buffered before the writer flushes to disk.
+"""
+
+_LINE_WIDTH = 80
+_NEWLINE = "\r\n"
+
+_HIVE_LONG_NAMES: dict[str, str] = {
+    "HKLM": "HKEY_LOCAL_MACHINE",
+    "HKCU": "HKEY_CURRENT_USER",
+    "HKCR": "HKEY_CLASSES_ROOT",
+    "HKU": "HKEY_USERS",
+}
+
+# Win32 registry value type identifiers used when formatting values.
+_REG_SZ = 1
+_REG_EXPAND_SZ = 2
+_REG_BINARY = 3
+_REG_DWORD = 4
+_REG_DWORD_BIG_ENDIAN = 5
+_REG_MULTI_SZ = 7
+_REG_QWORD = 11
+
+
+def native_export_available() -> bool:
+    """!
+    @brief Report whether ``winreg`` exposes the calls needed to export natively.
+    """
+    winreg = registry_tools.winreg
+    return all(hasattr(winreg, name) for name in ("OpenKey", "EnumKey", "EnumValue", "CloseKey"))
+
+
+def _escape_string(text: str) -> str:
+    """!
+    @brief Escape backslashes and quotes the way ``regedit`` does.
+    """
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _format_value_name(name: str) -> str:
+    """!
+    @brief Render a value name, using ``@`` for the default value.
+    """
+    return "@" if not name else f'"{_escape_string(name)}"'
+
+
+def _format_hex(prefix: str, data: bytes) -> str:
+    """!
+    @brief Render ``data`` as comma separated hex wrapped at regedit's line width.
+    """
+    if not data:
+        return prefix
+    parts: list[str] = [prefix]
+    line_length = len(prefix)
+    last = len(data) - 1
+    for index, byte in enumerate(data):
+        token = f"{byte:02x}" + ("," if index < last else "")
+        if line_length + len(token) > _LINE_WIDTH - 3 and index < last:
+            parts.append("\\" + _NEWLINE + "  ")
+            line_length = 2
+        parts.append(token)
+        line_length += len(token)
+    return "".join(parts)
+
+
+def _utf16_bytes(text: str) -> bytes:
+    """!
+    @brief Encode ``text`` as null-terminated UTF-16LE.
+    """
+    return text.encode("utf-16-le") + b"\x00\x00"
+
+
+def format_value(name: str, value: Any, kind: int) -> str:
+    """!
+    @brief Render a single value line (without the trailing newline).
+    @details Strings and DWORDs use their readable forms; every other type is
+    emitted as ``hex(N):`` bytes so the file round-trips through ``regedit``.
+    """
+    label = _format_value_name(name)
+    if kind == _REG_SZ and isinstance(value, str):
+        return f'{label}="{_escape_string(value)}"'
+    if kind == _REG_DWORD and isinstance(value, int):
+        return f"{label}=dword:{value & 0xFFFFFFFF:08x}"
+
+    if kind in (_REG_EXPAND_SZ, _REG_SZ) and isinstance(value, str):
+        data = _utf16_bytes(value)
+    elif kind == _REG_MULTI_SZ and isinstance(value, (list, tuple)):
+        data = b"".join(_utf16_bytes(str(item)) for item in value) + b"\x00\x00"
+    elif kind == _REG_QWORD and isinstance(value, int):
+        data = (value & 0xFFFFFFFFFFFFFFFF).to_bytes(8, "little")
+    elif kind == _REG_DWORD_BIG_ENDIAN and isinstance(value, int):
+        data = (value & 0xFFFFFFFF).to_bytes(4, "big")
+    elif isinstance(value, int):
+        data = (value & 0xFFFFFFFF).to_bytes(4, "little")
+    elif isinstance(value, (bytes, bytearray)):
+        data = bytes(value)
+    elif value is None:
+        data = b""
+    else:
+        data = _utf16_bytes(str(value))
+
+    prefix = f"{label}=hex:" if kind == _REG_BINARY else f"{label}=hex({kind:x}):"
+    return _format_hex(prefix, data)
+
+
+class RegFileWriter:
+    """!
+    @brief Stream REGEDIT5 content to ``path`` through a bounded buffer.
+    @details Use as a context manager; the header is written on entry and the
+    buffer is flushed on exit. ``buffer_chars`` caps the number of characters
+    held in memory between writes.
+    """
+
+    def __init__(self, path: str | Path, *, buffer_chars: int = DEFAULT_BUFFER_CHARS) -> None:
+        self.path = Path(path)
+        self.buffer_chars = max(1, int(buffer_chars))
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._stream: Any = None
+        self.keys_written = 0
+        self.values_written = 0
+
+    def __enter__(self) -> RegFileWriter:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = self.path.open("wb")
+        self._stream.write(b"\xff\xfe")
+        self._write(REGEDIT5_HEADER + _NEWLINE)
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        try:
+            if exc_type is None:
+                self._write(_NEWLINE)
+            self.flush()
+        finally:
+            self._stream.close()
+            self._stream = None
+
+    def _write(self, text: str) -> None:
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_chars:
+            self.flush()
+
+    def flush(self) -> None:
+        """!
+        @brief Encode and write any buffered text.
+        """
+        if not self._buffer or self._stream is None:
+            return
+        self._stream.write("".join(self._buffer).encode("utf-16-le"))
+        self._buffer.clear()
+        self._buffered = 0
+
+    def write_key(self, full_path: str) -> None:
+        """!
+        @brief Start a ``[HIVE\\path]`` section.
+        """
+        self._write(_NEWLINE + f"[{full_path}]" + _NEWLINE)
+        self.keys_written += 1
+
+    def write_value(self, name: str, value: Any, kind: int) -> None:
+        """!
+        @brief Append one value line to the current section.
+        """
+        self._write(format_value(name, value, kind) + _NEWLINE)
+        self.values_written += 1
+
+
+def _long_key_name(canonical_key: str) -> str:
+    """!
+    @brief Expand ``HKLM\\...`` style prefixes to the ``HKEY_*`` form regedit uses.
+    """
+    prefix, sep, rest = canonical_key.partition("\\")
+    long_prefix = _HIVE_LONG_NAMES.get(prefix.upper(), prefix)
+    return f"{long_prefix}{sep}{rest}"
+
+
+class IncompleteExportError(OSError):
+    """!
+    @brief Raised when a key was exported but some of its subkeys could not be read.
+    @details The partial section is already in the output file; callers must
+    not treat the key as backed up and should retry it with ``reg.exe``.
+    """
+
+    def __init__(self, key: str, unreadable: list[str]) -> None:
+        super().__init__(
+            f"{len(unreadable)} unreadable subkey(s) under {key}, first: {unreadable[0]}"
+        )
+        self.key = key
+        self.unreadable = unreadable
+
+
+def _iter_enum(func: Any, handle: Any) -> Iterator[Any]:
+    """!
+    @brief Yield ``func(handle, index)`` results until the enumeration ends.
+    """
+    index = 0
+    while True:
+        try:
+            item = func(handle, index)
+        except OSError:
+            return
+        index += 1
+        yield item
+
+
+def _write_tree(
+    writer: RegFileWriter, root: int, handle: Any, subpath: str, long_name: str, mask: int
+) -> list[str]:
+    """!
+    @brief Depth-first export from an open ``handle`` keeping one handle per level.
+    @details Takes ownership of ``handle`` and closes it before returning.
+    @returns Paths of subkeys that could not be opened and are missing from the file.
+    """
+    winreg = registry_tools.winreg
+    stack: list[tuple[Any, str, str, Iterator[str]]] = []
+    unreadable: list[str] = []
+
+    def _enter(key_handle: Any, key_path: str, key_name: str) -> None:
+        stack.append((key_handle, key_path, key_name, _iter_enum(winreg.EnumKey, key_handle)))
+        writer.write_key(key_name)
+        for value_name, value, kind in _iter_enum(winreg.EnumValue, key_handle):
+            writer.write_value(value_name, value, kind)
+
+    try:
+        _enter(handle, subpath, long_name)
+        while stack:
+            key_handle, key_path, key_name, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                winreg.CloseKey(key_handle)
+                continue
+            child_path = f"{key_path}\\{child}"
+            try:
+                child_handle = winreg.OpenKey(root, child_path, 0, mask)
+            except OSError as exc:
+                _LOGGER.debug("Skipping unreadable registry key %s: %s", child_path, exc)
+                unreadable.append(f"{key_name}\\{child}")
+                continue
+            _enter(child_handle, child_path, f"{key_name}\\{child}")
+    finally:
+        for key_handle, *_rest in stack:
+            winreg.CloseKey(key_handle)
+    return unreadable
+
+
+def export_tree(
+    writer: RegFileWriter,
+    key: str,
+    *,
+    view: str | None = "native",
+) -> bool:
+    """!
+    @brief Append ``key`` and its subtree to ``writer``.
+    @returns ``True`` when the key was found in one of the requested views.
+    @raises OSError When the key exists but cannot be opened.
+    @raises IncompleteExportError When some subkeys could not be read.
+    """
+    winreg = registry_tools.winreg
+    root, subpath = registry_tools._parse_registry_path(key)
+    long_name = _long_key_name(registry_tools._normalize_registry_key(key))
+    last_error: OSError | None = None
+    for mask in registry_tools._iter_access_masks(registry_tools._WINREG_KEY_READ, view):
+        try:
+            handle = winreg.OpenKey(root, subpath, 0, mask)
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            last_error = exc
+            continue
+        unreadable = _write_tree(writer, root, handle, subpath, long_name, mask)
+        if unreadable:
+            raise IncompleteExportError(key, unreadable)
+        return True
+    if last_error is not None:
+        raise last_error
+    return False
+
+
+def write_reg_file(
+    path: str | Path,
+    keys: Iterable[str],
+    *,
+    view: str | None = "native",
+    buffer_chars: int = DEFAULT_BUFFER_CHARS,
+) -> tuple[list[str], dict[str, str]]:
+    """!
+    @brief Export ``keys`` into a single REGEDIT5 file at ``path``.
+    @details Keys with unreadable subkeys are reported as skipped even though
+    their readable part is in the file, so callers never mistake a partial
+    backup for a complete one.
+    @returns Tuple of (keys written, mapping of skipped key to reason).
+    """
+    written: list[str] = []
+    skipped: dict[str, str] = {}
+    with RegFileWriter(path, buffer_chars=buffer_chars) as writer:
+        for key in keys:
+            try:
+                found = export_tree(writer, key, view=view)
+            except (OSError, ValueError) as exc:
+                skipped[key] = str(exc) or exc.__class__.__name__
+                continue
+            if found:
+                written.append(key)
+            else:
+                skipped[key] = "key not found"
+    return written, skipped
+
+
+__all__ = [
+    "DEFAULT_BUFFER_CHARS",
+    "IncompleteExportError",
+    "REGEDIT5_HEADER",
+    "RegFileWriter",
+    "export_tree",
+    "format_value",
+    "native_export_available",
+    "write_reg_file",
+]
@@ -7,11 +7,14 @@ and published components cleanup.
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import logging
-from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
-from . import registry_tools
+from . import guid_utils, registry_tools
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -368,21 +371,186 @@ def filter_multi_string_value(
     return results
 
 
+DEFAULT_COMPONENT_WORKERS = 4
+"""!
+@brief Worker threads applying Published Components rewrites in parallel.
+"""
+
+_COMPONENTS_PATH = "Installer\\Components"
+
+
+@functools.cache
+def _is_office_squished(squished: str) -> bool:
+    """!
+    @brief Memoized Office check for a 20-character packed product GUID.
+    @details Component values reference the same few hundred products tens of
+    thousands of times, so each distinct packed GUID is decoded only once.
+    """
+
+    try:
+        decoded = guid_utils.decode_squished_guid(squished)
+    except guid_utils.GuidError:
+        return False
+    return is_office_guid(decoded)
+
+
+def _keep_component_entry(entry: str) -> bool:
+    """!
+    @brief Return ``True`` when a Published Components entry is not Office owned.
+    @details The first 20 characters of an entry hold the packed product GUID;
+    shorter entries cannot reference a product and are always kept.
+    """
+
+    if len(entry) < 20:
+        return True
+    return not _is_office_squished(entry[:20])
+
+
+@dataclass
+class ComponentRewrite:
+    """!
+    @brief One REG_MULTI_SZ value under ``Installer\\Components`` with Office entries.
+    @details ``kept`` is written back; an empty ``kept`` list deletes the value.
+    """
+
+    component: str
+    value_name: str
+    kept: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+def scan_published_components(
+    *,
+    view: str | None = None,
+) -> tuple[int, list[ComponentRewrite]]:
+    """!
+    @brief Read every Published Components key once and collect Office entries.
+    @details The ``Components`` root is opened once and each component key is
+    opened relative to it and enumerated a single time; values without Office
+    entries are discarded immediately. ``Installer`` keys are shared between
+    WOW64 views, so only the first view that opens is scanned.
+    @returns The number of component keys scanned and the rewrites to apply.
+    @throws FileNotFoundError When the ``Components`` key does not exist.
+    """
+
+    winreg = registry_tools.winreg
+    hkcr = registry_tools._WINREG_HKCR
+    read_mask = getattr(winreg, "KEY_READ", registry_tools._WINREG_KEY_READ)
+    multi_sz = getattr(winreg, "REG_MULTI_SZ", 7)
+
+    last_error: OSError | None = None
+    for mask in registry_tools._iter_access_masks(read_mask, view):
+        try:
+            root = winreg.OpenKey(hkcr, _COMPONENTS_PATH, 0, mask)
+        except OSError as exc:
+            last_error = exc
+            continue
+        break
+    else:
+        raise last_error or FileNotFoundError(_COMPONENTS_PATH)
+
+    scanned = 0
+    rewrites: list[ComponentRewrite] = []
+    try:
+        index = 0
+        while True:
+            try:
+                component = winreg.EnumKey(root, index)
+            except OSError:
+                break
+            index += 1
+            scanned += 1
+            try:
+                handle = winreg.OpenKey(root, component, 0, mask)
+            except OSError:
+                continue
+            try:
+                value_index = 0
+                while True:
+                    try:
+                        name, data, kind = winreg.EnumValue(handle, value_index)
+                    except OSError:
+                        break
+                    value_index += 1
+                    if kind != multi_sz or not isinstance(data, (list, tuple)):
+                        continue
+                    rewrite = ComponentRewrite(component=component, value_name=name)
+                    for entry in data:
+                        text = str(entry) if entry is not None else ""
+                        bucket = rewrite.kept if _keep_component_entry(text) else rewrite.removed
+                        bucket.append(text)
+                    if rewrite.removed:
+                        rewrites.append(rewrite)
+            finally:
+                winreg.CloseKey(handle)
+    finally:
+        winreg.CloseKey(root)
+    return scanned, rewrites
+
+
+def _apply_component_shard(
+    shard: Sequence[tuple[str, Sequence[ComponentRewrite]]],
+    *,
+    view: str | None,
+) -> tuple[int, list[str]]:
+    """!
+    @brief Write one shard of component rewrites, opening each key once.
+    @returns Number of values rewritten or deleted and any error messages.
+    """
+
+    winreg = registry_tools.winreg
+    hkcr = registry_tools._WINREG_HKCR
+    write_mask = getattr(winreg, "KEY_WRITE", 0x20006)
+    multi_sz = getattr(winreg, "REG_MULTI_SZ", 7)
+    applied = 0
+    errors: list[str] = []
+    for component, rewrites in shard:
+        path = f"{_COMPONENTS_PATH}\\{component}"
+        handle = None
+        for mask in registry_tools._iter_access_masks(write_mask, view):
+            try:
+                handle = winreg.OpenKey(hkcr, path, 0, mask)
+            except OSError:
+                continue
+            break
+        if handle is None:
+            errors.append(f"Failed to open {path} for writing")
+            continue
+        try:
+            for rewrite in rewrites:
+                try:
+                    if rewrite.kept:
+                        winreg.SetValueEx(handle, rewrite.value_name, 0, multi_sz, rewrite.kept)
+                    else:
+                        winreg.DeleteValue(handle, rewrite.value_name)
+                except OSError as exc:
+                    errors.append(f"Failed to rewrite {path}\\{rewrite.value_name}: {exc}")
+                else:
+                    applied += 1
+        finally:
+            winreg.CloseKey(handle)
+    return applied, errors
+
+
 def cleanup_published_components(
     *,
     dry_run: bool = False,
     view: str | None = None,
     logger: logging.Logger | None = None,
+    max_workers: int = DEFAULT_COMPONENT_WORKERS,
 ) -> dict[str, Any]:
     """!
     @brief Clean up Office entries from Windows Installer Published Components.
     @details Published Components are stored as REG_MULTI_SZ values under
         HKCR\\Installer\\Components. Each entry in the multi-string references
         a product GUID. This function filters out Office-related entries while
-        preserving entries for non-Office products.
+        preserving entries for non-Office products. The keys are read once by
+        :func:`scan_published_components`; the resulting writes are grouped by
+        component key and applied in shards across ``max_workers`` threads.
     @param dry_run If True, only log without modifying.
     @param view Registry view (native, 32bit, 64bit).
     @param logger Optional logger.
+    @param max_workers Upper bound on threads applying the rewrites.
     @returns Dictionary with summary of cleanup results.
     """
     logger = logger or _LOGGER
@@ -394,22 +562,9 @@ def cleanup_published_components(
         "errors": [],
     }
 
-    components_path = "Installer\\Components"
-    hkcr = registry_tools._WINREG_HKCR
-
-    def should_keep_entry(entry: str) -> bool:
-        """Check if an entry references a non-Office product."""
-        if len(entry) < 20:
-            return True  # Too short to contain a valid squished GUID
-        # First 20 chars are the squished GUID - decode and check
-        squished = entry[:20]
-        decoded = decode_squished_guid(squished)
-        if decoded and is_office_guid(decoded):
-            return False  # This is an Office entry, remove it
-        return True  # Keep non-Office entries
-
     try:
-        component_keys = list(registry_tools.iter_subkeys(hkcr, components_path, view=view))
+        registry_tools._ensure_winreg()
+        scanned, rewrites = scan_published_components(view=view)
     except FileNotFoundError:
         logger.debug("Components key not found")
         return results
@@ -417,33 +572,28 @@ def cleanup_published_components(
         results["errors"].append(f"Failed to enumerate components: {exc}")
         return results
 
-    for component_key in component_keys:
-        results["components_processed"] += 1
-        key_path = f"{components_path}\\{component_key}"
-
-        try:
-            # Get all values in this component key
-            values = list(registry_tools.iter_values(hkcr, key_path, view=view))
-        except (FileNotFoundError, OSError):
-            continue
-
-        for value_name, _value_type in values:
-            result = filter_multi_string_value(
-                hkcr,
-                key_path,
-                value_name,
-                should_keep_entry,
-                dry_run=dry_run,
-                view=view,
-                logger=logger,
+    results["components_processed"] = scanned
+    results["values_modified"] = len(rewrites)
+    results["entries_removed"] = sum(len(rewrite.removed) for rewrite in rewrites)
+
+    if rewrites and not dry_run:
+        grouped: dict[str, list[ComponentRewrite]] = {}
+        for rewrite in rewrites:
+            grouped.setdefault(rewrite.component, []).append(rewrite)
+        workers = max(1, min(int(max_workers), len(grouped)))
+        shards: list[list[tuple[str, Sequence[ComponentRewrite]]]] = [[] for _ in range(workers)]
+        for position, item in enumerate(grouped.items()):
+            shards[position % workers].append(item)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="published_components"
+        ) as pool:
+            outcomes = list(
+                pool.map(lambda shard: _apply_component_shard(shard, view=view), shards)
             )
-
-            if result.get("entries_removed"):
-                results["values_modified"] += 1
-                results["entries_removed"] += len(result["entries_removed"])
-
-            if result.get("error"):
-                results["errors"].append(result["error"])
+        applied = sum(count for count, _ in outcomes)
+        for _, errors in outcomes:
+            results["errors"].extend(errors)
+        results["values_modified"] = applied
 
     logger.info(
         "Published Components cleanup: %d components, %d values modified, %d entries removed",
@@ -461,10 +611,13 @@ def cleanup_published_components(
 
 
 __all__ = [
+    "ComponentRewrite",
+    "DEFAULT_COMPONENT_WORKERS",
     "cleanup_published_components",
     "decode_squished_guid",
     "filter_multi_string_value",
     "is_office_guid",
     "iter_office_uninstall_entries",
     "looks_like_office_entry",
+    "scan_published_components",
 ]
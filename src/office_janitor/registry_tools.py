@@ -16,12 +16,14 @@ from __future__ import annotations
 import logging
 import re
 import shutil
+import time
 from collections.abc import Iterable, Iterator, Mapping
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from . import exec_utils, safety, spinner
+from . import exec_utils, logging_ext, safety, spinner, tracing
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     import winreg as _winreg
@@ -52,6 +54,10 @@ _WINREG_HKLM: int = getattr(winreg, "HKEY_LOCAL_MACHINE", 0)
 _WINREG_HKCU: int = getattr(winreg, "HKEY_CURRENT_USER", 0)
 _WINREG_HKU: int = getattr(winreg, "HKEY_USERS", 0)
 _WINREG_HKCR: int = getattr(winreg, "HKEY_CLASSES_ROOT", 0)
+_WINREG_KEY_ALL_ACCESS: int = getattr(winreg, "KEY_ALL_ACCESS", 0xF003F)
+_WINREG_WOW64_MASK: int = getattr(winreg, "KEY_WOW64_32KEY", 0) | getattr(
+    winreg, "KEY_WOW64_64KEY", 0
+)
 
 _CANONICAL_PREFIXES: Mapping[str, str] = {
     "HKEY_LOCAL_MACHINE": "HKLM",
@@ -73,6 +79,24 @@ class RegistryError(RuntimeError):
     """
 
 
+@dataclass
+class RegistryDeletionResult:
+    """!
+    @brief Aggregated outcome of a :func:`delete_keys` batch.
+    @details ``deleted`` lists keys removed in-process, ``missing`` keys that
+    were absent in every requested view, ``fallback`` keys handed to
+    ``reg.exe`` and ``failed`` keys that could not be removed by either path.
+    """
+
+    deleted: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    fallback: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    dry_run: bool = False
+    native: bool = False
+    duration: float = 0.0
+
+
 def _ensure_winreg() -> None:
     """!
     @brief Raise an informative error when ``winreg`` is unavailable.
@@ -108,43 +132,21 @@ def _normalize_for_comparison(key: str) -> str:
     return canonical.upper()
 
 
-_ALLOWED_REGISTRY_PREFIXES = tuple(
-    _normalize_registry_key(entry) for entry in safety.REGISTRY_WHITELIST
-)
-_BLOCKED_REGISTRY_PREFIXES = tuple(
-    _normalize_registry_key(entry) for entry in safety.REGISTRY_BLACKLIST
-)
-_CRITICAL_BLOCKED_PREFIXES = tuple(
-    _normalize_registry_key(entry) for entry in safety.REGISTRY_CRITICAL_BLACKLIST
-)
-
-
 def _is_critically_blocked(key: str) -> bool:
     """!
     @brief Check against the immutable critical blacklist (never bypassable).
     """
-    normalized = _normalize_for_comparison(key)
-    return any(normalized.startswith(blocked) for blocked in _CRITICAL_BLOCKED_PREFIXES)
+    return safety.compiled_policy().registry_critically_blocked(_normalize_for_comparison(key))
 
 
 def _is_registry_path_allowed(key: str) -> bool:
     """!
     @brief Validate the registry path against the whitelist/blacklist rules.
     @details Critical blacklist is checked first and cannot be overridden.
-    Whitelist is then checked so more specific allowed paths take precedence
-    over broader blacklist entries.
+    Otherwise the longest matching whitelist/blacklist entry decides, so more
+    specific allowed paths take precedence over broader blacklist entries.
     """
-    normalized = _normalize_for_comparison(key)
-    # Critical blacklist — always blocks, no override
-    if _is_critically_blocked(key):
-        return False
-    # Check whitelist first (more specific rules take precedence)
-    if any(normalized.startswith(allowed) for allowed in _ALLOWED_REGISTRY_PREFIXES):
-        return True
-    # Then check blacklist
-    if any(normalized.startswith(blocked) for blocked in _BLOCKED_REGISTRY_PREFIXES):
-        return False
-    return False
+    return safety.compiled_policy().registry_allowed(_normalize_for_comparison(key))
 
 
 def _validate_registry_keys(
@@ -161,12 +163,13 @@ def _validate_registry_keys(
     ``--dangerous-actions --no-whitelist``.
     """
     _logger = logging.getLogger(__name__)
+    policy = safety.compiled_policy()
     canonical_keys: list[str] = []
     for key in keys:
         try:
             canonical = _normalize_registry_key(key)
             # Critical blacklist is ALWAYS enforced, even with skip_whitelist
-            if _is_critically_blocked(canonical):
+            if policy.registry_critically_blocked(canonical):
                 _logger.warning(
                     "Refusing critical system registry key " "(immutable blacklist): %s",
                     key,
@@ -175,7 +178,7 @@ def _validate_registry_keys(
             if skip_whitelist:
                 canonical_keys.append(canonical)
                 continue
-            if not _is_registry_path_allowed(canonical):
+            if not policy.registry_allowed(canonical):
                 _logger.warning("Skipping non-whitelisted registry key: %s", key)
                 continue
             canonical_keys.append(canonical)
@@ -319,6 +322,7 @@ def iter_values(root: int, path: str, *, view: str | None = None) -> Iterator[tu
         raise FileNotFoundError(path)
 
 
+@tracing.traced("registry.read_values")
 def read_values(root: int, path: str, *, view: str | None = None) -> dict[str, Any]:
     """!
     @brief Read all values beneath ``root``/``path`` into a dictionary.
@@ -380,6 +384,7 @@ def _parse_registry_path(full_path: str) -> tuple[int, str]:
     return hive, subpath
 
 
+@tracing.traced("registry.key_exists")
 def key_exists(
     root_or_path: int | str,
     path: str | None = None,
@@ -449,6 +454,63 @@ def _unique_export_path(directory: Path, key: str) -> Path:
     return candidate
 
 
+def _export_key_with_reg(
+    reg_executable: str,
+    key: str,
+    export_path: Path,
+    *,
+    logger: logging.Logger,
+) -> bool:
+    """!
+    @brief Export ``key`` through ``reg.exe``; used when native export is unavailable.
+    """
+    try:
+        exec_utils.run_command(
+            [reg_executable, "export", key, str(export_path), "/y"],
+            event="registry_export",
+            dry_run=False,
+            check=True,
+            extra={"key": key, "path": str(export_path)},
+        )
+    except Exception:
+        # Export failure is non-fatal - key may not exist or access denied
+        # Use spinner-aware output to avoid mangled console lines
+        spinner.pause_for_output()
+        logger.warning(
+            "Registry export skipped for %s (key may not exist)",
+            key,
+        )
+        spinner.resume_after_output()
+        return False
+    return True
+
+
+def _export_key_native(
+    key: str,
+    export_path: Path,
+    *,
+    reg_executable: str | None,
+    view: str | None,
+    logger: logging.Logger,
+) -> bool:
+    """!
+    @brief Export ``key`` in-process, retrying with ``reg.exe`` on access errors.
+    """
+    try:
+        written, skipped = registry_export.write_reg_file(export_path, [key], view=view)
+    except OSError as exc:
+        written, skipped = [], {key: str(exc)}
+    if written:
+        return True
+    reason = skipped.get(key, "key not found")
+    export_path.unlink(missing_ok=True)
+    if reason != "key not found" and reg_executable:
+        return _export_key_with_reg(reg_executable, key, export_path, logger=logger)
+    logger.debug("Registry export skipped for %s (%s)", key, reason)
+    return False
+
+
+@tracing.traced("registry.export_keys", capture=("dry_run",))
 def export_keys(
     keys: Iterable[str],
     destination: str | Path,
@@ -456,12 +518,19 @@ def export_keys(
     dry_run: bool = False,
     logger: logging.Logger | None = None,
     skip_whitelist: bool = False,
+    consolidated: bool = False,
+    view: str | None = "native",
 ) -> list[Path]:
     """!
     @brief Export the provided registry keys to ``.reg`` files in ``destination``.
-    @details On non-Windows systems the exports become placeholder files so unit
-    tests and dry-run flows can still verify orchestration logic without access
-    to the native ``reg.exe`` utility.
+    @details Keys are streamed to REGEDIT5 files in-process via
+    :mod:`registry_export` when ``winreg`` is usable, and ``reg.exe`` is only
+    used for keys the native walk cannot read fully. When ``consolidated`` is
+    ``True`` every key is written into a single ``.reg`` file instead of one
+    file per key; keys that could not be read completely are additionally
+    exported to their own file through ``reg.exe``. On non-Windows systems the
+    exports become placeholder files so unit tests and dry-run flows can still
+    verify orchestration logic without access to the native ``reg.exe`` utility.
     When ``skip_whitelist`` is ``True`` the whitelist guard is bypassed.
     """
     logger = logger or _LOGGER
@@ -473,6 +542,45 @@ def export_keys(
         logger.debug("No valid registry keys to export after validation")
         return []
     reg_executable = shutil.which("reg")
+    native = registry_export.native_export_available()
+
+    if consolidated:
+        export_path = _unique_export_path(dest_path, "registry-export")
+        logger.info(
+            "Preparing consolidated registry export",
+            extra={
+                "action": "registry-export",
+                "keys": list(canonical_keys),
+                "path": str(export_path),
+                "dry_run": dry_run,
+            },
+        )
+        if dry_run:
+            return [export_path]
+        if native:
+            written, skipped = registry_export.write_reg_file(
+                export_path, canonical_keys, view=view
+            )
+            consolidated_paths = [export_path] if written else []
+            for key, reason in skipped.items():
+                if reason == "key not found":
+                    logger.debug("Registry export skipped for %s (%s)", key, reason)
+                    continue
+                # Unreadable or partially read keys get a complete per-key backup.
+                fallback_path = _unique_export_path(dest_path, key)
+                if reg_executable and _export_key_with_reg(
+                    reg_executable, key, fallback_path, logger=logger
+                ):
+                    consolidated_paths.append(fallback_path)
+                    continue
+                spinner.pause_for_output()
+                logger.warning("Registry backup incomplete for %s (%s)", key, reason)
+                spinner.resume_after_output()
+            if not written:
+                export_path.unlink(missing_ok=True)
+            return consolidated_paths
+        # Without winreg there is no single-file path; fall through to per-key files.
+
     exported: list[Path] = []
 
     for key in canonical_keys:
@@ -490,25 +598,16 @@ def export_keys(
             exported.append(export_path)
             continue
 
+        if native:
+            if _export_key_native(
+                key, export_path, reg_executable=reg_executable, view=view, logger=logger
+            ):
+                exported.append(export_path)
+            continue
+
         if reg_executable:
-            try:
-                exec_utils.run_command(
-                    [reg_executable, "export", key, str(export_path), "/y"],
-                    event="registry_export",
-                    dry_run=dry_run,
-                    check=True,
-                    extra={"key": key, "path": str(export_path)},
-                )
+            if _export_key_with_reg(reg_executable, key, export_path, logger=logger):
                 exported.append(export_path)
-            except Exception:
-                # Export failure is non-fatal - key may not exist or access denied
-                # Use spinner-aware output to avoid mangled console lines
-                spinner.pause_for_output()
-                logger.warning(
-                    "Registry export skipped for %s (key may not exist)",
-                    key,
-                )
-                spinner.resume_after_output()
             continue
 
         export_path.write_text(
@@ -520,54 +619,257 @@ def export_keys(
     return exported
 
 
+def _native_registry_available() -> bool:
+    """!
+    @brief Report whether ``winreg`` exposes the calls used by the native engines.
+    """
+    return all(hasattr(winreg, name) for name in ("OpenKey", "EnumKey", "DeleteKey", "CloseKey"))
+
+
+class _HiveHandleCache:
+    """!
+    @brief Lazily connect each registry hive once per batch.
+    @details Hosts without ``ConnectRegistry`` fall back to the predefined hive
+    constants, which ``winreg`` already treats as open handles.
+    """
+
+    def __init__(self) -> None:
+        self._handles: dict[int, Any] = {}
+        self._connected: list[Any] = []
+
+    def __getitem__(self, root: int) -> Any:
+        handle = self._handles.get(root)
+        if handle is not None:
+            return handle
+        handle = root
+        connect = getattr(winreg, "ConnectRegistry", None)
+        if connect is not None:
+            try:
+                handle = connect(None, root)
+            except OSError:
+                handle = root
+            else:
+                self._connected.append(handle)
+        self._handles[root] = handle
+        return handle
+
+    def close(self) -> None:
+        for handle in self._connected:
+            try:
+                winreg.CloseKey(handle)
+            except OSError:  # pragma: no cover - best effort cleanup
+                pass
+        self._connected.clear()
+        self._handles.clear()
+
+
+@contextmanager
+def _open_hive_handles() -> Iterator[_HiveHandleCache]:
+    """!
+    @brief Provide a hive handle cache that is closed when the batch ends.
+    """
+    cache = _HiveHandleCache()
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
+def _collect_subtree(hive: Any, path: str, mask: int) -> list[str]:
+    """!
+    @brief Return ``path`` and all of its descendants in pre-order.
+    @details Reversing the returned list yields a deepest-first deletion order
+    because every parent precedes its children. Raises ``FileNotFoundError``
+    when ``path`` does not exist in the view selected by ``mask``.
+    """
+    ordered: list[str] = []
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            handle = winreg.OpenKey(hive, current, 0, mask)
+        except FileNotFoundError:
+            if current == path:
+                raise
+            continue
+        ordered.append(current)
+        try:
+            index = 0
+            while True:
+                try:
+                    name = winreg.EnumKey(handle, index)
+                except OSError:
+                    break
+                index += 1
+                pending.append(f"{current}\\{name}")
+        finally:
+            winreg.CloseKey(handle)
+    return ordered
+
+
+def _delete_single_key(hive: Any, path: str, mask: int) -> None:
+    """!
+    @brief Delete one childless key honouring the WOW64 bits in ``mask``.
+    """
+    delete_ex = getattr(winreg, "DeleteKeyEx", None)
+    view_bits = mask & _WINREG_WOW64_MASK
+    if delete_ex is not None and view_bits:
+        delete_ex(hive, path, view_bits, 0)
+    else:
+        winreg.DeleteKey(hive, path)
+
+
+def _delete_tree_native(hive: Any, path: str, *, view: str | None) -> bool:
+    """!
+    @brief Remove ``path`` and its subtree in-process for every requested view.
+    @returns ``True`` when the key existed in at least one view, ``False`` when
+    it was missing everywhere.
+    @raises OSError When a key exists but cannot be removed natively.
+    """
+    found = False
+    for mask in _iter_access_masks(_WINREG_KEY_READ, view):
+        try:
+            ordered = _collect_subtree(hive, path, mask)
+        except FileNotFoundError:
+            continue
+        found = True
+        for subkey in reversed(ordered):
+            try:
+                _delete_single_key(hive, subkey, mask)
+            except FileNotFoundError:
+                continue
+    return found
+
+
+def _delete_key_with_reg(
+    reg_executable: str,
+    key: str,
+    *,
+    dry_run: bool,
+    logger: logging.Logger,
+) -> bool:
+    """!
+    @brief Remove ``key`` through ``reg.exe``; used when the native path fails.
+    """
+    try:
+        exec_utils.run_command(
+            [reg_executable, "delete", key, "/f"],
+            event="registry_delete",
+            dry_run=dry_run,
+            check=True,
+            extra={"key": key},
+        )
+    except Exception:
+        # Deletion failure is non-fatal - key may not exist or access denied
+        spinner.pause_for_output()
+        logger.warning(
+            "Registry deletion skipped for %s (key may not exist or access denied)",
+            key,
+        )
+        spinner.resume_after_output()
+        return False
+    return True
+
+
+@tracing.traced("registry.delete_keys", capture=("dry_run",))
 def delete_keys(
     keys: Iterable[str],
     *,
     dry_run: bool = False,
     logger: logging.Logger | None = None,
     skip_whitelist: bool = False,
-) -> None:
+    view: str | None = "native",
+) -> RegistryDeletionResult:
     """!
     @brief Remove registry keys while respecting dry-run safeguards.
-    @details Continues processing remaining keys even if individual deletions fail.
+    @details Keys are deleted in-process with ``winreg``: each hive is opened
+    once for the batch and every subtree is walked and removed deepest-first.
+    Only keys that fail natively are handed to ``reg.exe``; hosts without a
+    usable ``winreg`` route every key through ``reg.exe`` as before. A single
+    ``registry_delete_batch`` machine event summarises the batch.
+    Continues processing remaining keys even if individual deletions fail.
     Invalid keys are automatically skipped during validation.
     When ``skip_whitelist`` is ``True`` the whitelist guard is bypassed.
+    @param view WOW64 view passed to :func:`_iter_access_masks`; ``native``
+    mirrors ``reg delete`` while ``both`` also clears the redirected view.
+    @returns :class:`RegistryDeletionResult` describing the batch.
     """
     logger = logger or _LOGGER
+    result = RegistryDeletionResult()
     canonical_keys = _validate_registry_keys(keys, skip_whitelist=skip_whitelist)
     if not canonical_keys:
         logger.debug("No valid registry keys to delete after validation")
-        return
+        return result
     if not safety.should_execute_destructive_action(
         "registry key deletion",
         dry_run=dry_run,
     ):
         dry_run = True
+    result.dry_run = dry_run
+    result.native = _native_registry_available()
     reg_executable = shutil.which("reg")
+    start = time.monotonic()
+
+    pending_fallback: list[str] = []
+    with _open_hive_handles() as hives:
+        for key in canonical_keys:
+            logger.info(
+                "Preparing registry deletion",
+                extra={"action": "registry-delete", "key": key, "dry_run": dry_run},
+            )
+            if not result.native:
+                pending_fallback.append(key)
+                continue
+            if dry_run:
+                logging_ext.get_machine_logger().info(
+                    "registry_delete_dry_run",
+                    extra={
+                        "event": "registry_delete_dry_run",
+                        "key": key,
+                        "view": view,
+                        "native": True,
+                    },
+                )
+                result.deleted.append(key)
+                continue
+            try:
+                root, subpath = _parse_registry_path(key)
+                existed = _delete_tree_native(hives[root], subpath, view=view)
+            except (OSError, ValueError) as exc:
+                logger.debug("Native deletion failed for %s: %s", key, exc)
+                pending_fallback.append(key)
+                continue
+            if existed:
+                result.deleted.append(key)
+            else:
+                result.missing.append(key)
 
-    for key in canonical_keys:
-        logger.info(
-            "Preparing registry deletion",
-            extra={"action": "registry-delete", "key": key, "dry_run": dry_run},
-        )
+    for key in pending_fallback:
         if not reg_executable:
+            if result.native:
+                result.failed.append(key)
             continue
-        try:
-            exec_utils.run_command(
-                [reg_executable, "delete", key, "/f"],
-                event="registry_delete",
-                dry_run=dry_run,
-                check=True,
-                extra={"key": key},
-            )
-        except Exception:
-            # Deletion failure is non-fatal - key may not exist or access denied
-            spinner.pause_for_output()
-            logger.warning(
-                "Registry deletion skipped for %s (key may not exist or access denied)",
-                key,
-            )
-            spinner.resume_after_output()
+        result.fallback.append(key)
+        if not _delete_key_with_reg(reg_executable, key, dry_run=dry_run, logger=logger):
+            result.failed.append(key)
+
+    result.duration = time.monotonic() - start
+    logging_ext.get_machine_logger().info(
+        "registry_delete_batch",
+        extra={
+            "event": "registry_delete_batch",
+            "dry_run": dry_run,
+            "native": result.native,
+            "view": view,
+            "requested": len(canonical_keys),
+            "deleted": list(result.deleted),
+            "missing": list(result.missing),
+            "fallback": list(result.fallback),
+            "failed": list(result.failed),
+            "duration_ms": round(result.duration * 1000, 3),
+        },
+    )
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -576,6 +878,7 @@ def delete_keys(
 # These functions have been moved to registry_office.py but are re-exported
 # here to maintain the existing public API.
 
+from . import registry_export  # noqa: E402
 from .registry_office import (  # noqa: E402
     cleanup_published_components,
     decode_squished_guid,
@@ -624,6 +927,7 @@ from .registry_wi_cleanup import (  # noqa: E402
 
 __all__ = [
     # Core registry operations
+    "RegistryDeletionResult",
     "RegistryError",
     "delete_keys",
     "export_keys",
@@ -14,7 +14,7 @@ import shutil
 from pathlib import Path
 from typing import Any
 
-from . import exec_utils, logging_ext, registry_tools, safety
+from . import exec_utils, logging_ext, registry_export, registry_tools, safety
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -98,7 +98,9 @@ def _export_registry_backups(
 ) -> dict[str, Any]:
     """!
     @brief Export registry keys before mutation.
-    @details Uses ``reg.exe export`` when available and writes placeholder files
+    @details Streams each key to a ``.reg`` file in-process via
+    :mod:`registry_export`, uses ``reg.exe export`` for keys the native walk
+    cannot read or when ``winreg`` is unavailable, and writes placeholder files
     otherwise so every cleanup run produces an auditable backup trail.
     """
 
@@ -145,12 +147,27 @@ def _export_registry_backups(
         run_directory.mkdir(parents=True, exist_ok=True)
 
     reg_executable = shutil.which("reg")
+    native = registry_export.native_export_available()
     for index, key_path in enumerate(unique_paths, 1):
         export_path = run_directory / _sanitize_backup_filename(key_path, index)
         if dry_run:
             artifacts.append(str(export_path))
             continue
 
+        if native:
+            try:
+                written, skipped = registry_export.write_reg_file(export_path, [key_path])
+            except OSError as exc:
+                written, skipped = [], {key_path: str(exc)}
+            if written:
+                artifacts.append(str(export_path))
+                continue
+            export_path.unlink(missing_ok=True)
+            reason = skipped.get(key_path, "key not found")
+            if reason == "key not found" or not reg_executable:
+                errors.append(f"{key_path}: export failed ({reason})")
+                continue
+
         if reg_executable:
             try:
                 result = exec_utils.run_command(
@@ -0,0 +1,274 @@
+"""!
+@brief Concurrent post-uninstall removal verification.
+@details Uninstallers describe each product they expect to disappear as a
+:class:`RemovalTarget`: a presence probe plus the parent registry keys whose
+subkeys vanish on removal. :func:`await_removals` probes every pending target
+together and, between probes, blocks on ``RegNotifyChangeKeyValue`` events for
+the watched parent keys so a deletion wakes it immediately. Hosts without the
+notification API (or targets whose residue lives on disk) fall back to
+adaptive polling that starts short and backs off towards a cap. Several
+products therefore share one verification window instead of each sleeping
+through its own.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import dataclasses
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+
+from . import registry_tools
+
+DEFAULT_INITIAL_INTERVAL = 0.25
+"""!
+@brief First polling interval in seconds; doubled after every idle probe.
+"""
+
+KEY_NOTIFY = 0x0010
+REG_NOTIFY_CHANGE_NAME = 0x00000001
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+MAXIMUM_WAIT_OBJECTS = 64
+
+
+@dataclasses.dataclass
+class RemovalTarget:
+    """!
+    @brief One product whose removal should be confirmed.
+    @details ``probe`` returns ``True`` while residue is still present.
+    ``watch_keys`` lists ``(hive, path)`` parent keys that change when the
+    product's uninstall keys are deleted.
+    """
+
+    name: str
+    probe: Callable[[], bool]
+    watch_keys: Sequence[tuple[int, str]] = ()
+
+
+def adaptive_delays(budget: float, *, initial: float, cap: float) -> Iterator[float]:
+    """!
+    @brief Yield back-off delays that add up to exactly ``budget`` seconds.
+    @details Delays start at ``initial`` and double up to ``cap``; the final
+    delay is trimmed so the series never overshoots the budget.
+    """
+
+    remaining = max(0.0, float(budget))
+    delay = max(0.001, float(initial))
+    cap = max(delay, float(cap))
+    while remaining > 1e-9:
+        step = min(delay, remaining)
+        yield step
+        remaining -= step
+        delay = min(cap, delay * 2)
+
+
+def parent_key(path: str) -> str:
+    """!
+    @brief Return the parent of a backslash separated registry ``path``.
+    """
+
+    return path.rstrip("\\").rpartition("\\")[0]
+
+
+class RegistryChangeNotifier:
+    """!
+    @brief Wait for subkey creation or deletion under a set of registry keys.
+    @details Each key is opened with ``KEY_NOTIFY`` and armed with an
+    auto-reset event; :meth:`wait` blocks on all of them at once and re-arms
+    the notifications after every wake.
+    """
+
+    def __init__(self, advapi32: Any, kernel32: Any, keys: Iterable[tuple[int, str]]) -> None:
+        self._advapi32 = advapi32
+        self._kernel32 = kernel32
+        self._watches: list[tuple[Any, Any]] = []
+        winreg = registry_tools.winreg
+        for hive, path in dict.fromkeys(keys):
+            if len(self._watches) >= MAXIMUM_WAIT_OBJECTS:
+                break
+            try:
+                handle = winreg.OpenKey(hive, path, 0, KEY_NOTIFY)
+            except OSError:
+                continue
+            event = kernel32.CreateEventW(None, False, False, None)
+            if not event:
+                winreg.CloseKey(handle)
+                continue
+            self._watches.append((handle, event))
+            self._arm(handle, event)
+
+    def __bool__(self) -> bool:
+        return bool(self._watches)
+
+    def _arm(self, handle: Any, event: Any) -> None:
+        self._advapi32.RegNotifyChangeKeyValue(
+            int(handle), False, REG_NOTIFY_CHANGE_NAME, event, True
+        )
+
+    def wait(self, timeout: float) -> bool:
+        """!
+        @brief Block until a watched key changes or ``timeout`` seconds pass.
+        @returns ``True`` when a change was signalled.
+        """
+
+        if not self._watches:
+            time.sleep(max(0.0, timeout))
+            return False
+        events = (ctypes.c_void_p * len(self._watches))(*(event for _, event in self._watches))
+        milliseconds = max(0, int(timeout * 1000))
+        status = self._kernel32.WaitForMultipleObjects(
+            len(self._watches), events, False, milliseconds
+        )
+        index = int(status) - WAIT_OBJECT_0
+        if 0 <= index < len(self._watches):
+            self._arm(*self._watches[index])
+            return True
+        return False
+
+    def close(self) -> None:
+        """!
+        @brief Release every key handle and event.
+        """
+
+        winreg = registry_tools.winreg
+        for handle, event in self._watches:
+            try:
+                winreg.CloseKey(handle)
+            except OSError:
+                pass
+            self._kernel32.CloseHandle(event)
+        self._watches.clear()
+
+
+def _load_notification_api() -> tuple[Any, Any] | None:
+    """!
+    @brief Load ``advapi32``/``kernel32`` with the prototypes the notifier uses.
+    """
+
+    if os.name != "nt" or not hasattr(registry_tools.winreg, "CloseKey"):
+        return None
+    try:
+        advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    except (AttributeError, OSError):
+        return None
+    handle = ctypes.c_void_p
+    dword = ctypes.c_uint32
+    try:  # pragma: no cover - exercised on Windows only
+        advapi32.RegNotifyChangeKeyValue.argtypes = (
+            handle,
+            ctypes.c_int,
+            dword,
+            handle,
+            ctypes.c_int,
+        )
+        advapi32.RegNotifyChangeKeyValue.restype = ctypes.c_long
+        kernel32.CreateEventW.argtypes = (handle, ctypes.c_int, ctypes.c_int, ctypes.c_wchar_p)
+        kernel32.CreateEventW.restype = handle
+        kernel32.WaitForMultipleObjects.argtypes = (
+            dword,
+            ctypes.POINTER(handle),
+            ctypes.c_int,
+            dword,
+        )
+        kernel32.WaitForMultipleObjects.restype = dword
+        kernel32.CloseHandle.argtypes = (handle,)
+        kernel32.CloseHandle.restype = ctypes.c_int
+    except AttributeError:
+        return None
+    return advapi32, kernel32
+
+
+def default_notifier(keys: Iterable[tuple[int, str]]) -> RegistryChangeNotifier | None:
+    """!
+    @brief Return a notifier watching ``keys``, or ``None`` when unavailable.
+    """
+
+    api = _load_notification_api()
+    if api is None:
+        return None
+    notifier = RegistryChangeNotifier(api[0], api[1], keys)
+    return notifier if notifier else None
+
+
+def await_removals(
+    targets: Sequence[RemovalTarget],
+    *,
+    budget: float,
+    initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+    max_interval: float,
+    on_probe: Callable[[RemovalTarget, int, bool], None] | None = None,
+    notifier_factory: Callable[[Iterable[tuple[int, str]]], Any] | None = None,
+) -> dict[str, bool]:
+    """!
+    @brief Wait until every target is gone or ``budget`` seconds have elapsed.
+    @details All pending targets are probed in each round, so verification of
+    several products overlaps. Targets drop out as soon as their probe reports
+    them absent.
+    @param budget Seconds to keep waiting after the first probe.
+    @param initial_interval First polling delay; doubled up to ``max_interval``.
+    @param max_interval Longest delay between two probe rounds.
+    @param on_probe Optional callback ``(target, attempt, present)`` for telemetry.
+    @param notifier_factory Optional override for :func:`default_notifier`.
+    @returns Mapping of target name to ``True`` when its removal was confirmed.
+    """
+
+    results = {target.name: False for target in targets}
+    pending = list(targets)
+    if not pending:
+        return results
+
+    factory = notifier_factory if notifier_factory is not None else default_notifier
+    notifier = factory(key for target in pending for key in target.watch_keys)
+    deadline = time.monotonic() + max(0.0, float(budget))
+    delays = adaptive_delays(budget, initial=initial_interval, cap=max_interval)
+    attempt = 0
+    delay: float | None = None
+    try:
+        while pending:
+            attempt += 1
+            still_present: list[RemovalTarget] = []
+            for target in pending:
+                present = bool(target.probe())
+                if on_probe is not None:
+                    on_probe(target, attempt, present)
+                if present:
+                    still_present.append(target)
+                else:
+                    results[target.name] = True
+            pending = still_present
+            if not pending:
+                break
+
+            if delay is None:
+                delay = next(delays, None)
+                if delay is None:
+                    break
+            if notifier:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if notifier.wait(min(delay, remaining)):
+                    # Woken by a registry change: probe again without using up the delay.
+                    continue
+            else:
+                time.sleep(delay)
+            delay = None
+    finally:
+        if notifier:
+            notifier.close()
+    return results
+
+
+__all__ = [
+    "DEFAULT_INITIAL_INTERVAL",
+    "RegistryChangeNotifier",
+    "RemovalTarget",
+    "adaptive_delays",
+    "await_removals",
+    "default_notifier",
+    "parent_key",
+]
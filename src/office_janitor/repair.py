@@ -499,6 +499,7 @@ def run_repair(
             event="repair_exec",
             timeout=config.effective_timeout,
             dry_run=dry_run,
+            stream_output=True,
         )
 
     repair_result = RepairResult(
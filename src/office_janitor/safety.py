@@ -16,6 +16,7 @@ import shutil
 from collections.abc import Iterable, Mapping, Sequence
 
 from . import constants, fs_tools
+from .prefix_trie import PrefixTrie
 
 _logger = logging.getLogger(__name__)
 
@@ -130,6 +131,81 @@ REGISTRY_CRITICAL_BLACKLIST = (
 )
 
 
+class SafetyPolicy:
+    """!
+    @brief Registry and filesystem guard rules compiled into prefix tries.
+    @details Built once from :data:`REGISTRY_WHITELIST`,
+    :data:`REGISTRY_BLACKLIST`, :data:`REGISTRY_CRITICAL_BLACKLIST`,
+    :data:`FILESYSTEM_WHITELIST` and :data:`FILESYSTEM_BLACKLIST` and shared by
+    plan preflight and the registry delete/export helpers. Keys are matched
+    upper-cased; the critical blacklist always wins, otherwise the longest
+    matching whitelist/blacklist entry decides and unmatched keys are refused.
+    """
+
+    def __init__(
+        self,
+        *,
+        registry_whitelist: Iterable[str] = REGISTRY_WHITELIST,
+        registry_blacklist: Iterable[str] = REGISTRY_BLACKLIST,
+        registry_critical_blacklist: Iterable[str] = REGISTRY_CRITICAL_BLACKLIST,
+        filesystem_whitelist: Iterable[str] = FILESYSTEM_WHITELIST,
+        filesystem_blacklist: Iterable[str] = FILESYSTEM_BLACKLIST,
+    ) -> None:
+        self._critical: PrefixTrie[bool] = PrefixTrie()
+        for entry in registry_critical_blacklist:
+            self._critical.add(entry.upper(), True)
+        self._registry: PrefixTrie[bool] = PrefixTrie()
+        for entry in registry_blacklist:
+            self._registry.add(entry.upper(), False)
+        for entry in registry_whitelist:
+            self._registry.add(entry.upper(), True)
+        self.filesystem = fs_tools.PathPolicy(filesystem_whitelist, filesystem_blacklist)
+
+    def registry_critically_blocked(self, key: str) -> bool:
+        return self._critical.matches(key.upper())
+
+    def registry_allowed(self, key: str) -> bool:
+        normalized = key.upper()
+        if self._critical.matches(normalized):
+            return False
+        match = self._registry.longest_match(normalized)
+        return match is not None and match[1]
+
+    def path_allowed(self, path: str) -> bool:
+        return self.filesystem.allows(path)
+
+
+_POLICY: tuple[tuple[object, ...], SafetyPolicy] | None = None
+
+
+def compiled_policy() -> SafetyPolicy:
+    """!
+    @brief Return the shared :class:`SafetyPolicy`, compiling it on first use.
+    @details Rebinding any of the module-level lists compiles a fresh policy.
+    """
+
+    global _POLICY
+    sources = (
+        REGISTRY_WHITELIST,
+        REGISTRY_BLACKLIST,
+        REGISTRY_CRITICAL_BLACKLIST,
+        FILESYSTEM_WHITELIST,
+        FILESYSTEM_BLACKLIST,
+    )
+    cached = _POLICY
+    if cached is None or any(old is not new for old, new in zip(cached[0], sources)):
+        policy = SafetyPolicy(
+            registry_whitelist=REGISTRY_WHITELIST,
+            registry_blacklist=REGISTRY_BLACKLIST,
+            registry_critical_blacklist=REGISTRY_CRITICAL_BLACKLIST,
+            filesystem_whitelist=FILESYSTEM_WHITELIST,
+            filesystem_blacklist=FILESYSTEM_BLACKLIST,
+        )
+        cached = (sources, policy)
+        _POLICY = cached
+    return cached[1]
+
+
 def perform_preflight_checks(plan: Iterable[Mapping[str, object]]) -> None:
     """!
     @brief Validate that the plan satisfies safety requirements before execution.
@@ -345,38 +421,30 @@ def _enforce_target_scope(
 
 
 def _enforce_filesystem_whitelist(plan_steps: Sequence[Mapping[str, object]]) -> None:
+    policy = compiled_policy()
     for step in plan_steps:
         if step.get("category") != "filesystem-cleanup":
             continue
         metadata = step.get("metadata", {})
         for path in metadata.get("paths", []) or []:
-            if not _path_allowed(path):
+            if not policy.path_allowed(path):
                 raise ValueError(f"Refusing to operate on non-whitelisted path: {path}")
 
 
 def _enforce_registry_whitelist(plan_steps: Sequence[Mapping[str, object]]) -> None:
+    policy = compiled_policy()
     for step in plan_steps:
         if step.get("category") != "registry-cleanup":
             continue
         metadata = step.get("metadata", {})
         keys = metadata.get("keys") or metadata.get("paths") or []
         for key in keys:
-            if not _registry_allowed(key):
+            if not policy.registry_allowed(key):
                 raise ValueError(f"Refusing to modify non-whitelisted registry key: {key}")
 
 
 def _path_allowed(path: str) -> bool:
-    if fs_tools.is_path_whitelisted(
-        path, whitelist=FILESYSTEM_WHITELIST, blacklist=FILESYSTEM_BLACKLIST
-    ):
-        return True
-    normalized = fs_tools.normalize_windows_path(path)
-    if any(
-        normalized.startswith(fs_tools.normalize_windows_path(blocked))
-        for blocked in FILESYSTEM_BLACKLIST
-    ):
-        return False
-    return False
+    return compiled_policy().path_allowed(path)
 
 
 def _is_registry_critically_blocked(key: str) -> bool:
@@ -384,8 +452,7 @@ def _is_registry_critically_blocked(key: str) -> bool:
     @brief Check whether a key falls inside the immutable critical blacklist.
     @details This check cannot be bypassed by any CLI flag.
     """
-    normalized = key.upper()
-    return any(normalized.startswith(blocked.upper()) for blocked in REGISTRY_CRITICAL_BLACKLIST)
+    return compiled_policy().registry_critically_blocked(key)
 
 
 def _enforce_registry_critical_blacklist(
@@ -395,28 +462,19 @@ def _enforce_registry_critical_blacklist(
     @brief Reject plan steps targeting immutable critical system hives.
     @details This guard is unconditional and runs before all other checks.
     """
+    policy = compiled_policy()
     for step in plan_steps:
         if step.get("category") != "registry-cleanup":
             continue
         metadata = step.get("metadata", {})
         keys = metadata.get("keys") or metadata.get("paths") or []
         for key in keys:
-            if _is_registry_critically_blocked(str(key)):
+            if policy.registry_critically_blocked(str(key)):
                 raise ValueError(f"Refusing to modify critical system registry key: {key}")
 
 
 def _registry_allowed(key: str) -> bool:
-    normalized = key.upper()
-    # Critical blacklist is always enforced
-    if _is_registry_critically_blocked(key):
-        return False
-    # Check whitelist first (more specific rules take precedence)
-    if any(normalized.startswith(allowed.upper()) for allowed in REGISTRY_WHITELIST):
-        return True
-    # Then check blacklist
-    if any(normalized.startswith(blocked.upper()) for blocked in REGISTRY_BLACKLIST):
-        return False
-    return False
+    return compiled_policy().registry_allowed(key)
 
 
 def _enforce_template_guard(
@@ -31,6 +31,7 @@ from . import (
     registry_tools,  # noqa: F401 - re-exported for test patching
     restore_point,
     safety,
+    scrub_scheduler,
     spinner,
     tasks_services,
 )
@@ -162,6 +163,7 @@ def execute_plan(
     dry_run: bool = False,
     max_passes: int | None = None,
     start_time: float | None = None,
+    inventory: Mapping[str, object] | None = None,
 ) -> None:
     """!
     @brief Run each plan step while respecting dry-run safety requirements.
@@ -171,6 +173,9 @@ def execute_plan(
     final plan, ensuring filesystem and licensing tasks do not repeat across
     passes.
     @param start_time Optional startup timestamp for continuous timing across modules.
+    @param inventory Optional inventory the plan was built from. When supplied,
+    re-probes between passes only recheck the products the previous pass tried
+    to remove (see :func:`detect.reprobe_incremental`).
     """
     global _SCRUB_START_TIME
     # Use provided start_time for continuous timestamps, or start fresh
@@ -219,7 +224,14 @@ def execute_plan(
     else:
         max_pass_limit = DEFAULT_MAX_PASSES
 
-    _scrub_progress(f"Configuration: dry_run={global_dry_run}, max_passes={max_pass_limit}")
+    step_workers = max(1, int(options.get("step_workers") or scrub_scheduler.DEFAULT_STEP_WORKERS))
+    # Only pass the worker count when parallel scheduling is requested.
+    schedule_kwargs: dict[str, int] = {"max_workers": step_workers} if step_workers > 1 else {}
+
+    _scrub_progress(
+        f"Configuration: dry_run={global_dry_run}, max_passes={max_pass_limit}, "
+        f"step_workers={step_workers}"
+    )
 
     machine_logger.info(
         "scrub_plan_start",
@@ -320,7 +332,12 @@ def execute_plan(
 
             _scrub_progress("Executing uninstall steps...", indent=1)
             try:
-                pass_results = _execute_steps(current_plan, UNINSTALL_CATEGORIES, global_dry_run)
+                pass_results = _execute_steps(
+                    current_plan,
+                    UNINSTALL_CATEGORIES,
+                    global_dry_run,
+                    **schedule_kwargs,
+                )
             except StepExecutionError as exc:
                 _scrub_progress(f"Pass {current_pass} FAILED", indent=1)
                 all_results.extend(exc.partial_results)
@@ -391,7 +408,19 @@ def execute_plan(
                 break
 
             _scrub_progress("Re-probing inventory for next pass...", indent=1)
-            inventory = detect.reprobe(base_options)
+            if inventory is not None:
+                diff = detect.reprobe_incremental(inventory, _attempted_uninstalls(current_plan))
+                inventory = diff.apply(inventory)
+                machine_logger.info(
+                    "scrub_reprobe_incremental",
+                    extra={
+                        "event": "scrub_reprobe_incremental",
+                        "pass_index": current_pass,
+                        **diff.to_dict(),
+                    },
+                )
+            else:
+                inventory = detect.reprobe(base_options)
             next_plan_raw = plan_module.build_plan(
                 inventory, base_options, pass_index=current_pass + 1
             )
@@ -436,7 +465,11 @@ def execute_plan(
         _scrub_progress("Executing cleanup steps...")
         # Cleanup steps should continue on failure - don't stop the whole process
         cleanup_results = _execute_steps(
-            final_plan, CLEANUP_CATEGORIES, global_dry_run, continue_on_failure=True
+            final_plan,
+            CLEANUP_CATEGORIES,
+            global_dry_run,
+            continue_on_failure=True,
+            **schedule_kwargs,
         )
         all_results.extend(cleanup_results)
 
@@ -510,6 +543,30 @@ def _has_uninstall_steps(plan_steps: Iterable[Mapping[str, object]]) -> bool:
     return False
 
 
+def _attempted_uninstalls(plan_steps: Iterable[Mapping[str, object]]) -> dict[str, list[str]]:
+    """!
+    @brief Collect the MSI product codes and Click-to-Run release IDs a pass targeted.
+    """
+
+    attempted: dict[str, list[str]] = {"msi": [], "c2r": []}
+    for step in plan_steps:
+        metadata = step.get("metadata")
+        if not isinstance(metadata, Mapping):
+            continue
+        category = step.get("category")
+        if category == "msi-uninstall":
+            product = metadata.get("product")
+            if isinstance(product, Mapping) and product.get("product_code"):
+                attempted["msi"].append(str(product["product_code"]))
+        elif category == "c2r-uninstall":
+            installation = metadata.get("installation")
+            if isinstance(installation, Mapping):
+                attempted["c2r"].extend(
+                    str(release) for release in installation.get("release_ids") or []
+                )
+    return attempted
+
+
 def _annotate_cleanup_metadata(
     plan_steps: Iterable[MutableMapping[str, object]],
     options: Mapping[str, object],
@@ -591,10 +648,13 @@ def _execute_steps(
     dry_run: bool,
     *,
     continue_on_failure: bool = False,
+    max_workers: int = scrub_scheduler.DEFAULT_STEP_WORKERS,
 ) -> list[StepResult]:
     """!
     @brief Execute the subset of plan steps matching ``categories``.
     @param continue_on_failure If True, continue to next step after failure instead of raising.
+    @param max_workers When greater than one, schedule steps along their ``depends_on``
+           edges on a worker pool via :func:`scrub_scheduler.run_step_graph`.
     @return Ordered list of :class:`StepResult` entries describing each step.
     """
 
@@ -633,14 +693,26 @@ def _execute_steps(
         step for step in plan_steps if step.get("category", "unknown") in selected_categories
     ]
 
-    executor = StepExecutor(
-        dry_run=dry_run,
-        context_metadata=context_metadata,
-        backup_destination=backup_destination,
-        log_directory=log_directory,
-        total_steps=len(selected_steps) or 1,
-    )
+    def _make_executor() -> StepExecutor:
+        return StepExecutor(
+            dry_run=dry_run,
+            context_metadata=context_metadata,
+            backup_destination=backup_destination,
+            log_directory=log_directory,
+            total_steps=len(selected_steps) or 1,
+        )
+
+    if max_workers > 1:
+        # StepExecutor tracks the in-flight step on the instance, so each
+        # concurrently scheduled step gets its own executor.
+        return scrub_scheduler.run_step_graph(
+            selected_steps,
+            lambda step, index: _make_executor().run_step(step, index=index),
+            max_workers=max_workers,
+            continue_on_failure=continue_on_failure,
+        )
 
+    executor = _make_executor()
     results: list[StepResult] = []
 
     for index, step in enumerate(selected_steps, start=1):
@@ -358,7 +358,9 @@ def perform_registry_cleanup(
         if step_backup is not None:
             _scrub_progress(f"Exporting {len(keys)} registry keys to backup...", indent=3)
             try:
-                registry_tools.export_keys(keys, step_backup, skip_whitelist=skip_whitelist)
+                registry_tools.export_keys(
+                    keys, step_backup, skip_whitelist=skip_whitelist, consolidated=True
+                )
                 backup_performed = True
                 _scrub_progress(f"Registry backup complete: {step_backup}", indent=3)
             except Exception as exc:  # pragma: no cover - defensive
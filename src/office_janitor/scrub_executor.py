@@ -27,6 +27,7 @@ from . import (
     safety,
     spinner,
     tasks_services,
+    tracing,
 )
 
 # ---------------------------------------------------------------------------
@@ -158,6 +159,19 @@ class StepExecutor:
         backups occurred.
         """
 
+        with tracing.span(
+            "scrub.step",
+            step_id=str(step.get("id")),
+            category=str(step.get("category", "unknown")),
+            index=index,
+        ):
+            return self._run_step(step, index=index)
+
+    def _run_step(self, step: Mapping[str, object], *, index: int) -> StepResult:
+        """!
+        @brief Body of :meth:`run_step`, executed inside its trace span.
+        """
+
         category = step.get("category", "unknown")
         step_id = step.get("id")
         metadata = dict(step.get("metadata", {}))
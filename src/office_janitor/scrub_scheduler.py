@@ -0,0 +1,245 @@
+"""!
+@file scrub_scheduler.py
+@brief Dependency-aware parallel scheduling for scrub plan steps.
+
+@details ``plan.build_plan`` gives every step an ``id`` and a ``depends_on``
+list. This module turns the selected steps into a DAG and runs them on a
+bounded worker pool: a step becomes ready once every dependency that is part
+of the same batch has finished, and ready steps are dispatched in plan order.
+Each category claims a set of named resources (``msiexec``, registry hives,
+the Service Control Manager, ...) before it starts, so anything that shares a
+resource is serialized while unrelated work overlaps. Results are always
+returned in plan order regardless of completion order.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
+
+from . import logging_ext
+from .scrub_executor import StepExecutionError, StepResult
+
+DEFAULT_STEP_WORKERS = 1
+"""!
+@brief Default worker count; ``1`` keeps the historical sequential executor.
+"""
+
+STEP_RESOURCES: dict[str, tuple[str, ...]] = {
+    "context": (),
+    "detect": (),
+    # Windows Installer runs one transaction at a time; serialize our msiexec calls.
+    "msi-uninstall": ("msiexec",),
+    "c2r-uninstall": ("click-to-run",),
+    "licensing-cleanup": ("licensing", "hive:HKLM"),
+    "task-cleanup": ("task-scheduler",),
+    "service-cleanup": ("service-control-manager",),
+    "filesystem-cleanup": ("filesystem",),
+    "registry-cleanup": ("hive:HKLM", "hive:HKCU"),
+    "vnext-identity-cleanup": ("hive:HKLM", "hive:HKCU"),
+    "taskband-cleanup": ("hive:HKCU",),
+    "published-components-cleanup": ("hive:HKLM",),
+    "ose-service-validation": ("service-control-manager",),
+}
+"""!
+@brief Resources each step category must hold exclusively while it runs.
+@details Categories missing from the table lock a resource named after the
+category, so unknown steps never overlap with another step of their kind.
+"""
+
+
+def step_resources(step: Mapping[str, object]) -> frozenset[str]:
+    """!
+    @brief Resolve the resource names ``step`` needs to hold while running.
+    @details An explicit ``resources`` list on the step overrides the table.
+    """
+
+    explicit = step.get("resources")
+    if isinstance(explicit, Iterable) and not isinstance(explicit, (str, bytes)):
+        return frozenset(str(item) for item in explicit if item)
+    category = str(step.get("category", "unknown"))
+    return frozenset(STEP_RESOURCES.get(category, (category,)))
+
+
+class ResourceLocks:
+    """!
+    @brief All-or-nothing claims over named resources.
+    @details Claims are taken by the scheduling thread before a step is
+    dispatched, so workers never block on each other and lock ordering cannot
+    deadlock.
+    """
+
+    def __init__(self) -> None:
+        self._held: set[str] = set()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, names: frozenset[str]) -> bool:
+        """!
+        @brief Claim every resource in ``names`` or none of them.
+        """
+        with self._lock:
+            if self._held.intersection(names):
+                return False
+            self._held.update(names)
+            return True
+
+    def release(self, names: frozenset[str]) -> None:
+        """!
+        @brief Return previously claimed resources.
+        """
+        with self._lock:
+            self._held.difference_update(names)
+
+
+def _resolve_dependencies(steps: Sequence[Mapping[str, object]]) -> list[set[int]] | None:
+    """!
+    @brief Map each step to the positions of the steps it waits for.
+    @details Dependencies on steps outside the batch (for example uninstall
+    steps from an earlier pass) are treated as already satisfied.
+    @returns ``None`` when the edges contain a cycle.
+    """
+
+    positions: dict[str, int] = {}
+    for position, step in enumerate(steps):
+        step_id = step.get("id")
+        if step_id is not None:
+            positions.setdefault(str(step_id), position)
+
+    dependencies: list[set[int]] = []
+    for position, step in enumerate(steps):
+        raw = step.get("depends_on") or []
+        if isinstance(raw, (str, bytes)) or not isinstance(raw, Iterable):
+            raw = [raw]
+        resolved = {positions[str(dep)] for dep in raw if str(dep) in positions}
+        resolved.discard(position)
+        dependencies.append(resolved)
+
+    # Kahn's algorithm purely to reject cycles before anything runs.
+    remaining = [len(deps) for deps in dependencies]
+    dependents: list[list[int]] = [[] for _ in steps]
+    for position, deps in enumerate(dependencies):
+        for dep in deps:
+            dependents[dep].append(position)
+    queue = [position for position, count in enumerate(remaining) if count == 0]
+    visited = 0
+    while queue:
+        current = queue.pop()
+        visited += 1
+        for child in dependents[current]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                queue.append(child)
+    if visited != len(steps):
+        return None
+    return dependencies
+
+
+def run_step_graph(
+    steps: Sequence[Mapping[str, object]],
+    run_step: Callable[[Mapping[str, object], int], StepResult],
+    *,
+    max_workers: int = DEFAULT_STEP_WORKERS,
+    continue_on_failure: bool = False,
+) -> list[StepResult]:
+    """!
+    @brief Execute ``steps`` topologically on a bounded worker pool.
+    @param run_step Callable invoked as ``run_step(step, index)`` on a worker
+           thread, where ``index`` is the 1-based plan position.
+    @param max_workers Upper bound on concurrently running steps.
+    @param continue_on_failure Keep scheduling after a recoverable failure.
+    @returns Step results in plan order.
+    @throws StepExecutionError When a recoverable failure occurs and
+            ``continue_on_failure`` is false. Steps already running are allowed
+            to finish and are included in ``partial_results``.
+    """
+
+    human_logger = logging_ext.get_human_logger()
+    machine_logger = logging_ext.get_machine_logger()
+
+    ordered = list(steps)
+    dependencies = _resolve_dependencies(ordered)
+    workers = max(1, int(max_workers))
+    if dependencies is None:
+        human_logger.warning("Plan step dependencies contain a cycle; running sequentially.")
+        dependencies = [set(range(position)) for position in range(len(ordered))]
+        workers = 1
+
+    resources = [step_resources(step) for step in ordered]
+    locks = ResourceLocks()
+    results: dict[int, StepResult] = {}
+    pending = list(range(len(ordered)))
+    running: dict[concurrent.futures.Future[StepResult], int] = {}
+    fatal: int | None = None
+
+    machine_logger.info(
+        "scrub_schedule_start",
+        extra={
+            "event": "scrub_schedule_start",
+            "step_count": len(ordered),
+            "max_workers": workers,
+        },
+    )
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="scrub_step"
+    ) as pool:
+        while running or (pending and fatal is None):
+            if fatal is None:
+                for position in list(pending):
+                    if len(running) >= workers:
+                        break
+                    if not dependencies[position].issubset(results):
+                        continue
+                    if not locks.try_acquire(resources[position]):
+                        continue
+                    pending.remove(position)
+                    future = pool.submit(run_step, ordered[position], position + 1)
+                    running[future] = position
+
+            if not running:  # pragma: no cover - unreachable for an acyclic graph
+                break
+
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                position = running.pop(future)
+                locks.release(resources[position])
+                result = future.result()
+                results[position] = result
+                if result.status != "failed":
+                    continue
+                if result.non_recoverable or continue_on_failure:
+                    human_logger.warning(
+                        "Step %s failed%s, continuing to next step...",
+                        result.step_id or result.category,
+                        " (non-recoverable)" if result.non_recoverable else "",
+                    )
+                    continue
+                if fatal is None or position < fatal:
+                    fatal = position
+
+    ordered_results = [results[position] for position in sorted(results)]
+    machine_logger.info(
+        "scrub_schedule_complete",
+        extra={
+            "event": "scrub_schedule_complete",
+            "step_count": len(ordered),
+            "executed": len(ordered_results),
+            "max_workers": workers,
+        },
+    )
+    if fatal is not None:
+        failed = results[fatal]
+        raise StepExecutionError(failed, ordered_results) from failed.exception
+    return ordered_results
+
+
+__all__ = [
+    "DEFAULT_STEP_WORKERS",
+    "STEP_RESOURCES",
+    "ResourceLocks",
+    "run_step_graph",
+    "step_resources",
+]
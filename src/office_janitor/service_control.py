@@ -0,0 +1,281 @@
+"""!
+@brief Native Service Control Manager backend for bulk service shutdown.
+@details Opens the Service Control Manager once through ``advapi32`` and, for
+every requested service, switches the start type to disabled and sends a stop
+control. The requests are issued concurrently and the services are then polled
+against one shared deadline, replacing two ``sc.exe`` spawns per service.
+:class:`ServiceController` is the interface :mod:`tasks_services` talks to, so
+tests can substitute a fake controller and non-Windows hosts simply get no
+native backend.
+"""
+
+from __future__ import annotations
+
+import abc
+import concurrent.futures
+import ctypes
+import dataclasses
+import os
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+SC_MANAGER_CONNECT = 0x0001
+SERVICE_CHANGE_CONFIG = 0x0002
+SERVICE_QUERY_STATUS = 0x0004
+SERVICE_STOP = 0x0020
+SERVICE_NO_CHANGE = 0xFFFFFFFF
+SERVICE_DISABLED = 0x00000004
+SERVICE_CONTROL_STOP = 0x00000001
+SERVICE_STOPPED = 0x00000001
+
+ERROR_SERVICE_DOES_NOT_EXIST = 1060
+ERROR_SERVICE_NOT_ACTIVE = 1062
+
+DEFAULT_POLL_INTERVAL = 0.25
+"""!
+@brief Seconds between status polls while waiting for services to stop.
+"""
+
+_MAX_REQUEST_WORKERS = 8
+
+
+class SERVICE_STATUS(ctypes.Structure):
+    """!
+    @brief Mirror of the Win32 ``SERVICE_STATUS`` structure.
+    """
+
+    _fields_ = [
+        ("dwServiceType", ctypes.c_uint32),
+        ("dwCurrentState", ctypes.c_uint32),
+        ("dwControlsAccepted", ctypes.c_uint32),
+        ("dwWin32ExitCode", ctypes.c_uint32),
+        ("dwServiceSpecificExitCode", ctypes.c_uint32),
+        ("dwCheckPoint", ctypes.c_uint32),
+        ("dwWaitHint", ctypes.c_uint32),
+    ]
+
+
+@dataclasses.dataclass
+class ServiceOutcome:
+    """!
+    @brief Result of stopping and disabling one service.
+    @details ``found`` is ``False`` when the service is not installed.
+    ``error`` is set when the backend could not act on the service at all,
+    signalling callers to fall back to another mechanism.
+    """
+
+    service: str
+    found: bool = True
+    stopped: bool = False
+    disabled: bool = False
+    timed_out: bool = False
+    error: str | None = None
+
+
+class ServiceController(abc.ABC):
+    """!
+    @brief Interface for backends that stop and disable services in bulk.
+    """
+
+    name = "abstract"
+
+    @abc.abstractmethod
+    def stop_and_disable(self, services: Sequence[str], *, timeout: float) -> list[ServiceOutcome]:
+        """!
+        @brief Stop and disable ``services`` within ``timeout`` seconds overall.
+        @returns One outcome per service, in input order.
+        @throws OSError When the backend cannot be used at all.
+        """
+
+
+class ScmServiceController(ServiceController):
+    """!
+    @brief :class:`ServiceController` backed by ``advapi32`` via ``ctypes``.
+    @details The start type is switched to disabled before the stop control is
+    sent so recovery actions cannot restart the service mid-shutdown.
+    """
+
+    name = "scm"
+
+    def __init__(
+        self,
+        advapi32: Any,
+        *,
+        get_last_error: Callable[[], int] | None = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        self._api = advapi32
+        self._get_last_error = get_last_error or getattr(ctypes, "get_last_error", lambda: 0)
+        self._poll_interval = max(0.0, float(poll_interval))
+
+    def stop_and_disable(self, services: Sequence[str], *, timeout: float) -> list[ServiceOutcome]:
+        outcomes = [ServiceOutcome(service=name) for name in services]
+        if not outcomes:
+            return outcomes
+
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        scm = self._api.OpenSCManagerW(None, None, SC_MANAGER_CONNECT)
+        if not scm:
+            raise OSError(self._get_last_error(), "OpenSCManagerW failed")
+
+        handles: dict[int, Any] = {}
+        pool: concurrent.futures.ThreadPoolExecutor | None = None
+        requests: dict[int, concurrent.futures.Future[None]] = {}
+        try:
+            access = SERVICE_STOP | SERVICE_QUERY_STATUS | SERVICE_CHANGE_CONFIG
+            for index, outcome in enumerate(outcomes):
+                handle = self._api.OpenServiceW(scm, outcome.service, access)
+                if handle:
+                    handles[index] = handle
+                    continue
+                code = self._get_last_error()
+                if code == ERROR_SERVICE_DOES_NOT_EXIST:
+                    outcome.found = False
+                else:
+                    outcome.error = f"OpenServiceW failed with error {code}"
+
+            if handles:
+                pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(_MAX_REQUEST_WORKERS, len(handles)),
+                    thread_name_prefix="service_control",
+                )
+                requests = {
+                    index: pool.submit(self._request_stop, handle, outcomes[index])
+                    for index, handle in handles.items()
+                }
+                concurrent.futures.wait(
+                    requests.values(), timeout=max(0.0, deadline - time.monotonic())
+                )
+                self._wait_for_stop(handles, outcomes, deadline)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            for index, handle in handles.items():
+                request = requests.get(index)
+                # A request still blocked inside ControlService keeps its handle.
+                if request is None or request.done():
+                    self._api.CloseServiceHandle(handle)
+            self._api.CloseServiceHandle(scm)
+
+        return outcomes
+
+    def _request_stop(self, handle: Any, outcome: ServiceOutcome) -> None:
+        """!
+        @brief Disable ``handle`` and send it a stop control.
+        """
+
+        outcome.disabled = bool(
+            self._api.ChangeServiceConfigW(
+                handle,
+                SERVICE_NO_CHANGE,
+                SERVICE_DISABLED,
+                SERVICE_NO_CHANGE,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+            )
+        )
+        status = SERVICE_STATUS()
+        if self._api.ControlService(handle, SERVICE_CONTROL_STOP, ctypes.byref(status)):
+            outcome.stopped = status.dwCurrentState == SERVICE_STOPPED
+            return
+        if self._get_last_error() == ERROR_SERVICE_NOT_ACTIVE:
+            outcome.stopped = True
+
+    def _query_state(self, handle: Any) -> int | None:
+        """!
+        @brief Return the current state of ``handle`` or ``None`` on failure.
+        """
+
+        status = SERVICE_STATUS()
+        if not self._api.QueryServiceStatus(handle, ctypes.byref(status)):
+            return None
+        return int(status.dwCurrentState)
+
+    def _wait_for_stop(
+        self, handles: dict[int, Any], outcomes: list[ServiceOutcome], deadline: float
+    ) -> None:
+        """!
+        @brief Poll every pending service until it stops or ``deadline`` passes.
+        """
+
+        pending = {index for index in handles if not outcomes[index].stopped}
+        while pending:
+            for index in sorted(pending):
+                if self._query_state(handles[index]) == SERVICE_STOPPED:
+                    outcomes[index].stopped = True
+                    pending.discard(index)
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(min(self._poll_interval, max(0.0, deadline - time.monotonic())))
+        for index in pending:
+            outcomes[index].timed_out = True
+
+
+def _load_advapi32() -> Any | None:
+    """!
+    @brief Load ``advapi32`` with the prototypes the controller relies on.
+    """
+
+    if os.name != "nt":
+        return None
+    try:
+        advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    except (AttributeError, OSError):
+        return None
+    handle = ctypes.c_void_p
+    dword = ctypes.c_uint32
+    wstr = ctypes.c_wchar_p
+    try:  # pragma: no cover - exercised on Windows only
+        advapi32.OpenSCManagerW.argtypes = (wstr, wstr, dword)
+        advapi32.OpenSCManagerW.restype = handle
+        advapi32.OpenServiceW.argtypes = (handle, wstr, dword)
+        advapi32.OpenServiceW.restype = handle
+        advapi32.ChangeServiceConfigW.argtypes = (
+            handle,
+            dword,
+            dword,
+            dword,
+            wstr,
+            wstr,
+            ctypes.c_void_p,
+            wstr,
+            wstr,
+            wstr,
+            wstr,
+        )
+        advapi32.ChangeServiceConfigW.restype = ctypes.c_int
+        advapi32.ControlService.argtypes = (handle, dword, ctypes.POINTER(SERVICE_STATUS))
+        advapi32.ControlService.restype = ctypes.c_int
+        advapi32.QueryServiceStatus.argtypes = (handle, ctypes.POINTER(SERVICE_STATUS))
+        advapi32.QueryServiceStatus.restype = ctypes.c_int
+        advapi32.CloseServiceHandle.argtypes = (handle,)
+        advapi32.CloseServiceHandle.restype = ctypes.c_int
+    except AttributeError:
+        return None
+    return advapi32
+
+
+def default_controller() -> ServiceController | None:
+    """!
+    @brief Return the native controller for this host, or ``None`` when unavailable.
+    """
+
+    advapi32 = _load_advapi32()
+    if advapi32 is None:
+        return None
+    return ScmServiceController(advapi32)
+
+
+__all__ = [
+    "DEFAULT_POLL_INTERVAL",
+    "ScmServiceController",
+    "ServiceController",
+    "ServiceOutcome",
+    "default_controller",
+]
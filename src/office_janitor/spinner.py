@@ -15,12 +15,14 @@ killing any tracked subprocesses.
 from __future__ import annotations
 
 import atexit
+import logging
 import os
 import signal
 import subprocess
 import sys
 import threading
 import time
+from collections.abc import Iterable
 from typing import Any, TextIO
 
 # ---------------------------------------------------------------------------
@@ -281,23 +283,56 @@ def _sigint_handler(signum: int, frame: object) -> None:
     if _spinner_stop_event is not None:
         _spinner_stop_event.set()
 
+    # os._exit skips atexit, so drain queued log records (events.jsonl is written
+    # by a background thread) before leaving.
+    try:
+        logging.shutdown()
+    except Exception:
+        pass
+
     # Exit immediately - use os._exit to bypass any blocking cleanup
     os._exit(130)  # 128 + SIGINT(2)
 
 
 def _kill_process_trees() -> None:
     """Kill all tracked subprocesses and their entire process trees."""
+    snapshot = _take_process_snapshot()
     with _process_lock:
         for proc in list(_active_processes):
             try:
                 if proc.poll() is None:  # Still running
-                    _kill_process_tree(proc.pid)
+                    _kill_process_tree(proc.pid, snapshot=snapshot)
             except Exception:
                 pass  # Best effort cleanup
         _active_processes.clear()
 
     # Also kill any ClickToRun/ODT processes that may have been spawned
-    _kill_clicktorun_processes()
+    _kill_clicktorun_processes(snapshot=snapshot)
+
+
+def _take_process_snapshot() -> Any:
+    """Capture one native process snapshot, or ``None`` when unavailable."""
+    try:
+        from . import process_snapshot
+
+        return process_snapshot.take_snapshot()
+    except Exception:
+        return None
+
+
+def _kill_snapshot_tree(snapshot: Any, roots: list[int]) -> bool:
+    """
+    Terminate ``roots`` and their descendants using the process snapshot.
+
+    Returns True when every PID in the trees was terminated.
+    """
+    try:
+        from . import process_snapshot
+
+        results = process_snapshot.terminate_trees(snapshot, roots)
+    except Exception:
+        return False
+    return results is not None and all(results.values())
 
 
 # List of ClickToRun and ODT-related process names to kill on interrupt
@@ -315,12 +350,14 @@ _CLICKTORUN_PROCESS_NAMES = [
 ]
 
 
-def _kill_clicktorun_processes() -> None:
+def _kill_clicktorun_processes(snapshot: Any = None) -> None:
     """
     Kill ClickToRun and ODT-related processes that may be running.
 
     This ensures all Office installation/update processes are terminated
-    when the user presses Ctrl+C during an ODT operation.
+    when the user presses Ctrl+C during an ODT operation. Live PIDs from the
+    process snapshot are killed directly; taskkill is used per name only
+    when no snapshot is available.
     """
     import platform
 
@@ -329,6 +366,18 @@ def _kill_clicktorun_processes() -> None:
 
     console = _get_console()
 
+    if snapshot is None:
+        snapshot = _take_process_snapshot()
+    if snapshot is not None:
+        for entry in snapshot.match(_CLICKTORUN_PROCESS_NAMES):
+            if _kill_snapshot_tree(snapshot, [entry.pid]):
+                try:
+                    console.write(f"\033[33m[KILLED]\033[0m {entry.name}\n")
+                    console.flush()
+                except (OSError, ValueError):
+                    pass
+        return
+
     for proc_name in _CLICKTORUN_PROCESS_NAMES:
         try:
             # Use taskkill to kill by name - /F for force, /T for tree
@@ -348,16 +397,21 @@ def _kill_clicktorun_processes() -> None:
             pass  # Best effort - process may not exist
 
 
-def _kill_process_tree(pid: int) -> None:
+def _kill_process_tree(pid: int, *, snapshot: Any = None) -> None:
     """
     Kill a process and all its children/descendants.
 
-    On Windows, uses taskkill /T for tree kill.
+    On Windows, walks the tree from a process snapshot and falls back to
+    taskkill /T when the snapshot is unavailable or a kill fails.
     On Unix, walks the process tree manually.
     """
     import platform
 
     if platform.system() == "Windows":
+        if snapshot is None:
+            snapshot = _take_process_snapshot()
+        if snapshot is not None and _kill_snapshot_tree(snapshot, [pid]):
+            return
         # Use taskkill with /T to kill entire process tree, /F for force
         try:
             subprocess.run(
@@ -438,11 +492,12 @@ def kill_all_processes() -> int:
     @return Number of processes that were killed.
     """
     killed = 0
+    snapshot = _take_process_snapshot()
     with _process_lock:
         for proc in list(_active_processes):
             try:
                 if proc.poll() is None:  # Still running
-                    _kill_process_tree(proc.pid)
+                    _kill_process_tree(proc.pid, snapshot=snapshot)
                     killed += 1
             except Exception:
                 pass
@@ -450,6 +505,30 @@ def kill_all_processes() -> int:
     return killed
 
 
+def kill_processes(processes: Iterable[subprocess.Popen[Any]]) -> int:
+    """
+    Kill the given subprocesses and their process trees, leaving others tracked.
+
+    @param processes The Popen objects to kill; they are also unregistered.
+    @return Number of processes that were killed.
+    """
+    targets = list(processes)
+    if not targets:
+        return 0
+    killed = 0
+    snapshot = _take_process_snapshot()
+    with _process_lock:
+        for proc in targets:
+            try:
+                if proc.poll() is None:  # Still running
+                    _kill_process_tree(proc.pid, snapshot=snapshot)
+                    killed += 1
+            except Exception:
+                pass
+            _active_processes.discard(proc)
+    return killed
+
+
 # ---------------------------------------------------------------------------
 # Spinner thread management
 # ---------------------------------------------------------------------------
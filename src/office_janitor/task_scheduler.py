@@ -0,0 +1,351 @@
+"""!
+@brief Batch scheduled-task backend built on the Task Scheduler store.
+@details Registered tasks are enumerated by walking the task XML tree under
+``%SystemRoot%\\System32\\Tasks`` without spawning any process. Disable and
+delete requests for many tasks are then applied in one PowerShell session
+through the ``Schedule.Service`` COM API, which reports a result per task.
+Only the folders holding the requested tasks are listed. Tasks missing from
+the XML tree are reported as not found without being sent to PowerShell at
+all, and tasks in folders that cannot be listed are left to the ``schtasks``
+fallback. :class:`TaskBackend` is the interface
+:mod:`tasks_services` talks to, so tests can substitute a fake backend and
+non-Windows hosts simply get no native backend.
+"""
+
+from __future__ import annotations
+
+import abc
+import dataclasses
+import json
+import os
+import stat
+import xml.etree.ElementTree as ET
+from collections.abc import Sequence
+from pathlib import Path
+
+from . import exec_utils
+
+TASK_XML_NAMESPACE = "http://schemas.microsoft.com/windows/2004/02/mit/task"
+
+DEFAULT_BATCH_TIMEOUT = 120
+"""!
+@brief Seconds allowed for one batched PowerShell session.
+"""
+
+_ACTIONS = ("disable", "delete")
+
+
+@dataclasses.dataclass
+class TaskOutcome:
+    """!
+    @brief Result of disabling or deleting one scheduled task.
+    @details ``found`` is ``False`` when the task is not registered and
+    ``skipped`` is set for dry-run requests. ``error`` is set when the backend
+    could not act on the task, signalling callers to fall back to ``schtasks``.
+    """
+
+    task: str
+    found: bool = True
+    disabled: bool = False
+    deleted: bool = False
+    skipped: bool = False
+    error: str | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class RegisteredTask:
+    """!
+    @brief One task definition discovered in the task XML tree.
+    @details ``enabled`` is ``None`` when the definition could not be parsed.
+    """
+
+    path: str
+    enabled: bool | None = None
+
+
+def normalize_task_path(name: str) -> str:
+    """!
+    @brief Normalise ``name`` to the ``\\Folder\\Task`` form used by Task Scheduler.
+    @details Collapses repeated separators and adds the leading backslash, so
+    bare names resolve to the root folder just like ``schtasks /TN`` does.
+    """
+
+    parts = [part for part in str(name).strip().replace("/", "\\").split("\\") if part]
+    return "\\" + "\\".join(parts)
+
+
+def default_tasks_root() -> Path:
+    """!
+    @brief Return the directory that holds registered task definitions.
+    """
+
+    system_root = os.environ.get("SystemRoot") or os.environ.get("WINDIR") or r"C:\Windows"
+    return Path(system_root) / "System32" / "Tasks"
+
+
+def _read_enabled(path: Path) -> bool | None:
+    """!
+    @brief Read ``Settings/Enabled`` from a task definition file.
+    """
+
+    try:
+        root = ET.parse(path).getroot()
+    except (ET.ParseError, OSError):
+        return None
+    node = root.find(f"{{{TASK_XML_NAMESPACE}}}Settings/{{{TASK_XML_NAMESPACE}}}Enabled")
+    if node is None or node.text is None:
+        return True
+    return node.text.strip().lower() != "false"
+
+
+def _task_folder_path(root: Path, directory: str | Path) -> str:
+    """!
+    @brief Return the ``\\Folder`` task path for ``directory`` under ``root``.
+    """
+
+    relative = Path(directory).relative_to(root).as_posix()
+    return normalize_task_path("" if relative == "." else relative)
+
+
+def _scan_task_folders(
+    root: Path, folders: Sequence[str], *, recursive: bool
+) -> tuple[dict[str, RegisteredTask], set[str]]:
+    """!
+    @brief Read the task definitions in ``folders``.
+    @returns Tuple of (mapping of lowercase task path to :class:`RegisteredTask`,
+    lowercase task folders that exist but could not be listed).
+    """
+
+    tasks: dict[str, RegisteredTask] = {}
+    unreadable: set[str] = set()
+
+    def _record_error(exc: OSError) -> None:
+        if exc.filename is None:
+            raise exc
+        unreadable.add(_task_folder_path(root, exc.filename).lower())
+
+    def _record_file(full: Path) -> None:
+        path = normalize_task_path(full.relative_to(root).as_posix())
+        tasks[path.lower()] = RegisteredTask(path=path, enabled=_read_enabled(full))
+
+    for folder in dict.fromkeys(normalize_task_path(folder) for folder in folders):
+        relative = folder.strip("\\")
+        start = root.joinpath(*relative.split("\\")) if relative else root
+        try:
+            if not stat.S_ISDIR(start.stat().st_mode):
+                continue
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except OSError:
+            unreadable.add(folder.lower())
+            continue
+        if recursive:
+            for directory, _dirs, files in os.walk(start, onerror=_record_error):
+                for filename in files:
+                    _record_file(Path(directory) / filename)
+            continue
+        try:
+            with os.scandir(start) as entries:
+                files = [Path(entry.path) for entry in entries if entry.is_file()]
+        except OSError as exc:
+            _record_error(exc)
+            continue
+        for full in files:
+            _record_file(full)
+    return tasks, unreadable
+
+
+def list_registered_tasks(
+    tasks_root: str | Path | None = None,
+    *,
+    folders: Sequence[str] | None = None,
+) -> dict[str, RegisteredTask] | None:
+    """!
+    @brief Enumerate registered tasks from the task XML tree in one walk.
+    @param tasks_root Directory to walk; defaults to :func:`default_tasks_root`.
+    @param folders Optional task folders (for example ``\\Microsoft\\Office``)
+    restricting the walk; the whole tree is read when omitted.
+    @returns Mapping of lowercase task path to :class:`RegisteredTask`, or
+    ``None`` when the tree, or any folder inside the walk, is not readable on
+    this host so callers fall back to ``schtasks`` instead of missing tasks.
+    """
+
+    root = Path(tasks_root) if tasks_root is not None else default_tasks_root()
+    if not root.is_dir():
+        return None
+    try:
+        tasks, unreadable = _scan_task_folders(
+            root, folders if folders is not None else ["\\"], recursive=True
+        )
+    except OSError:
+        return None
+    if unreadable:
+        return None
+    return tasks
+
+
+def _powershell_literal(text: str) -> str:
+    """!
+    @brief Quote ``text`` as a single-quoted PowerShell string literal.
+    """
+
+    return "'" + text.replace("'", "''") + "'"
+
+
+def build_batch_script(paths: Sequence[str], action: str) -> str:
+    """!
+    @brief Build the PowerShell script applying ``action`` to every task path.
+    @details The script connects to ``Schedule.Service`` once and emits a JSON
+    array with ``task``, ``found``, ``ok`` and ``error`` for every path.
+    """
+
+    path_list = ",".join(_powershell_literal(path) for path in paths)
+    operation = "$d.DeleteTask($n,0)" if action == "delete" else "$t.Enabled=$false"
+    return (
+        "$ErrorActionPreference='Stop';"
+        "$s=New-Object -ComObject Schedule.Service;$s.Connect();"
+        "$missing=@(-2147024894,-2147024893);"
+        "$r=@();"
+        f"foreach($p in @({path_list})){{"
+        "$i=$p.LastIndexOf('\\');"
+        "$f=$p.Substring(0,[Math]::Max($i,1));$n=$p.Substring($i+1);"
+        "$o=[ordered]@{task=$p;found=$true;ok=$false;error=$null};"
+        "try{$d=$s.GetFolder($f);$t=$d.GetTask($n)}catch{"
+        "if($missing -contains $_.Exception.HResult){$o.found=$false}"
+        "else{$o.error=$_.Exception.Message};"
+        "$r+=[pscustomobject]$o;continue};"
+        f"try{{{operation};$o.ok=$true}}catch{{$o.error=$_.Exception.Message}};"
+        "$r+=[pscustomobject]$o};"
+        "ConvertTo-Json -InputObject @($r) -Compress"
+    )
+
+
+class TaskBackend(abc.ABC):
+    """!
+    @brief Interface for backends that disable or delete tasks in bulk.
+    """
+
+    name = "abstract"
+
+    @abc.abstractmethod
+    def apply(self, tasks: Sequence[str], *, action: str) -> list[TaskOutcome]:
+        """!
+        @brief Apply ``action`` (``disable`` or ``delete``) to every task.
+        @returns One outcome per task, in input order.
+        @throws OSError When the backend cannot be used at all.
+        """
+
+
+class ScheduleServiceBackend(TaskBackend):
+    """!
+    @brief :class:`TaskBackend` driving ``Schedule.Service`` from one PowerShell run.
+    """
+
+    name = "schedule-service"
+
+    def __init__(
+        self,
+        *,
+        tasks_root: str | Path | None = None,
+        timeout: int = DEFAULT_BATCH_TIMEOUT,
+    ) -> None:
+        self._tasks_root = tasks_root
+        self._timeout = timeout
+
+    def _registered(
+        self, folders: Sequence[str]
+    ) -> tuple[dict[str, RegisteredTask] | None, set[str]]:
+        """!
+        @brief List the tasks directly inside ``folders``, each folder read once.
+        @returns ``(None, set())`` when the task tree is not available at all.
+        """
+
+        root = Path(self._tasks_root) if self._tasks_root is not None else default_tasks_root()
+        if not root.is_dir():
+            return None, set()
+        try:
+            return _scan_task_folders(root, folders, recursive=False)
+        except OSError:
+            return None, set()
+
+    def apply(self, tasks: Sequence[str], *, action: str) -> list[TaskOutcome]:
+        if action not in _ACTIONS:
+            raise ValueError(f"Unsupported task action: {action}")
+        outcomes = [TaskOutcome(task=task) for task in tasks]
+        if not outcomes:
+            return outcomes
+
+        paths = [normalize_task_path(task) for task in tasks]
+        folders = [path.rsplit("\\", 1)[0] or "\\" for path in paths]
+        registered, unreadable = self._registered(folders)
+        pending: list[int] = []
+        for index, path in enumerate(paths):
+            if folders[index].lower() in unreadable:
+                outcomes[index].error = "task folder is not readable"
+            elif registered is not None and path.lower() not in registered:
+                outcomes[index].found = False
+            else:
+                pending.append(index)
+        if not pending:
+            return outcomes
+
+        batch = list(dict.fromkeys(paths[index] for index in pending))
+        result = exec_utils.run_command(
+            ["powershell.exe", "-NoProfile", "-NonInteractive", "-Command"]
+            + [build_batch_script(batch, action)],
+            event=f"task_{action}_batch",
+            timeout=self._timeout,
+            extra={"tasks": batch},
+        )
+        if result.returncode == 127 or result.timed_out:
+            raise OSError(result.returncode, f"PowerShell task {action} batch did not run")
+        try:
+            payload = json.loads(result.stdout.strip() or "[]")
+        except json.JSONDecodeError as exc:
+            raise OSError(result.returncode, f"Unparsable task batch output: {exc}") from exc
+        if isinstance(payload, dict):
+            payload = [payload]
+
+        reported = {
+            str(item.get("task", "")).lower(): item for item in payload if isinstance(item, dict)
+        }
+        for index in pending:
+            outcome = outcomes[index]
+            item = reported.get(paths[index].lower())
+            if item is None:
+                outcome.error = "no result reported"
+                continue
+            if not item.get("found", True):
+                outcome.found = False
+            elif item.get("ok"):
+                if action == "delete":
+                    outcome.deleted = True
+                else:
+                    outcome.disabled = True
+            else:
+                outcome.error = str(item.get("error") or "operation failed")
+        return outcomes
+
+
+def default_backend() -> TaskBackend | None:
+    """!
+    @brief Return the native backend for this host, or ``None`` when unavailable.
+    """
+
+    if os.name != "nt":
+        return None
+    return ScheduleServiceBackend()
+
+
+__all__ = [
+    "DEFAULT_BATCH_TIMEOUT",
+    "RegisteredTask",
+    "ScheduleServiceBackend",
+    "TaskBackend",
+    "TaskOutcome",
+    "build_batch_script",
+    "default_backend",
+    "default_tasks_root",
+    "list_registered_tasks",
+    "normalize_task_path",
+]
@@ -2,8 +2,11 @@
 @brief Scheduled task and service management utilities.
 @details Wraps ``schtasks.exe`` and ``sc.exe`` to disable/delete scheduled
 Office tasks, stop/start related services, and poll service state with
-retry-aware logging. The helpers mirror OffScrub automation semantics while
-respecting dry-run and timeout safeguards.
+retry-aware logging. Bulk task changes prefer the batched backend in
+:mod:`task_scheduler` and bulk service shutdown prefers the native Service
+Control Manager backend in :mod:`service_control`. The helpers mirror
+OffScrub automation semantics while respecting dry-run and timeout
+safeguards.
 """
 
 from __future__ import annotations
@@ -12,93 +15,167 @@ import time
 from collections.abc import Iterable, Iterator, Sequence
 from contextlib import contextmanager
 
-from . import constants, exec_utils, logging_ext, safety
+from . import constants, exec_utils, logging_ext, safety, service_control, task_scheduler
 
+_TASK_ACTION_VERBS = {"disable": "Disabled", "delete": "Deleted"}
 
-def disable_tasks(task_names: Iterable[str], *, dry_run: bool = False) -> None:
+
+def _schtasks_task_action(task: str, action: str, *, dry_run: bool) -> task_scheduler.TaskOutcome:
+    """!
+    @brief Apply ``action`` to one task with ``schtasks.exe``.
+    """
+
+    human_logger = logging_ext.get_human_logger()
+    if action == "delete":
+        command = ["schtasks.exe", "/Delete", "/TN", task, "/F"]
+        human_message = f"Deleting scheduled task {task}"
+    else:
+        command = ["schtasks.exe", "/Change", "/TN", task, "/Disable"]
+        human_message = f"Disabling scheduled task {task}"
+
+    outcome = task_scheduler.TaskOutcome(task=task)
+    result = exec_utils.run_command(
+        command,
+        event=f"task_{action}",
+        timeout=60,
+        dry_run=dry_run,
+        human_message=human_message,
+        extra={"task": task},
+    )
+
+    if result.skipped:
+        outcome.skipped = True
+        return outcome
+
+    if result.returncode == 127:
+        human_logger.debug("schtasks.exe unavailable; cannot %s %s", action, task)
+        outcome.error = "schtasks.exe unavailable"
+        return outcome
+
+    if result.returncode == 0 and not result.error:
+        human_logger.info("%s scheduled task %s", _TASK_ACTION_VERBS[action], task)
+        if action == "delete":
+            outcome.deleted = True
+        else:
+            outcome.disabled = True
+    else:
+        human_logger.debug(
+            "schtasks exited with %s for %s: %s",
+            result.returncode,
+            task,
+            result.stderr.strip(),
+        )
+        outcome.error = f"schtasks exited with {result.returncode}"
+    return outcome
+
+
+def _apply_task_action(
+    task_names: Iterable[str],
+    action: str,
+    *,
+    dry_run: bool,
+    backend: task_scheduler.TaskBackend | None,
+) -> list[task_scheduler.TaskOutcome]:
+    """!
+    @brief Apply ``action`` to every task through one backend session.
+    @details Tasks the native backend could not act on, or every task when no
+    backend is available or ``dry_run`` is set, go through ``schtasks.exe``.
+    """
+
+    human_logger = logging_ext.get_human_logger()
+    tasks: list[str] = [name for name in (str(name).strip() for name in task_names) if name]
+    outcomes: dict[int, task_scheduler.TaskOutcome] = {}
+
+    native = None if dry_run else (backend or task_scheduler.default_backend())
+    if native is not None and tasks:
+        started = time.perf_counter()
+        try:
+            batch = native.apply(tasks, action=action)
+        except OSError as exc:
+            human_logger.debug("Native task %s unavailable (%s); using schtasks.exe", action, exc)
+            batch = []
+        for index, outcome in enumerate(batch):
+            if outcome.error:
+                human_logger.debug(
+                    "Native %s failed for %s: %s", action, outcome.task, outcome.error
+                )
+                continue
+            outcomes[index] = outcome
+            if not outcome.found:
+                human_logger.debug("Scheduled task %s is not registered", outcome.task)
+            else:
+                human_logger.info("%s scheduled task %s", _TASK_ACTION_VERBS[action], outcome.task)
+        if batch:
+            logging_ext.get_machine_logger().info(
+                "task_batch",
+                extra={
+                    "event": "task_batch",
+                    "action": action,
+                    "backend": native.name,
+                    "tasks": len(batch),
+                    "missing": sum(1 for outcome in batch if not outcome.found),
+                    "fallback": [outcome.task for outcome in batch if outcome.error],
+                    "duration": round(time.perf_counter() - started, 6),
+                },
+            )
+
+    for index, task in enumerate(tasks):
+        if index not in outcomes:
+            outcomes[index] = _schtasks_task_action(task, action, dry_run=dry_run)
+    return [outcomes[index] for index in range(len(tasks))]
+
+
+def disable_tasks(
+    task_names: Iterable[str],
+    *,
+    dry_run: bool = False,
+    backend: task_scheduler.TaskBackend | None = None,
+) -> list[task_scheduler.TaskOutcome]:
     """!
     @brief Disable scheduled tasks linked to Office components.
-    @details Executes ``schtasks /Change /Disable`` unless ``dry_run`` is set.
+    @details Disables every task in one native Task Scheduler session and
+    falls back to ``schtasks /Change /Disable`` per task when the backend is
+    unavailable or fails for a task. ``dry_run`` only logs the intended action.
     @param task_names Iterable of task paths to disable.
     @param dry_run When ``True`` just logs the intended action.
+    @param backend Optional backend override; defaults to
+    :func:`task_scheduler.default_backend`.
+    @returns One :class:`task_scheduler.TaskOutcome` per task.
     """
 
-    human_logger = logging_ext.get_human_logger()
     if not safety.should_execute_destructive_action(
         "scheduled task disable",
         dry_run=dry_run,
     ):
         dry_run = True
 
-    tasks: list[str] = [name for name in (str(name).strip() for name in task_names) if name]
-    for task in tasks:
-        result = exec_utils.run_command(
-            ["schtasks.exe", "/Change", "/TN", task, "/Disable"],
-            event="task_disable",
-            timeout=60,
-            dry_run=dry_run,
-            human_message=f"Disabling scheduled task {task}",
-            extra={"task": task},
-        )
-
-        if result.skipped:
-            continue
+    return _apply_task_action(task_names, "disable", dry_run=dry_run, backend=backend)
 
-        if result.returncode == 127:
-            human_logger.debug("schtasks.exe unavailable; cannot disable %s", task)
-            continue
 
-        if result.returncode == 0 and not result.error:
-            human_logger.info("Disabled scheduled task %s", task)
-        else:
-            human_logger.debug(
-                "schtasks exited with %s for %s: %s",
-                result.returncode,
-                task,
-                result.stderr.strip(),
-            )
-
-
-def delete_tasks(task_names: Sequence[str], *, dry_run: bool = False) -> None:
+def delete_tasks(
+    task_names: Sequence[str],
+    *,
+    dry_run: bool = False,
+    backend: task_scheduler.TaskBackend | None = None,
+) -> list[task_scheduler.TaskOutcome]:
     """!
     @brief Delete scheduled tasks using ``schtasks /Delete`` semantics.
+    @details Deletes every task in one native Task Scheduler session, falling
+    back to ``schtasks /Delete`` per task.
     @param task_names Tasks to remove.
     @param dry_run When ``True`` skip executing the command.
+    @param backend Optional backend override; defaults to
+    :func:`task_scheduler.default_backend`.
+    @returns One :class:`task_scheduler.TaskOutcome` per task.
     """
 
-    human_logger = logging_ext.get_human_logger()
     if not safety.should_execute_destructive_action(
         "scheduled task deletion",
         dry_run=dry_run,
     ):
         dry_run = True
 
-    for task in (str(name).strip() for name in task_names if str(name).strip()):
-        result = exec_utils.run_command(
-            ["schtasks.exe", "/Delete", "/TN", task, "/F"],
-            event="task_delete",
-            timeout=60,
-            dry_run=dry_run,
-            human_message=f"Deleting scheduled task {task}",
-            extra={"task": task},
-        )
-
-        if result.skipped:
-            continue
-
-        if result.returncode == 127:
-            human_logger.debug("schtasks.exe unavailable; cannot delete %s", task)
-            continue
-
-        if result.returncode == 0 and not result.error:
-            human_logger.info("Deleted scheduled task %s", task)
-        else:
-            human_logger.debug(
-                "schtasks exited with %s for %s: %s",
-                result.returncode,
-                task,
-                result.stderr.strip(),
-            )
+    return _apply_task_action(task_names, "delete", dry_run=dry_run, backend=backend)
 
 
 _PENDING_REBOOT_SERVICES: set[str] = set()
@@ -176,77 +253,167 @@ def suppress_reboot_recommendations(enabled: bool = True) -> Iterator[None]:
         _SUPPRESS_REBOOT_RECOMMENDATIONS = previous
 
 
-def stop_services(service_names: Iterable[str], *, timeout: int = 30) -> dict[str, object]:
+def _flag_stop_timeout(service: str, reboot_services: list[str]) -> None:
     """!
-    @brief Stop services that keep Office components resident.
-    @details Issues ``sc stop`` followed by ``sc config start= disabled`` to
-    prevent restarts during cleanup.
-    @param service_names Iterable of service names.
-    @param timeout Maximum seconds for each subprocess call.
-    @returns Dictionary containing ``reboot_required`` and
-    ``services_requiring_reboot`` flags for downstream summaries.
+    @brief Record a service that did not stop in time as requiring a reboot.
+    """
+
+    reboot_services.append(service)
+    _record_reboot_recommendation(service)
+    logging_ext.get_human_logger().warning(
+        "Timed out stopping service %s; recommend reboot to finish shutting it down.",
+        service,
+    )
+    logging_ext.get_machine_logger().warning(
+        "service_stop_timeout",
+        extra={
+            "event": "service_stop_timeout",
+            "service": service,
+            "reboot_required": True,
+        },
+    )
+
+
+def _stop_service_with_sc(service: str, *, timeout: int, reboot_services: list[str]) -> None:
+    """!
+    @brief Stop and disable ``service`` through two ``sc.exe`` invocations.
     """
 
     human_logger = logging_ext.get_human_logger()
-    machine_logger = logging_ext.get_machine_logger()
 
-    services: list[str] = [name for name in (str(name).strip() for name in service_names) if name]
-    reboot_services: list[str] = []
+    stop_result = exec_utils.run_command(
+        ["sc.exe", "stop", service],
+        event="service_stop",
+        timeout=timeout,
+        human_message=f"Stopping service {service}",
+        extra={"service": service},
+    )
 
-    for service in services:
-        stop_result = exec_utils.run_command(
-            ["sc.exe", "stop", service],
-            event="service_stop",
-            timeout=timeout,
-            human_message=f"Stopping service {service}",
-            extra={"service": service},
-        )
+    if stop_result.returncode == 127:
+        human_logger.debug("sc.exe unavailable; cannot stop %s", service)
+        return
 
-        if stop_result.returncode == 127:
-            human_logger.debug("sc.exe unavailable; cannot stop %s", service)
-            continue
+    if stop_result.timed_out:
+        _flag_stop_timeout(service, reboot_services)
 
-        if stop_result.timed_out:
-            reboot_services.append(service)
-            _record_reboot_recommendation(service)
-            human_logger.warning(
-                "Timed out stopping service %s; recommend reboot to finish shutting it down.",
-                service,
-            )
-            machine_logger.warning(
-                "service_stop_timeout",
-                extra={
-                    "event": "service_stop_timeout",
-                    "service": service,
-                    "reboot_required": True,
-                },
-            )
+    if stop_result.returncode == 0 and not stop_result.error:
+        human_logger.info("Stopped service %s", service)
+    else:
+        human_logger.debug("Service %s stop returned %s", service, stop_result.returncode)
 
-        if stop_result.returncode == 0 and not stop_result.error:
-            human_logger.info("Stopped service %s", service)
-        else:
-            human_logger.debug("Service %s stop returned %s", service, stop_result.returncode)
+    disable_result = exec_utils.run_command(
+        ["sc.exe", "config", service, "start=", "disabled"],
+        event="service_disable",
+        timeout=timeout,
+        human_message=f"Disabling service {service}",
+        extra={"service": service},
+    )
 
-        disable_result = exec_utils.run_command(
-            ["sc.exe", "config", service, "start=", "disabled"],
-            event="service_disable",
-            timeout=timeout,
-            human_message=f"Disabling service {service}",
-            extra={"service": service},
-        )
+    if disable_result.returncode == 127:
+        human_logger.debug("sc.exe unavailable; cannot disable %s", service)
+        return
 
-        if disable_result.returncode == 127:
-            human_logger.debug("sc.exe unavailable; cannot disable %s", service)
-            continue
+    if disable_result.timed_out:
+        human_logger.warning("Timed out disabling service %s", service)
+        return
 
-        if disable_result.timed_out:
-            human_logger.warning("Timed out disabling service %s", service)
-            continue
+    if disable_result.returncode == 0 and not disable_result.error:
+        human_logger.info("Configured service %s to be disabled", service)
+    else:
+        human_logger.debug("Service %s disable returned %s", service, disable_result.returncode)
+
+
+def _stop_services_native(
+    controller: service_control.ServiceController,
+    services: Sequence[str],
+    *,
+    timeout: int,
+    reboot_services: list[str],
+) -> list[str]:
+    """!
+    @brief Stop ``services`` through ``controller`` with one shared deadline.
+    @returns Services the controller could not act on, to be retried with ``sc.exe``.
+    """
 
-        if disable_result.returncode == 0 and not disable_result.error:
+    human_logger = logging_ext.get_human_logger()
+    started = time.perf_counter()
+    outcomes = controller.stop_and_disable(services, timeout=timeout)
+
+    fallback: list[str] = []
+    for outcome in outcomes:
+        service = outcome.service
+        if not outcome.found:
+            human_logger.debug("Service %s is not installed", service)
+            continue
+        if outcome.error:
+            human_logger.debug("Native stop failed for %s: %s", service, outcome.error)
+            fallback.append(service)
+            continue
+        if outcome.timed_out:
+            _flag_stop_timeout(service, reboot_services)
+        elif outcome.stopped:
+            human_logger.info("Stopped service %s", service)
+        if outcome.disabled:
             human_logger.info("Configured service %s to be disabled", service)
         else:
-            human_logger.debug("Service %s disable returned %s", service, disable_result.returncode)
+            human_logger.debug("Service %s could not be configured as disabled", service)
+
+    logging_ext.get_machine_logger().info(
+        "service_stop_batch",
+        extra={
+            "event": "service_stop_batch",
+            "backend": controller.name,
+            "services": len(outcomes),
+            "stopped": sum(1 for outcome in outcomes if outcome.stopped),
+            "missing": sum(1 for outcome in outcomes if not outcome.found),
+            "timed_out": sum(1 for outcome in outcomes if outcome.timed_out),
+            "fallback": fallback,
+            "duration": round(time.perf_counter() - started, 6),
+        },
+    )
+    return fallback
+
+
+def stop_services(
+    service_names: Iterable[str],
+    *,
+    timeout: int = 30,
+    controller: service_control.ServiceController | None = None,
+) -> dict[str, object]:
+    """!
+    @brief Stop services that keep Office components resident.
+    @details Services are disabled and stopped together through the native
+    Service Control Manager backend, waiting on all of them with one shared
+    ``timeout``. When no native backend is available (or it cannot act on a
+    service) the helper falls back to ``sc stop`` followed by
+    ``sc config start= disabled`` per service.
+    @param service_names Iterable of service names.
+    @param timeout Shared deadline in seconds for the native backend, or the
+    maximum seconds for each ``sc.exe`` call on the fallback path.
+    @param controller Optional backend override; defaults to
+    :func:`service_control.default_controller`.
+    @returns Dictionary containing ``reboot_required`` and
+    ``services_requiring_reboot`` flags for downstream summaries.
+    """
+
+    services: list[str] = [name for name in (str(name).strip() for name in service_names) if name]
+    reboot_services: list[str] = []
+
+    remaining = services
+    backend = controller if controller is not None else service_control.default_controller()
+    if backend is not None and services:
+        try:
+            remaining = _stop_services_native(
+                backend, services, timeout=timeout, reboot_services=reboot_services
+            )
+        except OSError as exc:
+            logging_ext.get_human_logger().debug(
+                "Native service control unavailable (%s); falling back to sc.exe", exc
+            )
+            remaining = services
+
+    for service in remaining:
+        _stop_service_with_sc(service, timeout=timeout, reboot_services=reboot_services)
 
     unique_reboot_services = list(dict.fromkeys(reboot_services))
 
@@ -266,15 +433,17 @@ def start_services(service_names: Iterable[str], *, timeout: int = 30) -> None:
     human_logger = logging_ext.get_human_logger()
 
     services: list[str] = [name for name in (str(name).strip() for name in service_names) if name]
-    for service in services:
-        result = exec_utils.run_command(
+    results = exec_utils.run_commands(
+        exec_utils.CommandSpec(
             ["sc.exe", "start", service],
             event="service_start",
             timeout=timeout,
             human_message=f"Starting service {service}",
             extra={"service": service},
         )
-
+        for service in services
+    )
+    for service, result in zip(services, results):
         if result.returncode == 127:
             human_logger.debug("sc.exe unavailable; cannot start %s", service)
             continue
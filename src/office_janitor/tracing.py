@@ -0,0 +1,217 @@
+"""!
+@brief Lightweight hierarchical span tracer with Chrome ``trace_event`` export.
+@details Spans are opened with the :func:`span` context manager or the
+:func:`traced` decorator and record their thread, parent span and attributes.
+Tracing is off by default: a disabled :func:`span` returns a shared no-op
+context and a :func:`traced` wrapper calls straight through after a single
+flag check, so instrumented hot paths cost next to nothing. ``--trace FILE``
+enables the tracer for one run and :func:`export_chrome` writes the recorded
+spans as a JSON document that Perfetto or ``chrome://tracing`` can open.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_ENABLED = False
+_LOCK = threading.Lock()
+_EVENTS: list[dict[str, Any]] = []
+_THREAD_NAMES: dict[int, str] = {}
+_IDS = itertools.count(1)
+_LOCAL = threading.local()
+_ORIGIN_NS = time.perf_counter_ns()
+_NULL_SPAN: contextlib.nullcontext[None] = contextlib.nullcontext()
+
+
+def enable() -> None:
+    """!
+    @brief Start recording spans; previously recorded spans are discarded.
+    """
+
+    global _ENABLED, _ORIGIN_NS
+    reset()
+    _ORIGIN_NS = time.perf_counter_ns()
+    _ENABLED = True
+
+
+def disable() -> None:
+    """!
+    @brief Stop recording spans; recorded spans stay available for export.
+    """
+
+    global _ENABLED
+    _ENABLED = False
+
+
+def is_enabled() -> bool:
+    """!
+    @brief Report whether spans are currently being recorded.
+    """
+
+    return _ENABLED
+
+
+def reset() -> None:
+    """!
+    @brief Drop every recorded span.
+    """
+
+    with _LOCK:
+        _EVENTS.clear()
+        _THREAD_NAMES.clear()
+
+
+def _stack() -> list[int]:
+    stack: list[int] | None = getattr(_LOCAL, "stack", None)
+    if stack is None:
+        stack = []
+        _LOCAL.stack = stack
+    return stack
+
+
+def current_span_id() -> int | None:
+    """!
+    @brief Return the id of the innermost open span on this thread.
+    @details Pass it as ``parent`` to spans opened on worker threads so they
+    nest under the span that scheduled them.
+    """
+
+    if not _ENABLED:
+        return None
+    stack = _stack()
+    return stack[-1] if stack else None
+
+
+@contextlib.contextmanager
+def _record(name: str, parent: int | None, attributes: dict[str, Any]) -> Iterator[None]:
+    span_id = next(_IDS)
+    stack = _stack()
+    parent_id = parent if parent is not None else (stack[-1] if stack else None)
+    thread = threading.current_thread()
+    stack.append(span_id)
+    start = time.perf_counter_ns()
+    error: str | None = None
+    try:
+        yield
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        end = time.perf_counter_ns()
+        stack.pop()
+        args: dict[str, Any] = {"span_id": span_id, "parent_id": parent_id}
+        args.update(attributes)
+        if error is not None:
+            args["error"] = error
+        event = {
+            "name": name,
+            "cat": name.partition(".")[0],
+            "ph": "X",
+            "ts": (start - _ORIGIN_NS) / 1000.0,
+            "dur": (end - start) / 1000.0,
+            "pid": os.getpid(),
+            "tid": thread.ident or 0,
+            "args": args,
+        }
+        with _LOCK:
+            _EVENTS.append(event)
+            _THREAD_NAMES.setdefault(thread.ident or 0, thread.name)
+
+
+def span(
+    name: str, *, parent: int | None = None, **attributes: Any
+) -> contextlib.AbstractContextManager[None]:
+    """!
+    @brief Time the enclosed block as a span called ``name``.
+    @param parent Explicit parent span id; defaults to the innermost span open
+    on the current thread.
+    @param attributes JSON-serialisable values stored with the span.
+    """
+
+    if not _ENABLED:
+        return _NULL_SPAN
+    return _record(name, parent, attributes)
+
+
+def traced(name: str | None = None, *, capture: Sequence[str] = ()) -> Callable[[_F], _F]:
+    """!
+    @brief Decorate a function so every call is recorded as a span.
+    @param name Span name; defaults to ``module.qualname`` of the function.
+    @param capture Keyword argument names copied into the span attributes.
+    """
+
+    def decorator(func: _F) -> _F:
+        span_name = name or f"{func.__module__.rpartition('.')[2]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            attributes = {key: _attribute(kwargs[key]) for key in capture if key in kwargs}
+            with _record(span_name, None, attributes):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _attribute(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def events() -> list[dict[str, Any]]:
+    """!
+    @brief Return a copy of the recorded span events.
+    """
+
+    with _LOCK:
+        return [dict(event) for event in _EVENTS]
+
+
+def export_chrome(path: str | Path) -> Path:
+    """!
+    @brief Write the recorded spans as a Chrome ``trace_event`` JSON document.
+    @details Complete (``"X"``) events are sorted by start time and preceded
+    by ``thread_name`` metadata so each worker thread gets a labelled track.
+    """
+
+    with _LOCK:
+        recorded = sorted(_EVENTS, key=lambda event: event["ts"])
+        threads = dict(_THREAD_NAMES)
+    pid = os.getpid()
+    metadata = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": label}}
+        for tid, label in threads.items()
+    ]
+    target = Path(path).expanduser()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"traceEvents": metadata + recorded, "displayTimeUnit": "ms"}
+    target.write_text(json.dumps(payload, default=str), encoding="utf-8")
+    return target
+
+
+__all__ = [
+    "current_span_id",
+    "disable",
+    "enable",
+    "events",
+    "export_chrome",
+    "is_enabled",
+    "reset",
+    "span",
+    "traced",
+]
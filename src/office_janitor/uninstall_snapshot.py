@@ -0,0 +1,133 @@
+"""!
+@brief Shared, lazily populated view of the ARP ``Uninstall`` registry roots.
+@details Several detection routines need the same ``Uninstall`` keys: MSI
+detection looks up known product codes, the Control Panel scan walks every
+entry, and the orphaned-product scan only needs the subkey names. An
+:class:`UninstallSnapshot` enumerates each root (merged across WOW64 views)
+exactly once, reads an entry's values only when a consumer first asks for
+them, and answers membership questions with dictionary lookups. A detection
+run installs one snapshot through :func:`scope` so its worker threads share it
+instead of traversing the registry again.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from . import registry_tools
+
+
+class UninstallSnapshot:
+    """!
+    @brief Thread-safe cache of ``Uninstall`` subkey names and their values.
+    @details Roots are enumerated on first use. A root that cannot be
+    enumerated reports ``None`` so callers can fall back to direct reads;
+    only a successfully enumerated root is trusted to prove a key is absent.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subkeys: dict[tuple[int, str], dict[str, str] | None] = {}
+        self._values: dict[tuple[int, str, str], dict[str, Any]] = {}
+
+    def subkeys(self, hive: int, base: str) -> dict[str, str] | None:
+        """!
+        @brief Return ``{lowercase name: name}`` for the subkeys of ``hive\\base``.
+        @returns ``None`` when the root could not be enumerated.
+        """
+
+        root = (hive, base.lower())
+        with self._lock:
+            if root in self._subkeys:
+                return self._subkeys[root]
+        try:
+            names: dict[str, str] | None = {
+                name.lower(): name for name in registry_tools.iter_subkeys(hive, base)
+            }
+        except OSError:
+            names = None
+        with self._lock:
+            return self._subkeys.setdefault(root, names)
+
+    def contains(self, hive: int, base: str, name: str) -> bool | None:
+        """!
+        @brief Report whether ``name`` is a subkey of ``hive\\base``.
+        @returns ``None`` when the root could not be enumerated.
+        """
+
+        names = self.subkeys(hive, base)
+        if names is None:
+            return None
+        return name.lower() in names
+
+    def values(self, hive: int, base: str, name: str) -> dict[str, Any]:
+        """!
+        @brief Return the values of ``hive\\base\\name``, reading them at most once.
+        """
+
+        cache_key = (hive, base.lower(), name.lower())
+        with self._lock:
+            cached = self._values.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        names = self.subkeys(hive, base) or {}
+        actual = names.get(name.lower(), name)
+        try:
+            values = registry_tools.read_values(hive, f"{base}\\{actual}")
+        except OSError:
+            values = {}
+        with self._lock:
+            self._values.setdefault(cache_key, values)
+        return dict(values)
+
+    def entries(self, hive: int, base: str) -> Iterator[str]:
+        """!
+        @brief Yield the subkey names of ``hive\\base`` in enumeration order.
+        """
+
+        yield from (self.subkeys(hive, base) or {}).values()
+
+
+_ACTIVE: UninstallSnapshot | None = None
+_ACTIVE_LOCK = threading.Lock()
+
+
+@contextmanager
+def scope(snapshot: UninstallSnapshot | None = None) -> Iterator[UninstallSnapshot]:
+    """!
+    @brief Share one snapshot with every :func:`current` caller inside the block.
+    @details The snapshot is process wide for the duration of the block so
+    detection worker threads see it too; the previous snapshot (if any) is
+    restored on exit.
+    """
+
+    global _ACTIVE
+    active = snapshot if snapshot is not None else UninstallSnapshot()
+    with _ACTIVE_LOCK:
+        previous = _ACTIVE
+        _ACTIVE = active
+    try:
+        yield active
+    finally:
+        with _ACTIVE_LOCK:
+            _ACTIVE = previous
+
+
+def current() -> UninstallSnapshot:
+    """!
+    @brief Return the snapshot of the active detection run, or a fresh one.
+    """
+
+    with _ACTIVE_LOCK:
+        active = _ACTIVE
+    return active if active is not None else UninstallSnapshot()
+
+
+__all__ = [
+    "UninstallSnapshot",
+    "current",
+    "scope",
+]
@@ -0,0 +1,57 @@
+"""!
+@brief Stand-in PowerShell host speaking the ``powershell_host`` frame protocol.
+@details Used by ``test_powershell_host.py`` on hosts without PowerShell. The
+first stdin line (the bootstrap script) is ignored; each request script is a
+tiny command: ``echo TEXT``, ``fail CODE``, ``sleep SECONDS``, ``crash``,
+``noise`` (stray output before the frame) or ``pid``.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import sys
+import time
+
+PREFIX = "<<OJ-PS>>"
+
+
+def _frame(payload: dict) -> None:
+    sys.stdout.write(PREFIX + json.dumps(payload) + "\n")
+    sys.stdout.flush()
+
+
+def _b64(text: str) -> str:
+    return base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def main() -> int:
+    sys.stdin.readline()  # bootstrap
+    _frame({"ready": os.getpid()})
+    for line in sys.stdin:
+        request = json.loads(line)
+        script = base64.b64decode(request["script"]).decode("utf-8")
+        verb, _, argument = script.partition(" ")
+        code, stdout, stderr = 0, "", ""
+        if verb == "echo":
+            stdout = argument + "\n"
+        elif verb == "fail":
+            code, stderr = int(argument), "failed\n"
+        elif verb == "sleep":
+            time.sleep(float(argument))
+        elif verb == "crash":
+            return 3
+        elif verb == "noise":
+            sys.stdout.write("stray console output ")
+            stdout = "ok\n"
+        elif verb == "pid":
+            stdout = f"{os.getpid()}\n"
+        else:
+            code, stderr = 1, f"unknown script: {script}\n"
+        _frame({"id": request["id"], "code": code, "stdout": _b64(stdout), "stderr": _b64(stderr)})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,172 @@
+"""!
+@brief Tests for the offline benchmark harness in ``benchmarks/``.
+@details Checks that the synthetic registry behaves like ``winreg`` for the
+registry helpers, that the fake subprocess layer records spawns and applies
+latency, and that report comparison flags regressions.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import time
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+for _path in (SRC_PATH, PROJECT_ROOT):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from benchmarks import harness, synthetic_fs  # noqa: E402
+from benchmarks.fake_subprocess import CannedResult, FakeProcessLayer  # noqa: E402
+from benchmarks.synthetic_registry import (  # noqa: E402
+    HKEY_CLASSES_ROOT,
+    HKEY_LOCAL_MACHINE,
+    MachineProfile,
+    SyntheticRegistry,
+    populate_office_machine,
+)
+from office_janitor import exec_utils, powershell_host, registry_tools  # noqa: E402
+
+
+def _report(**medians: float) -> dict:
+    return {
+        "format": harness.REPORT_FORMAT,
+        "benchmarks": {name: {"median": value} for name, value in medians.items()},
+    }
+
+
+def test_synthetic_registry_serves_registry_tools(monkeypatch) -> None:
+    """!
+    @brief ``iter_subkeys``/``read_values`` should see keys added to the fake.
+    """
+
+    registry = SyntheticRegistry()
+    registry.add_key(
+        HKEY_LOCAL_MACHINE,
+        r"SOFTWARE\Microsoft\Office\16.0\Common",
+        {"Version": "16.0", "Flags": 3},
+    )
+    registry.add_key(HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Office\ClickToRun")
+    monkeypatch.setattr(registry_tools, "winreg", registry)
+
+    subkeys = list(registry_tools.iter_subkeys(HKEY_LOCAL_MACHINE, r"software\microsoft\office"))
+    common = r"SOFTWARE\Microsoft\Office\16.0\Common"
+    values = registry_tools.read_values(HKEY_LOCAL_MACHINE, common)
+
+    assert subkeys == ["16.0", "ClickToRun"]
+    assert values == {"Flags": 3, "Version": "16.0"}
+    assert registry.calls["OpenKey"] >= 2
+
+
+def test_synthetic_registry_delete_and_restore() -> None:
+    """!
+    @brief ``DeleteKey`` refuses non-empty keys and ``restore`` undoes writes.
+    """
+
+    registry = SyntheticRegistry()
+    registry.add_key(HKEY_LOCAL_MACHINE, r"SOFTWARE\Contoso\Child", {"Name": "value"})
+    snapshot = registry.snapshot(HKEY_LOCAL_MACHINE, r"SOFTWARE\Contoso")
+    before = registry.QueryInfoKey(registry.OpenKey(HKEY_LOCAL_MACHINE, "SOFTWARE"))[2]
+
+    with pytest.raises(PermissionError):
+        registry.DeleteKey(HKEY_LOCAL_MACHINE, r"SOFTWARE\Contoso")
+    registry.DeleteKey(HKEY_LOCAL_MACHINE, r"SOFTWARE\Contoso\Child")
+    registry.DeleteKey(HKEY_LOCAL_MACHINE, r"SOFTWARE\Contoso")
+    after = registry.QueryInfoKey(registry.OpenKey(HKEY_LOCAL_MACHINE, "SOFTWARE"))[2]
+    assert after > before
+
+    registry.restore(HKEY_LOCAL_MACHINE, r"SOFTWARE\Contoso", snapshot)
+    handle = registry.OpenKey(HKEY_LOCAL_MACHINE, r"SOFTWARE\Contoso\Child")
+    assert registry.QueryValueEx(handle, "name") == ("value", registry.REG_SZ)
+
+
+def test_populated_machine_has_office_published_components(monkeypatch) -> None:
+    """!
+    @brief The generated Published Components include Office entries to strip.
+    """
+
+    registry = SyntheticRegistry()
+    profile = MachineProfile(office_products=10, other_products=20, components=200)
+    summary = populate_office_machine(registry, profile)
+    monkeypatch.setattr(registry_tools, "winreg", registry)
+
+    results = registry_tools.cleanup_published_components(dry_run=True)
+
+    assert len(summary["office_products"]) == 10
+    assert results["components_processed"] == 200
+    assert results["entries_removed"] > 0
+    components = registry.OpenKey(HKEY_CLASSES_ROOT, r"Installer\Components")
+    assert registry.QueryInfoKey(components)[0] == 200
+
+
+def test_fake_process_layer_records_and_delays(monkeypatch) -> None:
+    """!
+    @brief Commands routed through ``run_command`` hit the fake with its latency.
+    """
+
+    monkeypatch.setattr(powershell_host, "_ENABLED", False)
+    layer = FakeProcessLayer(latencies={"powershell": 0.05}, default_latency=0.0)
+    layer.results["powershell"] = CannedResult(returncode=0, stdout="ok")
+
+    with layer.installed():
+        start = time.perf_counter()
+        result = exec_utils.run_command(
+            [r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe", "-Command", "1"],
+            event="bench_test",
+        )
+        elapsed = time.perf_counter() - start
+        exec_utils.run_command(["reg.exe", "query", "HKLM"], event="bench_test")
+
+    assert result.returncode == 0
+    assert result.stdout == "ok"
+    assert elapsed >= 0.05
+    assert layer.spawn_counts() == {"powershell": 1, "reg": 1}
+
+
+def test_build_office_tree_creates_files(tmp_path) -> None:
+    """!
+    @brief The generated tree honours the profile's shape.
+    """
+
+    profile = synthetic_fs.TreeProfile(
+        roots=1, files_per_folder=2, nesting=1, large_files=1, large_file_size=16
+    )
+    roots = synthetic_fs.build_office_tree(tmp_path, profile)
+
+    assert [root.name for root in roots] == ["Microsoft Office 0"]
+    assert synthetic_fs.count_files(roots) == 8 * 2 * 2 + 1
+
+
+def test_compare_reports_flags_regressions() -> None:
+    """!
+    @brief Slowdowns beyond both the ratio and absolute floor are regressions.
+    """
+
+    baseline = _report(detect=1.0, plan=0.001, scrub=0.5)
+    current = _report(detect=1.4, plan=0.002, scrub=0.55, new=3.0)
+
+    comparisons = {
+        item.name: item for item in harness.compare_reports(current, baseline, threshold=0.25)
+    }
+
+    assert set(comparisons) == {"detect", "plan", "scrub"}
+    assert comparisons["detect"].regressed
+    assert not comparisons["plan"].regressed  # doubled, but under min_delta
+    assert not comparisons["scrub"].regressed
+
+
+def test_report_round_trip(tmp_path) -> None:
+    """!
+    @brief ``write_report``/``load_report`` round-trip and reject foreign files.
+    """
+
+    path = tmp_path / "results.json"
+    harness.write_report(_report(detect=1.0), path)
+    assert harness.load_report(path)["benchmarks"]["detect"]["median"] == 1.0
+
+    path.write_text('{"format": 99}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        harness.load_report(path)
@@ -16,6 +16,7 @@ from office_janitor import (  # noqa: E402
     fs_tools,
     licensing,
     logging_ext,
+    process_snapshot,
     processes,
     restore_point,
     tasks_services,
@@ -193,12 +194,50 @@ def test_remove_paths_deletes_entries(monkeypatch, tmp_path) -> None:
 
     monkeypatch.setattr(fs_tools, "make_paths_writable", fake_make)
     monkeypatch.setattr(fs_tools, "reset_acl", fake_reset)
-    fs_tools.remove_paths([deleted, file_entry])
+    fs_tools.remove_paths([deleted, file_entry, tmp_path / "missing"])
 
     assert not deleted.exists()
     assert not file_entry.exists()
-    assert calls == [deleted, file_entry]
-    assert attrib_calls
+    # Attributes are cleared in-process and ACLs are only reset on access denied.
+    assert calls == []
+    assert attrib_calls == []
+
+
+def test_remove_paths_walks_tree_and_resets_acl_on_denied(monkeypatch, tmp_path) -> None:
+    """!
+    @brief Tree removal clears read-only files and resets ACLs only where denied.
+    """
+
+    root = tmp_path / "root" / "Office16"
+    nested = root / "nested" / "deeper"
+    nested.mkdir(parents=True)
+    for index in range(20):
+        (nested / f"file{index}.dll").write_text("x", encoding="utf-8")
+    readonly = root / "readonly.dat"
+    readonly.write_text("x", encoding="utf-8")
+    readonly.chmod(0o444)
+    locked = root / "nested" / "locked.dll"
+    locked.write_text("x", encoding="utf-8")
+
+    resets: list[pathlib.Path] = []
+    real_unlink = fs_tools.os.unlink
+
+    def fake_unlink(path, *args, **kwargs):
+        if str(path) == str(locked) and not resets:
+            raise PermissionError("denied")
+        return real_unlink(path, *args, **kwargs)
+
+    def fail_make(paths, *, dry_run: bool = False):
+        raise AssertionError("attrib.exe should not run")
+
+    monkeypatch.setattr(fs_tools.os, "unlink", fake_unlink)
+    monkeypatch.setattr(fs_tools, "make_paths_writable", fail_make)
+    monkeypatch.setattr(fs_tools, "reset_acl", resets.append)
+
+    fs_tools.remove_paths([root], max_workers=4)
+
+    assert not root.exists()
+    assert resets == [root / "nested"]
 
 
 def test_remove_paths_dry_run(monkeypatch, tmp_path) -> None:
@@ -274,6 +313,7 @@ def test_terminate_office_processes_invokes_taskkill(monkeypatch, tmp_path) -> N
         commands.append([str(part) for part in command])
         return _command_result(command)
 
+    monkeypatch.setattr(process_snapshot, "take_snapshot", lambda: None)
     monkeypatch.setattr(processes.exec_utils, "run_command", fake_run)
     processes.terminate_office_processes(["winword.exe", "excel.exe"])
 
@@ -300,6 +340,7 @@ def test_enumerate_processes_filters_patterns(monkeypatch, tmp_path) -> None:
             ),
         )
 
+    monkeypatch.setattr(process_snapshot, "take_snapshot", lambda: None)
     monkeypatch.setattr(processes.exec_utils, "run_command", fake_run)
 
     matches = processes.enumerate_processes(["ose*.exe", "winword.exe", ""])
@@ -383,6 +424,7 @@ def test_terminate_process_patterns_uses_enumerator(monkeypatch, tmp_path) -> No
     def fake_terminate(names, *, timeout=30):
         killed.append(list(names))
 
+    monkeypatch.setattr(process_snapshot, "take_snapshot", lambda: None)
     monkeypatch.setattr(processes, "enumerate_processes", fake_enumerate)
     monkeypatch.setattr(processes, "terminate_office_processes", fake_terminate)
 
@@ -392,6 +434,95 @@ def test_terminate_process_patterns_uses_enumerator(monkeypatch, tmp_path) -> No
     assert killed == [["ose.exe", "integrator.exe"]]
 
 
+def _process_table() -> process_snapshot.ProcessSnapshot:
+    """!
+    @brief Build a small process table with a ``WINWORD.EXE`` tree.
+    """
+
+    entry = process_snapshot.ProcessEntry
+    return process_snapshot.ProcessSnapshot(
+        [
+            entry(pid=4, parent_pid=0, name="System", create_time=1),
+            entry(pid=100, parent_pid=4, name="WINWORD.EXE", session_id=1, create_time=10),
+            entry(pid=110, parent_pid=100, name="splwow64.exe", create_time=11),
+            entry(pid=111, parent_pid=110, name="conhost.exe", create_time=12),
+            entry(pid=200, parent_pid=4, name="ose.exe", session_id=0, create_time=20),
+            entry(pid=300, parent_pid=4, name="explorer.exe", create_time=2),
+            # Started before WINWORD.EXE reused PID 100: not part of its tree.
+            entry(pid=400, parent_pid=100, name="notepad.exe", create_time=5),
+            entry(pid=500, parent_pid=100, name="unknown.exe"),
+        ]
+    )
+
+
+def test_process_snapshot_matches_and_orders_trees() -> None:
+    """!
+    @brief Snapshot matching is case-insensitive and trees list children first.
+    @details Entries older than their recorded parent, or without a creation
+    time, are not adopted into the tree.
+    """
+
+    snapshot = _process_table()
+
+    assert snapshot.names(["ose*.exe", "winword.exe"]) == ["ose.exe", "winword.exe"]
+    assert [entry.pid for entry in snapshot.match(["WinWord.exe"])] == [100]
+    assert snapshot.tree([100, 999]) == [111, 110, 100]
+
+
+def test_terminate_office_processes_kills_snapshot_pids(monkeypatch, tmp_path) -> None:
+    """!
+    @brief With a snapshot, only live PIDs are killed and failures fall back to taskkill.
+    """
+
+    logging_ext.setup_logging(tmp_path)
+    killed: list[list[int]] = []
+    commands: list[list[str]] = []
+
+    def fake_terminate(pids):
+        killed.append(list(pids))
+        return {pid: pid != 200 for pid in pids}
+
+    def fake_run(command, *, event, **kwargs):
+        commands.append([str(part) for part in command])
+        return _command_result(command)
+
+    monkeypatch.setattr(process_snapshot, "take_snapshot", _process_table)
+    monkeypatch.setattr(process_snapshot, "terminate_pids", fake_terminate)
+    monkeypatch.setattr(processes.exec_utils, "run_command", fake_run)
+
+    processes.terminate_office_processes(["winword.exe", "ose.exe", "excel.exe"])
+
+    assert killed == [[111, 110, 100, 200]]
+    assert commands == [["taskkill.exe", "/IM", "ose.exe", "/F", "/T"]]
+
+
+def test_terminate_office_processes_retries_failed_descendants_by_pid(
+    monkeypatch, tmp_path
+) -> None:
+    """!
+    @brief A descendant that survives is retried by PID, never by its image name.
+    """
+
+    logging_ext.setup_logging(tmp_path)
+    commands: list[list[str]] = []
+
+    def fake_run(command, *, event, **kwargs):
+        commands.append([str(part) for part in command])
+        return _command_result(command)
+
+    monkeypatch.setattr(process_snapshot, "take_snapshot", _process_table)
+    monkeypatch.setattr(
+        process_snapshot, "terminate_pids", lambda pids: {pid: pid != 111 for pid in pids}
+    )
+    monkeypatch.setattr(processes.exec_utils, "run_command", fake_run)
+
+    processes.terminate_office_processes(["winword.exe"])
+    processes.terminate_process_patterns(["winword*"])
+
+    expected = ["taskkill.exe", "/PID", "111", "/F", "/T"]
+    assert commands == [expected, expected]
+
+
 def test_disable_tasks_respects_dry_run(monkeypatch, tmp_path) -> None:
     """!
     @brief Scheduled task disablement should honour dry-run.
@@ -422,6 +553,7 @@ def test_disable_tasks_executes(monkeypatch, tmp_path) -> None:
         commands.append([str(part) for part in command])
         return _command_result(command)
 
+    monkeypatch.setattr(tasks_services.task_scheduler, "default_backend", lambda: None)
     monkeypatch.setattr(tasks_services.exec_utils, "run_command", fake_run)
     tasks_services.disable_tasks([r"Microsoft\\Office\\Task"], dry_run=False)
 
@@ -441,6 +573,7 @@ def test_delete_tasks_executes_delete(monkeypatch, tmp_path) -> None:
         commands.append([str(part) for part in command])
         return _command_result(command)
 
+    monkeypatch.setattr(tasks_services.task_scheduler, "default_backend", lambda: None)
     monkeypatch.setattr(tasks_services.exec_utils, "run_command", fake_run)
     tasks_services.delete_tasks([r"Microsoft\\Office\\Cleanup"], dry_run=False)
 
@@ -478,6 +611,7 @@ def test_stop_services_invokes_sc(monkeypatch, tmp_path) -> None:
         return _command_result(command)
 
     monkeypatch.setattr(tasks_services.exec_utils, "run_command", fake_run)
+    monkeypatch.setattr(tasks_services.service_control, "default_controller", lambda: None)
     outcome = tasks_services.stop_services(["ClickToRunSvc"], timeout=10)
 
     assert len(commands) == 2
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import os
@@ -380,6 +381,90 @@ def test_reprobe_with_options(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "c2r" in result
 
 
+def test_reprobe_incremental_rechecks_only_attempted(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """!
+    @brief Only attempted products are probed and removed records drop out.
+    """
+
+    probed: list[str] = []
+    live = {"HKLM\\SOFTWARE\\Uninstall\\{KEPT}"}
+
+    def fake_key_exists(handle, path=None, *, view=None):  # type: ignore[no-untyped-def]
+        probed.append(str(handle))
+        return str(handle) in live
+
+    monkeypatch.setattr(detect.registry_tools, "key_exists", fake_key_exists)
+
+    kept = {"product_code": "{KEPT}", "uninstall_handles": sorted(live)}
+    untouched = {"product_code": "{OTHER}", "uninstall_handles": ["HKLM\\X\\{OTHER}"]}
+    install_dir = tmp_path / "Office"
+    install_dir.mkdir()
+    c2r = {
+        "release_ids": ["O365ProPlusRetail"],
+        "uninstall_handles": ["HKLM\\SOFTWARE\\Uninstall\\O365ProPlusRetail - en-us"],
+        "properties": {"install_path": str(install_dir)},
+    }
+    previous = {
+        "msi": [kept, untouched],
+        "c2r": [c2r],
+        "uninstall_entries": [{"product_code": "{OTHER}", "registry_handle": "HKLM\\X\\{OTHER}"}],
+        "processes": [{"name": "winword.exe"}],
+    }
+
+    diff = detect.reprobe_incremental(previous, {"msi": ["{KEPT}"], "c2r": ["o365proplusretail"]})
+    updated = diff.apply(previous)
+
+    # Nothing was removed, so no other product is probed.
+    assert not any("{OTHER}" in handle for handle in probed)
+    assert updated["msi"] == [kept, untouched]
+    # The install directory still exists, so the Click-to-Run record stays.
+    assert updated["c2r"] == [c2r]
+    assert updated["processes"] is previous["processes"]
+    assert diff.to_dict() == {
+        "removed": {"msi": 0, "c2r": 0, "uninstall_entries": 0},
+        "remaining": {"msi": 1, "c2r": 1},
+    }
+
+
+def test_reprobe_incremental_drops_side_effect_removals_from_copies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """!
+    @brief A removal triggers a sweep for products that vanished alongside it.
+    @details The inventory the diff is applied to is a deep copy, as it is when
+    sections come from the inventory cache.
+    """
+
+    live = {"HKLM\\SOFTWARE\\Uninstall\\{KEPT}", "HKLM\\X\\{OTHER}"}
+    monkeypatch.setattr(
+        detect.registry_tools,
+        "key_exists",
+        lambda handle, path=None, *, view=None: str(handle) in live,
+    )
+
+    gone = {"product_code": "{GONE}", "uninstall_handles": ["HKLM\\SOFTWARE\\Uninstall\\{GONE}"]}
+    member = {"product_code": "{MEMBER}", "uninstall_handles": ["HKLM\\X\\{MEMBER}"]}
+    untouched = {"product_code": "{OTHER}", "uninstall_handles": ["HKLM\\X\\{OTHER}"]}
+    previous = {
+        "msi": [gone, member, untouched],
+        "uninstall_entries": [
+            {"product_code": "{GONE}", "registry_handle": gone["uninstall_handles"][0]},
+            {"product_code": "{MEMBER}", "registry_handle": "HKLM\\X\\{MEMBER}"},
+            {"product_code": "{OTHER}", "registry_handle": "HKLM\\X\\{OTHER}"},
+        ],
+    }
+
+    diff = detect.reprobe_incremental(previous, {"msi": ["{gone}"]})
+    updated = diff.apply(copy.deepcopy(previous))
+
+    assert updated["msi"] == [untouched]
+    assert updated["uninstall_entries"] == [previous["uninstall_entries"][2]]
+    assert diff.to_dict()["removed"] == {"msi": 2, "c2r": 0, "uninstall_entries": 2}
+    assert diff.remaining["msi"] == []
+
+
 def test_detect_msi_installations_with_registry(monkeypatch: pytest.MonkeyPatch) -> None:
     """!
     @brief Test MSI detection with fake registry entries.
@@ -418,6 +503,216 @@ def test_detect_msi_installations_with_registry(monkeypatch: pytest.MonkeyPatch)
     assert found.version == "16.0.1234.5678"
 
 
+def test_detect_msi_installations_bulk_powershell_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """!
+    @brief Native misses should be resolved by a single bulk PowerShell invocation.
+    """
+
+    product_code = "{90160000-0011-0000-0000-0000000FF1CE}"
+    hive, base_key = constants.MSI_UNINSTALL_ROOTS[0]
+    provider_path = detect._powershell_registry_path(hive, f"{base_key}\\{product_code}")
+    commands: list[list[str]] = []
+
+    def fake_run_command(arguments, *, timeout=None):
+        commands.append([str(part) for part in arguments])
+        payload = {
+            provider_path: {
+                "DisplayName": "Microsoft Office Professional Plus 2016",
+                "DisplayVersion": "16.0.1234.5678",
+                "PSPath": "ignored",
+            }
+        }
+        return 0, json.dumps(payload)
+
+    monkeypatch.setattr(detect.registry_tools, "read_values", lambda root, path: {})
+    monkeypatch.setattr(detect, "_run_command", fake_run_command)
+
+    installations = detect.detect_msi_installations(skip_slow_probes=True)
+
+    assert len(commands) == 1
+    found = [inst for inst in installations if inst.product_code == product_code]
+    assert found and found[0].version == "16.0.1234.5678"
+    assert not detect._fallback_cache
+
+
+def test_uninstall_snapshot_shared_across_detection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """!
+    @brief One snapshot scope enumerates each Uninstall root once for every consumer.
+    """
+
+    product_code = "{90160000-0011-0000-0000-0000000FF1CE}"
+    hive, base_key = constants.MSI_UNINSTALL_ROOTS[0]
+    listings = {
+        (hive, base_key): [product_code, "Contoso.App"],
+        constants.MSI_UNINSTALL_ROOTS[1]: [],
+    }
+    values = {
+        f"{base_key}\\{product_code}": {
+            "DisplayName": "Microsoft Office Professional Plus 2016",
+            "DisplayVersion": "16.0.1234.5678",
+            "Publisher": "Microsoft Corporation",
+        },
+        f"{base_key}\\Contoso.App": {"DisplayName": "Contoso", "Publisher": "Contoso"},
+    }
+    enumerated: list[tuple[int, str]] = []
+    read: list[str] = []
+
+    def fake_iter_subkeys(root, path, *, view=None):  # type: ignore[no-untyped-def]
+        enumerated.append((root, path))
+        if (root, path) not in listings:
+            raise FileNotFoundError(path)
+        yield from listings[(root, path)]
+
+    def fake_read_values(root, path):  # type: ignore[no-untyped-def]
+        read.append(path)
+        return dict(values.get(path, {}))
+
+    def fail_fallback(root, path):  # type: ignore[no-untyped-def]
+        raise AssertionError(f"unexpected direct probe of {path}")
+
+    monkeypatch.setattr(detect.registry_tools, "iter_subkeys", fake_iter_subkeys)
+    monkeypatch.setattr(detect.registry_tools, "read_values", fake_read_values)
+    monkeypatch.setattr(detect, "_read_values_with_fallback", fail_fallback)
+    monkeypatch.setattr(detect, "_probe_msi_registry", lambda: {})
+
+    with detect.uninstall_snapshot.scope():
+        msi = detect.detect_msi_installations(skip_slow_probes=True)
+        entries = detect.detect_uninstall_entries()
+
+    assert [inst.product_code for inst in msi] == [product_code]
+    assert [entry["product_code"] for entry in entries] == [product_code]
+    assert sorted(set(enumerated)) == sorted(enumerated)
+    # Values are read lazily and only once per key.
+    assert read == [f"{base_key}\\{product_code}", f"{base_key}\\Contoso.App"]
+
+
+def test_detect_msi_installations_falls_back_when_listed_key_is_unreadable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """!
+    @brief A product the snapshot lists but cannot read natively is still detected.
+    """
+
+    product_code = "{90160000-0011-0000-0000-0000000FF1CE}"
+    hive, base_key = constants.MSI_UNINSTALL_ROOTS[0]
+    listings = {(hive, base_key): [product_code], constants.MSI_UNINSTALL_ROOTS[1]: []}
+    fallbacks: list[str] = []
+
+    def fake_iter_subkeys(root, path, *, view=None):  # type: ignore[no-untyped-def]
+        if (root, path) not in listings:
+            raise FileNotFoundError(path)
+        yield from listings[(root, path)]
+
+    def denied(root, path):  # type: ignore[no-untyped-def]
+        raise PermissionError(path)
+
+    def fake_fallback(root, path):  # type: ignore[no-untyped-def]
+        fallbacks.append(path)
+        return {"DisplayName": "Microsoft Office Professional Plus 2016"}
+
+    monkeypatch.setattr(detect.registry_tools, "iter_subkeys", fake_iter_subkeys)
+    monkeypatch.setattr(detect.registry_tools, "read_values", denied)
+    monkeypatch.setattr(detect, "_read_values_with_fallback", fake_fallback)
+    monkeypatch.setattr(detect, "_probe_msi_registry", lambda: {})
+
+    with detect.uninstall_snapshot.scope():
+        msi = detect.detect_msi_installations(skip_slow_probes=True)
+
+    assert fallbacks == [f"{base_key}\\{product_code}"]
+    assert [inst.product_code for inst in msi] == [product_code]
+    assert msi[0].product == "Microsoft Office Professional Plus 2016"
+
+
+def test_probe_msi_registry_expands_packed_product_codes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """!
+    @brief The Installer registry probe should recover product codes and metadata.
+    """
+
+    userdata = detect._MSI_USERDATA_ROOT
+    classes = detect._MSI_CLASSES_PRODUCTS_ROOT
+    subkeys = {
+        userdata: ["S-1-5-18"],
+        f"{userdata}\\S-1-5-18\\Products": [
+            "00006109110000000000000000F01FEC",
+            "000061091D0000000000000000F01FEC",
+        ],
+        classes: ["00006109110000000000000000F01FEC", "00005109B50000000000000000F01FEC"],
+    }
+    values = {
+        f"{userdata}\\S-1-5-18\\Products\\00006109110000000000000000F01FEC"
+        "\\InstallProperties": {
+            "DisplayName": "Microsoft Office Professional Plus 2016",
+            "DisplayVersion": "16.0.4266.1001",
+            "InstallLocation": "C:\\Program Files\\Microsoft Office\\",
+        },
+        f"{userdata}\\S-1-5-18\\Products\\000061091D0000000000000000F01FEC"
+        "\\InstallProperties": {"DisplayName": "Visual Studio SDK Project Templates"},
+        f"{classes}\\00005109B50000000000000000F01FEC": {
+            "ProductName": "Microsoft Visio Standard 2013",
+            "Version": (15 << 24) | 4569,
+        },
+    }
+
+    def fake_iter_subkeys(root, path, *, view=None):
+        if path not in subkeys:
+            raise FileNotFoundError(path)
+        return iter(subkeys[path])
+
+    monkeypatch.setattr(detect.registry_tools, "iter_subkeys", fake_iter_subkeys)
+    monkeypatch.setattr(
+        detect.registry_tools, "read_values", lambda root, path: dict(values.get(path, {}))
+    )
+
+    results = detect._probe_msi_registry()
+
+    assert set(results) == {
+        "{90160000-0011-0000-0000-0000000FF1CE}",
+        "{90150000-005B-0000-0000-0000000FF1CE}",
+    }
+    office = results["{90160000-0011-0000-0000-0000000FF1CE}"]
+    assert office["version"] == "16.0.4266.1001"
+    assert office["install_location"] == "C:\\Program Files\\Microsoft Office\\"
+    assert office["probe"] == "registry"
+    assert results["{90150000-005B-0000-0000-0000000FF1CE}"]["version"] == "15.0.4569"
+
+
+def test_inventory_defaults_to_registry_msi_probe(monkeypatch: pytest.MonkeyPatch) -> None:
+    """!
+    @brief Win32_Product probes should only run when deep probing is requested.
+    """
+
+    captured_kwargs: list[dict[str, object]] = []
+
+    def fail_probe():
+        raise AssertionError("Win32_Product probe should not run by default")
+
+    monkeypatch.setattr(detect, "_probe_msi_wmi", fail_probe)
+    monkeypatch.setattr(detect, "_probe_msi_powershell", fail_probe)
+
+    def fake_detect_msi_installations(**kwargs):
+        captured_kwargs.append(dict(kwargs))
+        return []
+
+    monkeypatch.setattr(detect, "detect_msi_installations", fake_detect_msi_installations)
+    monkeypatch.setattr(detect, "detect_c2r_installations", lambda: [])
+    monkeypatch.setattr(detect, "gather_running_office_processes", lambda: [])
+    monkeypatch.setattr(detect, "gather_office_services", lambda: [])
+    monkeypatch.setattr(detect, "gather_office_tasks", lambda: [])
+    monkeypatch.setattr(detect, "detect_appx_packages", lambda: [])
+    monkeypatch.setattr(detect, "detect_uninstall_entries", lambda: [])
+    monkeypatch.setattr(detect, "gather_activation_state", lambda: {})
+    monkeypatch.setattr(detect, "gather_registry_residue", lambda: [])
+    monkeypatch.setattr(detect.Path, "exists", lambda self: False, raising=False)
+
+    detect.gather_office_inventory(parallel=False)
+
+    assert captured_kwargs == [{"skip_slow_probes": True}]
+
+
 def test_inventory_reruns_inline_msi_probes_when_probe_metadata_empty(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -445,13 +740,105 @@ def test_inventory_reruns_inline_msi_probes_when_probe_metadata_empty(
     monkeypatch.setattr(detect, "gather_registry_residue", lambda: [])
     monkeypatch.setattr(detect.Path, "exists", lambda self: False, raising=False)
 
-    detect.gather_office_inventory(parallel=False, fast_mode=False)
+    detect.gather_office_inventory(parallel=False, fast_mode=False, deep_probe=True)
 
     assert captured_kwargs
     assert captured_kwargs[-1]["skip_slow_probes"] is False
     assert captured_kwargs[-1]["precomputed_fallbacks"] is None
 
 
+def test_inventory_cache_reuses_sections_with_unchanged_fingerprints(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """!
+    @brief Cached sections are reused until their fingerprint changes or a refresh is forced.
+    """
+
+    from office_janitor import inventory_cache
+
+    calls: list[str] = []
+
+    def probe(name, result):
+        def _run(*args, **kwargs):
+            calls.append(name)
+            return result
+
+        return _run
+
+    monkeypatch.setattr(detect, "detect_msi_installations", probe("msi", []))
+    monkeypatch.setattr(detect, "detect_c2r_installations", probe("c2r", []))
+    monkeypatch.setattr(detect, "gather_running_office_processes", probe("processes", []))
+    monkeypatch.setattr(
+        detect, "gather_office_services", probe("services", [{"name": "ClickToRunSvc"}])
+    )
+    monkeypatch.setattr(detect, "gather_office_tasks", probe("tasks", []))
+    monkeypatch.setattr(detect, "detect_appx_packages", probe("appx", []))
+    monkeypatch.setattr(detect, "detect_uninstall_entries", probe("uninstall", []))
+    monkeypatch.setattr(detect, "gather_activation_state", probe("activation", {}))
+    monkeypatch.setattr(detect, "gather_registry_residue", probe("registry", []))
+    monkeypatch.setattr(detect.Path, "exists", lambda self: False, raising=False)
+
+    fingerprints = {name: f"{name}-1" for name in inventory_cache.CACHED_SECTIONS}
+    fingerprints["appx"] = None
+    monkeypatch.setattr(
+        inventory_cache, "section_fingerprints", lambda *a, **kw: dict(fingerprints)
+    )
+    cache_path = tmp_path / inventory_cache.CACHE_FILENAME
+
+    first = detect.gather_office_inventory(
+        parallel=False, cache=inventory_cache.InventoryCache(cache_path)
+    )
+    assert sorted(calls) == sorted(
+        ["msi", "c2r", "processes", "services", "tasks", "appx", "uninstall"]
+        + ["activation", "registry"]
+    )
+    stored = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert "appx" not in stored["sections"]
+
+    calls.clear()
+    fingerprints["msi"] = "msi-2"
+    second = detect.gather_office_inventory(
+        parallel=False, cache=inventory_cache.InventoryCache(cache_path)
+    )
+    assert sorted(calls) == ["activation", "appx", "msi", "processes", "services"]
+    assert second["services"] == first["services"] == [{"name": "ClickToRunSvc"}]
+
+    calls.clear()
+    detect.gather_office_inventory(
+        parallel=True, cache=inventory_cache.InventoryCache(cache_path, refresh=True)
+    )
+    assert "services" in calls and "registry" in calls
+
+
+def test_inventory_fingerprints_track_directory_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """!
+    @brief Filesystem fingerprints change when a residue path appears; unreadable
+    registry sources are reported as uncacheable.
+    """
+
+    from office_janitor import inventory_cache
+
+    residue = tmp_path / "Microsoft Office" / "Office16"
+    residue.parent.mkdir()
+    monkeypatch.setattr(constants, "INSTALL_ROOT_TEMPLATES", ())
+    monkeypatch.setattr(constants, "RESIDUE_PATH_TEMPLATES", ({"path": str(residue)},))
+    monkeypatch.setattr(registry_tools, "winreg", object())
+
+    before = inventory_cache.section_fingerprints(["filesystem", "c2r"])
+    assert before["filesystem"] is not None
+    assert before["c2r"] is None
+    assert inventory_cache.section_fingerprints(["filesystem"]) == {
+        "filesystem": before["filesystem"]
+    }
+
+    residue.mkdir()
+    os.utime(residue.parent, ns=(1, 1))
+    after = inventory_cache.section_fingerprints(["filesystem"])
+    assert after["filesystem"] != before["filesystem"]
+
+
 def test_inventory_uses_precomputed_msi_probe_metadata(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -489,7 +876,7 @@ def test_inventory_uses_precomputed_msi_probe_metadata(
     monkeypatch.setattr(detect, "gather_registry_residue", lambda: [])
     monkeypatch.setattr(detect.Path, "exists", lambda self: False, raising=False)
 
-    detect.gather_office_inventory(parallel=False, fast_mode=False)
+    detect.gather_office_inventory(parallel=False, fast_mode=False, deep_probe=True)
 
     assert captured_kwargs
     assert captured_kwargs[-1]["skip_slow_probes"] is True
@@ -390,45 +390,76 @@ class TestSafeDecodeEncodingFallback:
 
 class TestAppxUninstallEncoding:
     """!
-    @brief Verify appx_uninstall._run_powershell uses encoding params.
+    @brief Verify appx_uninstall._run_powershell goes through exec_utils.
     """
 
-    def test_run_powershell_uses_utf8_encoding(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """_run_powershell should pass encoding/errors instead of text=True."""
-        from office_janitor import appx_uninstall
+    def test_run_powershell_routes_through_run_command(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """_run_powershell should share run_command's UTF-8 decoding and logging."""
+        from office_janitor import appx_uninstall, exec_utils
 
-        captured_kwargs: dict[str, object] = {}
+        captured: dict[str, object] = {}
 
-        def capturing_run(*args: object, **kwargs: object) -> subprocess.CompletedProcess[str]:
-            captured_kwargs.update(kwargs)
-            return subprocess.CompletedProcess(args=args, returncode=0, stdout="", stderr="")
+        def capturing_run(command: list[str], **kwargs: object) -> exec_utils.CommandResult:
+            captured["command"] = command
+            captured.update(kwargs)
+            return exec_utils.CommandResult(
+                command=command, returncode=0, stdout="", stderr="", duration=0.0
+            )
 
-        monkeypatch.setattr(subprocess, "run", capturing_run)
+        monkeypatch.setattr(exec_utils, "run_command", capturing_run)
 
-        appx_uninstall._run_powershell("Write-Host test")
+        appx_uninstall._run_powershell("Write-Host test", timeout=30)
 
-        assert captured_kwargs.get("encoding") == "utf-8"
-        assert captured_kwargs.get("errors") == "replace"
-        assert "text" not in captured_kwargs
+        assert captured["command"] == [
+            "powershell",
+            "-NoProfile",
+            "-NonInteractive",
+            "-Command",
+            "Write-Host test",
+        ]
+        assert captured["timeout"] == 30
 
     def test_run_powershell_handles_high_bytes(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """PowerShell returning non-ASCII output should not crash."""
-        from office_janitor import appx_uninstall
+        from office_janitor import appx_uninstall, exec_utils
 
-        def fake_run(*args: object, **kwargs: object) -> subprocess.CompletedProcess[str]:
-            return subprocess.CompletedProcess(
-                args=args,
+        def fake_run(command: list[str], **_kwargs: object) -> exec_utils.CommandResult:
+            return exec_utils.CommandResult(
+                command=command,
                 returncode=0,
                 stdout='{"Name":"Microsoft.Office.Desktop\ufffd"}',
                 stderr="",
+                duration=0.0,
             )
 
-        monkeypatch.setattr(subprocess, "run", fake_run)
+        monkeypatch.setattr(exec_utils, "run_command", fake_run)
 
         result = appx_uninstall._run_powershell("Get-AppxPackage")
         assert result.returncode == 0
         assert "Microsoft.Office" in result.stdout
 
+    def test_run_powershell_raises_on_timeout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A timed-out run surfaces as subprocess.TimeoutExpired for the callers."""
+        from office_janitor import appx_uninstall, exec_utils
+
+        def fake_run(command: list[str], **_kwargs: object) -> exec_utils.CommandResult:
+            return exec_utils.CommandResult(
+                command=command,
+                returncode=1,
+                stdout="",
+                stderr="",
+                duration=5.0,
+                timed_out=True,
+                error="timeout",
+            )
+
+        monkeypatch.setattr(exec_utils, "run_command", fake_run)
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            appx_uninstall._run_powershell("Get-AppxPackage", timeout=5)
+
 
 # ---------------------------------------------------------------------------
 # Integration: odt_build encoding
@@ -6,8 +6,12 @@ logging behaviour for :mod:`office_janitor.exec_utils`.
 
 from __future__ import annotations
 
+import os
+import signal
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -17,7 +21,7 @@ SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from office_janitor import exec_utils  # noqa: E402
+from office_janitor import exec_utils, spinner  # noqa: E402
 
 
 class _StubLogger:
@@ -225,3 +229,214 @@ def test_global_timeout_caps_per_command(monkeypatch: pytest.MonkeyPatch) -> Non
     # Now using polling with 0.1s timeout, but the effective timeout is still capped at 5
     # The test needs to verify the timeout capping logic works, not the exact value passed
     assert captured["timeout"] == 0.1  # Polling interval
+
+
+def test_run_commands_overlaps_and_preserves_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """!
+    @brief Batches run concurrently up to the limit and return results in input order.
+    """
+
+    human_logger = _StubLogger()
+    machine_logger = _StubLogger()
+    monkeypatch.setattr(exec_utils.logging_ext, "get_human_logger", lambda: human_logger)
+    monkeypatch.setattr(exec_utils.logging_ext, "get_machine_logger", lambda: machine_logger)
+
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+    registered: list[object] = []
+
+    class FakePopen:
+        def __init__(self, command, *, stdout, stderr, encoding, errors, env, cwd):
+            self.command = command
+            self.returncode = 0
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+
+        def communicate(self, timeout=None):
+            # Later commands finish first, so completion order differs from input order
+            time.sleep(0.05 * (5 - int(self.command[1])))
+            with lock:
+                state["running"] -= 1
+            return (self.command[1], "")
+
+    monkeypatch.setattr(exec_utils.subprocess, "Popen", FakePopen)
+    monkeypatch.setattr(spinner, "register_process", registered.append)
+
+    specs = [exec_utils.CommandSpec(["cmd", str(index)], event="batch") for index in range(5)]
+    results = exec_utils.run_commands(specs, max_concurrency=3)
+
+    assert [result.stdout for result in results] == ["0", "1", "2", "3", "4"]
+    assert state["peak"] == 3
+    assert len(registered) == 5
+    events = [record[1] for record in machine_logger.records]
+    assert events.count("batch_plan") == 5
+    assert events.count("batch_result") == 5
+
+
+def test_run_commands_dry_run_skips_every_spec(monkeypatch: pytest.MonkeyPatch) -> None:
+    """!
+    @brief ``dry_run`` applies to the whole batch and never spawns.
+    """
+
+    human_logger = _StubLogger()
+    machine_logger = _StubLogger()
+    monkeypatch.setattr(exec_utils.logging_ext, "get_human_logger", lambda: human_logger)
+    monkeypatch.setattr(exec_utils.logging_ext, "get_machine_logger", lambda: machine_logger)
+
+    def fail_popen(*args, **kwargs):
+        raise AssertionError("dry-run must not spawn")
+
+    monkeypatch.setattr(exec_utils.subprocess, "Popen", fail_popen)
+
+    specs = [exec_utils.CommandSpec(["cmd", name], event="batch") for name in ("a", "b")]
+    results = exec_utils.run_commands(specs, dry_run=True)
+
+    assert [result.command for result in results] == [["cmd", "a"], ["cmd", "b"]]
+    assert all(result.skipped for result in results)
+    assert exec_utils.run_commands([]) == []
+
+
+def test_run_commands_interrupt_kills_only_its_own_children(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """!
+    @brief Ctrl+C kills the batch's children; other failures and processes are left alone.
+    """
+
+    human_logger = _StubLogger()
+    machine_logger = _StubLogger()
+    monkeypatch.setattr(exec_utils.logging_ext, "get_human_logger", lambda: human_logger)
+    monkeypatch.setattr(exec_utils.logging_ext, "get_machine_logger", lambda: machine_logger)
+
+    started = threading.Event()
+    error: dict[str, type[BaseException]] = {}
+
+    class FakePopen:
+        def __init__(self, command, *, stdout, stderr, encoding, errors, env, cwd):
+            self.command = command
+            self.returncode = 0
+            if command[1] == "slow":
+                started.set()
+
+        def communicate(self, timeout=None):
+            if self.command[1] == "slow":
+                time.sleep(0.1)
+                return ("", "")
+            started.wait(5)
+            raise error["type"]()
+
+    killed: list[list[str]] = []
+    monkeypatch.setattr(exec_utils.subprocess, "Popen", FakePopen)
+    monkeypatch.setattr(spinner, "register_process", lambda proc: None)
+    monkeypatch.setattr(
+        spinner, "kill_processes", lambda procs: killed.extend(p.command[1] for p in procs)
+    )
+    monkeypatch.setattr(
+        spinner, "kill_all_processes", lambda: pytest.fail("must not kill unrelated processes")
+    )
+
+    specs = [exec_utils.CommandSpec(["cmd", name], event="batch") for name in ("slow", "boom")]
+
+    error["type"] = ValueError
+    with pytest.raises(ValueError):
+        exec_utils.run_commands(specs, max_concurrency=2)
+    assert killed == []
+
+    started.clear()
+    error["type"] = KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        exec_utils.run_commands(specs, max_concurrency=2)
+    assert sorted(killed) == ["boom", "slow"]
+
+
+def test_run_command_streams_lines_into_bounded_buffers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """!
+    @brief Streaming keeps head and tail, counts every byte and excerpts the log event.
+    """
+
+    human_logger = _StubLogger()
+    machine_logger = _StubLogger()
+    monkeypatch.setattr(exec_utils.logging_ext, "get_human_logger", lambda: human_logger)
+    monkeypatch.setattr(exec_utils.logging_ext, "get_machine_logger", lambda: machine_logger)
+    monkeypatch.setattr(exec_utils, "_LOG_OUTPUT_LIMIT", 1024)
+
+    script = (
+        "import sys\n"
+        "for i in range(5000):\n"
+        "    print(f'line {i:05d}')\n"
+        "sys.stderr.write('warning\\n')\n"
+    )
+    lines: list[tuple[str, str]] = []
+
+    result = exec_utils.run_command(
+        [sys.executable, "-c", script],
+        event="stream",
+        timeout=30,
+        output_callback=lambda stream, line: lines.append((stream, line)),
+        output_limit=4096,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout_bytes == len(b"line 00000\n") * 5000
+    assert result.output_truncated
+    assert result.stdout.startswith("line 00000\n")
+    assert result.stdout.endswith("line 04999\n")
+    assert "bytes omitted" in result.stdout
+    assert len(result.stdout) < 4096 + 64
+    assert result.stderr == "warning\n"
+    assert len([line for stream, line in lines if stream == "stdout"]) == 5000
+    assert ("stderr", "warning") in lines
+
+    logged = machine_logger.records[-1][2]["extra"]["result"]
+    assert logged["stdout_bytes"] == result.stdout_bytes
+    assert len(logged["stdout"]) < 1024 + 64
+    assert "of 55000 bytes omitted" in logged["stdout"]
+
+
+def test_run_command_streaming_returns_when_grandchild_holds_pipes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """!
+    @brief A grandchild that inherited the pipes cannot keep the call from returning.
+    """
+
+    human_logger = _StubLogger()
+    machine_logger = _StubLogger()
+    monkeypatch.setattr(exec_utils.logging_ext, "get_human_logger", lambda: human_logger)
+    monkeypatch.setattr(exec_utils.logging_ext, "get_machine_logger", lambda: machine_logger)
+    monkeypatch.setattr(exec_utils, "_DRAIN_GRACE", 0.2)
+
+    script = (
+        "import subprocess, sys\n"
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+        "print(child.pid, flush=True)\n"
+    )
+
+    started = time.monotonic()
+    result = exec_utils.run_command(
+        [sys.executable, "-c", script], event="stream", stream_output=True
+    )
+    elapsed = time.monotonic() - started
+    try:
+        os.kill(int(result.stdout.strip()), signal.SIGTERM)
+    except (OSError, ValueError):
+        pass
+
+    assert result.returncode == 0
+    assert result.stdout.strip().isdigit()
+    assert elapsed < 10
+
+
+def test_bounded_output_keeps_everything_under_limit() -> None:
+    """!
+    @brief Short output round-trips unchanged and is not flagged as truncated.
+    """
+
+    buffer = exec_utils._BoundedOutput(64)
+    for line in ("alpha\n", "beta\n", "gamma\n"):
+        buffer.append(line, len(line))
+
+    assert buffer.text() == "alpha\nbeta\ngamma\n"
+    assert buffer.total_bytes == 17
+    assert not buffer.dropped
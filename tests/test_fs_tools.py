@@ -7,6 +7,7 @@ directory resolution implemented in :mod:`office_janitor.fs_tools`.
 from __future__ import annotations
 
 import pathlib
+import stat
 import sys
 import types
 
@@ -78,6 +79,23 @@ def test_is_path_whitelisted_expands_environment() -> None:
     assert fs_tools.is_path_whitelisted(path, env=env)
 
 
+def test_path_policy_longest_entry_decides() -> None:
+    """!
+    @brief A whitelisted root nested inside a blacklisted one stays allowed.
+    """
+
+    policy = fs_tools.PathPolicy(
+        whitelist=[r"C:\\Data\\Office"],
+        blacklist=[r"C:\\Data", r"C:\\Data\\Office\\Keep"],
+    )
+
+    assert policy.allows(r"C:\\Data\\Office\\Cache")
+    assert policy.allows("c:/data/office 15/cache")
+    assert not policy.allows(r"C:\\Data\\Office\\Keep\\file.txt")
+    assert not policy.allows(r"C:\\Data\\Other")
+    assert fs_tools.default_path_policy() is fs_tools.default_path_policy()
+
+
 def test_backup_path_copies_file(tmp_path, monkeypatch) -> None:
     """!
     @brief Backup helper should duplicate files into the destination root.
@@ -244,6 +262,35 @@ def test_remove_paths_schedules_on_permission_error(tmp_path, monkeypatch) -> No
     assert target.exists()
 
 
+def test_remove_paths_never_descends_into_reparse_points(tmp_path, monkeypatch) -> None:
+    """!
+    @brief Junctions are removed as links; the directories they point at survive.
+    @details Linux has no junctions, so a real directory is reported as a
+    reparse point through ``st_file_attributes``-style detection.
+    """
+
+    target = tmp_path / "Office"
+    junction = target / "Shared"
+    junction.mkdir(parents=True)
+    (junction / "outside.txt").write_text("keep", encoding="utf-8")
+    (target / "residue.txt").write_text("remove", encoding="utf-8")
+    junction_inode = junction.stat().st_ino
+    assert fs_tools._is_reparse_point(
+        types.SimpleNamespace(st_file_attributes=stat.FILE_ATTRIBUTE_REPARSE_POINT)
+    )
+
+    monkeypatch.setattr(fs_tools, "_is_reparse_point", lambda info: info.st_ino == junction_inode)
+    monkeypatch.setattr(fs_tools, "reset_acl", lambda _path: None)
+    monkeypatch.setattr(fs_tools, "_schedule_delete_on_reboot", lambda path, **_kwargs: True)
+    monkeypatch.setattr(fs_tools.logging_ext, "get_human_logger", lambda: _NullLogger())
+    monkeypatch.setattr(fs_tools.logging_ext, "get_machine_logger", lambda: _NullLogger())
+
+    fs_tools.remove_paths([target])
+
+    assert (junction / "outside.txt").read_text(encoding="utf-8") == "keep"
+    assert not (target / "residue.txt").exists()
+
+
 def test_get_default_log_directory_prefers_programdata(tmp_path) -> None:
     """!
     @brief Windows defaults should use ``ProgramData`` when available.
@@ -79,14 +79,13 @@ class TestGuidCompression:
         """Compression should match Windows Installer algorithm."""
         # Example from VBS OffScrub code
         result = compress_guid("{90160000-0011-0000-0000-0000000FF1CE}")
-        # The algorithm reverses pairs within each segment
-        # {90160000} -> 09610000
+        # The first three segments are reversed, the rest swap pairs
+        # {90160000} -> 00006109
         # {0011} -> 1100
         # {0000} -> 0000
         # {0000} -> 0000
-        # {0000000FF1CE} -> 000000F0F1EC
-        assert len(result) == 32
-        assert result.isalnum()
+        # {0000000FF1CE} -> 000000F01FEC
+        assert result == "00006109110000000000000000F01FEC"
 
     def test_compress_guid_without_braces(self) -> None:
         """Compression should work without braces."""
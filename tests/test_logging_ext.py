@@ -9,6 +9,8 @@ import json
 import logging
 import pathlib
 import sys
+import threading
+import time
 from contextlib import redirect_stdout
 
 import pytest
@@ -189,3 +191,92 @@ def test_log_directory_tracks_setup(tmp_path) -> None:
 
     logging_ext.setup_logging(tmp_path)
     assert logging_ext.get_log_directory() == tmp_path
+
+
+def test_machine_events_are_batched_and_drained_in_order(tmp_path) -> None:
+    """!
+    @brief Queued events reach ``events.jsonl`` in order once flushed, from any thread.
+    """
+
+    _, machine_logger = logging_ext.setup_logging(tmp_path)
+    handler = next(
+        item
+        for item in machine_logger.handlers
+        if isinstance(item, logging_ext._QueuedJsonlFileHandler)
+    )
+
+    def emit(prefix: str) -> None:
+        for index in range(500):
+            machine_logger.info("bulk", extra={"event": "bulk", "item": f"{prefix}{index}"})
+
+    workers = [threading.Thread(target=emit, args=(prefix,)) for prefix in "ab"]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    logging_ext.flush_logs()
+
+    entries = [
+        json.loads(line)
+        for line in (tmp_path / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    ]
+    items = [entry["item"] for entry in entries if entry["event"] == "bulk"]
+    assert len(items) == 1000
+    for prefix in "ab":
+        assert [item for item in items if item[0] == prefix] == [
+            f"{prefix}{index}" for index in range(500)
+        ]
+    assert handler._writer is not None and handler._writer.is_alive()
+
+
+def test_queued_handler_rolls_over_on_size_and_drains_on_close(tmp_path) -> None:
+    """!
+    @brief Size rollover uses the in-memory counter and ``close`` writes what is queued.
+    """
+
+    handler = logging_ext._QueuedJsonlFileHandler(
+        tmp_path / "events.jsonl", max_bytes=2048, backup_count=20
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger("office_janitor.test_rollover")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for index in range(200):
+            logger.info("record %04d %s", index, "x" * 40)
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    current = tmp_path / "events.jsonl"
+    backups = list(tmp_path.glob("events.jsonl.*"))
+    assert backups, "expected a size-triggered rollover"
+    assert all(path.stat().st_size < 2048 for path in [current, *backups])
+    assert handler._size == current.stat().st_size
+    lines = current.read_text(encoding="utf-8").splitlines()
+    assert lines[-1].startswith("record 0199 ")
+    numbers = [int(line.split()[1]) for line in lines]
+    assert numbers == list(range(numbers[0], 200))
+
+
+def test_queued_handler_close_gives_up_on_a_stuck_writer(tmp_path) -> None:
+    """!
+    @brief ``flush`` and ``close`` return after ``drain_timeout`` when the writer is blocked.
+    """
+
+    release = threading.Event()
+    handler = logging_ext._QueuedJsonlFileHandler(
+        tmp_path / "events.jsonl", flush_interval=0.0, drain_timeout=0.2
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler._write_lines = lambda pending: release.wait(10)  # type: ignore[method-assign]
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "stuck", None, None)
+    try:
+        handler.handle(record)
+        started = time.monotonic()
+        handler.flush()
+        handler.close()
+        assert time.monotonic() - started < 2.0
+    finally:
+        release.set()
@@ -146,7 +146,7 @@ def test_limited_user_flag_passes_to_detection(monkeypatch, tmp_path) -> None:
 
     captured = {}
 
-    def fake_gather(*, limited_user=None, progress_callback=None):
+    def fake_gather(*, limited_user=None, progress_callback=None, cache=None):
         captured["limited_user"] = limited_user
         return {"msi": [], "c2r": [], "filesystem": [], "registry": []}
 
@@ -215,6 +215,29 @@ def test_main_diagnose_skips_execution(monkeypatch, tmp_path) -> None:
     assert guard_calls == []
 
 
+def test_main_trace_flag_writes_chrome_trace(monkeypatch, tmp_path) -> None:
+    """!
+    @brief ``--trace`` should record the run and write a Chrome trace document.
+    """
+
+    monkeypatch.setattr(main, "ensure_admin_and_relaunch_if_needed", _no_op)
+    monkeypatch.setattr(main, "enable_vt_mode_if_possible", _no_op)
+    monkeypatch.setattr(main, "_resolve_log_directory", lambda candidate: tmp_path)
+    monkeypatch.setattr(main.detect, "gather_office_inventory", lambda **kw: {"msi": []})
+    monkeypatch.setattr(main.safety, "perform_preflight_checks", lambda plan: None)
+
+    trace_path = tmp_path / "trace.json"
+    exit_code = main.main(
+        ["--diagnose", "--logdir", str(tmp_path / "logs"), "--trace", str(trace_path)]
+    )
+
+    assert exit_code == 0
+    assert not main.tracing.is_enabled()
+    payload = json.loads(trace_path.read_text(encoding="utf-8"))
+    names = {event["name"] for event in payload["traceEvents"] if event["ph"] == "X"}
+    assert {"main", "plan.build_plan"} <= names
+
+
 def test_main_interactive_uses_cli(monkeypatch, tmp_path) -> None:
     """!
     @brief Without mode flags, the plain menu should launch.
@@ -10,6 +10,7 @@ from pathlib import Path
 
 import pytest
 
+from office_janitor import msi_components
 from office_janitor.msi_components import (
     ComponentInfo,
     MSIComponentScanner,
@@ -90,6 +91,12 @@ class MockInstaller:
         return self._component_paths.get((product_code, component_id), "")
 
 
+@pytest.fixture(autouse=True)
+def _reset_component_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stop the in-process component index leaking between tests."""
+    monkeypatch.setattr(msi_components, "_CACHED_INDEX", None)
+
+
 @pytest.fixture
 def mock_installer() -> MockInstaller:
     """Create a mock installer with sample Office products."""
@@ -259,6 +266,11 @@ class TestIsOfficeComponent:
 class TestMSIComponentScanner:
     """Tests for the MSIComponentScanner class."""
 
+    @pytest.fixture(autouse=True)
+    def _com_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Keep the scanner on the mocked COM API instead of the host registry."""
+        monkeypatch.setattr(msi_components, "load_component_index", lambda *_a, **_k: None)
+
     def test_scan_office_products(self, mock_installer: MockInstaller) -> None:
         """Should scan and find Office products."""
         scanner = MSIComponentScanner()
@@ -380,3 +392,152 @@ class TestWindowsInstallerError:
         """WindowsInstallerError should include message."""
         error = WindowsInstallerError("test message")
         assert "test message" in str(error)
+
+
+class _UserDataWinreg:
+    """Minimal ``winreg`` stand-in exposing a ``UserData`` component tree."""
+
+    KEY_READ = 0x20019
+    KEY_WOW64_64KEY = 0x0100
+
+    def __init__(self, components: dict[str, dict[str, str]], stamp: int = 1) -> None:
+        self.base = msi_components.USERDATA_PATH
+        self.components = components
+        self.stamp = stamp
+        self.opened: list[str] = []
+
+    def OpenKey(self, root, path, _reserved=0, _access=0):
+        full = path if isinstance(root, int) else f"{root}\\{path}"
+        if full != self.base and not full.startswith(self.base + "\\S-1-5-18\\Components"):
+            raise FileNotFoundError(full)
+        self.opened.append(full)
+        return full
+
+    def CloseKey(self, _handle) -> None:
+        return None
+
+    def EnumKey(self, handle, index):
+        if handle == self.base:
+            names = ["S-1-5-18"]
+        elif handle.endswith("\\Components"):
+            names = sorted(self.components)
+        else:
+            names = []
+        if index >= len(names):
+            raise OSError("no more items")
+        return names[index]
+
+    def EnumValue(self, handle, index):
+        items = sorted(self.components[handle.rpartition("\\")[2]].items())
+        if index >= len(items):
+            raise OSError("no more items")
+        name, value = items[index]
+        return name, value, 1
+
+    def QueryInfoKey(self, handle):
+        if handle.endswith("\\Components"):
+            return (len(self.components), 0, self.stamp)
+        return (0, len(self.components[handle.rpartition("\\")[2]]), self.stamp)
+
+
+class TestComponentIndex:
+    """Tests for the registry-backed component index."""
+
+    OFFICE = "{90160000-000F-0000-1000-0000000FF1CE}"
+    OTHER = "{12345678-1234-1234-1234-123456789012}"
+    COMPONENT_A = "{11111111-1111-1111-1111-111111111111}"
+    COMPONENT_B = "{22222222-2222-2222-2222-222222222222}"
+
+    def _fake(self, monkeypatch: pytest.MonkeyPatch) -> _UserDataWinreg:
+        compress = msi_components.guid_utils.compress_guid
+        fake = _UserDataWinreg(
+            {
+                compress(self.COMPONENT_A): {compress(self.OFFICE): r"C:\Office\WINWORD.EXE"},
+                compress(self.COMPONENT_B): {
+                    compress(self.OFFICE): "02:\\SOFTWARE\\Microsoft\\Office\\16.0",
+                    compress(self.OTHER): r"C:\Other\shared.dll",
+                },
+            }
+        )
+        monkeypatch.setattr(msi_components.registry_tools, "winreg", fake)
+        monkeypatch.setattr(msi_components, "_CACHED_INDEX", None)
+        return fake
+
+    def test_build_index_maps_both_directions(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """One registry pass yields product and component lookups."""
+        self._fake(monkeypatch)
+
+        index = msi_components.build_component_index()
+
+        assert index is not None
+        assert index.components(self.OFFICE) == [self.COMPONENT_A, self.COMPONENT_B]
+        assert index.clients(self.COMPONENT_B) == [self.OFFICE, self.OTHER]
+        assert index.key_path(self.OTHER, self.COMPONENT_B) == r"C:\Other\shared.dll"
+
+    def test_load_index_persists_until_stamp_changes(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """A persisted index is reused while the key last-write time matches."""
+        fake = self._fake(monkeypatch)
+        cache = tmp_path / "components.json"
+
+        first = msi_components.load_component_index(cache)
+        assert first is not None and cache.exists()
+
+        monkeypatch.setattr(msi_components, "_CACHED_INDEX", None)
+        monkeypatch.setattr(
+            msi_components,
+            "build_component_index",
+            lambda: pytest.fail("index should come from the cache file"),
+        )
+        reused = msi_components.load_component_index(cache)
+        assert reused is not None
+        assert reused.clients_by_component == first.clients_by_component
+
+        fake.stamp = 2
+        rebuilt: list[bool] = []
+        monkeypatch.setattr(
+            msi_components, "build_component_index", lambda: rebuilt.append(True) or first
+        )
+        msi_components.load_component_index(cache)
+        assert rebuilt == [True]
+
+    def test_load_index_rebuilds_when_component_clients_change(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """New client values under an existing component invalidate the index."""
+        fake = self._fake(monkeypatch)
+        cache = tmp_path / "components.json"
+        compress = msi_components.guid_utils.compress_guid
+
+        first = msi_components.load_component_index(cache)
+        assert first is not None
+        assert first.clients(self.COMPONENT_A) == [self.OFFICE]
+
+        fake.components[compress(self.COMPONENT_A)][compress(self.OTHER)] = r"C:\Other\a.dll"
+
+        rebuilt = msi_components.load_component_index(cache)
+        assert rebuilt is not None
+        assert rebuilt.clients(self.COMPONENT_A) == [self.OFFICE, self.OTHER]
+
+    def test_scanner_uses_index_without_com(
+        self, monkeypatch: pytest.MonkeyPatch, mock_installer: MockInstaller
+    ) -> None:
+        """Component lookups are served from the index instead of COM."""
+        self._fake(monkeypatch)
+
+        def fail(*_args):
+            raise AssertionError("COM component query should not run")
+
+        monkeypatch.setattr(mock_installer, "ComponentClients", fail, raising=False)
+        monkeypatch.setattr(mock_installer, "ComponentPath", fail, raising=False)
+        scanner = MSIComponentScanner()
+        scanner._installer = mock_installer
+
+        components = scanner.get_product_components(self.OTHER)
+        result = scanner.scan(office_only=True, include_components=True)
+
+        assert [info.component_id for info in components] == [self.COMPONENT_B]
+        assert components[0].clients == [self.OFFICE, self.OTHER]
+        assert set(result.components) == {self.COMPONENT_A, self.COMPONENT_B}
+        assert any("Microsoft\\Office" in path for path in result.registry_paths)
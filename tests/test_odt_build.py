@@ -711,6 +711,57 @@ class TestProgressMonitoring:
         status, pct = odt_build._parse_odt_progress(log_file)
         assert pct == 80
 
+    def test_odt_log_follower_reads_appended_lines(self, tmp_path: Path) -> None:
+        """Verify the follower parses only new lines and keeps the last status."""
+        follower = odt_build._OdtLogFollower(tmp_path)
+        assert follower.poll() == ("Starting...", None)
+
+        log_file = tmp_path / "Microsoft Office Click-to-Run 1.log"
+        log_file.write_bytes(b"Downloading files 10%\nInstalling Office 2")
+        assert follower.poll() == ("Downloading Office files", 10)
+
+        with log_file.open("ab") as handle:
+            handle.write(b"0%\nunrelated noise\n")
+        assert follower.poll() == ("Installing Office", 20)
+        assert follower.poll() == ("Installing Office", 20)
+        follower.close()
+
+    def test_odt_log_follower_switches_to_new_log(self, tmp_path: Path) -> None:
+        """Verify a newer log in the directory replaces the followed one."""
+        import os
+
+        old_log = tmp_path / "Microsoft Office Click-to-Run 1.log"
+        old_log.write_text("Configuring Office settings\n")
+        os.utime(old_log, (1_000_000, 1_000_000))
+        follower = odt_build._OdtLogFollower(tmp_path)
+        assert follower.poll() == ("Configuring Office", None)
+
+        new_log = tmp_path / "Microsoft Office Click-to-Run 2.log"
+        new_log.write_text("Removing old version\n")
+        assert follower.poll() == ("Removing old version", None)
+        assert follower.path == new_log
+        follower.close()
+
+    def test_odt_log_follower_handles_truncation(self, tmp_path: Path) -> None:
+        """Verify a truncated log is read again from the start."""
+        log_file = tmp_path / "Microsoft Office Click-to-Run 1.log"
+        log_file.write_text("Verifying installation\n" * 10)
+        follower = odt_build._OdtLogFollower(tmp_path)
+        assert follower.poll() == ("Verifying installation", None)
+
+        log_file.write_text("Applying\n")
+        assert follower.poll() == ("Applying settings", None)
+        follower.close()
+
+    def test_odt_log_follower_skips_partial_first_line(self, tmp_path: Path) -> None:
+        """Verify a tail that starts mid-line ignores the leading fragment."""
+        log_file = tmp_path / "Microsoft Office Click-to-Run 1.log"
+        log_file.write_text("Downloading files 99%\nRegistering components\n")
+        follower = odt_build._OdtLogFollower(tmp_path, tail_bytes=30)
+
+        assert follower.poll() == ("Registering components", None)
+        follower.close()
+
 
 class TestInstallMetrics:
     """Tests for installation metrics functions."""
@@ -762,6 +813,50 @@ class TestInstallMetrics:
         assert isinstance(count, int)
         assert count >= 0
 
+    def test_install_tree_tracker_totals(self, tmp_path: Path) -> None:
+        """Verify the tracker totals sizes and files across nested folders."""
+        (tmp_path / "root" / "sub").mkdir(parents=True)
+        (tmp_path / "root" / "a.dll").write_bytes(b"x" * 10)
+        (tmp_path / "root" / "sub" / "b.dll").write_bytes(b"x" * 5)
+
+        tracker = odt_build._InstallTreeTracker([tmp_path / "root", tmp_path / "missing"])
+
+        assert tracker.refresh() == (15, 2)
+        assert tracker.directories_scanned == 2
+
+    def test_install_tree_tracker_rescans_only_changed_folders(self, tmp_path: Path) -> None:
+        """Verify unchanged folders are not listed again on refresh."""
+        for name in ("one", "two", "three"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "old.bin").write_bytes(b"x" * 4)
+        tracker = odt_build._InstallTreeTracker([tmp_path], hot_window=0)
+        tracker.refresh()
+
+        assert tracker.refresh() == (12, 3)
+        assert tracker.directories_scanned == 0
+
+        (tmp_path / "two" / "new.bin").write_bytes(b"x" * 6)
+        assert tracker.refresh() == (18, 4)
+        assert tracker.directories_scanned == 1
+
+        for entry in (tmp_path / "three").iterdir():
+            entry.unlink()
+        (tmp_path / "three").rmdir()
+        assert tracker.refresh() == (14, 3)
+
+    def test_install_tree_tracker_follows_growing_files(self, tmp_path: Path) -> None:
+        """Verify recently written files are re-stat'd without relisting."""
+        target = tmp_path / "stream.cab"
+        target.write_bytes(b"x" * 100)
+        tracker = odt_build._InstallTreeTracker([tmp_path])
+        tracker.refresh()
+
+        with target.open("ab") as handle:
+            handle.write(b"x" * 50)
+
+        assert tracker.refresh() == (150, 1)
+        assert tracker.directories_scanned == 0
+
     def test_capture_install_metrics_returns_dataclass(self) -> None:
         """Verify capture_install_metrics returns proper dataclass."""
         metrics = odt_build._capture_install_metrics()
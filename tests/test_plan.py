@@ -107,11 +107,13 @@ class TestPlanBuilder:
         assert task_step["metadata"]["tasks"] == [r"\\Microsoft\\Office\\TelemetryTask"]
 
         service_step = next(step for step in plan_steps if step["category"] == "service-cleanup")
-        assert service_step["depends_on"] == [task_step["id"]]
+        assert service_step["depends_on"] == ["licensing-1-0"]
         assert service_step["metadata"]["services"] == ["ClickToRunSvc"]
 
         filesystem = next(step for step in plan_steps if step["category"] == "filesystem-cleanup")
-        assert filesystem["depends_on"] == [service_step["id"]]
+        assert filesystem["depends_on"] == [task_step["id"], service_step["id"]]
+        registry = next(step for step in plan_steps if step["category"] == "registry-cleanup")
+        assert registry["depends_on"] == filesystem["depends_on"]
 
         msi_step = next(step for step in plan_steps if step["category"] == "msi-uninstall")
         detection_c2r_step = next(
@@ -464,7 +466,7 @@ class TestPlanBuilder:
         assert task_step["depends_on"] == [licensing["id"]]
 
         service_step = next(step for step in plan_steps if step["category"] == "service-cleanup")
-        assert service_step["depends_on"] == [task_step["id"]]
+        assert service_step["depends_on"] == [licensing["id"]]
 
     def test_plan_includes_task_and_service_cleanup(self) -> None:
         """!
@@ -493,7 +495,7 @@ class TestPlanBuilder:
 
         service_step = next(step for step in plan_steps if step["category"] == "service-cleanup")
         assert service_step["metadata"]["services"] == ["ClickToRunSvc", "ose"]
-        assert service_step["depends_on"] == [task_step["id"]]
+        assert service_step["depends_on"] == task_step["depends_on"]
         detect_step = next(step for step in plan_steps if step["category"] == "detect")
         assert detect_step["depends_on"] == ["context"]
 
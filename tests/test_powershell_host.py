@@ -0,0 +1,220 @@
+"""!
+@brief Tests for the pooled PowerShell hosts.
+@details The protocol, timeout and restart paths run against
+``powershell_host_stub.py``; the real bootstrap runs only where ``pwsh`` is
+installed.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import shutil
+import subprocess
+import sys
+import threading
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from office_janitor import exec_utils, powershell_host  # noqa: E402
+
+STUB_COMMAND = [sys.executable, str(pathlib.Path(__file__).with_name("powershell_host_stub.py"))]
+
+
+def _restore_defaults() -> None:
+    powershell_host.configure(
+        enabled=sys.platform == "win32",
+        size=powershell_host.DEFAULT_POOL_SIZE,
+        command=powershell_host.host_command(),
+    )
+
+
+@pytest.fixture
+def host():
+    instance = powershell_host.PowerShellHost(STUB_COMMAND, start_timeout=10)
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def stub_pool():
+    powershell_host.configure(enabled=True, size=2, command=STUB_COMMAND)
+    yield
+    _restore_defaults()
+
+
+def test_script_from_command() -> None:
+    """!
+    @brief Only plain ``-Command``/``-File`` invocations are hostable.
+    """
+
+    extract = powershell_host.script_from_command
+    assert extract(["powershell", "-NoProfile", "-Command", "Get-Date"]) == "Get-Date"
+    assert (
+        extract(
+            [r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe", "-NoProfile"]
+            + ["-ExecutionPolicy", "Bypass", "-NonInteractive", "-Command", "exit 3"]
+        )
+        == "exit 3"
+    )
+    assert extract(["powershell.exe", "-File", r"C:\it's.ps1"]) == r"& 'C:\it''s.ps1'"
+    assert extract(["powershell", "-Sta", "-Command", "1"]) is None
+    assert extract(["powershell", "-Command", "-"]) is None
+    assert extract(["pwsh", "-Command", "1"]) is None
+    assert extract(["cmd.exe", "/c", "dir"]) is None
+
+
+def test_host_round_trip_and_framing(host) -> None:
+    """!
+    @brief Requests reuse one process and stray output does not break framing.
+    """
+
+    first = host.execute("pid")
+    assert host.execute("echo héllo wörld").stdout == "héllo wörld\n"
+    assert host.execute("noise").stdout == "ok\n"
+    failed = host.execute("fail 5")
+
+    assert (failed.returncode, failed.stderr) == (5, "failed\n")
+    assert host.execute("pid").stdout == first.stdout
+    assert host.starts == 1
+
+
+def test_host_timeout_kills_and_restarts(host) -> None:
+    """!
+    @brief A request past its timeout kills the host; the next one restarts it.
+    """
+
+    before = host.execute("pid").stdout
+    with pytest.raises(powershell_host.PowerShellHostTimeout):
+        host.execute("sleep 5", timeout=0.3)
+    assert not host.alive
+
+    assert host.execute("pid").stdout != before
+    assert host.starts == 2
+
+
+def test_host_crash_is_reported_then_recovered(host) -> None:
+    """!
+    @brief A host that dies mid-request raises, and the next request restarts it.
+    """
+
+    with pytest.raises(powershell_host.PowerShellHostError):
+        host.execute("crash", timeout=5)
+    assert host.execute("echo back").stdout == "back\n"
+
+
+def test_pool_unavailable_when_host_cannot_start() -> None:
+    """!
+    @brief A missing executable disables the pool instead of retrying per call.
+    """
+
+    pool = powershell_host.PowerShellPool(
+        factory=lambda: powershell_host.PowerShellHost(["/nonexistent/powershell"])
+    )
+    with pytest.raises(powershell_host.PowerShellHostUnavailable):
+        pool.run("echo hi")
+    assert not pool.available
+    with pytest.raises(powershell_host.PowerShellHostUnavailable):
+        pool.run("echo hi")
+
+
+def test_pool_runs_concurrent_requests() -> None:
+    """!
+    @brief Concurrent callers share at most ``size`` hosts.
+    """
+
+    pool = powershell_host.PowerShellPool(
+        2, factory=lambda: powershell_host.PowerShellHost(STUB_COMMAND)
+    )
+    outputs: list[str] = []
+    try:
+        threads = [
+            threading.Thread(target=lambda n=n: outputs.append(pool.run(f"echo {n}").stdout))
+            for n in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(outputs) == [f"{n}\n" for n in range(6)]
+        assert len(pool._hosts) <= 2
+    finally:
+        pool.shutdown()
+
+
+def test_run_command_routes_powershell_through_pool(stub_pool, monkeypatch) -> None:
+    """!
+    @brief ``run_command`` hands PowerShell calls to the pool without spawning.
+    """
+
+    spawned: list[object] = []
+    real_popen = subprocess.Popen
+
+    def tracking_popen(args, *pargs, **kwargs):
+        spawned.append(args)
+        return real_popen(args, *pargs, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", tracking_popen)
+
+    results = [
+        exec_utils.run_command(
+            ["powershell.exe", "-NoProfile", "-Command", f"echo {n}"], event="ps_host_test"
+        )
+        for n in range(3)
+    ]
+    timed_out = exec_utils.run_command(
+        ["powershell", "-Command", "sleep 5"], event="ps_host_test", timeout=0.3
+    )
+
+    assert [result.stdout for result in results] == ["0\n", "1\n", "2\n"]
+    assert spawned == [STUB_COMMAND]  # the killed host is only replaced on next use
+    assert timed_out.timed_out and timed_out.returncode == 1
+
+
+def test_run_command_falls_back_when_pool_unavailable(monkeypatch) -> None:
+    """!
+    @brief Without a usable host the command is spawned as before.
+    """
+
+    powershell_host.configure(enabled=True, command=["/nonexistent/powershell"])
+    try:
+        result = exec_utils.run_command(
+            ["powershell", "-NoProfile", "-Command", "1"], event="ps_host_test"
+        )
+    finally:
+        _restore_defaults()
+    assert result.returncode == 127
+
+
+def test_bootstrap_never_reuses_a_predictable_script_path() -> None:
+    """!
+    @brief Scripts go to fresh random names that must not already exist.
+    """
+
+    bootstrap = powershell_host._HOST_BOOTSTRAP
+    assert "$PID+'.ps1'" not in bootstrap
+    assert bootstrap.count("NewGuid()") == 2
+    assert "'CreateNew'" in bootstrap
+    assert "SetAccessRuleProtection($true,$false)" in bootstrap
+
+
+@pytest.mark.skipif(shutil.which("pwsh") is None, reason="pwsh not installed")
+def test_real_bootstrap_with_pwsh() -> None:
+    """!
+    @brief The PowerShell side of the protocol, including ``exit`` and errors.
+    """
+
+    host = powershell_host.PowerShellHost(powershell_host.host_command("pwsh"))
+    try:
+        assert host.execute("Write-Output 'hi'", timeout=60).stdout.strip() == "hi"
+        assert host.execute("exit 7", timeout=60).returncode == 7
+        failed = host.execute("Write-Error 'boom'", timeout=60)
+        assert failed.returncode == 1 and "boom" in failed.stderr
+        assert host.execute("$x = 1; $x + 1", timeout=60).stdout.strip() == "2"
+        assert host.starts == 1
+    finally:
+        host.close()
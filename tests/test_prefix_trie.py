@@ -0,0 +1,53 @@
+"""!
+@brief Tests for the component trie behind the whitelist/blacklist guards.
+@details Covers longest-match selection and the ``str.startswith`` semantics
+kept for a prefix's last component in :mod:`office_janitor.prefix_trie`.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from office_janitor.prefix_trie import PrefixTrie  # noqa: E402
+
+
+def test_longest_match_prefers_deepest_prefix() -> None:
+    """!
+    @brief A nested entry overrides its parent for keys beneath it.
+    """
+
+    trie: PrefixTrie[str] = PrefixTrie()
+    parent = r"HKLM\SOFTWARE"
+    office = r"HKLM\SOFTWARE\MICROSOFT\OFFICE"
+    trie.add(parent, "parent")
+    trie.add(office, "office")
+
+    assert trie.longest_match(office + r"\16.0") == (len(office), "office")
+    assert trie.longest_match(parent + r"\CONTOSO") == (len(parent), "parent")
+    assert trie.longest_match(r"HKCU\SOFTWARE") is None
+    assert len(trie) == 2
+
+
+def test_last_component_matches_like_startswith() -> None:
+    """!
+    @brief ``...\\MICROSOFT OFFICE`` still covers ``...\\MICROSOFT OFFICE 15``.
+    """
+
+    trie: PrefixTrie[bool] = PrefixTrie()
+    office = r"C:\PROGRAM FILES\MICROSOFT OFFICE"
+    root = office + r" 15\ROOT"
+    trie.add(office, True)
+    trie.add(root, False)
+    trie.add("", True)
+
+    assert trie.longest_match(office + r" 15\DATA") == (len(office), True)
+    assert trie.longest_match(root + r"\X") == (len(root), False)
+    assert trie.matches(office)
+    assert not trie.matches(r"C:\PROGRAM FILES\MICROSOFT")
+    assert not trie.matches(r"D:\PROGRAM FILES\MICROSOFT OFFICE")
@@ -16,7 +16,7 @@ SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from office_janitor import exec_utils, registry_tools  # noqa: E402
+from office_janitor import exec_utils, guid_utils, registry_tools  # noqa: E402
 
 
 def _command_result(
@@ -57,6 +57,114 @@ class _Recorder:
         self.messages.append((message, payload))
 
 
+class _FakeRegistryKey:
+    """!
+    @brief Node in the in-memory registry used by :class:`_FakeWinreg`.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.children: dict[str, _FakeRegistryKey] = {}
+        self.values: dict[str, tuple[object, int]] = {}
+
+
+class _FakeWinreg:
+    """!
+    @brief Minimal ``winreg`` stand-in backed by a case-insensitive key tree.
+    """
+
+    KEY_READ = 0x20019
+    KEY_WRITE = 0x20006
+    KEY_ALL_ACCESS = 0xF003F
+    KEY_WOW64_32KEY = 0x0200
+    KEY_WOW64_64KEY = 0x0100
+    HKEY_CLASSES_ROOT = 0x80000000
+    HKEY_CURRENT_USER = 0x80000001
+    HKEY_LOCAL_MACHINE = 0x80000002
+    HKEY_USERS = 0x80000003
+    REG_SZ = 1
+    REG_EXPAND_SZ = 2
+    REG_BINARY = 3
+    REG_DWORD = 4
+    REG_MULTI_SZ = 7
+    REG_QWORD = 11
+
+    def __init__(self) -> None:
+        self.hives: dict[int, _FakeRegistryKey] = {}
+        self.locked: set[str] = set()
+        self.unreadable: set[str] = set()
+        self.deleted: list[str] = []
+
+    def add_key(self, hive: int, path: str, values: dict[str, tuple[object, int]] | None = None):
+        node = self.hives.setdefault(hive, _FakeRegistryKey(""))
+        for part in [segment for segment in path.split("\\") if segment]:
+            node = node.children.setdefault(part.lower(), _FakeRegistryKey(part))
+        node.values.update(values or {})
+        return node
+
+    def _resolve(self, root, path: str) -> tuple[_FakeRegistryKey, str]:
+        if isinstance(root, tuple):
+            hive, base = root
+        else:
+            hive, base = root, ""
+        full = "\\".join(part for part in (base, path) if part)
+        node = self.hives.get(hive)
+        if node is None:
+            raise FileNotFoundError(full)
+        for part in [segment for segment in full.split("\\") if segment]:
+            node = node.children.get(part.lower())
+            if node is None:
+                raise FileNotFoundError(full)
+        return node, full
+
+    def ConnectRegistry(self, _machine, hive):
+        return (hive, "")
+
+    def OpenKey(self, root, path, _reserved=0, _access=0):
+        _node, full = self._resolve(root, path)
+        if full.lower() in self.unreadable:
+            raise PermissionError(5, "Access is denied", full)
+        hive = root[0] if isinstance(root, tuple) else root
+        return (hive, full)
+
+    def CloseKey(self, _handle) -> None:
+        return None
+
+    def EnumKey(self, handle, index):
+        node, _ = self._resolve(handle, "")
+        names = sorted(child.name for child in node.children.values())
+        if index >= len(names):
+            raise OSError("no more items")
+        return names[index]
+
+    def EnumValue(self, handle, index):
+        node, _ = self._resolve(handle, "")
+        items = sorted(node.values.items())
+        if index >= len(items):
+            raise OSError("no more items")
+        name, (value, kind) = items[index]
+        return name, value, kind
+
+    def QueryValueEx(self, handle, name):
+        node, _ = self._resolve(handle, "")
+        if name not in node.values:
+            raise FileNotFoundError(name)
+        value, kind = node.values[name]
+        return value, kind
+
+    def DeleteKey(self, root, path) -> None:
+        node, full = self._resolve(root, path)
+        if full.lower() in self.locked:
+            raise PermissionError(5, "Access is denied", full)
+        if node.children:
+            raise PermissionError(5, "Key has subkeys", full)
+        parent_path, _, leaf = full.rpartition("\\")
+        hive = root[0] if isinstance(root, tuple) else root
+        parent, _ = self._resolve(hive, parent_path)
+        del parent.children[leaf.lower()]
+        self.deleted.append(full)
+
+
 def test_delete_keys_invokes_reg_when_available(monkeypatch) -> None:
     """!
     @brief Deletion should call ``reg delete`` when the binary exists.
@@ -64,6 +172,7 @@ def test_delete_keys_invokes_reg_when_available(monkeypatch) -> None:
 
     commands: list[list[str]] = []
 
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "reg.exe")
 
     def fake_run(command, *, event, dry_run=False, **kwargs):
@@ -82,11 +191,117 @@ def test_delete_keys_invokes_reg_when_available(monkeypatch) -> None:
     assert commands == [["reg.exe", "delete", "HKLM\\Software\\Microsoft\\Office\\Contoso", "/f"]]
 
 
+def test_delete_keys_native_removes_subtree_deepest_first(monkeypatch) -> None:
+    """!
+    @brief The native engine should delete children before parents without ``reg.exe``.
+    """
+
+    fake = _FakeWinreg()
+    fake.add_key(fake.HKEY_LOCAL_MACHINE, "Software\\Microsoft\\Office\\Contoso\\Child\\Leaf")
+    fake.add_key(fake.HKEY_LOCAL_MACHINE, "Software\\Microsoft\\Office\\Contoso\\Sibling")
+    monkeypatch.setattr(registry_tools, "winreg", fake)
+    monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "reg.exe")
+
+    def fail_run(*_args, **_kwargs):
+        raise AssertionError("reg.exe should not be invoked when native deletion succeeds")
+
+    monkeypatch.setattr(registry_tools.exec_utils, "run_command", fail_run)
+    machine = _Recorder()
+    monkeypatch.setattr(registry_tools.logging_ext, "get_machine_logger", lambda: machine)
+
+    result = registry_tools.delete_keys(
+        [
+            "HKLM\\Software\\Microsoft\\Office\\Contoso",
+            "HKLM\\Software\\Microsoft\\Office\\Missing",
+        ],
+        dry_run=False,
+        logger=_Recorder(),
+    )
+
+    assert result.native is True
+    assert result.deleted == ["HKLM\\Software\\Microsoft\\Office\\Contoso"]
+    assert result.missing == ["HKLM\\Software\\Microsoft\\Office\\Missing"]
+    assert fake.deleted[-1] == "Software\\Microsoft\\Office\\Contoso"
+    assert fake.deleted.index("Software\\Microsoft\\Office\\Contoso\\Child\\Leaf") < (
+        fake.deleted.index("Software\\Microsoft\\Office\\Contoso\\Child")
+    )
+    batch_events = [m for m in machine.messages if m[0] == "registry_delete_batch"]
+    assert len(batch_events) == 1
+    assert batch_events[0][1]["extra"]["requested"] == 2
+
+
+def test_delete_keys_native_failure_falls_back_to_reg(monkeypatch) -> None:
+    """!
+    @brief Keys that fail natively should be retried through ``reg.exe`` only.
+    """
+
+    fake = _FakeWinreg()
+    fake.add_key(fake.HKEY_LOCAL_MACHINE, "Software\\Microsoft\\Office\\Locked")
+    fake.add_key(fake.HKEY_LOCAL_MACHINE, "Software\\Microsoft\\Office\\Open")
+    fake.locked.add("software\\microsoft\\office\\locked")
+    monkeypatch.setattr(registry_tools, "winreg", fake)
+    monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "reg.exe")
+    monkeypatch.setattr(registry_tools.logging_ext, "get_machine_logger", lambda: _Recorder())
+
+    commands: list[list[str]] = []
+
+    def fake_run(command, *, event, dry_run=False, **kwargs):
+        commands.append([str(part) for part in command])
+        return _command_result(command, skipped=dry_run)
+
+    monkeypatch.setattr(registry_tools.exec_utils, "run_command", fake_run)
+
+    result = registry_tools.delete_keys(
+        [
+            "HKLM\\Software\\Microsoft\\Office\\Locked",
+            "HKLM\\Software\\Microsoft\\Office\\Open",
+        ],
+        dry_run=False,
+        logger=_Recorder(),
+    )
+
+    assert commands == [["reg.exe", "delete", "HKLM\\Software\\Microsoft\\Office\\Locked", "/f"]]
+    assert result.deleted == ["HKLM\\Software\\Microsoft\\Office\\Open"]
+    assert result.fallback == ["HKLM\\Software\\Microsoft\\Office\\Locked"]
+    assert not result.failed
+
+
+def test_delete_keys_native_dry_run_emits_plan_events(monkeypatch) -> None:
+    """!
+    @brief Native dry runs should log one plan event per key and delete nothing.
+    """
+
+    fake = _FakeWinreg()
+    fake.add_key(fake.HKEY_LOCAL_MACHINE, "Software\\Microsoft\\Office\\Contoso")
+    monkeypatch.setattr(registry_tools, "winreg", fake)
+    monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "reg.exe")
+    machine = _Recorder()
+    monkeypatch.setattr(registry_tools.logging_ext, "get_machine_logger", lambda: machine)
+
+    result = registry_tools.delete_keys(
+        [
+            "HKLM\\Software\\Microsoft\\Office\\Contoso",
+            "HKLM\\Software\\Microsoft\\Office\\Other",
+        ],
+        dry_run=True,
+        logger=_Recorder(),
+    )
+
+    plans = [m[1]["extra"]["key"] for m in machine.messages if m[0] == "registry_delete_dry_run"]
+    assert plans == [
+        "HKLM\\Software\\Microsoft\\Office\\Contoso",
+        "HKLM\\Software\\Microsoft\\Office\\Other",
+    ]
+    assert result.dry_run is True
+    assert not fake.deleted
+
+
 def test_delete_keys_dry_run_skips_execution(monkeypatch) -> None:
     """!
     @brief Dry-run should avoid invoking ``reg.exe``.
     """
 
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "reg.exe")
 
     calls: list[bool] = []
@@ -111,6 +326,7 @@ def test_delete_keys_respects_safety_guard(monkeypatch) -> None:
     @brief Dry-run safety guard should force simulated registry deletion.
     """
 
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "reg.exe")
     monkeypatch.setattr(
         registry_tools.safety,
@@ -159,6 +375,7 @@ def test_delete_keys_skip_whitelist_allows_any_key(monkeypatch, caplog) -> None:
         calls.append(command[2] if len(command) > 2 else "")
         return _command_result(command, skipped=dry_run)
 
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "reg.exe")
     monkeypatch.setattr(registry_tools.exec_utils, "run_command", fake_run)
 
@@ -215,6 +432,7 @@ def test_export_keys_skip_whitelist_exports_any_key(tmp_path, monkeypatch) -> No
     """!
     @brief ``skip_whitelist=True`` allows exporting otherwise blocked keys.
     """
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: None)
 
     exported = registry_tools.export_keys(
@@ -232,6 +450,7 @@ def test_export_keys_creates_placeholder_when_reg_missing(tmp_path, monkeypatch)
     @brief Exports should produce placeholder files if ``reg.exe`` is absent.
     """
 
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: None)
 
     recorder = _Recorder()
@@ -291,6 +510,7 @@ def test_export_keys_invokes_reg_command(tmp_path, monkeypatch) -> None:
     @brief When ``reg.exe`` is present the utility should invoke it for exports.
     """
 
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "C:/Windows/system32/reg.exe")
     calls: list[list[str]] = []
 
@@ -324,6 +544,7 @@ def test_export_keys_produces_unique_filenames(tmp_path, monkeypatch) -> None:
     @brief Duplicate key exports should yield unique placeholder filenames.
     """
 
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: None)
 
     exported = registry_tools.export_keys(
@@ -343,6 +564,128 @@ def test_export_keys_produces_unique_filenames(tmp_path, monkeypatch) -> None:
     assert exported[0].exists() and exported[1].exists()
 
 
+def test_write_reg_file_streams_regedit5_tree(tmp_path, monkeypatch) -> None:
+    """!
+    @brief The native exporter should emit a UTF-16LE REGEDIT5 file for the subtree.
+    """
+
+    from office_janitor import registry_export
+
+    fake = _FakeWinreg()
+    fake.add_key(
+        fake.HKEY_LOCAL_MACHINE,
+        "Software\\Microsoft\\Office\\Fabrikam",
+        {
+            "": ("Default", fake.REG_SZ),
+            "Path": ('C:\\Program Files\\"Office"', fake.REG_SZ),
+            "Count": (42, fake.REG_DWORD),
+            "Flags": (b"\x01\xff", fake.REG_BINARY),
+            "Items": (["a", "b"], fake.REG_MULTI_SZ),
+        },
+    )
+    fake.add_key(
+        fake.HKEY_LOCAL_MACHINE,
+        "Software\\Microsoft\\Office\\Fabrikam\\Child",
+        {"Blob": (bytes(range(40)), fake.REG_BINARY)},
+    )
+    monkeypatch.setattr(registry_tools, "winreg", fake)
+
+    target = tmp_path / "export.reg"
+    written, skipped = registry_export.write_reg_file(
+        target,
+        ["HKLM\\Software\\Microsoft\\Office\\Fabrikam", "HKLM\\Software\\Microsoft\\Nope"],
+        buffer_chars=16,
+    )
+
+    assert written == ["HKLM\\Software\\Microsoft\\Office\\Fabrikam"]
+    assert skipped == {"HKLM\\Software\\Microsoft\\Nope": "key not found"}
+    raw = target.read_bytes()
+    assert raw.startswith(b"\xff\xfe")
+    text = raw[2:].decode("utf-16-le")
+    lines = text.split("\r\n")
+    assert lines[0] == "Windows Registry Editor Version 5.00"
+    assert "[HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Office\\Fabrikam]" in lines
+    assert '@="Default"' in lines
+    assert '"Path"="C:\\\\Program Files\\\\\\"Office\\""' in lines
+    assert '"Count"=dword:0000002a' in lines
+    assert '"Flags"=hex:01,ff' in lines
+    assert '"Items"=hex(7):61,00,00,00,62,00,00,00,00,00' in lines
+    child_index = lines.index("[HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Office\\Fabrikam\\Child]")
+    assert child_index > lines.index('"Items"=hex(7):61,00,00,00,62,00,00,00,00,00')
+    blob_line = lines[child_index + 1]
+    assert blob_line.startswith('"Blob"=hex:00,01,') and blob_line.endswith(",\\")
+    assert all(len(line) <= 80 for line in lines)
+
+
+def test_export_keys_consolidated_native_skips_reg(tmp_path, monkeypatch) -> None:
+    """!
+    @brief Consolidated exports should write every key into one file in-process.
+    """
+
+    fake = _FakeWinreg()
+    fake.add_key(fake.HKEY_LOCAL_MACHINE, "Software\\Microsoft\\Office\\One", {"A": (1, 4)})
+    fake.add_key(fake.HKEY_CURRENT_USER, "Software\\Microsoft\\Office\\Two", {"B": ("x", 1)})
+    monkeypatch.setattr(registry_tools, "winreg", fake)
+    monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "reg.exe")
+
+    def fail_run(*_args, **_kwargs):
+        raise AssertionError("reg.exe should not be invoked for native exports")
+
+    monkeypatch.setattr(registry_tools.exec_utils, "run_command", fail_run)
+
+    exported = registry_tools.export_keys(
+        [
+            "HKLM\\Software\\Microsoft\\Office\\One",
+            "HKCU\\Software\\Microsoft\\Office\\Two",
+        ],
+        tmp_path,
+        consolidated=True,
+        logger=_Recorder(),
+    )
+
+    assert len(exported) == 1
+    text = exported[0].read_bytes()[2:].decode("utf-16-le")
+    assert "[HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Office\\One]" in text
+    assert "[HKEY_CURRENT_USER\\Software\\Microsoft\\Office\\Two]" in text
+
+
+def test_export_keys_consolidated_retries_partial_keys_with_reg(tmp_path, monkeypatch) -> None:
+    """!
+    @brief Keys with unreadable subkeys must get a complete ``reg.exe`` backup.
+    """
+
+    fake = _FakeWinreg()
+    fake.add_key(fake.HKEY_LOCAL_MACHINE, "Software\\Microsoft\\Office\\One\\Locked")
+    fake.add_key(fake.HKEY_LOCAL_MACHINE, "Software\\Microsoft\\Office\\Two")
+    fake.unreadable.add("software\\microsoft\\office\\one\\locked")
+    monkeypatch.setattr(registry_tools, "winreg", fake)
+    monkeypatch.setattr(registry_tools.shutil, "which", lambda exe: "reg.exe")
+
+    commands: list[list[str]] = []
+
+    def fake_run(command, *, event, dry_run=False, **kwargs):
+        commands.append([str(part) for part in command])
+        return _command_result(command)
+
+    monkeypatch.setattr(registry_tools.exec_utils, "run_command", fake_run)
+
+    exported = registry_tools.export_keys(
+        [
+            "HKLM\\Software\\Microsoft\\Office\\One",
+            "HKLM\\Software\\Microsoft\\Office\\Two",
+        ],
+        tmp_path,
+        consolidated=True,
+        logger=_Recorder(),
+    )
+
+    assert [command[:3] for command in commands] == [
+        ["reg.exe", "export", "HKLM\\Software\\Microsoft\\Office\\One"]
+    ]
+    assert len(exported) == 2
+    assert str(exported[1]) == commands[0][3]
+
+
 def test_iter_office_uninstall_entries_filters_non_office(monkeypatch) -> None:
     """!
     @brief Only Office-like entries should be returned from uninstall enumeration.
@@ -800,3 +1143,61 @@ class TestCleanupPublishedComponents:
 
         assert result["components_processed"] == 0
         assert result["values_modified"] == 0
+
+    def test_cleanup_scans_once_and_rewrites_office_entries(self, monkeypatch) -> None:
+        """Office entries are filtered from one scan and written back per component."""
+
+        office = "{90160000-008C-0000-0000-0000000FF1CE}"
+        other = "{12345678-1234-1234-1234-123456789ABC}"
+        office_entry = guid_utils.squish_guid(office) + "Feature"
+        other_entry = guid_utils.squish_guid(other) + "Feature"
+
+        class _WritableWinreg(_FakeWinreg):
+            def __init__(self) -> None:
+                super().__init__()
+                self.opened: list[str] = []
+
+            def OpenKey(self, root, path, _reserved=0, _access=0):
+                handle = super().OpenKey(root, path, _reserved, _access)
+                self.opened.append(handle[1])
+                return handle
+
+            def SetValueEx(self, handle, name, _reserved, kind, value) -> None:
+                node, _ = self._resolve(handle, "")
+                node.values[name] = (value, kind)
+
+            def DeleteValue(self, handle, name) -> None:
+                node, _ = self._resolve(handle, "")
+                del node.values[name]
+
+        fake = _WritableWinreg()
+        hkcr = registry_tools._WINREG_HKCR
+        multi = fake.REG_MULTI_SZ
+        fake.add_key(
+            hkcr,
+            "Installer\\Components\\Mixed",
+            {"shared": ([office_entry, other_entry], multi), "plain": ("text", fake.REG_SZ)},
+        )
+        fake.add_key(hkcr, "Installer\\Components\\OfficeOnly", {"": ([office_entry], multi)})
+        fake.add_key(hkcr, "Installer\\Components\\Foreign", {"x": ([other_entry], multi)})
+        monkeypatch.setattr(registry_tools, "winreg", fake)
+
+        dry = registry_tools.cleanup_published_components(dry_run=True, logger=_Recorder())
+        assert dry["components_processed"] == 3
+        assert dry["values_modified"] == 2
+        assert dry["entries_removed"] == 2
+        opened_during_scan = len(fake.opened)
+        # The Components root plus one relative open per component key.
+        assert opened_during_scan == 4
+
+        result = registry_tools.cleanup_published_components(
+            dry_run=False, logger=_Recorder(), max_workers=2
+        )
+
+        assert result["values_modified"] == 2
+        assert result["errors"] == []
+        components = fake.hives[hkcr].children["installer"].children["components"].children
+        assert components["mixed"].values["shared"] == ([other_entry], multi)
+        assert components["mixed"].values["plain"] == ("text", fake.REG_SZ)
+        assert "" not in components["officeonly"].values
+        assert components["foreign"].values["x"] == ([other_entry], multi)
@@ -64,6 +64,7 @@ def test_cleanup_vnext_identity_registry_exports_backups(tmp_path, monkeypatch)
     commands: list[list[str]] = []
 
     monkeypatch.setattr(registry_tools, "key_exists", lambda *args, **kwargs: False)
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_user.shutil, "which", lambda exe: "reg.exe")
 
     def fake_run(command, *, event, dry_run=False, check=False, extra=None, **kwargs):
@@ -92,6 +93,7 @@ def test_cleanup_taskband_registry_include_all_users_with_backup(tmp_path, monke
     deleted: list[str] = []
     unloaded: list[bool] = []
 
+    monkeypatch.setattr(registry_tools, "winreg", None)
     monkeypatch.setattr(registry_user.shutil, "which", lambda exe: None)
     monkeypatch.setattr(
         registry_user,
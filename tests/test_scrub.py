@@ -9,13 +9,15 @@ from __future__ import annotations
 import json
 import pathlib
 import sys
+import threading
+import time
 
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from office_janitor import logging_ext, scrub, scrub_executor  # noqa: E402
+from office_janitor import detect, logging_ext, scrub, scrub_executor, scrub_scheduler  # noqa: E402
 
 
 def _context(dry_run: bool = False, options: dict | None = None, pass_index: int = 1) -> dict:
@@ -53,6 +55,7 @@ def test_log_summary_mentions_reboot(tmp_path) -> None:
     human_log = (tmp_path / "human.log").read_text(encoding="utf-8")
     assert "reboot recommended" in human_log.lower()
 
+    logging_ext.flush_logs()
     machine_log = (tmp_path / "events.jsonl").read_text(encoding="utf-8").splitlines()
     events = [json.loads(line) for line in machine_log if line.strip()]
     summary = next(event for event in events if event.get("event") == "scrub_summary")
@@ -458,6 +461,55 @@ def test_execute_plan_repeats_until_clean(monkeypatch, tmp_path) -> None:
     ]
 
 
+def test_execute_plan_reprobes_incrementally_with_inventory(monkeypatch, tmp_path) -> None:
+    """!
+    @brief Passes after the first recheck only the products that were attempted.
+    """
+
+    logging_ext.setup_logging(tmp_path)
+
+    monkeypatch.setattr(
+        scrub.restore_point,
+        "create_restore_point",
+        lambda description, **kwargs: None,
+    )
+    monkeypatch.setattr(scrub.processes, "terminate_office_processes", lambda names: None)
+    monkeypatch.setattr(scrub.msi_uninstall, "uninstall_products", lambda products, **kw: None)
+
+    def unexpected_reprobe(options):  # type: ignore[no-untyped-def]
+        raise AssertionError("full re-probe should not run when the inventory is known")
+
+    monkeypatch.setattr(scrub.detect, "reprobe", unexpected_reprobe)
+
+    attempted: list[dict] = []
+
+    def fake_incremental(previous, targets):  # type: ignore[no-untyped-def]
+        attempted.append({key: list(value) for key, value in targets.items()})
+        return detect.InventoryDiff(removed={"msi": [previous["msi"][0]]}, remaining={"msi": []})
+
+    monkeypatch.setattr(scrub.detect, "reprobe_incremental", fake_incremental)
+
+    replanned: list[dict] = []
+
+    def fake_replan(inventory, options, pass_index=1):  # type: ignore[no-untyped-def]
+        replanned.append(dict(inventory))
+        return [_context(False, options, pass_index)]
+
+    monkeypatch.setattr(scrub.plan_module, "build_plan", fake_replan)
+
+    product = {"product_code": "{CODE}", "version": "2016"}
+    inventory = {"msi": [product], "c2r": [], "filesystem": []}
+    plan = [
+        _context(False, {"max_passes": 3}, 1),
+        {"id": "msi-1-0", "category": "msi-uninstall", "metadata": {"product": product}},
+    ]
+
+    scrub.execute_plan(plan, inventory=inventory)
+
+    assert attempted == [{"msi": ["{CODE}"], "c2r": []}]
+    assert replanned == [{"msi": [], "c2r": [], "filesystem": []}]
+
+
 def test_registry_cleanup_exports_and_deletes(monkeypatch, tmp_path) -> None:
     """!
     @brief Ensure registry cleanup exports keys before deletion.
@@ -677,3 +729,73 @@ def test_execute_plan_alerts_when_pass_limit_reached(monkeypatch, tmp_path) -> N
 
     human_log = (tmp_path / "human.log").read_text(encoding="utf-8")
     assert "ALERT: Reached maximum scrub passes" in human_log
+
+
+def _graph_plan() -> list[dict]:
+    return [
+        {"id": "context", "category": "context", "depends_on": []},
+        {"id": "detect-1-0", "category": "detect", "depends_on": ["context"]},
+        {"id": "c2r-1-0", "category": "c2r-uninstall", "depends_on": ["detect-1-0"]},
+        {"id": "msi-1-0", "category": "msi-uninstall", "depends_on": ["detect-1-0"]},
+        {"id": "msi-1-1", "category": "msi-uninstall", "depends_on": ["detect-1-0"]},
+        {"id": "licensing-1-0", "category": "licensing-cleanup", "depends_on": ["msi-1-1"]},
+    ]
+
+
+def test_run_step_graph_overlaps_independent_steps(tmp_path) -> None:
+    """!
+    @brief Unrelated uninstalls overlap while msiexec steps stay serialized.
+    """
+
+    logging_ext.setup_logging(tmp_path)
+
+    overlap = threading.Barrier(2, timeout=5)
+    state_lock = threading.Lock()
+    active: dict[str, int] = {"msiexec": 0}
+    peak: dict[str, int] = {"msiexec": 0}
+    finished: list[str] = []
+
+    def run_step(step, index):
+        step_id = step["id"]
+        if step_id in {"c2r-1-0", "msi-1-0"}:
+            # Both must be in flight at the same time for the barrier to release.
+            overlap.wait()
+        if step["category"] == "msi-uninstall":
+            with state_lock:
+                active["msiexec"] += 1
+                peak["msiexec"] = max(peak["msiexec"], active["msiexec"])
+            time.sleep(0.02)
+            with state_lock:
+                active["msiexec"] -= 1
+        with state_lock:
+            finished.append(step_id)
+        return scrub.StepResult(step_id=step_id, category=step["category"], status="success")
+
+    results = scrub_scheduler.run_step_graph(_graph_plan(), run_step, max_workers=4)
+
+    assert [item.step_id for item in results] == [step["id"] for step in _graph_plan()]
+    assert peak["msiexec"] == 1
+    assert finished.index("licensing-1-0") > finished.index("msi-1-1")
+
+
+def test_run_step_graph_stops_after_recoverable_failure(tmp_path) -> None:
+    """!
+    @brief A recoverable failure raises with partial results and skips dependents.
+    """
+
+    logging_ext.setup_logging(tmp_path)
+
+    def run_step(step, index):
+        status = "failed" if step["id"] == "msi-1-1" else "success"
+        return scrub.StepResult(step_id=step["id"], category=step["category"], status=status)
+
+    try:
+        scrub_scheduler.run_step_graph(_graph_plan(), run_step, max_workers=2)
+    except scrub.StepExecutionError as exc:
+        assert exc.result.step_id == "msi-1-1"
+        executed = [item.step_id for item in exc.partial_results]
+    else:  # pragma: no cover - defensive
+        raise AssertionError("expected StepExecutionError")
+
+    assert "licensing-1-0" not in executed
+    assert executed == sorted(executed, key=[s["id"] for s in _graph_plan()].index)
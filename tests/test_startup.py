@@ -0,0 +1,104 @@
+"""!
+@brief Startup budget for the CLI entry point.
+@details Importing :mod:`office_janitor.main` must not pull in detection,
+scrub, the interactive UIs or the ODT builder; those load only when a command
+needs them. Measured in a fresh interpreter with ``-X importtime``.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from office_janitor import cli_help  # noqa: E402
+
+STARTUP_BUDGET_US = 400_000
+"""!
+@brief Cumulative import time allowed for ``office_janitor.main`` (microseconds).
+@details Roughly 2-3x the measured cost, so slow CI hosts pass while a
+regression that eagerly imports detection or scrub again (about 4x) fails.
+"""
+
+DEFERRED_MODULES = (
+    "office_janitor.constants",
+    "office_janitor.detect",
+    "office_janitor.main_repair",
+    "office_janitor.main_state",
+    "office_janitor.odt_build",
+    "office_janitor.plan",
+    "office_janitor.scrub",
+    "office_janitor.tui",
+    "office_janitor.ui",
+)
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    env = dict(os.environ, PYTHONPATH=str(SRC_PATH))
+    command = [sys.executable, "-X", "importtime", "-c", statement]
+    subprocess.run(command, env=env, capture_output=True, check=True)  # warm bytecode caches
+    completed = subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.split("|")
+        try:
+            cumulative = int(fields[1])
+        except (IndexError, ValueError):
+            continue  # header row
+        times[fields[2].strip()] = cumulative
+    return times
+
+
+def test_main_import_defers_heavy_modules() -> None:
+    """!
+    @brief Heavy modules stay unloaded and the import fits the budget.
+    """
+
+    times = _import_times("import office_janitor.main")
+
+    assert "office_janitor.main" in times
+    assert not [name for name in DEFERRED_MODULES if name in times]
+    assert times["office_janitor.main"] < STARTUP_BUDGET_US
+
+
+def test_lazy_attributes_resolve_on_access() -> None:
+    """!
+    @brief Deferred names remain reachable as attributes of ``main``.
+    """
+
+    pytest.importorskip("winreg", reason="main_state imports Windows-only modules")
+    from office_janitor import main, main_state
+
+    assert main._determine_mode is main_state.determine_mode
+    assert main.plan_module.__name__ == "office_janitor.plan"
+    with pytest.raises(AttributeError):
+        main.no_such_attribute  # noqa: B018
+
+
+def test_subcommand_options_built_only_when_selected() -> None:
+    """!
+    @brief Only the selected subcommand's parser receives its options.
+    """
+
+    parser = cli_help.build_arg_parser()
+    subparsers = next(
+        action for action in parser._actions if isinstance(action, cli_help.LazySubParsersAction)
+    )
+
+    args = parser.parse_args(["remove", "--dry-run"])
+
+    assert args.command == "remove"
+    assert args.dry_run is True
+    assert set(subparsers._builders) == set(subparsers.choices) - {"remove"}
+    assert not subparsers.choices["odt"]._actions
+    assert subparsers.build("odt")._actions
@@ -16,7 +16,13 @@ SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from office_janitor import exec_utils, logging_ext, tasks_services  # noqa: E402
+from office_janitor import (  # noqa: E402
+    exec_utils,
+    logging_ext,
+    service_control,
+    task_scheduler,
+    tasks_services,
+)
 
 
 def _command_result(
@@ -64,6 +70,7 @@ def test_stop_services_timeout_requests_reboot(monkeypatch, tmp_path) -> None:
         return _command_result(command)
 
     monkeypatch.setattr(tasks_services.exec_utils, "run_command", fake_run)
+    monkeypatch.setattr(tasks_services.service_control, "default_controller", lambda: None)
     outcome = tasks_services.stop_services(["ClickToRunSvc"], timeout=5)
 
     assert commands[0][:2] == ["sc.exe", "stop"]
@@ -76,6 +83,7 @@ def test_stop_services_timeout_requests_reboot(monkeypatch, tmp_path) -> None:
     human_log = (tmp_path / "human.log").read_text(encoding="utf-8")
     assert "recommend reboot" in human_log.lower()
 
+    logging_ext.flush_logs()
     machine_log = (tmp_path / "events.jsonl").read_text(encoding="utf-8").splitlines()
     machine_events = [json.loads(line) for line in machine_log if line.strip()]
     timeout_event = next(
@@ -89,6 +97,120 @@ def test_stop_services_timeout_requests_reboot(monkeypatch, tmp_path) -> None:
     assert tasks_services.consume_reboot_recommendations() == []
 
 
+class _FakeController(service_control.ServiceController):
+    """!
+    @brief Canned :class:`service_control.ServiceController` for tests.
+    """
+
+    name = "fake"
+
+    def __init__(self, outcomes: dict[str, service_control.ServiceOutcome]) -> None:
+        self.outcomes = outcomes
+        self.calls: list[tuple[list[str], float]] = []
+
+    def stop_and_disable(self, services, *, timeout):
+        self.calls.append((list(services), timeout))
+        return [self.outcomes[name] for name in services]
+
+
+def test_stop_services_native_backend_keeps_reboot_contract(monkeypatch, tmp_path) -> None:
+    """!
+    @brief The native backend handles all services in one call; errors fall back to sc.exe.
+    """
+
+    logging_ext.setup_logging(tmp_path)
+    commands: list[list[str]] = []
+
+    def fake_run(command, *, event, **kwargs):
+        commands.append([str(part) for part in command])
+        return _command_result(command)
+
+    controller = _FakeController(
+        {
+            "ClickToRunSvc": service_control.ServiceOutcome(
+                "ClickToRunSvc", stopped=True, disabled=True
+            ),
+            "ose": service_control.ServiceOutcome("ose", disabled=True, timed_out=True),
+            "Missing": service_control.ServiceOutcome("Missing", found=False),
+            "Denied": service_control.ServiceOutcome("Denied", error="access denied"),
+        }
+    )
+    monkeypatch.setattr(tasks_services.exec_utils, "run_command", fake_run)
+
+    outcome = tasks_services.stop_services(
+        ["ClickToRunSvc", "ose", "Missing", "Denied"], timeout=7, controller=controller
+    )
+
+    assert controller.calls == [(["ClickToRunSvc", "ose", "Missing", "Denied"], 7)]
+    assert [command[:3] for command in commands] == [
+        ["sc.exe", "stop", "Denied"],
+        ["sc.exe", "config", "Denied"],
+    ]
+    assert outcome == {"reboot_required": True, "services_requiring_reboot": ["ose"]}
+    assert tasks_services.consume_reboot_recommendations() == ["ose"]
+
+
+class _FakeAdvapi32:
+    """!
+    @brief Minimal ``advapi32`` stand-in driving :class:`ScmServiceController`.
+    """
+
+    def __init__(self, states: dict[str, list[int]]) -> None:
+        self.states = states
+        self.last_error = 0
+        self.disabled: list[str] = []
+        self.stop_requests: list[str] = []
+        self.closed: list[object] = []
+
+    def OpenSCManagerW(self, machine, database, access):  # noqa: N802
+        return "scm"
+
+    def OpenServiceW(self, scm, name, access):  # noqa: N802
+        if name not in self.states:
+            self.last_error = service_control.ERROR_SERVICE_DOES_NOT_EXIST
+            return None
+        return name
+
+    def ChangeServiceConfigW(self, handle, *args):  # noqa: N802
+        self.disabled.append(handle)
+        return 1
+
+    def ControlService(self, handle, control, status_ref):  # noqa: N802
+        self.stop_requests.append(handle)
+        status_ref._obj.dwCurrentState = 3  # SERVICE_STOP_PENDING
+        return 1
+
+    def QueryServiceStatus(self, handle, status_ref):  # noqa: N802
+        sequence = self.states[handle]
+        status_ref._obj.dwCurrentState = sequence.pop(0) if len(sequence) > 1 else sequence[0]
+        return 1
+
+    def CloseServiceHandle(self, handle):  # noqa: N802
+        self.closed.append(handle)
+        return 1
+
+
+def test_scm_controller_waits_on_shared_deadline() -> None:
+    """!
+    @brief Stop requests go out for every service and stragglers time out together.
+    """
+
+    api = _FakeAdvapi32({"Fast": [3, 1], "Hung": [3]})
+    controller = service_control.ScmServiceController(
+        api, get_last_error=lambda: api.last_error, poll_interval=0.01
+    )
+
+    outcomes = controller.stop_and_disable(["Fast", "Hung", "Missing"], timeout=0.2)
+
+    assert sorted(api.disabled) == ["Fast", "Hung"]
+    assert sorted(api.stop_requests) == ["Fast", "Hung"]
+    by_name = {outcome.service: outcome for outcome in outcomes}
+    assert by_name["Fast"].stopped and not by_name["Fast"].timed_out
+    assert by_name["Hung"].timed_out and not by_name["Hung"].stopped
+    assert by_name["Missing"].found is False
+    assert sorted(api.closed, key=str) == ["Fast", "Hung", "scm"]
+
+
 def test_delete_tasks_respects_safety_guard(monkeypatch) -> None:
     """!
     @brief Task deletion should downgrade to dry-run when the safety guard blocks.
@@ -110,3 +232,163 @@ def test_delete_tasks_respects_safety_guard(monkeypatch) -> None:
     tasks_services.delete_tasks([r"\Microsoft\Office\TestTask"], dry_run=False)
 
     assert dry_run_flags and all(dry_run_flags)
+
+
+_TASK_XML = """<?xml version="1.0" encoding="UTF-16"?>
+<Task xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
+  <Settings><Enabled>{enabled}</Enabled></Settings>
+</Task>
+"""
+
+
+def _write_task(root: pathlib.Path, path: str, *, enabled: bool = True) -> None:
+    target = root.joinpath(*path.strip("\\").split("\\"))
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(_TASK_XML.format(enabled=str(enabled).lower()), encoding="utf-16")
+
+
+def test_schedule_service_backend_batches_registered_tasks(monkeypatch, tmp_path) -> None:
+    """!
+    @brief One PowerShell session handles every registered task; absent tasks are skipped.
+    """
+
+    logging_ext.setup_logging(tmp_path / "logs")
+    tasks_root = tmp_path / "Tasks"
+    _write_task(tasks_root, r"\Microsoft\Office\OfficeTelemetryAgentLogOn")
+    _write_task(tasks_root, r"\Microsoft\Office\Locked", enabled=False)
+    commands: list[list[str]] = []
+
+    def fake_run(command, *, event, **kwargs):
+        commands.append([str(part) for part in command])
+        payload = [
+            {"task": r"\Microsoft\Office\OfficeTelemetryAgentLogOn", "found": True, "ok": True},
+            {"task": r"\Microsoft\Office\Locked", "found": True, "ok": False, "error": "denied"},
+        ]
+        return _command_result(command, stdout=json.dumps(payload))
+
+    monkeypatch.setattr(task_scheduler.exec_utils, "run_command", fake_run)
+
+    backend = task_scheduler.ScheduleServiceBackend(tasks_root=tasks_root)
+    outcomes = backend.apply(
+        [
+            r"Microsoft\\Office\\OfficeTelemetryAgentLogOn",
+            "FF_INTEGRATEDstreamSchedule",
+            r"\Microsoft\Office\Locked",
+        ],
+        action="delete",
+    )
+
+    assert len(commands) == 1
+    script = commands[0][-1]
+    assert "OfficeTelemetryAgentLogOn" in script and "Locked" in script
+    assert "FF_INTEGRATEDstreamSchedule" not in script
+    assert [(o.found, o.deleted, o.error) for o in outcomes] == [
+        (True, True, None),
+        (False, False, None),
+        (True, False, "denied"),
+    ]
+
+    registered = task_scheduler.list_registered_tasks(tasks_root)
+    assert registered is not None
+    assert registered[r"\microsoft\office\locked"].enabled is False
+
+
+def test_schedule_service_backend_reads_only_requested_folders(monkeypatch, tmp_path) -> None:
+    """!
+    @brief Only the requested folders are parsed; unreadable ones fall back to ``schtasks``.
+    """
+
+    logging_ext.setup_logging(tmp_path / "logs")
+    tasks_root = tmp_path / "Tasks"
+    _write_task(tasks_root, r"\Microsoft\Office\OfficeTelemetryAgentLogOn")
+    _write_task(tasks_root, r"\Microsoft\Windows\Defrag\ScheduledDefrag")
+    _write_task(tasks_root, r"\Microsoft\Office\Nested\Deep")
+    _write_task(tasks_root, r"\Locked\Task")
+    parsed: list[str] = []
+    read_enabled = task_scheduler._read_enabled
+
+    def counting_read(path):
+        parsed.append(path.name)
+        return read_enabled(path)
+
+    real_scandir = task_scheduler.os.scandir
+
+    def guarded_scandir(path):
+        if pathlib.Path(path).name == "Locked":
+            raise PermissionError(13, "Access is denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(task_scheduler, "_read_enabled", counting_read)
+    monkeypatch.setattr(task_scheduler.os, "scandir", guarded_scandir)
+
+    def fake_run(command, *, event, **kwargs):
+        payload = [{"task": r"\Microsoft\Office\OfficeTelemetryAgentLogOn", "ok": True}]
+        return _command_result(command, stdout=json.dumps(payload))
+
+    monkeypatch.setattr(task_scheduler.exec_utils, "run_command", fake_run)
+
+    backend = task_scheduler.ScheduleServiceBackend(tasks_root=tasks_root)
+    outcomes = backend.apply(
+        [
+            r"\Microsoft\Office\OfficeTelemetryAgentLogOn",
+            r"\Microsoft\Office\Missing",
+            r"\Locked\Task",
+        ],
+        action="disable",
+    )
+
+    assert parsed == ["OfficeTelemetryAgentLogOn"]
+    assert [(o.found, o.disabled, o.error) for o in outcomes] == [
+        (True, True, None),
+        (False, False, None),
+        (True, False, "task folder is not readable"),
+    ]
+    assert task_scheduler.list_registered_tasks(tasks_root) is None
+
+
+class _FakeTaskBackend(task_scheduler.TaskBackend):
+    """!
+    @brief Canned :class:`task_scheduler.TaskBackend` for tests.
+    """
+
+    name = "fake"
+
+    def __init__(self, outcomes: dict[str, task_scheduler.TaskOutcome]) -> None:
+        self.outcomes = outcomes
+        self.calls: list[tuple[list[str], str]] = []
+
+    def apply(self, tasks, *, action):
+        self.calls.append((list(tasks), action))
+        return [self.outcomes[name] for name in tasks]
+
+
+def test_disable_tasks_uses_backend_and_falls_back_per_task(monkeypatch, tmp_path) -> None:
+    """!
+    @brief Tasks the backend reports errors for are retried with ``schtasks``.
+    """
+
+    logging_ext.setup_logging(tmp_path)
+    commands: list[list[str]] = []
+
+    def fake_run(command, *, event, **kwargs):
+        commands.append([str(part) for part in command])
+        return _command_result(command)
+
+    backend = _FakeTaskBackend(
+        {
+            "A": task_scheduler.TaskOutcome("A", disabled=True),
+            "B": task_scheduler.TaskOutcome("B", found=False),
+            "C": task_scheduler.TaskOutcome("C", error="denied"),
+        }
+    )
+    monkeypatch.setattr(tasks_services.exec_utils, "run_command", fake_run)
+
+    outcomes = tasks_services.disable_tasks(["A", "B", "C"], backend=backend)
+
+    assert backend.calls == [(["A", "B", "C"], "disable")]
+    assert commands == [["schtasks.exe", "/Change", "/TN", "C", "/Disable"]]
+    assert [(o.task, o.found, o.disabled) for o in outcomes] == [
+        ("A", True, True),
+        ("B", False, False),
+        ("C", True, True),
+    ]
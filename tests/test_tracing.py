@@ -0,0 +1,78 @@
+"""!
+@brief Tests for :mod:`office_janitor.tracing`.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import threading
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from office_janitor import tracing  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracing() -> None:
+    """!
+    @brief Start and leave each test with tracing disabled and no recorded spans.
+    """
+
+    tracing.disable()
+    tracing.reset()
+    yield
+    tracing.disable()
+    tracing.reset()
+
+
+def test_tracing_records_nested_spans_and_exports_chrome_trace(tmp_path) -> None:
+    """!
+    @brief Spans nest per thread, accept explicit parents and export as trace events.
+    """
+
+    @tracing.traced("test.work", capture=("label",))
+    def work(*, label: str) -> str:
+        return label
+
+    assert tracing.span("test.disabled") is tracing.span("test.other")
+    work(label="ignored")
+    assert tracing.events() == []
+
+    tracing.enable()
+    try:
+        with tracing.span("test.root", mode="demo"):
+            root_id = tracing.current_span_id()
+            work(label="inline")
+
+            def run_worker() -> None:
+                with tracing.span("test.worker", parent=root_id):
+                    pass
+
+            worker = threading.Thread(target=run_worker, name="trace-worker")
+            worker.start()
+            worker.join()
+    finally:
+        tracing.disable()
+
+    by_name = {event["name"]: event for event in tracing.events()}
+    root = by_name["test.root"]
+    assert root["args"]["parent_id"] is None
+    assert root["args"]["mode"] == "demo"
+    assert by_name["test.work"]["args"]["parent_id"] == root["args"]["span_id"]
+    assert by_name["test.work"]["args"]["label"] == "inline"
+    assert by_name["test.worker"]["args"]["parent_id"] == root["args"]["span_id"]
+    assert by_name["test.worker"]["tid"] != root["tid"]
+
+    target = tracing.export_chrome(tmp_path / "trace.json")
+    payload = json.loads(target.read_text(encoding="utf-8"))
+    phases = [event["ph"] for event in payload["traceEvents"]]
+    assert phases.count("X") == 3
+    thread_names = {event["args"]["name"] for event in payload["traceEvents"] if event["ph"] == "M"}
+    assert "trace-worker" in thread_names
@@ -25,6 +25,7 @@ from office_janitor import (  # noqa: E402
     command_runner,
     logging_ext,
     msi_uninstall,
+    removal_watch,
 )
 
 
@@ -62,6 +63,7 @@ def test_msi_uninstall_builds_msiexec_command(monkeypatch, tmp_path) -> None:
         dry_run: bool = False,
         human_message: str | None = None,
         extra: dict | None = None,
+        stream_output: bool = False,
     ) -> command_runner.CommandResult:
         executed.append(command)
         state["present"] = False
@@ -112,6 +114,7 @@ def test_msi_uninstall_falls_back_to_setup_when_msiexec_fails(monkeypatch, tmp_p
         dry_run: bool = False,
         human_message: str | None = None,
         extra: dict | None = None,
+        stream_output: bool = False,
     ) -> command_runner.CommandResult:
         executed.append((command, event, dry_run))
         if command[0].lower().endswith("msiexec.exe"):
@@ -170,6 +173,7 @@ def test_msi_uninstall_dry_run(monkeypatch, tmp_path) -> None:
         dry_run: bool = False,
         human_message: str | None = None,
         extra: dict | None = None,
+        stream_output: bool = False,
     ) -> command_runner.CommandResult:
         nonlocal called
         called = True
@@ -207,6 +211,7 @@ def test_msi_uninstall_reports_failure(monkeypatch, tmp_path) -> None:
         dry_run: bool = False,
         human_message: str | None = None,
         extra: dict | None = None,
+        stream_output: bool = False,
     ) -> command_runner.CommandResult:
         return _command_result(command, returncode=1603)
 
@@ -238,6 +243,7 @@ def test_msi_uninstall_prompts_and_retries_when_installer_busy(monkeypatch, tmp_
         dry_run: bool = False,
         human_message: str | None = None,
         extra: dict | None = None,
+        stream_output: bool = False,
     ) -> command_runner.CommandResult:
         executed.append(command)
         state["attempt"] += 1
@@ -287,6 +293,7 @@ def test_msi_uninstall_cancels_when_busy_operator_declines(monkeypatch, tmp_path
         dry_run: bool = False,
         human_message: str | None = None,
         extra: dict | None = None,
+        stream_output: bool = False,
     ) -> command_runner.CommandResult:
         executed.append(command)
         return _command_result(command, returncode=msi_uninstall.MSI_BUSY_RETURN_CODE)
@@ -311,6 +318,64 @@ def test_msi_uninstall_cancels_when_busy_operator_declines(monkeypatch, tmp_path
     assert len(executed) == 1, "Should not retry when operator declines"
 
 
+def test_msi_uninstall_verifies_products_together(monkeypatch, tmp_path) -> None:
+    """!
+    @brief Verification starts after every command and shares one window.
+    """
+
+    logging_ext.setup_logging(tmp_path)
+    timeline: list[str] = []
+    sleeps: list[float] = []
+
+    def fake_run_command(
+        command: list[str], *, event: str, **kwargs: object
+    ) -> command_runner.CommandResult:
+        timeline.append("run")
+        return _command_result(command)
+
+    def fake_present(entry) -> bool:
+        timeline.append("probe")
+        if timeline.count("run") < 2:
+            return True
+        verify_probes = timeline.count("probe") - 2
+        # Product B needs one extra probe round before its keys disappear.
+        return "BBBB" in entry.product_code and verify_probes <= 2
+
+    monkeypatch.setattr(msi_uninstall.command_runner, "run_command", fake_run_command)
+    monkeypatch.setattr(msi_uninstall, "_is_product_present", fake_present)
+    monkeypatch.setattr(msi_uninstall.time, "sleep", lambda seconds: sleeps.append(seconds))
+
+    codes = ["{AAAAAAAA-0000-0000-0000-0000000FF1CE}", "{BBBBBBBB-0000-0000-0000-0000000FF1CE}"]
+    msi_uninstall.uninstall_products([{"product_code": code} for code in codes])
+
+    assert timeline[:4] == ["probe", "run", "probe", "run"]
+    assert timeline[4:] == ["probe", "probe", "probe"]
+    assert sleeps == [removal_watch.DEFAULT_INITIAL_INTERVAL]
+
+
+def test_await_removals_backs_off_within_budget(monkeypatch) -> None:
+    """!
+    @brief Residue that never disappears is polled with growing delays inside the budget.
+    """
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(removal_watch.time, "sleep", lambda seconds: sleeps.append(seconds))
+    attempts: list[int] = []
+
+    result = removal_watch.await_removals(
+        [removal_watch.RemovalTarget("stuck", lambda: True)],
+        budget=4.0,
+        initial_interval=0.5,
+        max_interval=2.0,
+        on_probe=lambda target, attempt, present: attempts.append(attempt),
+        notifier_factory=lambda keys: None,
+    )
+
+    assert result == {"stuck": False}
+    assert sleeps == [0.5, 1.0, 2.0, 0.5]
+    assert attempts == [1, 2, 3, 4, 5]
+
+
 def test_c2r_uninstall_prefers_client(monkeypatch, tmp_path) -> None:
     """!
     @brief OfficeC2RClient.exe should be preferred when available.
@@ -328,6 +393,7 @@ def test_c2r_uninstall_prefers_client(monkeypatch, tmp_path) -> None:
         dry_run: bool = False,
         human_message: str | None = None,
         extra: dict | None = None,
+        stream_output: bool = False,
     ) -> command_runner.CommandResult:
         executed.append((command, extra or {}))
         state["present"] = False
@@ -398,6 +464,7 @@ def test_c2r_uninstall_fallback_to_setup(monkeypatch, tmp_path) -> None:
         dry_run: bool = False,
         human_message: str | None = None,
         extra: dict | None = None,
+        stream_output: bool = False,
     ) -> command_runner.CommandResult:
         executed.append(command)
         state["present"] = False
@@ -454,6 +521,7 @@ def test_c2r_uninstall_dry_run(monkeypatch, tmp_path) -> None:
         dry_run: bool = False,
         human_message: str | None = None,
         extra: dict | None = None,
+        stream_output: bool = False,
     ) -> command_runner.CommandResult:
         executed.append(command)
         return _command_result(command, skipped=True)